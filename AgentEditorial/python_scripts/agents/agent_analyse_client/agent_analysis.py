@@ -2,8 +2,10 @@
 
 import json
 import re
+from functools import partial
 from typing import Any, Dict, List, Optional
 
+from python_scripts.agents.agent_analyse_client.model_scheduler import ModelCallScheduler
 from python_scripts.agents.base_agent import BaseAgent
 from python_scripts.agents.prompts import (
     EDITORIAL_ANALYSIS_PROMPT_LLAMA3,
@@ -11,6 +13,7 @@ from python_scripts.agents.prompts import (
     EDITORIAL_ANALYSIS_PROMPT_PHI3,
     EDITORIAL_SYNTHESIS_PROMPT,
 )
+from python_scripts.agents.utils.llm_cache import invalidate_cached_response
 from python_scripts.agents.utils.llm_factory import (
     get_llama3_llm,
     get_mistral_llm,
@@ -382,11 +385,11 @@ class EditorialAnalysisAgent(BaseAgent):
         try:
             # Get appropriate LLM
             if model_name == "llama3:8b":
-                llm = get_llama3_llm(temperature=0.7)
+                llm = get_llama3_llm(temperature=0.7, cache_template="editorial_analysis")
             elif model_name == "mistral:7b":
-                llm = get_mistral_llm(temperature=0.7)
+                llm = get_mistral_llm(temperature=0.7, cache_template="editorial_analysis")
             elif model_name == "phi3:medium":
-                llm = get_phi3_llm(temperature=0.7)
+                llm = get_phi3_llm(temperature=0.7, cache_template="editorial_analysis")
             else:
                 raise LLMError(f"Unknown model: {model_name}")
 
@@ -419,6 +422,7 @@ class EditorialAnalysisAgent(BaseAgent):
                 # Normalize the result to ensure proper JSON structure
                 result = normalize_json_data(result)
             except LLMError as e:
+                invalidate_cached_response(llm, prompt)
                 # Log full response for debugging (truncated to 2000 chars)
                 logger.error(
                     "JSON parsing failed",
@@ -481,7 +485,7 @@ class EditorialAnalysisAgent(BaseAgent):
         
         try:
             # Use Llama3 for synthesis (best for complex reasoning)
-            llm = get_llama3_llm(temperature=0.5)  # Lower temperature for more consistent synthesis
+            llm = get_llama3_llm(temperature=0.5, cache_template="editorial_synthesis")  # Lower temperature for more consistent synthesis
 
             # Format prompt with available results
             prompt = EDITORIAL_SYNTHESIS_PROMPT.format(
@@ -594,60 +598,30 @@ class EditorialAnalysisAgent(BaseAgent):
 
         self.log_step("analysis_start", "running", "Starting multi-LLM analysis")
 
-        # Run analyses with error tolerance - continue even if one fails
-        results = {}
-        errors = {}
-        
-        # Analyze with Llama3
-        try:
-            llama3_result = await self.analyze_with_llm(
-                content,
-                "llama3:8b",
-                EDITORIAL_ANALYSIS_PROMPT_LLAMA3,
-            )
-            results["llama3:8b"] = llama3_result
-        except Exception as e:
-            logger.warning(
-                "Llama3 analysis failed, continuing with other models",
-                error=str(e),
-                execution_id=str(execution_id),
-            )
-            errors["llama3:8b"] = str(e)
-            results["llama3:8b"] = None
-
-        # Analyze with Mistral
-        try:
-            mistral_result = await self.analyze_with_llm(
-                content,
-                "mistral:7b",
-                EDITORIAL_ANALYSIS_PROMPT_MISTRAL,
-            )
-            results["mistral:7b"] = mistral_result
-        except Exception as e:
-            logger.warning(
-                "Mistral analysis failed, continuing with other models",
-                error=str(e),
-                execution_id=str(execution_id),
-            )
-            errors["mistral:7b"] = str(e)
-            results["mistral:7b"] = None
+        # Run analyses with error tolerance - continue even if one fails.
+        # Models run concurrently when Ollama can keep them resident together,
+        # otherwise in the order that minimizes model swaps.
+        prompts = {
+            "llama3:8b": EDITORIAL_ANALYSIS_PROMPT_LLAMA3,
+            "mistral:7b": EDITORIAL_ANALYSIS_PROMPT_MISTRAL,
+            "phi3:medium": EDITORIAL_ANALYSIS_PROMPT_PHI3,
+        }
+        calls = {
+            model: partial(self.analyze_with_llm, content, model, prompt)
+            for model, prompt in prompts.items()
+        }
+        # llama3 also runs the synthesis: keep it loaded for that call
+        report = await ModelCallScheduler().run(calls, run_last="llama3:8b")
 
-        # Analyze with Phi3
-        try:
-            phi3_result = await self.analyze_with_llm(
-                content,
-                "phi3:medium",
-                EDITORIAL_ANALYSIS_PROMPT_PHI3,
-            )
-            results["phi3:medium"] = phi3_result
-        except Exception as e:
+        results = {model: report.results.get(model) for model in prompts}
+        errors = dict(report.errors)
+        for model, error in errors.items():
             logger.warning(
-                "Phi3 analysis failed, continuing with other models",
-                error=str(e),
+                "LLM analysis failed, continuing with other models",
+                model=model,
+                error=error,
                 execution_id=str(execution_id),
             )
-            errors["phi3:medium"] = str(e)
-            results["phi3:medium"] = None
 
         # Check if we have at least one successful result
         successful_results = {k: v for k, v in results.items() if v is not None}
@@ -680,6 +654,7 @@ class EditorialAnalysisAgent(BaseAgent):
         if results.get("phi3:medium"):
             individual_analyses["phi3"] = results["phi3:medium"]
         synthesized["individual_analyses"] = individual_analyses
+        synthesized["analysis_schedule"] = report.to_dict()
         
         # Add error information if any
         if errors:
@@ -0,0 +1,290 @@
+"""VRAM-aware scheduler for independent Ollama model calls.
+
+Ollama keeps a model in VRAM between requests and serves several models at
+once as long as they fit (and OLLAMA_MAX_LOADED_MODELS allows it). When they
+do not fit, every call to another model evicts the previous one and pays a
+full model load.
+
+The scheduler groups calls in batches that fit the VRAM budget: calls of one
+batch run concurrently, batches run one after another. Models already loaded
+(/api/ps, the same view VRAMResourceManager uses) run first, so that they are
+not evicted before being used, and the model needed right after the calls
+(the synthesis model) runs last, so that it is still loaded.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from python_scripts.config.settings import settings
+from python_scripts.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# VRAM needed to load a model, relative to its size on disk (KV cache, buffers)
+VRAM_OVERHEAD = 1.2
+SCHEDULING_MODES = ("auto", "concurrent", "sequential")
+
+
+@dataclass
+class OllamaResidency:
+    """Models loaded by Ollama and VRAM available for them."""
+
+    loaded: Dict[str, int] = field(default_factory=dict)  # model -> VRAM bytes, in load order
+    model_sizes: Dict[str, int] = field(default_factory=dict)  # model -> size on disk (bytes)
+    vram_budget_bytes: Optional[int] = None  # None when unknown
+
+    def required_bytes(self, model: str) -> Optional[int]:
+        """Estimate the VRAM used by a model once loaded (None if unknown)."""
+        if model in self.loaded:
+            return self.loaded[model]
+        size = self.model_sizes.get(model)
+        return int(size * VRAM_OVERHEAD) if size else None
+
+
+@dataclass
+class ModelRunReport:
+    """Outcome of a scheduled run."""
+
+    mode: str
+    batches: List[List[str]]
+    results: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    durations: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export the schedule (without results) as a dictionary."""
+        return {
+            "mode": self.mode,
+            "batches": self.batches,
+            "durations": {model: round(seconds, 2) for model, seconds in self.durations.items()},
+            "errors": dict(self.errors),
+        }
+
+
+async def fetch_ollama_residency(base_url: Optional[str] = None, timeout: float = 5.0) -> OllamaResidency:
+    """
+    Query Ollama for loaded models (/api/ps) and model sizes (/api/tags).
+
+    Args:
+        base_url: Ollama API URL (default: settings.ollama_base_url)
+        timeout: Request timeout in seconds
+
+    Returns:
+        OllamaResidency (empty when Ollama cannot be reached)
+    """
+    base_url = (base_url or settings.ollama_base_url).rstrip("/")
+    residency = OllamaResidency()
+    try:
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            ps_response, tags_response = await asyncio.gather(
+                client.get(f"{base_url}/api/ps"),
+                client.get(f"{base_url}/api/tags"),
+            )
+            ps_response.raise_for_status()
+            tags_response.raise_for_status()
+    except Exception as e:
+        logger.warning("Could not query Ollama model residency", base_url=base_url, error=str(e))
+        return residency
+
+    for model_info in ps_response.json().get("models") or []:
+        name = model_info.get("name") or model_info.get("model")
+        if name:
+            residency.loaded[name] = int(model_info.get("size_vram") or model_info.get("size") or 0)
+    for model_info in tags_response.json().get("models") or []:
+        name = model_info.get("name") or model_info.get("model")
+        if name:
+            residency.model_sizes[name] = int(model_info.get("size") or 0)
+    return residency
+
+
+def _gpu_vram_budget_bytes() -> Optional[int]:
+    """Total VRAM seen by VRAMResourceManager (None without GPU tooling)."""
+    try:
+        from python_scripts.image_generation.vram_resource_manager import get_vram_resource_manager
+
+        status = get_vram_resource_manager().get_vram_status()
+    except Exception as e:
+        logger.debug("VRAM status unavailable", error=str(e))
+        return None
+    if status.vram_total_gb <= 0:
+        return None
+    return int(status.vram_total_gb * 1024**3)
+
+
+def plan_batches(
+    models: List[str],
+    residency: OllamaResidency,
+    mode: str = "auto",
+    max_loaded_models: int = 3,
+    run_last: Optional[str] = None,
+) -> List[List[str]]:
+    """
+    Group models in batches that can be resident at the same time.
+
+    Loaded models come first (in load order), then the others; run_last is
+    moved to the end of its group. In auto mode, a batch is closed when the
+    next model would exceed the VRAM budget or max_loaded_models. Without a
+    known budget, only models that are already loaded are run together.
+
+    Args:
+        models: Models to run
+        residency: Current Ollama residency
+        mode: "auto", "concurrent" (one batch) or "sequential" (one model per batch)
+        max_loaded_models: Maximum number of models loaded at once
+        run_last: Model to run as late as possible
+
+    Returns:
+        Ordered list of batches
+    """
+    resident = [model for model in residency.loaded if model in models]
+    others = [model for model in models if model not in resident]
+    for group in (resident, others):
+        if run_last in group:
+            group.remove(run_last)
+            group.append(run_last)
+    ordered = resident + others
+
+    if mode == "concurrent":
+        return [ordered] if ordered else []
+    if mode == "sequential":
+        return [[model] for model in ordered]
+
+    budget = residency.vram_budget_bytes
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    batch_bytes = 0
+    for model in ordered:
+        required = residency.required_bytes(model)
+        if budget is None or required is None:
+            fits = model in residency.loaded and all(m in residency.loaded for m in batch)
+        else:
+            fits = batch_bytes + required <= budget
+        if batch and (not fits or len(batch) >= max_loaded_models):
+            batches.append(batch)
+            batch, batch_bytes = [], 0
+        batch.append(model)
+        batch_bytes += required or 0
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class ModelCallScheduler:
+    """
+    Run independent calls to several Ollama models.
+
+    Each call has its own timeout; a failed or timed out call is reported in
+    the run report and does not stop the others.
+    """
+
+    def __init__(
+        self,
+        mode: Optional[str] = None,
+        model_timeouts: Optional[Dict[str, float]] = None,
+        default_timeout: Optional[float] = None,
+        max_loaded_models: Optional[int] = None,
+        vram_budget_bytes: Optional[int] = None,
+        base_url: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            mode: "auto", "concurrent" or "sequential" (default: settings.ollama_scheduling_mode)
+            model_timeouts: Timeout per model in seconds (default: settings.ollama_model_timeouts)
+            default_timeout: Timeout of other models (default: settings.ollama_model_timeout)
+            max_loaded_models: Models Ollama keeps loaded at once (default: settings.ollama_max_loaded_models)
+            vram_budget_bytes: VRAM available to Ollama (default: settings.ollama_vram_budget_gb,
+                then the GPU total reported by VRAMResourceManager)
+            base_url: Ollama API URL (default: settings.ollama_base_url)
+        """
+        self.mode = mode or settings.ollama_scheduling_mode
+        if self.mode not in SCHEDULING_MODES:
+            raise ValueError(f"Unknown scheduling mode: {self.mode}")
+        self.model_timeouts = (
+            model_timeouts if model_timeouts is not None else dict(settings.ollama_model_timeouts)
+        )
+        self.default_timeout = default_timeout or settings.ollama_model_timeout
+        self.max_loaded_models = max(1, max_loaded_models or settings.ollama_max_loaded_models)
+        self.vram_budget_bytes = vram_budget_bytes
+        self.base_url = base_url
+
+    def get_timeout(self, model: str) -> float:
+        """Get the timeout of a model in seconds."""
+        return self.model_timeouts.get(model, self.default_timeout)
+
+    async def get_residency(self) -> OllamaResidency:
+        """Get the current residency and VRAM budget."""
+        residency = await fetch_ollama_residency(self.base_url)
+        if self.vram_budget_bytes is not None:
+            residency.vram_budget_bytes = self.vram_budget_bytes
+        elif settings.ollama_vram_budget_gb:
+            residency.vram_budget_bytes = int(settings.ollama_vram_budget_gb * 1024**3)
+        else:
+            residency.vram_budget_bytes = await asyncio.to_thread(_gpu_vram_budget_bytes)
+        return residency
+
+    async def _run_call(
+        self,
+        model: str,
+        call: Callable[[], Awaitable[Any]],
+        report: ModelRunReport,
+    ) -> None:
+        started = time.perf_counter()
+        timeout = self.get_timeout(model)
+        try:
+            report.results[model] = await asyncio.wait_for(call(), timeout=timeout)
+        except asyncio.TimeoutError:
+            report.errors[model] = f"{model} timed out after {timeout:.0f}s"
+            logger.warning("Model call timed out", model=model, timeout=timeout)
+        except Exception as e:
+            report.errors[model] = str(e)
+            logger.warning("Model call failed", model=model, error=str(e))
+        finally:
+            report.durations[model] = time.perf_counter() - started
+
+    async def run(
+        self,
+        calls: Dict[str, Callable[[], Awaitable[Any]]],
+        run_last: Optional[str] = None,
+    ) -> ModelRunReport:
+        """
+        Run one call per model.
+
+        Args:
+            calls: Coroutine function to run, per model name
+            run_last: Model used right after these calls (kept loaded)
+
+        Returns:
+            ModelRunReport with results and errors per model
+        """
+        models = list(calls)
+        if self.mode == "auto":
+            residency = await self.get_residency()
+        else:
+            residency = await fetch_ollama_residency(self.base_url)
+        batches = plan_batches(
+            models,
+            residency,
+            mode=self.mode,
+            max_loaded_models=self.max_loaded_models,
+            run_last=run_last,
+        )
+        report = ModelRunReport(mode=self.mode, batches=batches)
+        logger.info(
+            "Model calls scheduled",
+            mode=self.mode,
+            batches=batches,
+            loaded_models=list(residency.loaded),
+            vram_budget_gb=(
+                round(residency.vram_budget_bytes / 1024**3, 1) if residency.vram_budget_bytes else None
+            ),
+        )
+
+        for batch in batches:
+            await asyncio.gather(*(self._run_call(model, calls[model], report) for model in batch))
+        return report
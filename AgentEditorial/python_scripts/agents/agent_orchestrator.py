@@ -370,6 +370,7 @@ class EditorialAnalysisOrchestrator:
                     db_session=self.db_session,
                     respect_robots=True,
                     use_cache=True,
+                    include_html=False,  # Only the text is aggregated
                 )
 
                 if not crawled_pages:
@@ -1,5 +1,6 @@
 """Competitor search agent with optimized multi-source search and 12-step validation pipeline."""
 
+import asyncio
 import time
 from typing import Any, Dict, List
 
@@ -21,9 +22,11 @@ from python_scripts.agents.competitor.filters import (
     DomainFilter,
     MediaFilter,
     PreFilter,
+    share_matcher,
 )
 from python_scripts.agents.competitor.query_generator import QueryGenerator
 from python_scripts.agents.competitor.scorer import CompetitorScorer
+from python_scripts.agents.competitor.search_fanout import SearchFanout, get_search_cache
 from python_scripts.config.settings import settings
 from python_scripts.database.crud_profiles import get_site_profile_by_domain
 from python_scripts.utils.exceptions import WorkflowError
@@ -44,6 +47,8 @@ class CompetitorSearchAgent(BaseAgent):
         self.domain_filter = DomainFilter(self.config)
         self.content_filter = ContentFilter(self.config)
         self.media_filter = MediaFilter(self.config)
+        # Pré-filtre, filtre média et validation du contenu partagent un matcher mémoïsé
+        share_matcher([self.pre_filter, self.media_filter, self.content_filter])
         self.esn_classifier = ESNClassifier(self.config)
         self.business_classifier = BusinessTypeClassifier(self.config)
         self.relevance_classifier = RelevanceClassifier(self.config)
@@ -214,12 +219,19 @@ class CompetitorSearchAgent(BaseAgent):
         """
         Search using DuckDuckGo.
 
+        The DDGS client is blocking: it runs in a worker thread so that
+        concurrent queries do not stall the event loop.
+
         Args:
             query: Search query
 
         Returns:
             List of search results
         """
+        return await asyncio.to_thread(self._search_duckduckgo_sync, query)
+
+    def _search_duckduckgo_sync(self, query: str) -> List[Dict[str, Any]]:
+        """Run a DuckDuckGo search (blocking)."""
         start_time = time.time()
         try:
             with DDGS() as ddgs:
@@ -356,52 +368,37 @@ class CompetitorSearchAgent(BaseAgent):
                 strategies=list(set(q["strategy"] for q in queries)),
             )
 
-            all_results: List[Dict[str, Any]] = []
-            strategy_results: Dict[str, Dict[str, int]] = {}
-
-            for i, query_info in enumerate(queries, 1):
-                query = query_info["query"]
-                strategy = query_info["strategy"]
-
-                # Search Tavily
-                tavily_results = await self._search_tavily(query)
-                for result in tavily_results:
-                    result["strategy"] = strategy
-                all_results.extend(tavily_results)
-
-                # Search DuckDuckGo
-                ddg_results = await self._search_duckduckgo(query)
-                for result in ddg_results:
-                    result["strategy"] = strategy
-                all_results.extend(ddg_results)
-
-                # Track strategy performance
-                if strategy not in strategy_results:
-                    strategy_results[strategy] = {"tavily": 0, "duckduckgo": 0, "total": 0}
-                strategy_results[strategy]["tavily"] += len(tavily_results)
-                strategy_results[strategy]["duckduckgo"] += len(ddg_results)
-                strategy_results[strategy]["total"] += len(tavily_results) + len(ddg_results)
-
-                # Log progress every 10 queries
-                if i % 10 == 0:
-                    logger.debug(
-                        "Query execution progress",
-                        domain=domain,
-                        queries_executed=i,
-                        total_queries=len(queries),
-                        results_so_far=len(all_results),
-                    )
+            # Queries go to Tavily and DuckDuckGo concurrently (per-provider limits),
+            # through the result cache; unproductive strategies stop early
+            fanout = SearchFanout(
+                {"tavily": self._search_tavily, "duckduckgo": self._search_duckduckgo},
+                self.config,
+                self.query_generator,
+                cache=get_search_cache(),
+                max_results={
+                    "tavily": self.config.max_results_tavily,
+                    "duckduckgo": self.config.max_results_duckduckgo,
+                },
+            )
+            fanout_result = await fanout.search(queries, exclude_domain=domain)
+            all_results: List[Dict[str, Any]] = fanout_result.results
 
             step1_duration = time.time() - step1_start
             logger.info(
                 "Step 1: Query execution completed",
                 domain=domain,
-                queries_executed=len(queries),
+                queries_executed=fanout_result.queries_executed,
+                queries_skipped=fanout_result.queries_skipped,
+                cache_hits=fanout_result.cache_hits,
                 total_results=len(all_results),
-                strategy_breakdown=strategy_results,
+                strategy_breakdown=fanout_result.strategy_results,
                 duration_seconds=round(step1_duration, 2),
             )
-            self.log_step("step_1", "completed", f"Found {len(all_results)} results from {len(queries)} queries")
+            self.log_step(
+                "step_1",
+                "completed",
+                f"Found {len(all_results)} results from {fanout_result.queries_executed} queries",
+            )
 
             # Step 2: Deduplication by domain
             step2_start = time.time()
@@ -441,9 +438,22 @@ class CompetitorSearchAgent(BaseAgent):
             self.log_step("step_4", "running", "Enriching top candidates")
             candidates_to_enrich = pre_filtered[:self.config.max_candidates_to_enrich]
             enriched_count = 0
-            if db_session:
-                enricher = CandidateEnricher(self.config, db_session)
-                enriched = await enricher.enrich_candidates(candidates_to_enrich, max_candidates=len(candidates_to_enrich))
+            # One enricher for steps 4, 5 and 7: embeddings computed while
+            # homepages arrive are reused by the similarity step
+            enricher = CandidateEnricher(self.config, db_session) if db_session else None
+            # Target text for semantic similarity, from the profile
+            target_text = " ".join(
+                [
+                    str(profile_dict.get("activity_domains", {})),
+                    str(profile_dict.get("keywords", {})),
+                ]
+            )
+            if enricher:
+                enriched = await enricher.enrich_candidates(
+                    candidates_to_enrich,
+                    max_candidates=len(candidates_to_enrich),
+                    target_text=target_text,
+                )
                 enriched_count = sum(1 for c in enriched if c.get("enriched", False))
                 # Merge enriched back with others
                 enriched_domains = {c.get("domain") for c in enriched}
@@ -465,8 +475,7 @@ class CompetitorSearchAgent(BaseAgent):
             step5_start = time.time()
             self.log_step("step_5", "running", "Cross-source validation")
             cross_validated_count = 0
-            if db_session:
-                enricher = CandidateEnricher(self.config, db_session)
+            if enricher:
                 pre_filtered = enricher.detect_cross_validation(pre_filtered)
                 cross_validated_count = sum(1 for c in pre_filtered if c.get("cross_validated", False))
             step5_duration = time.time() - step5_start
@@ -524,15 +533,7 @@ class CompetitorSearchAgent(BaseAgent):
             step7_start = time.time()
             self.log_step("step_7", "running", "Calculating semantic similarity")
             avg_similarity = 0.0
-            if db_session:
-                enricher = CandidateEnricher(self.config, db_session)
-                # Prepare target text from profile
-                target_text = " ".join(
-                    [
-                        str(profile_dict.get("activity_domains", {})),
-                        str(profile_dict.get("keywords", {})),
-                    ]
-                )
+            if enricher:
                 filtered = enricher.calculate_semantic_similarity(target_text, filtered)
                 avg_similarity = sum(c.get("semantic_similarity", 0) for c in filtered) / len(filtered) if filtered else 0
             step7_duration = time.time() - step7_start
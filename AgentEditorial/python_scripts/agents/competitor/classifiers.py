@@ -1,17 +1,36 @@
 """Classifiers for competitor categorization and scoring."""
 
+import asyncio
 import json
 import re
-from typing import Any, Dict, List, Optional
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from python_scripts.agents.competitor.config import CompetitorSearchConfig
 from python_scripts.agents.prompts import COMPETITOR_FILTERING_PROMPT
+from python_scripts.agents.utils.llm_cache import (
+    LLMResponseCache,
+    estimate_tokens,
+    get_llm_cache,
+    invalidate_cached_response,
+    make_cache_key,
+)
 from python_scripts.agents.utils.llm_factory import get_phi3_llm
 from python_scripts.utils.exceptions import LLMError
 from python_scripts.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Relevance classification model, and template id of its per-domain memo
+RELEVANCE_MODEL = "phi3:medium"
+RELEVANCE_TEMPERATURE = 0.3
+RELEVANCE_MEMO_TEMPLATE = "competitor_relevance_domain"
+# Parse outcomes of the last N batches drive the batch size
+RELEVANCE_OUTCOME_WINDOW = 8
+# Outcomes needed before the batch size is reduced
+RELEVANCE_MIN_OUTCOMES = 3
+
 
 class ESNClassifier:
     """Classifier for detecting ESN (Entreprise de Services Numériques)."""
@@ -127,6 +146,9 @@ class RelevanceClassifier:
     def __init__(self, config: CompetitorSearchConfig) -> None:
         """Initialize relevance classifier."""
         self.config = config
+        # Batch size, adapted to the parse failure rate observed on LLM responses
+        self.batch_size = config.relevance_batch_size
+        self._outcomes: Deque[bool] = deque(maxlen=RELEVANCE_OUTCOME_WINDOW)
 
     async def classify_batch(
         self,
@@ -137,6 +159,13 @@ class RelevanceClassifier:
         """
         Classify relevance of candidates using LLM.
 
+        Batches are sent concurrently (config.relevance_concurrency calls in
+        flight) and merged in batch order. Their prompts only differ by the
+        trailing candidate list, so Ollama reuses the KV cache of the shared
+        prefix. The classification of each domain is memoized in the LLM
+        response cache, so candidates already seen for the same target and
+        context are not sent again.
+
         Args:
             domain: Target domain
             candidates: List of candidate dictionaries
@@ -149,101 +178,89 @@ class RelevanceClassifier:
             return []
 
         try:
-            llm = get_phi3_llm(temperature=0.3)  # Lower temperature for consistency
+            # Lower temperature for consistency
+            llm = get_phi3_llm(temperature=RELEVANCE_TEMPERATURE, cache_template="competitor_relevance")
+            # Rendered once: identical (sorted keys) in every prompt and every run
+            context_text = json.dumps(
+                context, indent=2, ensure_ascii=False, sort_keys=True, default=str
+            )
 
-            # Process candidates in batches - reduced size for better reliability
-            batch_size = 15  # Further reduced to 15 for better reliability and to ensure all are evaluated
             result_map: Dict[str, Dict[str, Any]] = {}
-            total_batches = (len(candidates) + batch_size - 1) // batch_size
-            
+            memo = get_llm_cache()
+            memo_keys: Dict[str, str] = {}
+            to_classify: List[str] = []
+            memo_hits = 0
+            for candidate in candidates:
+                candidate_domain = candidate.get("domain", "").lower()
+                if not candidate_domain or candidate_domain in memo_keys:
+                    continue
+                memo_keys[candidate_domain] = self._memo_key(domain, context_text, candidate_domain)
+                found, classification = self._memo_lookup(memo, memo_keys[candidate_domain])
+                if not found:
+                    to_classify.append(candidate_domain)
+                    continue
+                memo_hits += 1
+                if classification is not None:
+                    result_map[candidate_domain] = classification
+
             logger.info(
                 "Starting LLM batch processing",
                 total_candidates=len(candidates),
-                batch_size=batch_size,
-                total_batches=total_batches,
+                memoized=memo_hits,
+                to_classify=len(to_classify),
+                batch_size=self.batch_size,
+                concurrency=self.config.relevance_concurrency,
             )
-            
-            for i in range(0, len(candidates), batch_size):
-                batch = candidates[i:i + batch_size]
-                candidates_text = "\n".join([f"- {c.get('domain', '')}" for c in batch])
-
-                # Format prompt
-                prompt = COMPETITOR_FILTERING_PROMPT.format(
-                    domain=domain,
-                    context=json.dumps(context, indent=2),
-                    candidates=candidates_text,
-                )
-
-                # Invoke LLM
-                try:
-                    if hasattr(llm, "ainvoke"):
-                        response = await llm.ainvoke(prompt)
-                    elif hasattr(llm, "invoke"):
-                        response = llm.invoke(prompt)
-                    else:
-                        response = await llm(prompt)
 
-                    # Parse JSON response
-                    response_text = response if isinstance(response, str) else str(response)
-                    
-                    # Log raw response for debugging if empty
-                    if i == 0 and len(result_map) == 0:
-                        logger.debug(
-                            "LLM raw response (first batch)",
-                            response_preview=response_text[:500] if len(response_text) > 500 else response_text,
-                        )
-
-                    # Extract JSON (reuse logic from agent_analysis)
-                    json_start = response_text.find("{")
-                    json_end = response_text.rfind("}") + 1
-                    if json_start >= 0 and json_end > json_start:
-                        json_text = response_text[json_start:json_end]
-                        try:
-                            parsed = json.loads(json_text)
-                        except json.JSONDecodeError:
-                            # Try JSON block
-                            json_block_match = re.search(r"```json\s*(.*?)\s*```", response_text, re.DOTALL)
-                            if json_block_match:
-                                parsed = json.loads(json_block_match.group(1))
-                            else:
-                                logger.warning(
-                                    "Failed to parse LLM JSON response",
-                                    batch=i // batch_size + 1,
-                                    response_preview=response_text[:200],
-                                )
-                                continue
-                    else:
+            # Parsed batches by start position, merged in order once all are done
+            batch_maps: Dict[int, Dict[str, Dict[str, Any]]] = {}
+            cursor = dispatched = 0
+
+            async def worker() -> None:
+                nonlocal cursor, dispatched
+                while cursor < len(to_classify):
+                    start = cursor
+                    batch = to_classify[start:start + self.batch_size]
+                    cursor += len(batch)
+                    dispatched += 1
+                    batch_number = dispatched
+                    prompt = COMPETITOR_FILTERING_PROMPT.format(
+                        domain=domain,
+                        context=context_text,
+                        candidates="\n".join(f"- {d}" for d in batch),
+                    )
+                    started = time.perf_counter()
+                    try:
+                        response = await self._invoke_llm(llm, prompt)
+                        response_text = response if isinstance(response, str) else str(response)
+                        if start == 0:
+                            logger.debug(
+                                "LLM raw response (first batch)",
+                                response_preview=response_text[:500],
+                            )
+                        batch_map, complete = self._parse_response(response_text, batch_number)
+                        if not complete:
+                            # Retried on the next run instead of served from cache
+                            invalidate_cached_response(llm, prompt)
+                    except Exception as batch_error:
                         logger.warning(
-                            "No JSON found in LLM response",
-                            batch=i // batch_size + 1,
-                            response_preview=response_text[:200],
+                            "LLM batch processing error",
+                            batch=batch_number,
+                            error=str(batch_error),
+                            error_type=type(batch_error).__name__,
                         )
-                        continue
-
-                    # Extract competitors from this batch
-                    competitors_data = parsed.get("competitors", [])
-                    if not isinstance(competitors_data, list):
-                        competitors_data = []
-
-                    # Add to result map
-                    for item in competitors_data:
-                        if isinstance(item, dict):
-                            domain_name = item.get("domain", "")
-                            if domain_name:
-                                result_map[domain_name.lower()] = {
-                                    "relevance_score": float(item.get("relevance_score", 0.5)),
-                                    "confidence_score": float(item.get("confidence_score", 0.5)),
-                                    "reason": item.get("reason", ""),
-                                }
-                except Exception as batch_error:
-                    logger.warning(
-                        "LLM batch processing error",
-                        batch=i // batch_size + 1,
-                        error=str(batch_error),
-                        error_type=type(batch_error).__name__,
-                    )
-                    continue
-            
+                        batch_map, complete = {}, False
+                    self._record_outcome(complete)
+                    batch_maps[start] = batch_map
+                    if complete:
+                        elapsed = time.perf_counter() - started
+                        self._memoize(memo, memo_keys, batch, batch_map, elapsed)
+
+            workers = min(max(1, self.config.relevance_concurrency), len(to_classify))
+            await asyncio.gather(*(worker() for _ in range(workers)))
+            for start in sorted(batch_maps):
+                result_map.update(batch_maps[start])
+
             # Log if LLM didn't evaluate all candidates
             evaluated_domains = set(result_map.keys())
             candidate_domains = {c.get("domain", "").lower() for c in candidates if c.get("domain")}
@@ -347,6 +364,164 @@ class RelevanceClassifier:
                 for c in candidates
             ]
 
+    async def _invoke_llm(self, llm: Any, prompt: str) -> Any:
+        """Invoke the LLM without blocking the event loop."""
+        if hasattr(llm, "ainvoke"):
+            return await llm.ainvoke(prompt)
+        if hasattr(llm, "invoke"):
+            return await asyncio.to_thread(llm.invoke, prompt)
+        return await llm(prompt)
+
+    def _parse_response(
+        self, response_text: str, batch_number: int
+    ) -> Tuple[Dict[str, Dict[str, Any]], bool]:
+        """
+        Extract the classified competitors from an LLM response.
+
+        Args:
+            response_text: Raw LLM response
+            batch_number: Batch number (for logging)
+
+        Returns:
+            Tuple of (classifications by lowercased domain, True if the whole
+            response was parsed)
+        """
+        # Extract JSON (reuse logic from agent_analysis)
+        json_start = response_text.find("{")
+        json_end = response_text.rfind("}") + 1
+        if json_start < 0 or json_end <= json_start:
+            logger.warning(
+                "No JSON found in LLM response",
+                batch=batch_number,
+                response_preview=response_text[:200],
+            )
+            return {}, False
+
+        try:
+            parsed = json.loads(response_text[json_start:json_end])
+        except json.JSONDecodeError:
+            # Try JSON block
+            json_block_match = re.search(r"```json\s*(.*?)\s*```", response_text, re.DOTALL)
+            if not json_block_match:
+                logger.warning(
+                    "Failed to parse LLM JSON response",
+                    batch=batch_number,
+                    response_preview=response_text[:200],
+                )
+                return {}, False
+            parsed = json.loads(json_block_match.group(1))
+
+        # Extract competitors from this batch
+        competitors_data = parsed.get("competitors", []) if isinstance(parsed, dict) else []
+        if not isinstance(competitors_data, list):
+            competitors_data = []
+
+        batch_map: Dict[str, Dict[str, Any]] = {}
+        for item in competitors_data:
+            if isinstance(item, dict):
+                domain_name = item.get("domain", "")
+                if domain_name:
+                    try:
+                        batch_map[domain_name.lower()] = {
+                            "relevance_score": float(item.get("relevance_score", 0.5)),
+                            "confidence_score": float(item.get("confidence_score", 0.5)),
+                            "reason": item.get("reason", ""),
+                        }
+                    except (TypeError, ValueError) as e:
+                        # Keep the items parsed so far
+                        logger.warning(
+                            "Invalid score in LLM response", batch=batch_number, error=str(e)
+                        )
+                        return batch_map, False
+        return batch_map, True
+
+    def _record_outcome(self, parsed: bool) -> None:
+        """
+        Adapt the batch size to the recent parse failure rate.
+
+        The size is halved when more than config.relevance_max_failure_rate of
+        the recent batches failed, and raised by a quarter after a full window
+        without failure.
+        """
+        self._outcomes.append(not parsed)
+        failures = sum(self._outcomes)
+        size = self.batch_size
+        if len(self._outcomes) >= RELEVANCE_MIN_OUTCOMES and (
+            failures / len(self._outcomes) > self.config.relevance_max_failure_rate
+        ):
+            size = max(self.config.relevance_min_batch_size, size // 2)
+        elif len(self._outcomes) == self._outcomes.maxlen and failures == 0:
+            size = min(self.config.relevance_max_batch_size, size + max(1, size // 4))
+
+        if size != self.batch_size:
+            logger.info(
+                "Relevance batch size adapted",
+                previous=self.batch_size,
+                batch_size=size,
+                recent_failures=failures,
+                recent_batches=len(self._outcomes),
+            )
+            self.batch_size = size
+            self._outcomes.clear()
+
+    @staticmethod
+    def _memo_key(domain: str, context_text: str, candidate_domain: str) -> str:
+        """Cache key of a candidate classification (target, context, prompt version)."""
+        return make_cache_key(
+            RELEVANCE_MODEL,
+            RELEVANCE_TEMPERATURE,
+            RELEVANCE_MEMO_TEMPLATE,
+            json.dumps([domain, context_text, candidate_domain, COMPETITOR_FILTERING_PROMPT]),
+        )
+
+    @staticmethod
+    def _memo_lookup(
+        memo: Optional[LLMResponseCache], key: str
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Look up a memoized classification.
+
+        Returns:
+            Tuple of (found, classification); the classification is None for a
+            domain the LLM left out of its answer (not a competitor)
+        """
+        if memo is None:
+            return False, None
+        try:
+            cached = memo.get(key, RELEVANCE_MODEL)
+        except Exception as e:
+            logger.warning("Relevance memo lookup failed", error=str(e))
+            return False, None
+        if cached is None:
+            return False, None
+        return True, json.loads(cached.response)
+
+    @staticmethod
+    def _memoize(
+        memo: Optional[LLMResponseCache],
+        memo_keys: Dict[str, str],
+        batch: List[str],
+        batch_map: Dict[str, Dict[str, Any]],
+        latency_seconds: float,
+    ) -> None:
+        """Memoize the classification (or omission) of each domain of a parsed batch."""
+        if memo is None:
+            return
+        for candidate_domain in batch:
+            response = json.dumps(batch_map.get(candidate_domain))
+            try:
+                memo.put(
+                    memo_keys[candidate_domain],
+                    RELEVANCE_MODEL,
+                    RELEVANCE_MEMO_TEMPLATE,
+                    response,
+                    estimate_tokens(response),
+                    latency_seconds / len(batch),
+                )
+            except Exception as e:
+                logger.warning("Could not memoize relevance classification", error=str(e))
+                return
+
 
 class GeographicClassifier:
     """Classifier for geographic matching."""
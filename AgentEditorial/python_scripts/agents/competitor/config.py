@@ -1,7 +1,19 @@
 """Configuration optimisée pour la recherche de concurrents."""
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from python_scripts.agents.competitor.matcher import (
+    EXACT_DOMAIN_RULES,
+    SUBSTRING_RULES,
+    ExclusionMatcher,
+)
+
+# Listes dont dépend le matcher compilé
+_EXCLUSION_LISTS = attrgetter(
+    "excluded_tlds", *(rule[0] for rule in EXACT_DOMAIN_RULES + SUBSTRING_RULES)
+)
 
 
 @dataclass
@@ -14,6 +26,27 @@ class CompetitorSearchConfig:
     max_queries: int = 50
     max_candidates_to_enrich: int = 50
 
+    # Enrichissement des pages d'accueil (concurrent)
+    enrichment_concurrency: int = 10  # Pages d'accueil crawlées en parallèle
+    enrichment_timeout: float = 20.0  # Délai maximal par candidat (crawl + analyse), en secondes
+    enrichment_target: int = 0  # Arrêt dès que les N premiers candidats (par rang) sont enrichis (0 = tous)
+
+    # Envoi des requêtes aux moteurs de recherche (concurrent, mis en cache)
+    search_batch_size: int = 8  # Requêtes envoyées en parallèle par vague
+    search_provider_concurrency: Dict[str, int] = None  # Appels simultanés par moteur
+    search_provider_interval: Dict[str, float] = None  # Délai minimal entre deux appels (s)
+    # Une stratégie s'arrête quand ses N dernières requêtes (search_efficiency_window)
+    # apportent moins de search_min_new_domains nouveaux domaines par requête (0 = jamais)
+    search_min_new_domains: float = 0.5
+    search_efficiency_window: int = 8
+
+    # Classification LLM de la pertinence (lots envoyés en parallèle)
+    relevance_concurrency: int = 2  # Appels LLM simultanés (cf. OLLAMA_NUM_PARALLEL)
+    relevance_batch_size: int = 15  # Taille initiale des lots, ajustée selon les échecs de parsing
+    relevance_min_batch_size: int = 5
+    relevance_max_batch_size: int = 30
+    relevance_max_failure_rate: float = 0.25  # Au-delà, la taille des lots est divisée par deux
+
     # Seuils de filtrage
     min_relevance_score: float = 0.45
     min_confidence_score: float = 0.35
@@ -71,6 +104,14 @@ class CompetitorSearchConfig:
     # Optimisation articles
     max_articles_per_domain: int = 500
 
+    # Règles d'exclusion compilées (reconstruites si une liste change)
+    _matcher: Optional[ExclusionMatcher] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _matcher_signature: Optional[Tuple[Any, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         """Initialiser les valeurs par défaut."""
         self._init_esn_keywords()
@@ -86,6 +127,7 @@ class CompetitorSearchConfig:
         self._init_excluded_business_sale()
         self._init_excluded_directories()
         self._init_max_per_category()
+        self._init_search_limits()
 
     def _init_esn_keywords(self) -> None:
         """Initialiser les mots-clés ESN."""
@@ -740,6 +782,14 @@ class CompetitorSearchConfig:
                 "autre": 20,
             }
 
+    def _init_search_limits(self) -> None:
+        """Limites d'appels par moteur de recherche."""
+        if self.search_provider_concurrency is None:
+            self.search_provider_concurrency = {"tavily": 4, "duckduckgo": 2}
+        if self.search_provider_interval is None:
+            # DuckDuckGo bloque rapidement les rafales de requêtes
+            self.search_provider_interval = {"tavily": 0.2, "duckduckgo": 1.0}
+
     def is_excluded_domain(self, domain: str) -> bool:
         """Vérifier si un domaine est exclu."""
         reason = self.get_exclusion_reason(domain)
@@ -755,68 +805,33 @@ class CompetitorSearchConfig:
         Returns:
             Tuple (catégorie, raison) si exclu, None sinon
         """
-        domain_lower = domain.lower()
-        
-        # 1. Vérifier TLDs exclus
-        for tld in self.excluded_tlds:
-            if domain_lower.endswith(tld):
-                return ("tld", f"TLD exclu: {tld}")
-        
-        # 2. Vérifier domaines exacts dans chaque catégorie
-        if self.excluded_job_sites and domain_lower in self.excluded_job_sites:
-            return ("job_site", f"Site d'emploi: {domain_lower}")
-        
-        if self.excluded_ecommerce and domain_lower in self.excluded_ecommerce:
-            return ("ecommerce", f"E-commerce: {domain_lower}")
-        
-        if self.excluded_universities and domain_lower in self.excluded_universities:
-            return ("university", f"Université/École: {domain_lower}")
-        
-        if self.excluded_public_services and domain_lower in self.excluded_public_services:
-            return ("public_service", f"Service public: {domain_lower}")
-        
-        if self.excluded_business_sale and domain_lower in self.excluded_business_sale:
-            return ("business_sale", f"Reprise/Vente entreprise: {domain_lower}")
-        
-        if self.excluded_directories and domain_lower in self.excluded_directories:
-            return ("directory", f"Annuaire: {domain_lower}")
-        
-        if self.excluded_domains and domain_lower in self.excluded_domains:
-            return ("domain", f"Domaine exclu: {domain_lower}")
-        
-        # 3. Vérifier patterns (outils, médias, plateformes)
-        if self.excluded_tools:
-            for tool in self.excluded_tools:
-                if tool in domain_lower:
-                    return ("tool", f"Outil SEO/Analytics: {tool}")
-        
-        if self.excluded_media:
-            for media in self.excluded_media:
-                if media in domain_lower:
-                    return ("media", f"Média/Presse: {media}")
-        
-        if self.excluded_listing_platforms:
-            for platform in self.excluded_listing_platforms:
-                if platform in domain_lower:
-                    return ("listing_platform", f"Plateforme de listing: {platform}")
-        
-        # 4. Patterns de détection par contenu du domaine
-        # Sites d'emploi
-        job_patterns = ["emploi", "job", "recrutement", "carriere", "career"]
-        if any(pattern in domain_lower for pattern in job_patterns):
-            return ("job_pattern", f"Pattern emploi détecté dans domaine")
-        
-        # Universités
-        univ_patterns = ["univ-", "universite", ".ac-", "ecole-", "ens-", "insa-"]
-        if any(pattern in domain_lower for pattern in univ_patterns):
-            return ("university_pattern", f"Pattern université détecté dans domaine")
-        
-        # Services publics
-        public_patterns = [".gouv.", "service-public", "servicepublic"]
-        if any(pattern in domain_lower for pattern in public_patterns):
-            return ("public_pattern", f"Pattern service public détecté dans domaine")
-        
-        return None
+        return self.get_matcher().exclusion_reason(domain)
+
+    def get_matcher(self) -> ExclusionMatcher:
+        """
+        Retourne les listes d'exclusion compilées (TLDs, domaines exacts, patterns).
+
+        Le matcher est construit une seule fois, puis reconstruit seulement si
+        une liste d'exclusion a été remplacée ou modifiée.
+
+        Returns:
+            ExclusionMatcher de cette configuration
+        """
+        signature = self._exclusion_signature()
+        if self._matcher is None or self._matcher_signature != signature:
+            self._matcher = ExclusionMatcher(self)
+            self._matcher_signature = signature
+        return self._matcher
+
+    def _exclusion_signature(self) -> Tuple[Any, ...]:
+        """
+        Listes d'exclusion et leurs tailles (toutes définies après __post_init__).
+
+        La comparaison des tuples teste d'abord l'identité de chaque liste :
+        seules les listes remplacées sont comparées par contenu.
+        """
+        values = _EXCLUSION_LISTS(self)
+        return (values, tuple(map(len, values)))
 
     def get_all_excluded_domains(self) -> Set[str]:
         """
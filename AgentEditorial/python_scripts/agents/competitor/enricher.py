@@ -1,5 +1,6 @@
 """Enricher for candidate domains with homepage content and semantic similarity."""
 
+import asyncio
 import re
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
@@ -8,6 +9,7 @@ import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from python_scripts.agents.competitor.config import CompetitorSearchConfig
+from python_scripts.ingestion.crawl_cache import session_lock
 from python_scripts.ingestion.crawl_pages import crawl_with_permissions
 from python_scripts.ingestion.text_cleaner import clean_html_text, extract_meta_description
 from python_scripts.utils.logging import get_logger
@@ -23,98 +25,202 @@ class CandidateEnricher:
         """Initialize enricher."""
         self.config = config
         self.db_session = db_session
+        # Embeddings by text, shared by enrichment and similarity scoring
+        self._embeddings: Dict[str, np.ndarray] = {}
+        self._embedding_lock = asyncio.Lock()
 
     async def enrich_candidates(
         self,
         candidates: List[Dict[str, Any]],
         max_candidates: int = 50,
+        target_text: Optional[str] = None,
+        target_count: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Enrich top candidates with homepage content.
 
+        Homepages are crawled and parsed concurrently (config.enrichment_concurrency
+        at a time), each within config.enrichment_timeout seconds. Results are
+        awaited in rank order: once the `target_count` best-ranked enrichable
+        candidates are enriched, the crawls of lower-ranked candidates still
+        running are cancelled. With a target text, the semantic similarity of
+        a candidate is computed as soon as its page is parsed.
+
         Args:
             candidates: List of candidate dictionaries
             max_candidates: Maximum number of candidates to enrich
+            target_text: Target text for semantic similarity (optional)
+            target_count: Enriched candidates (in rank order) after which
+                enrichment stops (default: config.enrichment_target, 0 to enrich all)
 
         Returns:
-            Enriched candidates list
+            Enriched candidates list, in the original order (enriched=False
+            for failed, timed-out or skipped candidates)
         """
         # Limit to top candidates
-        candidates_to_enrich = candidates[:max_candidates]
-        enriched: List[Dict[str, Any]] = []
+        candidates_to_enrich = [c for c in candidates[:max_candidates] if c.get("domain")]
+        if target_count is None:
+            target_count = self.config.enrichment_target
         logger.info(
             "Starting candidate enrichment",
             total_candidates=len(candidates),
             candidates_to_enrich=len(candidates_to_enrich),
+            concurrency=self.config.enrichment_concurrency,
+            target_count=target_count,
         )
 
-        for i, candidate in enumerate(candidates_to_enrich, 1):
+        target_embedding = None
+        if target_text:
             try:
-                domain = candidate.get("domain", "")
-                if not domain:
-                    continue
-
-                url = f"https://{domain}"
-
-                # Crawl homepage
-                crawled = await crawl_with_permissions(
-                    url=url,
-                    db_session=self.db_session,
-                    use_cache=True,
-                    respect_robots=True,
-                )
-
-                if crawled and crawled.get("text"):
-                    # Extract description
-                    description = extract_meta_description(crawled.get("html", ""))
-                    if not description:
-                        # Use first paragraph as description
-                        text = crawled.get("text", "")
-                        first_paragraph = text.split("\n\n")[0] if text else ""
-                        description = first_paragraph[:300]  # Limit to 300 chars
-
-                    # Extract services section
-                    services = self._extract_services(crawled.get("html", ""), crawled.get("text", ""))
-
-                    # Extract activity keywords
-                    activity_keywords = self._extract_activity_keywords(crawled.get("text", ""))
-
-                    # Update candidate
-                    candidate["description"] = description
-                    candidate["services"] = services[:3]  # Limit to 3 services
-                    candidate["activity_keywords"] = activity_keywords[:5]  # Limit to 5 keywords
-                    candidate["enriched"] = True
-
-                enriched.append(candidate)
-                if i % 10 == 0:
-                    logger.debug(
-                        "Enrichment progress",
-                        processed=i,
-                        total=len(candidates_to_enrich),
-                        successfully_enriched=sum(1 for c in enriched if c.get("enriched", False)),
-                    )
-
+                target_embedding = await self._embed(target_text)
             except Exception as e:
-                logger.warning(
-                    "Failed to enrich candidate",
-                    domain=candidate.get("domain", ""),
-                    error=str(e),
-                    error_type=type(e).__name__,
+                logger.warning("Target embedding failed", error=str(e), error_type=type(e).__name__)
+
+        semaphore = asyncio.Semaphore(max(1, self.config.enrichment_concurrency))
+        progress = {"processed": 0, "enriched": 0}
+
+        async def enrich_one(candidate: Dict[str, Any]) -> None:
+            async with semaphore:
+                try:
+                    # Timeouts and early stops cancel the crawl, not the
+                    # statement in flight on the shared session (run_locked)
+                    await asyncio.wait_for(
+                        self._enrich_candidate(candidate),
+                        timeout=self.config.enrichment_timeout,
+                    )
+                except asyncio.TimeoutError:
+                    logger.debug("Candidate enrichment timed out", domain=candidate.get("domain", ""))
+                    candidate["enriched"] = False
+                except Exception as e:
+                    logger.warning(
+                        "Failed to enrich candidate",
+                        domain=candidate.get("domain", ""),
+                        error=str(e),
+                        error_type=type(e).__name__,
+                    )
+                    # Keep candidate without enrichment
+                    candidate["enriched"] = False
+
+            progress["processed"] += 1
+            if candidate.get("enriched"):
+                progress["enriched"] += 1
+                if target_embedding is not None:
+                    await self._score_candidate(candidate, target_embedding)
+            if progress["processed"] % 10 == 0:
+                logger.debug(
+                    "Enrichment progress",
+                    processed=progress["processed"],
+                    total=len(candidates_to_enrich),
+                    successfully_enriched=progress["enriched"],
                 )
-                # Keep candidate without enrichment
+
+        tasks = [asyncio.create_task(enrich_one(candidate)) for candidate in candidates_to_enrich]
+        ranked_enriched = 0
+        for index, (candidate, task) in enumerate(zip(candidates_to_enrich, tasks)):
+            await task
+            if candidate.get("enriched"):
+                ranked_enriched += 1
+            if target_count and ranked_enriched >= target_count:
+                # The best-ranked candidates are enriched: lower-ranked
+                # homepages still being crawled are dropped
+                remaining = tasks[index + 1:]
+                for pending in remaining:
+                    pending.cancel()
+                await asyncio.gather(*remaining, return_exceptions=True)
+                break
+        # Cache writes of abandoned crawls finish before the session is handed back
+        async with session_lock(self.db_session):
+            pass
+
+        skipped = 0
+        for candidate, task in zip(candidates_to_enrich, tasks):
+            if task.cancelled() and not candidate.get("enriched"):
                 candidate["enriched"] = False
-                enriched.append(candidate)
+                candidate["enrichment_skipped"] = True
+                skipped += 1
 
+        enriched = candidates_to_enrich
         successfully_enriched = sum(1 for c in enriched if c.get("enriched", False))
         logger.info(
             "Candidate enrichment completed",
             total_processed=len(enriched),
             successfully_enriched=successfully_enriched,
-            failed=len(enriched) - successfully_enriched,
+            skipped=skipped,
+            failed=len(enriched) - successfully_enriched - skipped,
             success_rate=round(successfully_enriched / len(enriched) * 100, 1) if enriched else 0,
         )
         return enriched
 
+    async def _enrich_candidate(self, candidate: Dict[str, Any]) -> None:
+        """Crawl and parse the homepage of a candidate."""
+        url = f"https://{candidate['domain']}"
+
+        # Crawl homepage
+        crawled = await crawl_with_permissions(
+            url=url,
+            db_session=self.db_session,
+            use_cache=True,
+            respect_robots=True,
+            timeout=self.config.enrichment_timeout,
+        )
+
+        if not (crawled and crawled.get("text")):
+            candidate["enriched"] = False
+            return
+
+        # Extract description
+        description = extract_meta_description(crawled.get("html", ""))
+        if not description:
+            # Use first paragraph as description
+            text = crawled.get("text", "")
+            first_paragraph = text.split("\n\n")[0] if text else ""
+            description = first_paragraph[:300]  # Limit to 300 chars
+
+        # Extract services section
+        services = self._extract_services(crawled.get("html", ""), crawled.get("text", ""))
+
+        # Extract activity keywords
+        activity_keywords = self._extract_activity_keywords(crawled.get("text", ""))
+
+        # Update candidate
+        candidate["description"] = description
+        candidate["services"] = services[:3]  # Limit to 3 services
+        candidate["activity_keywords"] = activity_keywords[:5]  # Limit to 5 keywords
+        candidate["enriched"] = True
+
+    async def _embed(self, text: str) -> np.ndarray:
+        """Embed a text off the event loop (one model call at a time, memoized)."""
+        embedding = self._embeddings.get(text)
+        if embedding is None:
+            async with self._embedding_lock:
+                embedding = self._embeddings.get(text)
+                if embedding is None:
+                    embedding = np.array(await asyncio.to_thread(generate_embedding, text))
+                    self._embeddings[text] = embedding
+        return embedding
+
+    async def _score_candidate(self, candidate: Dict[str, Any], target_embedding: np.ndarray) -> None:
+        """Compute the semantic similarity of a freshly enriched candidate."""
+        try:
+            candidate_embedding = await self._embed(self._candidate_text(candidate))
+        except Exception as e:
+            logger.debug("Candidate embedding failed", domain=candidate.get("domain", ""), error=str(e))
+            return
+        similarity = float(np.dot(target_embedding, candidate_embedding))
+        candidate["semantic_similarity"] = max(0.0, min(1.0, similarity))
+
+    @staticmethod
+    def _candidate_text(candidate: Dict[str, Any]) -> str:
+        """Text embedded for a candidate: description, services and keywords."""
+        text_parts = []
+        if candidate.get("description"):
+            text_parts.append(candidate["description"])
+        if candidate.get("services"):
+            text_parts.extend(candidate["services"])
+        if candidate.get("activity_keywords"):
+            text_parts.extend(candidate["activity_keywords"])
+        return " ".join(text_parts) or candidate.get("domain", "")
+
     def _extract_services(self, html: str, text: str) -> List[str]:
         """Extract services from content."""
         services: List[str] = []
@@ -215,30 +321,24 @@ class CandidateEnricher:
             Updated candidates with semantic_similarity scores
         """
         try:
-            # Generate target embedding
-            target_embedding = np.array(generate_embedding(target_text))
-
-            # Prepare candidate texts
-            candidate_texts = []
-            for candidate in candidates:
-                # Combine description, services, keywords
-                text_parts = []
-                if candidate.get("description"):
-                    text_parts.append(candidate["description"])
-                if candidate.get("services"):
-                    text_parts.extend(candidate["services"])
-                if candidate.get("activity_keywords"):
-                    text_parts.extend(candidate["activity_keywords"])
-                candidate_text = " ".join(text_parts) or candidate.get("domain", "")
-                candidate_texts.append(candidate_text)
-
-            # Generate embeddings batch
-            candidate_embeddings = generate_embeddings_batch(candidate_texts, batch_size=32)
+            # Embeddings computed during enrichment are reused
+            target_embedding = self._embeddings.get(target_text)
+            if target_embedding is None:
+                target_embedding = np.array(generate_embedding(target_text))
+                self._embeddings[target_text] = target_embedding
+
+            candidate_texts = [self._candidate_text(candidate) for candidate in candidates]
+            missing_texts = list(dict.fromkeys(t for t in candidate_texts if t not in self._embeddings))
+            if missing_texts:
+                for text, embedding in zip(
+                    missing_texts, generate_embeddings_batch(missing_texts, batch_size=32)
+                ):
+                    self._embeddings[text] = np.array(embedding)
+            candidate_embeddings = [self._embeddings.get(text) for text in candidate_texts]
 
             # Calculate cosine similarity
-            for i, candidate in enumerate(candidates):
-                if i < len(candidate_embeddings):
-                    candidate_emb = np.array(candidate_embeddings[i])
+            for candidate, candidate_emb in zip(candidates, candidate_embeddings):
+                if candidate_emb is not None:
                     # Cosine similarity (embeddings are already normalized)
                     similarity = float(np.dot(target_embedding, candidate_emb))
                     candidate["semantic_similarity"] = max(0.0, min(1.0, similarity))  # Clamp to [0, 1]
@@ -251,6 +351,7 @@ class CandidateEnricher:
             logger.info(
                 "Semantic similarity calculation completed",
                 candidates_processed=len(candidates),
+                embeddings_reused=len(candidate_texts) - len(missing_texts),
                 avg_similarity=round(avg_similarity, 3),
                 max_similarity=round(max_similarity, 3),
                 min_similarity=round(min_similarity, 3),
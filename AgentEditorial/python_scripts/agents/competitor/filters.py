@@ -1,14 +1,41 @@
 """Filters for competitor search results."""
 
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import AbstractSet, Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from python_scripts.agents.competitor.config import CompetitorSearchConfig
+from python_scripts.agents.competitor.matcher import KeywordMatcher, ordered_hits
 from python_scripts.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Texts (domains, titles + snippets) whose hits ComprehensiveFilter memoizes
+MATCHER_CACHE_SIZE = 20000
+
+
+def share_matcher(filters: List[Any]) -> KeywordMatcher:
+    """
+    Compile the patterns of several filters into one memoized matcher they all use.
+
+    Filters applied in sequence to the same results then scan each domain and
+    each title + snippet once for every category of every filter, instead of
+    once per filter.
+
+    Args:
+        filters: Filters exposing all_patterns() and domain/content matchers
+
+    Returns:
+        The shared KeywordMatcher
+    """
+    matcher = KeywordMatcher(
+        (pattern for f in filters for pattern in f.all_patterns()),
+        cache_size=MATCHER_CACHE_SIZE,
+    )
+    for f in filters:
+        f.domain_matcher = f.content_matcher = matcher
+    return matcher
+
 
 class PreFilter:
     """Pre-filter to exclude unwanted domains and URLs."""
@@ -21,6 +48,46 @@ class PreFilter:
         # Patterns pour la détection de contenu
         self._init_patterns()
 
+        # Catégories dans l'ordre de vérification, compilées en deux matchers :
+        # un passage sur le domaine et un sur le contenu pour toutes les catégories
+        self.content_categories: List[Tuple[str, Dict[str, List[str]]]] = [
+            ("job_site_content", self.job_patterns),
+            ("ecommerce_content", self.ecommerce_patterns),
+            ("university_content", self.university_patterns),
+            ("public_service_content", self.public_service_patterns),
+            ("business_sale_content", self.business_sale_patterns),
+            ("directory_content", self.directory_patterns),
+            ("media_content", self.media_patterns),
+            ("listing_platform_content", self.listing_platform_patterns),
+            ("seo_tool_content", self.seo_tool_patterns),
+        ]
+        self.domain_matcher = KeywordMatcher(
+            p for _, patterns in self.content_categories for p in patterns.get("domain", [])
+        )
+        self.content_matcher = KeywordMatcher(
+            kw for _, patterns in self.content_categories for kw in patterns.get("keywords", [])
+        )
+        # Pattern -> index des catégories qui le contiennent (une entrée par occurrence)
+        self._domain_index = self._index_patterns("domain")
+        self._keyword_index = self._index_patterns("keywords")
+
+    def _index_patterns(self, kind: str) -> Dict[str, List[int]]:
+        """Map each pattern of a kind (domain or keywords) to its categories."""
+        index: Dict[str, List[int]] = {}
+        for position, (_, patterns) in enumerate(self.content_categories):
+            for pattern in patterns.get(kind, []):
+                index.setdefault(pattern, []).append(position)
+        return index
+
+    def all_patterns(self) -> List[str]:
+        """Return the domain and content patterns of every category."""
+        return [
+            pattern
+            for _, patterns in self.content_categories
+            for key in ("domain", "keywords")
+            for pattern in patterns.get(key, [])
+        ]
+
     def _init_patterns(self) -> None:
         """Initialiser les patterns de détection."""
         # Patterns pour sites d'emploi/recrutement
@@ -208,49 +275,11 @@ class PreFilter:
             snippet = result.get("snippet", "").lower()
             combined_text = f"{title} {snippet}"
 
-            # Check for job site patterns
-            if self._matches_patterns(domain, combined_text, self.job_patterns):
-                excluded_reasons["job_site_content"] = excluded_reasons.get("job_site_content", 0) + 1
-                continue
-
-            # Check for e-commerce patterns
-            if self._matches_patterns(domain, combined_text, self.ecommerce_patterns):
-                excluded_reasons["ecommerce_content"] = excluded_reasons.get("ecommerce_content", 0) + 1
-                continue
-
-            # Check for university patterns
-            if self._matches_patterns(domain, combined_text, self.university_patterns):
-                excluded_reasons["university_content"] = excluded_reasons.get("university_content", 0) + 1
-                continue
-
-            # Check for public service patterns
-            if self._matches_patterns(domain, combined_text, self.public_service_patterns):
-                excluded_reasons["public_service_content"] = excluded_reasons.get("public_service_content", 0) + 1
-                continue
-
-            # Check for business sale patterns
-            if self._matches_patterns(domain, combined_text, self.business_sale_patterns):
-                excluded_reasons["business_sale_content"] = excluded_reasons.get("business_sale_content", 0) + 1
-                continue
-
-            # Check for directory patterns
-            if self._matches_patterns(domain, combined_text, self.directory_patterns):
-                excluded_reasons["directory_content"] = excluded_reasons.get("directory_content", 0) + 1
-                continue
-
-            # Check for media patterns
-            if self._matches_patterns(domain, combined_text, self.media_patterns):
-                excluded_reasons["media_content"] = excluded_reasons.get("media_content", 0) + 1
-                continue
-
-            # Check for listing platform patterns
-            if self._matches_patterns(domain, combined_text, self.listing_platform_patterns):
-                excluded_reasons["listing_platform_content"] = excluded_reasons.get("listing_platform_content", 0) + 1
-                continue
-
-            # Check for SEO tool patterns
-            if self._matches_patterns(domain, combined_text, self.seo_tool_patterns):
-                excluded_reasons["seo_tool_content"] = excluded_reasons.get("seo_tool_content", 0) + 1
+            # Check job, e-commerce, university, public service, business sale,
+            # directory, media, listing platform and SEO tool patterns
+            category = self._content_category(domain, combined_text)
+            if category:
+                excluded_reasons[category] = excluded_reasons.get(category, 0) + 1
                 continue
 
             # All checks passed
@@ -270,35 +299,59 @@ class PreFilter:
 
         return filtered
 
-    def _matches_patterns(
-        self, domain: str, combined_text: str, patterns: Dict[str, List[str]]
-    ) -> bool:
+    def _content_category(self, domain: str, combined_text: str) -> Optional[str]:
+        """
+        Return the first content category matched by a result, in check order.
+
+        The domain and the text are scanned once for the patterns of every
+        category; the hits are then counted per category.
+
+        Args:
+            domain: The domain to check
+            combined_text: Combined title and snippet text (lowercased)
+
+        Returns:
+            Category name (e.g. "job_site_content"), None if no category matches
+        """
+        domain_hits = self.domain_matcher.find_all(domain)
+        keyword_hits = self.content_matcher.find_all(combined_text)
+        if not domain_hits and not keyword_hits:
+            return None
+
+        domain_matches = self._count_hits(domain_hits, self._domain_index)
+        keyword_matches = self._count_hits(keyword_hits, self._keyword_index)
+        for position, (name, _) in enumerate(self.content_categories):
+            if self._matches_patterns(domain_matches[position], keyword_matches[position]):
+                return name
+        return None
+
+    def _count_hits(self, hits: AbstractSet[str], index: Dict[str, List[int]]) -> List[int]:
+        """Count the patterns found per category."""
+        counts = [0] * len(self.content_categories)
+        for pattern in hits:
+            for position in index.get(pattern, ()):
+                counts[position] += 1
+        return counts
+
+    @staticmethod
+    def _matches_patterns(domain_matches: int, keyword_matches: int) -> bool:
         """
-        Check if domain or content matches the given patterns.
+        Check if domain or content matches the patterns of a category.
         
         For content patterns, we require STRONG matches (multiple keywords or 
         keyword + domain pattern) to avoid false positives.
 
         Args:
-            domain: The domain to check
-            combined_text: Combined title and snippet text
-            patterns: Dictionary with 'domain' and 'keywords' lists
+            domain_matches: Number of the category's domain patterns found in the domain
+            keyword_matches: Number of the category's keywords found in title and snippet
 
         Returns:
             True if matches patterns
         """
-        domain_lower = domain.lower()
-        
-        # Check domain patterns
-        domain_matches = sum(1 for p in patterns.get("domain", []) if p in domain_lower)
-        
         # If domain strongly matches (2+ patterns), it's likely this category
         if domain_matches >= 2:
             return True
         
-        # Check content keywords
-        keyword_matches = sum(1 for kw in patterns.get("keywords", []) if kw in combined_text)
-        
         # If domain partially matches AND content matches, it's this category
         if domain_matches >= 1 and keyword_matches >= 1:
             return True
@@ -442,6 +495,22 @@ class ContentFilter:
             ],
         }
 
+        # Indicateurs ESN forts (bonus)
+        self.esn_strong_indicators = [
+            "esn", "ssii", "services numériques", "services informatiques",
+        ]
+
+        # Tous les mots-clés compilés : un seul passage sur le texte et sur le domaine
+        self.domain_matcher = self.content_matcher = KeywordMatcher(self.all_patterns())
+
+    def all_patterns(self) -> List[str]:
+        """Return the negative, positive and strong ESN keywords."""
+        return (
+            [kw for keywords in self.negative_keywords.values() for kw in keywords]
+            + [kw for keywords in self.positive_keywords.values() for kw in keywords]
+            + self.esn_strong_indicators
+        )
+
     def validate_business_content(self, result: Dict[str, Any]) -> Tuple[bool, str]:
         """
         Validate that result has business content indicators.
@@ -465,9 +534,10 @@ class ContentFilter:
         # Compteur de signaux négatifs
         negative_score = 0
         negative_reasons = []
+        text_hits = self.content_matcher.find_all(combined_text)
         
         for category, keywords in self.negative_keywords.items():
-            matches = [kw for kw in keywords if kw in combined_text]
+            matches = ordered_hits(keywords, text_hits)
             if matches:
                 negative_score += len(matches)
                 negative_reasons.append(f"{category}:{len(matches)}")
@@ -487,16 +557,16 @@ class ContentFilter:
         
         positive_score = 0
         positive_reasons = []
+        hits = text_hits | self.domain_matcher.find_all(domain)
         
         for category, keywords in self.positive_keywords.items():
-            matches = [kw for kw in keywords if kw in combined_text or kw in domain]
+            matches = ordered_hits(keywords, hits)
             if matches:
                 positive_score += len(matches)
                 positive_reasons.append(f"{category}:{len(matches)}")
 
         # Bonus pour les indicateurs ESN forts
-        esn_strong_indicators = ["esn", "ssii", "services numériques", "services informatiques"]
-        if any(ind in combined_text or ind in domain for ind in esn_strong_indicators):
+        if ordered_hits(self.esn_strong_indicators, hits):
             positive_score += 3
             positive_reasons.append("esn_strong:3")
 
@@ -585,6 +655,13 @@ class MediaFilter:
             "édition", "rédaction", "journaliste", "interview",
         ]
 
+        self.domain_matcher = KeywordMatcher(self.media_domain_patterns)
+        self.content_matcher = KeywordMatcher(self.media_content_patterns)
+
+    def all_patterns(self) -> List[str]:
+        """Return the media domain and content patterns."""
+        return self.media_domain_patterns + self.media_content_patterns
+
     def is_media_site(self, result: Dict[str, Any]) -> Tuple[bool, str]:
         """
         Check if result is from a media/news site.
@@ -601,18 +678,17 @@ class MediaFilter:
         combined_text = f"{title} {snippet}"
 
         # Check excluded media domains from config
-        if self.config.excluded_media:
-            for media in self.config.excluded_media:
-                if media in domain:
-                    return True, f"Média exclu (config): {media}"
+        media = self.config.get_matcher().excluded_pattern("media", domain)
+        if media:
+            return True, f"Média exclu (config): {media}"
 
         # Check for media patterns in domain
-        domain_matches = [p for p in self.media_domain_patterns if p in domain]
+        domain_matches = self.domain_matcher.ordered_hits(self.media_domain_patterns, domain)
         if len(domain_matches) >= 2:
             return True, f"Patterns média dans domaine: {domain_matches}"
 
         # Check for media patterns in content
-        content_matches = [p for p in self.media_content_patterns if p in combined_text]
+        content_matches = self.content_matcher.ordered_hits(self.media_content_patterns, combined_text)
         
         # Domain partial match + content match = media
         if len(domain_matches) >= 1 and len(content_matches) >= 2:
@@ -685,6 +761,13 @@ class JobSiteFilter:
             "salaire", "rémunération", "avantages", "package salarial",
         ]
 
+        self.domain_matcher = KeywordMatcher(self.job_domain_patterns)
+        self.content_matcher = KeywordMatcher(self.job_content_patterns)
+
+    def all_patterns(self) -> List[str]:
+        """Return the job domain and content patterns."""
+        return self.job_domain_patterns + self.job_content_patterns
+
     def is_job_site(self, result: Dict[str, Any]) -> Tuple[bool, str]:
         """
         Check if result is from a job/recruitment site.
@@ -701,18 +784,17 @@ class JobSiteFilter:
         combined_text = f"{title} {snippet}"
 
         # Check excluded job sites from config
-        if self.config.excluded_job_sites:
-            for job_site in self.config.excluded_job_sites:
-                if job_site in domain or domain == job_site:
-                    return True, f"Site d'emploi exclu (config): {job_site}"
+        job_site = self.config.get_matcher().excluded_pattern("job_site", domain)
+        if job_site:
+            return True, f"Site d'emploi exclu (config): {job_site}"
 
         # Check for job patterns in domain
-        domain_matches = [p for p in self.job_domain_patterns if p in domain]
+        domain_matches = self.domain_matcher.ordered_hits(self.job_domain_patterns, domain)
         if len(domain_matches) >= 2:
             return True, f"Patterns emploi dans domaine: {domain_matches}"
 
         # Check for job patterns in content
-        content_matches = [p for p in self.job_content_patterns if p in combined_text]
+        content_matches = self.content_matcher.ordered_hits(self.job_content_patterns, combined_text)
         
         # Domain partial match + content match = job site
         if len(domain_matches) >= 1 and len(content_matches) >= 2:
@@ -779,6 +861,13 @@ class DirectoryFilter:
             "entreprises similaires", "concurrents de", "alternatives à",
         ]
 
+        self.domain_matcher = KeywordMatcher(self.directory_domain_patterns)
+        self.content_matcher = KeywordMatcher(self.directory_content_patterns)
+
+    def all_patterns(self) -> List[str]:
+        """Return the directory domain and content patterns."""
+        return self.directory_domain_patterns + self.directory_content_patterns
+
     def is_directory(self, result: Dict[str, Any]) -> Tuple[bool, str]:
         """
         Check if result is from a directory/listing site.
@@ -795,18 +884,17 @@ class DirectoryFilter:
         combined_text = f"{title} {snippet}"
 
         # Check excluded directories from config
-        if self.config.excluded_directories:
-            for directory in self.config.excluded_directories:
-                if directory in domain or domain == directory:
-                    return True, f"Annuaire exclu (config): {directory}"
+        directory = self.config.get_matcher().excluded_pattern("directory", domain)
+        if directory:
+            return True, f"Annuaire exclu (config): {directory}"
 
         # Check for directory patterns in domain
-        domain_matches = [p for p in self.directory_domain_patterns if p in domain]
+        domain_matches = self.domain_matcher.ordered_hits(self.directory_domain_patterns, domain)
         if len(domain_matches) >= 1:
             return True, f"Pattern annuaire dans domaine: {domain_matches}"
 
         # Check for directory patterns in content
-        content_matches = [p for p in self.directory_content_patterns if p in combined_text]
+        content_matches = self.content_matcher.ordered_hits(self.directory_content_patterns, combined_text)
         
         # Strong content match with directory indicators
         if len(content_matches) >= 3:
@@ -859,6 +947,15 @@ class ComprehensiveFilter:
         self.job_filter = JobSiteFilter(config)
         self.directory_filter = DirectoryFilter(config)
 
+        # Un matcher commun à tous les filtres : chaque texte analysé une seule fois
+        self.matcher = share_matcher([
+            self.pre_filter,
+            self.job_filter,
+            self.directory_filter,
+            self.media_filter,
+            self.content_filter,
+        ])
+
     def filter(
         self, 
         results: List[Dict[str, Any]], 
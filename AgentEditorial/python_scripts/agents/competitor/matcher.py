@@ -0,0 +1,434 @@
+"""Compiled pattern matchers for competitor exclusion rules.
+
+The competitor filters check search results (domain, title, snippet) against
+several hundred exclusion patterns. KeywordMatcher returns every pattern found
+in a text in one pass, SuffixMatcher checks the excluded TLDs with one walk of
+a reversed trie, and ExclusionMatcher compiles the lists of a
+CompetitorSearchConfig once to compute exclusion reasons.
+"""
+
+import importlib.util
+import re
+import sys
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from python_scripts.agents.competitor.config import CompetitorSearchConfig
+
+# Trie key marking the end of a pattern (characters are never empty strings)
+_END = ""
+
+# C Aho-Corasick automaton (pyahocorasick, a project dependency)
+AHOCORASICK_AVAILABLE = importlib.util.find_spec("ahocorasick") is not None
+
+# Without the automaton, smaller sets are always checked with `pattern in text`
+REGEX_MIN_PATTERNS = 64
+
+# Domains kept by ExclusionMatcher before its memo is reset
+MAX_CACHED_DOMAINS = 20000
+
+# Exact-domain lists, checked in this order (first list containing the domain wins)
+EXACT_DOMAIN_RULES: Tuple[Tuple[str, str, str], ...] = (
+    ("excluded_job_sites", "job_site", "Site d'emploi"),
+    ("excluded_ecommerce", "ecommerce", "E-commerce"),
+    ("excluded_universities", "university", "Université/École"),
+    ("excluded_public_services", "public_service", "Service public"),
+    ("excluded_business_sale", "business_sale", "Reprise/Vente entreprise"),
+    ("excluded_directories", "directory", "Annuaire"),
+    ("excluded_domains", "domain", "Domaine exclu"),
+)
+
+# Substring lists of the config, checked in this order after the exact domains
+SUBSTRING_RULES: Tuple[Tuple[str, str, str], ...] = (
+    ("excluded_tools", "tool", "Outil SEO/Analytics"),
+    ("excluded_media", "media", "Média/Presse"),
+    ("excluded_listing_platforms", "listing_platform", "Plateforme de listing"),
+)
+
+# Built-in patterns detected in the domain name, checked last
+DOMAIN_PATTERN_RULES: Tuple[Tuple[str, Tuple[str, ...], str], ...] = (
+    (
+        "job_pattern",
+        ("emploi", "job", "recrutement", "carriere", "career"),
+        "Pattern emploi détecté dans domaine",
+    ),
+    (
+        "university_pattern",
+        ("univ-", "universite", ".ac-", "ecole-", "ens-", "insa-"),
+        "Pattern université détecté dans domaine",
+    ),
+    (
+        "public_pattern",
+        (".gouv.", "service-public", "servicepublic"),
+        "Pattern service public détecté dans domaine",
+    ),
+)
+
+# Config lists also used as substrings by the job site and directory filters
+FILTER_SUBSTRING_LISTS: Tuple[Tuple[str, str], ...] = (
+    ("excluded_job_sites", "job_site"),
+    ("excluded_directories", "directory"),
+)
+
+
+def _trie_pattern(node: Dict[str, dict]) -> str:
+    """Render a character trie as a regex matching the longest pattern at a position."""
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char != _END
+    ]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    # Greedy optional group: try the longer patterns first, end here otherwise
+    return f"(?:{body})?" if _END in node else body
+
+
+def ordered_hits(patterns: Sequence[str], found: AbstractSet[str]) -> List[str]:
+    """
+    Return the patterns of a list that were found, in list order.
+
+    Args:
+        patterns: Pattern list of one category (duplicates are kept)
+        found: Patterns returned by KeywordMatcher.find_all
+
+    Returns:
+        Matched patterns, as ``[p for p in patterns if p in text]`` would list them
+    """
+    if not found:
+        return []
+    return [pattern for pattern in patterns if pattern in found]
+
+
+def most_specific(patterns: Iterable[str]) -> Optional[str]:
+    """Return the longest pattern (alphabetical order on ties), None if there is none."""
+    return min(patterns, key=lambda pattern: (-len(pattern), pattern), default=None)
+
+
+class KeywordMatcher:
+    """
+    Find every pattern occurring in a text in a single pass.
+
+    The result is the set ``{p for p in patterns if p in text}``, computed by
+    one of three backends:
+
+    - ``automaton``: an Aho-Corasick automaton (pyahocorasick, when installed)
+      reporting every occurrence, overlapping ones included, in one C pass.
+    - ``regex``: the patterns merged into a prefix trie rendered as one regular
+      expression. Each match yields the longest pattern starting at that
+      position, the shorter patterns it starts with come from a precomputed
+      table, and the scan resumes one character later for overlaps.
+    - ``substring``: the direct ``pattern in text`` loop.
+
+    By default the automaton is used (faster than the substring loop from a
+    few patterns on). Without it, the regex is only used for texts shorter
+    than half the number of patterns (domains checked against hundreds of
+    patterns): on longer texts, or for sets under REGEX_MIN_PATTERNS,
+    CPython's per-pattern substring search is cheaper than the per-position
+    cost of the regex engine.
+
+    A matcher built over the patterns of several filters can be shared by
+    them: each filter keeps the hits of its own lists with ordered_hits, and
+    the memo (when cache_size > 0) makes the later filters reuse the scan.
+    """
+
+    def __init__(
+        self, patterns: Iterable[str], cache_size: int = 0, backend: Optional[str] = None
+    ) -> None:
+        """
+        Compile the patterns.
+
+        Args:
+            patterns: Substrings to look for (already lowercased, empty ones are ignored)
+            cache_size: Texts whose hits are memoized (0 = no memo)
+            backend: automaton, regex or substring (default: chosen as described above)
+        """
+        self.patterns: FrozenSet[str] = frozenset(pattern for pattern in patterns if pattern)
+        self.cache_size = cache_size
+        self._cache: Dict[str, FrozenSet[str]] = {}
+        self._substrings = tuple(self.patterns)
+        self._automaton: Any = None
+        self._regex: Optional[re.Pattern] = None
+        # Pattern -> patterns it starts with (including itself), for the regex backend
+        self._prefixes: Dict[str, Tuple[str, ...]] = {}
+        # Longest text scanned with the regex (longer ones use the substring loop)
+        self._regex_max_length = len(self.patterns) // 2
+
+        if backend is None:
+            if AHOCORASICK_AVAILABLE:
+                backend = "automaton"
+            elif len(self.patterns) >= REGEX_MIN_PATTERNS:
+                backend = "regex"
+            else:
+                backend = "substring"
+        elif backend == "regex":
+            self._regex_max_length = sys.maxsize
+        if backend not in ("automaton", "regex", "substring"):
+            raise ValueError(f"Unknown matcher backend: {backend}")
+        self.backend = backend
+
+        if not self.patterns:
+            self.backend = "substring"
+        elif backend == "automaton":
+            self._automaton = self._build_automaton()
+        elif backend == "regex":
+            self._regex = self._build_regex()
+        # No compiled scan or memo to reuse: ordered_hits checks the list directly
+        self._direct = self.backend == "substring" and not cache_size
+
+    def _build_automaton(self) -> Any:
+        """Build the Aho-Corasick automaton (value of each word: the pattern itself)."""
+        import ahocorasick
+
+        automaton = ahocorasick.Automaton()
+        for pattern in self.patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return automaton
+
+    def _build_regex(self) -> re.Pattern:
+        """Build the trie regex and the prefix table of each pattern."""
+        root: Dict[str, dict] = {}
+        for pattern in self.patterns:
+            node = root
+            for char in pattern:
+                node = node.setdefault(char, {})
+            node[_END] = {}
+
+        for pattern in self.patterns:
+            node = root
+            prefixes = []
+            for index, char in enumerate(pattern, 1):
+                node = node[char]
+                if _END in node:
+                    prefixes.append(pattern[:index])
+            self._prefixes[pattern] = tuple(prefixes)
+
+        return re.compile(_trie_pattern(root))
+
+    def find_all(self, text: str) -> FrozenSet[str]:
+        """
+        Return every pattern occurring in the text.
+
+        Args:
+            text: Text to scan (lowercased by the caller)
+
+        Returns:
+            Set of matched patterns
+        """
+        if not text or not self.patterns:
+            return frozenset()
+        if self.cache_size:
+            cached = self._cache.get(text)
+            if cached is not None:
+                return cached
+
+        if self._automaton is not None:
+            hits = frozenset([pattern for _, pattern in self._automaton.iter(text)])
+        elif self._regex is not None and len(text) <= self._regex_max_length:
+            hits = self._scan_regex(text)
+        else:
+            hits = frozenset([pattern for pattern in self._substrings if pattern in text])
+
+        if self.cache_size:
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[text] = hits
+        return hits
+
+    def ordered_hits(self, patterns: Sequence[str], text: str) -> List[str]:
+        """
+        Return the patterns of a list occurring in the text, in list order.
+
+        Without a compiled scan or a memo to reuse, the list is checked
+        directly (one pass instead of find_all followed by ordered_hits).
+
+        Args:
+            patterns: Non-empty patterns of one category, compiled into this matcher
+            text: Text to scan (lowercased by the caller)
+
+        Returns:
+            Matched patterns, as ``[p for p in patterns if p in text]`` would list them
+        """
+        if self._direct:
+            return [pattern for pattern in patterns if pattern in text]
+        return ordered_hits(patterns, self.find_all(text))
+
+    def _scan_regex(self, text: str) -> FrozenSet[str]:
+        """Overlapping scan with the trie regex."""
+        found = set()
+        search = self._regex.search
+        match = search(text)
+        while match is not None:
+            longest = match.group()
+            if longest not in found:
+                found.update(self._prefixes[longest])
+            match = search(text, match.start() + 1)
+        return frozenset(found)
+
+
+class SuffixMatcher:
+    """Reversed character trie answering ``text.endswith(suffix)`` for a set of suffixes."""
+
+    def __init__(self, suffixes: Iterable[str]) -> None:
+        """
+        Build the trie.
+
+        Args:
+            suffixes: Suffixes to look for (e.g. excluded TLDs, already lowercased)
+        """
+        self._root: Dict[str, dict] = {}
+        for suffix in suffixes:
+            if not suffix:
+                continue
+            node = self._root
+            for char in reversed(suffix):
+                node = node.setdefault(char, {})
+            node[_END] = suffix
+
+    def longest_match(self, text: str) -> Optional[str]:
+        """
+        Return the longest suffix the text ends with.
+
+        Args:
+            text: Text to check (e.g. a lowercased domain)
+
+        Returns:
+            The matched suffix, None if the text ends with none of them
+        """
+        node = self._root
+        matched = None
+        for char in reversed(text):
+            node = node.get(char)
+            if node is None:
+                break
+            matched = node.get(_END, matched)
+        return matched
+
+
+class ExclusionMatcher:
+    """
+    Exclusion rules of a CompetitorSearchConfig compiled for one-pass lookups.
+
+    A domain is checked with one walk of the TLD suffix trie, one dictionary
+    lookup for the exact-domain lists and one scan of a KeywordMatcher holding
+    every substring rule. Results are memoized per domain, search results
+    repeating the same sites across queries.
+    """
+
+    def __init__(self, config: "CompetitorSearchConfig") -> None:
+        """
+        Compile the exclusion lists of a configuration.
+
+        Args:
+            config: Competitor search configuration
+        """
+        self._tlds = SuffixMatcher(config.excluded_tlds or ())
+
+        # Domain -> (category, label) of the first exact list containing it
+        self._exact: Dict[str, Tuple[str, str]] = {}
+        for attribute, category, label in EXACT_DOMAIN_RULES:
+            for domain in getattr(config, attribute) or ():
+                self._exact.setdefault(domain, (category, label))
+
+        # Category -> substring patterns
+        self._substrings: Dict[str, FrozenSet[str]] = {}
+        for attribute, category, _label in SUBSTRING_RULES:
+            self._substrings[category] = frozenset(getattr(config, attribute) or ())
+        for attribute, category in FILTER_SUBSTRING_LISTS:
+            self._substrings[category] = frozenset(getattr(config, attribute) or ())
+        for category, patterns, _reason in DOMAIN_PATTERN_RULES:
+            self._substrings[category] = frozenset(patterns)
+
+        self._keywords = KeywordMatcher(
+            pattern for patterns in self._substrings.values() for pattern in patterns
+        )
+        # Per-category matchers, for domains not scanned by exclusion_reason yet
+        self._category_matchers = {
+            category: KeywordMatcher(patterns) for category, patterns in self._substrings.items()
+        }
+        self._scans: Dict[str, Tuple[Optional[Tuple[str, str]], FrozenSet[str]]] = {}
+
+    def exclusion_reason(self, domain: str) -> Optional[Tuple[str, str]]:
+        """
+        Return the exclusion reason of a domain.
+
+        Args:
+            domain: Domain to check
+
+        Returns:
+            Tuple (category, reason) if excluded, None otherwise
+        """
+        return self._scan(domain.lower())[0]
+
+    def excluded_pattern(self, category: str, domain: str) -> Optional[str]:
+        """
+        Return the most specific pattern of a substring category found in a domain.
+
+        Args:
+            category: One of tool, media, listing_platform, job_site or directory
+            domain: Domain to check
+
+        Returns:
+            The matched pattern, None if no pattern of the category occurs in the domain
+        """
+        domain = domain.lower()
+        cached = self._scans.get(domain)
+        if cached is not None:
+            return most_specific(cached[1] & self._substrings[category])
+        # Domain not seen by exclusion_reason yet: one category is cheaper than a full scan
+        return most_specific(self._category_matchers[category].find_all(domain))
+
+    def _scan(self, domain: str) -> Tuple[Optional[Tuple[str, str]], FrozenSet[str]]:
+        """Compute (exclusion reason, substring hits) of a lowercased domain, memoized."""
+        cached = self._scans.get(domain)
+        if cached is not None:
+            return cached
+
+        hits = self._keywords.find_all(domain)
+        scan = (self._reason(domain, hits), hits)
+        if len(self._scans) >= MAX_CACHED_DOMAINS:
+            self._scans.clear()
+        self._scans[domain] = scan
+        return scan
+
+    def _reason(self, domain: str, hits: FrozenSet[str]) -> Optional[Tuple[str, str]]:
+        """Apply the rules in their order of precedence."""
+        # 1. TLDs exclus
+        tld = self._tlds.longest_match(domain)
+        if tld is not None:
+            return ("tld", f"TLD exclu: {tld}")
+
+        # 2. Domaines exacts, par catégorie
+        exact = self._exact.get(domain)
+        if exact is not None:
+            category, label = exact
+            return (category, f"{label}: {domain}")
+
+        if not hits:
+            return None
+
+        # 3. Patterns des listes (outils, médias, plateformes)
+        for _attribute, category, label in SUBSTRING_RULES:
+            pattern = most_specific(hits & self._substrings[category])
+            if pattern is not None:
+                return (category, f"{label}: {pattern}")
+
+        # 4. Patterns intégrés détectés dans le nom de domaine
+        for category, _patterns, reason in DOMAIN_PATTERN_RULES:
+            if hits & self._substrings[category]:
+                return (category, reason)
+
+        return None
@@ -1,6 +1,6 @@
 """Query generator for competitor search with multiple strategies."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from python_scripts.agents.competitor.config import CompetitorSearchConfig
 from python_scripts.utils.logging import get_logger
@@ -15,6 +15,8 @@ class QueryGenerator:
         """Initialize query generator."""
         self.config = config
         self.strategy_performance: Dict[str, Dict[str, int]] = {}
+        # (queries_executed, valid_results) of each tracked batch, per strategy
+        self.strategy_history: Dict[str, List[Tuple[int, int]]] = {}
 
     def extract_keywords_from_profile(self, profile: Dict[str, Any]) -> List[str]:
         """
@@ -198,13 +200,16 @@ class QueryGenerator:
         self.strategy_performance[strategy]["queries_executed"] += queries_executed
         self.strategy_performance[strategy]["results_found"] += results_found
         self.strategy_performance[strategy]["valid_results"] += valid_results
+        self.strategy_history.setdefault(strategy, []).append((queries_executed, valid_results))
 
-    def get_strategy_efficiency(self, strategy: str) -> float:
+    def get_strategy_efficiency(self, strategy: str, window: Optional[int] = None) -> float:
         """
         Get efficiency score for a strategy.
 
         Args:
             strategy: Strategy name
+            window: Only count the most recent batches covering at least this
+                many queries (marginal efficiency); None for the whole history
 
         Returns:
             Efficiency score (valid_results / queries_executed)
@@ -212,6 +217,15 @@ class QueryGenerator:
         if strategy not in self.strategy_performance:
             return 0.0
 
+        if window:
+            queries = valid = 0
+            for batch_queries, batch_valid in reversed(self.strategy_history.get(strategy, [])):
+                queries += batch_queries
+                valid += batch_valid
+                if queries >= window:
+                    break
+            return valid / queries if queries else 0.0
+
         perf = self.strategy_performance[strategy]
         queries = perf.get("queries_executed", 0)
         if queries == 0:
@@ -0,0 +1,428 @@
+"""Concurrent, cached fan-out of competitor search queries to the search providers.
+
+Queries are sent in batches (config.search_batch_size at a time) to every
+provider concurrently. Each provider has its own limit of simultaneous calls
+and minimum delay between two calls, so a slow or strict provider (DuckDuckGo)
+does not hold back the others.
+
+Non-empty result lists are stored in a SQLite cache keyed by provider,
+normalized query and requested number of results, with a TTL: re-running a
+search for the same domain does not pay for the same queries again. Empty
+lists are not cached, because the providers also return [] on errors.
+
+After each batch, the new domains brought by each query are reported to the
+QueryGenerator. A strategy whose last queries bring fewer new domains per
+query than config.search_min_new_domains is stopped: its remaining queries
+are skipped.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from python_scripts.agents.competitor.config import CompetitorSearchConfig
+from python_scripts.agents.competitor.query_generator import QueryGenerator
+from python_scripts.config.settings import settings
+from python_scripts.utils.logging import get_logger
+from python_scripts.vectorstore.embedding_cache import normalize_text
+
+logger = get_logger(__name__)
+
+# A provider takes a query and returns result dicts (url, domain, title, snippet, source)
+SearchProvider = Callable[[str], Awaitable[List[Dict[str, Any]]]]
+
+# Expired entries are purged every N writes
+PURGE_INTERVAL = 500
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for caching (whitespace and case)."""
+    return normalize_text(query).lower()
+
+
+def make_search_key(provider: str, query: str, max_results: Optional[int] = None) -> str:
+    """
+    Build the cache key of a provider call.
+
+    Args:
+        provider: Provider name
+        query: Search query
+        max_results: Number of results requested from the provider
+
+    Returns:
+        Hex digest
+    """
+    raw = json.dumps([provider, normalize_query(query), max_results])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SearchResultCache:
+    """SQLite-backed search result cache with TTL and LRU eviction."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        """
+        Open (or create) the cache.
+
+        Args:
+            path: SQLite file (default: settings.competitor_search_cache_path)
+            ttl_seconds: Lifetime of an entry
+                (default: settings.competitor_search_cache_ttl_hours)
+            max_entries: Maximum number of entries
+                (default: settings.competitor_search_cache_max_entries)
+        """
+        self.path = Path(path or settings.competitor_search_cache_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else settings.competitor_search_cache_ttl_hours * 3600
+        )
+        self.max_entries = max_entries or settings.competitor_search_cache_max_entries
+
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS searches ("
+            "key TEXT PRIMARY KEY, provider TEXT NOT NULL, query TEXT NOT NULL, "
+            "results TEXT NOT NULL, expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS searches_last_access ON searches (last_access)")
+        self._db.commit()
+
+    def _provider_stats(self, provider: str) -> Dict[str, int]:
+        return self._stats.setdefault(provider, {"hits": 0, "misses": 0})
+
+    def get(self, key: str, provider: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up the results of a provider call.
+
+        Args:
+            key: Cache key (make_search_key)
+            provider: Provider name (for statistics)
+
+        Returns:
+            Cached results, or None on miss or expired entry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT results, expires_at FROM searches WHERE key = ?", (key,)
+            ).fetchone()
+            stats = self._provider_stats(provider)
+            if row is None or row[1] < now:
+                stats["misses"] += 1
+                return None
+
+            self._db.execute("UPDATE searches SET last_access = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            stats["hits"] += 1
+            return json.loads(row[0])
+
+    def put(self, key: str, provider: str, query: str, results: List[Dict[str, Any]]) -> None:
+        """
+        Store the results of a provider call.
+
+        Args:
+            key: Cache key (make_search_key)
+            provider: Provider name
+            query: Search query
+            results: Result dicts (JSON-serializable)
+        """
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO searches "
+                "(key, provider, query, results, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, provider, query, json.dumps(results), now + self.ttl_seconds, now),
+            )
+            self._writes += 1
+            if self._writes % PURGE_INTERVAL == 0:
+                self._db.execute("DELETE FROM searches WHERE expires_at < ?", (now,))
+            self._evict()
+            self._db.commit()
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries above max_entries."""
+        (count,) = self._db.execute("SELECT COUNT(*) FROM searches").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM searches WHERE key IN "
+                "(SELECT key FROM searches ORDER BY last_access LIMIT ?)",
+                (excess,),
+            )
+
+    def clear(self, provider: Optional[str] = None) -> None:
+        """Remove every entry (or the entries of one provider)."""
+        with self._lock:
+            if provider is None:
+                self._db.execute("DELETE FROM searches")
+            else:
+                self._db.execute("DELETE FROM searches WHERE provider = ?", (provider,))
+            self._db.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entry count and, per provider, hits, misses and
+            hit rate (since process start)
+        """
+        with self._lock:
+            (entries,) = self._db.execute("SELECT COUNT(*) FROM searches").fetchone()
+            providers = {}
+            for provider, stats in self._stats.items():
+                lookups = stats["hits"] + stats["misses"]
+                providers[provider] = {
+                    "hits": stats["hits"],
+                    "misses": stats["misses"],
+                    "hit_rate": round(stats["hits"] / lookups, 3) if lookups else 0.0,
+                }
+            return {"entries": entries, "max_entries": self.max_entries, "providers": providers}
+
+
+_cache: Optional[SearchResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> Optional[SearchResultCache]:
+    """
+    Get the shared search result cache (None if disabled or unavailable).
+
+    Returns:
+        SearchResultCache instance or None
+    """
+    global _cache
+    if not settings.competitor_search_cache_enabled:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = SearchResultCache()
+            except Exception as e:
+                logger.warning("Competitor search cache unavailable", error=str(e))
+                return None
+        return _cache
+
+
+class ProviderLimiter:
+    """Limits simultaneous calls to a provider and spaces out their start times."""
+
+    def __init__(self, concurrency: int, interval: float) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            concurrency: Maximum number of calls in flight
+            interval: Minimum delay in seconds between two call starts
+        """
+        self.interval = max(0.0, interval)
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def __aenter__(self) -> "ProviderLimiter":
+        await self._semaphore.acquire()
+        if self.interval > 0:
+            async with self._lock:
+                now = time.monotonic()
+                wait_time = self._next_slot - now
+                self._next_slot = max(now, self._next_slot) + self.interval
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._semaphore.release()
+
+
+@dataclass
+class FanoutResult:
+    """Results of a fan-out run."""
+
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    # Per strategy: result counts per provider and "total"
+    strategy_results: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    queries_executed: int = 0
+    queries_skipped: int = 0
+    cache_hits: int = 0
+    provider_calls: int = 0
+    stopped_strategies: List[str] = field(default_factory=list)
+
+
+class SearchFanout:
+    """Send generated queries to several search providers concurrently."""
+
+    def __init__(
+        self,
+        providers: Dict[str, SearchProvider],
+        config: CompetitorSearchConfig,
+        query_generator: QueryGenerator,
+        cache: Optional[SearchResultCache] = None,
+        max_results: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Initialize the fan-out.
+
+        Args:
+            providers: Search functions by provider name, queried in this order
+            config: Search configuration (batch size, per-provider limits,
+                early stop threshold)
+            query_generator: Generator tracking the performance of each strategy
+            cache: Result cache (None to always call the providers)
+            max_results: Number of results requested per provider (part of the
+                cache key)
+        """
+        self.providers = providers
+        self.config = config
+        self.query_generator = query_generator
+        self.cache = cache
+        self.max_results = max_results or {}
+        self._limiters = {
+            name: ProviderLimiter(
+                config.search_provider_concurrency.get(name, 1),
+                config.search_provider_interval.get(name, 0.0),
+            )
+            for name in providers
+        }
+
+    async def search(
+        self,
+        queries: List[Dict[str, str]],
+        exclude_domain: Optional[str] = None,
+    ) -> FanoutResult:
+        """
+        Run the queries against every provider.
+
+        Args:
+            queries: Query dictionaries with "query" and "strategy"
+            exclude_domain: Domain not counted as a new domain (the target)
+
+        Returns:
+            FanoutResult with the results in query order, then provider order
+            (each tagged with its strategy)
+        """
+        outcome = FanoutResult()
+        seen_domains: Set[str] = {exclude_domain} if exclude_domain else set()
+        executed: Dict[str, int] = {}
+        stopped: Set[str] = set()
+        batch_size = max(1, self.config.search_batch_size)
+
+        position = 0
+        while position < len(queries):
+            batch: List[Dict[str, str]] = []
+            while position < len(queries) and len(batch) < batch_size:
+                query_info = queries[position]
+                position += 1
+                if query_info["strategy"] in stopped:
+                    outcome.queries_skipped += 1
+                else:
+                    batch.append(query_info)
+            if not batch:
+                break
+
+            responses = await asyncio.gather(*(self._run_query(q["query"], outcome) for q in batch))
+
+            for query_info, by_provider in zip(batch, responses):
+                strategy = query_info["strategy"]
+                counts = outcome.strategy_results.setdefault(
+                    strategy, {**{name: 0 for name in self.providers}, "total": 0}
+                )
+                found = new_domains = 0
+                for name, results in by_provider.items():
+                    for result in results:
+                        result["strategy"] = strategy
+                        domain = result.get("domain")
+                        if domain and domain not in seen_domains:
+                            seen_domains.add(domain)
+                            new_domains += 1
+                    outcome.results.extend(results)
+                    counts[name] += len(results)
+                    found += len(results)
+                counts["total"] += found
+                executed[strategy] = executed.get(strategy, 0) + 1
+                outcome.queries_executed += 1
+                self.query_generator.track_strategy_performance(strategy, 1, found, new_domains)
+
+            for strategy in dict.fromkeys(q["strategy"] for q in batch):
+                if self._should_stop(strategy, executed[strategy]):
+                    stopped.add(strategy)
+                    outcome.stopped_strategies.append(strategy)
+                    logger.info(
+                        "Search strategy stopped (few new domains)",
+                        strategy=strategy,
+                        queries_executed=executed[strategy],
+                        marginal_efficiency=round(
+                            self.query_generator.get_strategy_efficiency(
+                                strategy, window=self.config.search_efficiency_window
+                            ),
+                            2,
+                        ),
+                    )
+
+        logger.info(
+            "Search fan-out completed",
+            queries_executed=outcome.queries_executed,
+            queries_skipped=outcome.queries_skipped,
+            provider_calls=outcome.provider_calls,
+            cache_hits=outcome.cache_hits,
+            unique_domains=len(seen_domains) - (1 if exclude_domain else 0),
+            stopped_strategies=outcome.stopped_strategies,
+        )
+        return outcome
+
+    def _should_stop(self, strategy: str, executed: int) -> bool:
+        """Check the marginal new domains per query of a strategy in this run."""
+        threshold = self.config.search_min_new_domains
+        window = self.config.search_efficiency_window
+        # Only this run's queries: the generator also keeps earlier runs
+        if threshold <= 0 or window <= 0 or executed < window:
+            return False
+        return self.query_generator.get_strategy_efficiency(strategy, window=window) < threshold
+
+    async def _run_query(self, query: str, outcome: FanoutResult) -> Dict[str, List[Dict[str, Any]]]:
+        """Send a query to every provider concurrently."""
+        names = list(self.providers)
+        responses = await asyncio.gather(*(self._call(name, query, outcome) for name in names))
+        return dict(zip(names, responses))
+
+    async def _call(self, name: str, query: str, outcome: FanoutResult) -> List[Dict[str, Any]]:
+        """Serve a provider call from the cache, or run it within the provider limits."""
+        key = make_search_key(name, query, self.max_results.get(name))
+        if self.cache is not None:
+            try:
+                cached = self.cache.get(key, name)
+            except Exception as e:
+                logger.warning("Search cache lookup failed", provider=name, error=str(e))
+                cached = None
+            if cached is not None:
+                outcome.cache_hits += 1
+                return cached
+
+        async with self._limiters[name]:
+            outcome.provider_calls += 1
+            results = await self.providers[name](query)
+
+        if results and self.cache is not None:
+            try:
+                self.cache.put(key, name, query, results)
+            except Exception as e:
+                logger.warning("Could not store search results in cache", provider=name, error=str(e))
+        return results
@@ -157,6 +157,8 @@ Create a comprehensive editorial profile that combines all insights. Format as J
 
 # Competitor Search Prompts
 
+# Candidates come last: the batches of a search share the whole prefix,
+# whose KV cache Ollama reuses between calls
 COMPETITOR_FILTERING_PROMPT = """You are evaluating candidate domains to identify competitors for the target domain.
 
 Target domain: {domain}
@@ -164,9 +166,6 @@ Target domain: {domain}
 Context about the target domain:
 {context}
 
-Candidate domains to evaluate:
-{candidates}
-
 IMPORTANT EXCLUSIONS - DO NOT INCLUDE:
 - Government services (.gouv.fr, .ameli.fr, .caf.fr, .francetravail.fr, .parcoursup.fr, .labanquepostale.fr)
 - E-commerce sites (online shopping, retail stores)
@@ -210,6 +209,9 @@ Return your response as JSON in this format:
 
 Only include domains that are actual competitors (relevance_score >= 0.6) AND in the ESN/SSII/IT services sector. 
 Exclude all government services, e-commerce, and non-IT companies.
+
+Candidate domains to evaluate:
+{candidates}
 """
 
 # Topic Modeling Prompts (for post-processing)
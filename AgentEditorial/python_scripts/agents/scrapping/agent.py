@@ -1,25 +1,27 @@
 """Enhanced scraping agent with 4-phase discovery pipeline."""
 
+import asyncio
 from datetime import date, datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from python_scripts.agents.base_agent import BaseAgent
+from python_scripts.config.settings import settings
 from python_scripts.database.crud_articles import (
-    create_competitor_article,
-    get_competitor_article_by_hash,
-    update_qdrant_point_id,
+    create_competitor_articles_batch,
+    get_existing_competitor_article_hashes,
+    update_qdrant_point_ids_batch,
 )
 from python_scripts.database.crud_client_articles import (
-    create_client_article,
-    get_client_article_by_hash as get_client_article_by_hash_crud,
-    update_qdrant_point_id as update_client_qdrant_point_id,
+    create_client_articles_batch,
+    get_existing_client_article_hashes,
+    update_qdrant_point_ids_batch as update_client_qdrant_point_ids_batch,
 )
 from python_scripts.database.crud_error_logs import log_error_from_exception
 from python_scripts.database.crud_profiles import get_site_profile_by_domain
-from python_scripts.ingestion.crawl_pages import crawl_page_async, generate_url_hash
+from python_scripts.utils.exceptions import VectorStoreError
 from python_scripts.utils.logging import get_logger
 from python_scripts.vectorstore.qdrant_client import (
     COLLECTION_NAME,
@@ -32,14 +34,17 @@ from .crud import (
     create_site_discovery_profile,
     get_site_discovery_profile,
     save_discovery_log,
-    save_url_discovery_score,
+    save_url_discovery_scores_batch,
     update_site_discovery_profile,
     update_url_scrape_status,
     update_url_validation,
 )
 from .discovery import ArticleDiscovery
+from .extraction_engine import ConcurrentExtractionEngine, ExtractionOutcome
 from .extractor import AdaptiveExtractor
+from .frontier import UrlFrontier
 from .profiler import SiteProfiler
+from .scheduler import CrawlScheduler, host_key, summarize_domain_results
 from .scorer import ArticleScorer
 
 logger = get_logger(__name__)
@@ -84,6 +89,37 @@ def _convert_published_time_to_date(published_time: Any) -> Optional[date]:
     return None
 
 
+def _convert_published_time_to_datetime(published_time: Any) -> Optional[datetime]:
+    """
+    Convert published_time (datetime, date, str, or None) to datetime object.
+
+    Args:
+        published_time: Can be datetime, date, ISO string, or None
+
+    Returns:
+        datetime object or None
+    """
+    if not published_time:
+        return None
+
+    if isinstance(published_time, datetime):
+        return published_time
+
+    if isinstance(published_time, str):
+        try:
+            return datetime.fromisoformat(published_time.replace("Z", "+00:00"))
+        except (ValueError, AttributeError):
+            return None
+
+    if isinstance(published_time, date):
+        # Convert date to datetime at midnight UTC
+        return datetime.combine(
+            published_time, datetime.min.time()
+        ).replace(tzinfo=timezone.utc)
+
+    return None
+
+
 class EnhancedScrapingAgent(BaseAgent):
     """Enhanced scraping agent with 4-phase discovery pipeline."""
 
@@ -91,8 +127,20 @@ class EnhancedScrapingAgent(BaseAgent):
         self,
         min_word_count: int = 150,
         max_age_days: Optional[int] = 1095,
+        max_concurrency: Optional[int] = None,
+        politeness_delay: Optional[float] = None,
     ) -> None:
-        """Initialize the enhanced scraping agent."""
+        """
+        Initialize the enhanced scraping agent.
+
+        Args:
+            min_word_count: Minimum word count for a valid article
+            max_age_days: Maximum article age in days
+            max_concurrency: Parallel extraction workers per domain
+                (default: settings.scraping_max_concurrency)
+            politeness_delay: Delay in seconds between two requests to a domain
+                (default: settings.scraping_politeness_delay)
+        """
         super().__init__("scraping_enhanced")
         self.min_word_count = min_word_count
         self.max_age_days = max_age_days
@@ -102,6 +150,11 @@ class EnhancedScrapingAgent(BaseAgent):
         self.discovery = ArticleDiscovery()
         self.scorer = ArticleScorer()
         self.extractor = AdaptiveExtractor()
+        self.extraction_engine = ConcurrentExtractionEngine(
+            self.extractor,
+            max_concurrency=max_concurrency,
+            politeness_delay=politeness_delay,
+        )
 
     async def discover_and_scrape_articles(
         self,
@@ -113,6 +166,8 @@ class EnhancedScrapingAgent(BaseAgent):
         force_reprofile: bool = False,
         execution_id: Optional[UUID] = None,
         client_domain: Optional[str] = None,
+        incremental: Optional[bool] = None,
+        scheduler: Optional[CrawlScheduler] = None,
     ) -> Dict[str, Any]:
         """
         Complete pipeline: discover and scrape articles.
@@ -126,6 +181,11 @@ class EnhancedScrapingAgent(BaseAgent):
             force_reprofile: Force reprofiling even if profile exists
             execution_id: Execution ID for logging
             client_domain: Client domain name (used to generate collection name for competitors)
+            incremental: Skip sitemap entries older than the last successful discovery
+                (default: settings.sitemap_incremental)
+            scheduler: Multi-domain scheduler applying per-host and global
+                limits and the page budget of the run to phase 3 (default: a
+                scheduler for this domain alone)
 
         Returns:
             Dictionary with scraped articles and statistics
@@ -187,7 +247,8 @@ class EnhancedScrapingAgent(BaseAgent):
             }
 
             # PHASE 1: Multi-source discovery
-            discovered_urls = []
+            # Candidates are canonicalized, deduplicated and scored as they are added
+            frontier = UrlFrontier(self.scorer)
 
             # 1a. API REST (if available)
             if profile_dict.get("has_rest_api") and profile_dict.get("api_endpoints"):
@@ -197,98 +258,75 @@ class EnhancedScrapingAgent(BaseAgent):
                     max_articles,
                 )
                 for article in api_articles:
-                    discovered_urls.append({
-                        "url": article["url"],
-                        "source": "api",
-                        "title_hint": article.get("title"),
-                        "date_hint": article.get("date"),
-                    })
+                    frontier.add(
+                        article["url"],
+                        "api",
+                        title_hint=article.get("title"),
+                        date_hint=_convert_published_time_to_datetime(article.get("date")),
+                    )
                 stats["sources_used"].append("api")
                 logger.info("API discovery", domain=domain, count=len(api_articles))
 
             # 1b. RSS (complement if needed)
-            if len(discovered_urls) < max_articles and profile_dict.get("rss_feeds"):
-                remaining = max_articles - len(discovered_urls)
+            if len(frontier) < max_articles and profile_dict.get("rss_feeds"):
+                remaining = max_articles - len(frontier)
                 rss_urls = await self.discovery.discover_via_rss(
                     profile_dict["rss_feeds"],
                     remaining,
                 )
-                for url in rss_urls:
-                    if url not in [u["url"] for u in discovered_urls]:
-                        discovered_urls.append({"url": url, "source": "rss"})
+                frontier.add_many(rss_urls, "rss")
                 stats["sources_used"].append("rss")
                 logger.info("RSS discovery", domain=domain, count=len(rss_urls))
 
             # 1c. Sitemap (complement if needed)
-            if len(discovered_urls) < max_articles and profile_dict.get("sitemap_urls"):
-                remaining = max_articles - len(discovered_urls)
+            # last_crawled_at is the incremental watermark: it only advances when
+            # every sitemap entry newer than it was discovered and visited
+            sitemap_complete = not profile_dict.get("sitemap_urls")
+            if len(frontier) < max_articles and profile_dict.get("sitemap_urls"):
+                remaining = max_articles - len(frontier)
+                if incremental is None:
+                    incremental = settings.sitemap_incremental
+                sitemap_since = profile.last_crawled_at if incremental and profile else None
                 sitemap_urls = await self.discovery.discover_via_sitemap(
                     profile_dict["sitemap_urls"],
                     remaining,
+                    since=sitemap_since,
                 )
-                for url in sitemap_urls:
-                    if url not in [u["url"] for u in discovered_urls]:
-                        discovered_urls.append({"url": url, "source": "sitemap"})
+                frontier.add_many(sitemap_urls, "sitemap")
+                sitemap_complete = len(sitemap_urls) < remaining
                 stats["sources_used"].append("sitemap")
-                logger.info("Sitemap discovery", domain=domain, count=len(sitemap_urls))
+                logger.info("Sitemap discovery", domain=domain, count=len(sitemap_urls), since=sitemap_since)
 
             # 1d. Heuristics (last resort)
-            if len(discovered_urls) < max_articles:
-                remaining = max_articles - len(discovered_urls)
+            if len(frontier) < max_articles:
+                remaining = max_articles - len(frontier)
                 heuristic_urls = await self.discovery.discover_via_heuristics(
                     domain,
                     profile_dict,
                     remaining,
                 )
-                for url in heuristic_urls:
-                    if url not in [u["url"] for u in discovered_urls]:
-                        discovered_urls.append({"url": url, "source": "heuristic"})
+                frontier.add_many(heuristic_urls, "heuristic")
                 stats["sources_used"].append("heuristic")
                 logger.info("Heuristic discovery", domain=domain, count=len(heuristic_urls))
 
-            stats["discovered"] = len(discovered_urls)
+            stats["discovered"] = len(frontier)
 
-            # PHASE 2: Scoring
-            scored_urls = []
-            for url_data in discovered_urls:
-                score, breakdown = self.scorer.calculate_article_score(url_data)
-                url_hash = generate_url_hash(url_data["url"])
+            # PHASE 2: Scoring (done on insertion), saved in one batch
+            scored_urls = [entry.to_dict() for entry in frontier.ranked()]
+            await save_url_discovery_scores_batch(db_session, domain, scored_urls)
 
-                scored_urls.append({
-                    **url_data,
-                    "initial_score": score,
-                    "score_breakdown": breakdown,
-                    "url_hash": url_hash,
-                })
-
-                # Save score to database
-                await save_url_discovery_score(
-                    db_session,
-                    domain,
-                    url_data["url"],
-                    url_hash,
-                    url_data["source"],
-                    score,
-                    breakdown,
-                    title_hint=url_data.get("title_hint"),
-                )
-
-            # Sort and select
-            scored_urls.sort(key=lambda x: x["initial_score"], reverse=True)
-            urls_to_scrape = self.scorer.select_urls_to_scrape(scored_urls, max_articles)
-
-            # Log rejected URLs (score too low)
-            rejected_urls = [
-                url_data for url_data in scored_urls
-                if url_data["url"] not in urls_to_scrape
-            ]
-            if rejected_urls:
+            # Select the best URLs (score >= 0)
+            urls_in_order = [entry.to_dict() for entry in frontier.select(max_articles)]
+            rejected_count = len(scored_urls) - len(urls_in_order)
+            if rejected_count:
+                selected = {url_data["url_hash"] for url_data in urls_in_order}
+                rejected_urls = [u for u in scored_urls if u["url_hash"] not in selected]
                 logger.debug(
                     "URLs rejected by scoring",
                     domain=domain,
-                    rejected_count=len(rejected_urls),
-                    min_rejected_score=min(u["initial_score"] for u in rejected_urls) if rejected_urls else 0,
-                    max_rejected_score=max(u["initial_score"] for u in rejected_urls) if rejected_urls else 0,
+                    rejected_count=rejected_count,
+                    min_rejected_score=min(u["initial_score"] for u in rejected_urls),
+                    max_rejected_score=max(u["initial_score"] for u in rejected_urls),
                     sample_rejected=rejected_urls[:5],  # Log first 5
                 )
 
@@ -296,275 +334,85 @@ class EnhancedScrapingAgent(BaseAgent):
                 "Scoring complete",
                 domain=domain,
                 total=len(scored_urls),
-                selected=len(urls_to_scrape),
-                rejected=len(rejected_urls),
+                selected=len(urls_in_order),
+                rejected=rejected_count,
+                duplicates=frontier.duplicates,
                 min_score=scored_urls[-1]["initial_score"] if scored_urls else 0,
                 max_score=scored_urls[0]["initial_score"] if scored_urls else 0,
             )
 
+            # Articles already stored: one lookup for all selected URLs
+            selected_hashes = [url_data["url_hash"] for url_data in urls_in_order]
+            if is_client_site:
+                known_hashes = await get_existing_client_article_hashes(db_session, selected_hashes)
+            else:
+                known_hashes = await get_existing_competitor_article_hashes(db_session, selected_hashes)
+            if known_hashes:
+                stats["scraped"] += len(known_hashes)
+                urls_in_order = [u for u in urls_in_order if u["url_hash"] not in known_hashes]
+                logger.info("Already known URLs skipped", domain=domain, count=len(known_hashes))
+
             # PHASE 3: Extraction
+            # Per-host concurrency adapts to the site and starts from the rate
+            # learned by previous runs
+            if scheduler is None:
+                scheduler = CrawlScheduler(
+                    max_domains=1,
+                    per_host_concurrency=self.extraction_engine.max_concurrency,
+                    politeness_delay=self.extraction_engine.politeness_delay,
+                )
+                await scheduler.prepare_host(domain)
+            rate_host_key = host_key(domain)
+            if profile is not None:
+                scheduler.rate_controller.seed(rate_host_key, getattr(profile, "crawl_rate_state", None))
+
+            # Crawl/extract run concurrently inside a window, DB and Qdrant
+            # writes are batched at the end of each window (same order as the
+            # sequential pipeline, so stats and extraction_results are identical).
             scraped_articles = []
             extraction_results = []
 
-            for url_data in scored_urls:
-                if url_data["url"] not in urls_to_scrape:
-                    continue
-
-                url = url_data["url"]
-                url_hash = url_data["url_hash"]
-
-                try:
-                    # Check for duplicates
-                    if is_client_site:
-                        existing = await get_client_article_by_hash_crud(db_session, url_hash)
-                    else:
-                        existing = await get_competitor_article_by_hash(db_session, url_hash)
-
-                    if existing:
-                        stats["scraped"] += 1
-                        continue
-
-                    # Crawl
-                    crawl_result = await crawl_page_async(url)
-                    if not crawl_result.get("success"):
-                        await update_url_scrape_status(
-                            db_session,
-                            domain,
-                            url_hash,
-                            "failed",
-                            crawl_result.get("error"),
-                        )
-                        continue
-
-                    stats["scraped"] += 1
-                    await update_url_scrape_status(
-                        db_session,
-                        domain,
-                        url_hash,
-                        "success",
+            pending_urls = urls_in_order
+            async with self.extraction_engine.create_client() as http_client:
+                while pending_urls:
+                    window_size = scheduler.budget.reserve(
+                        min(self.extraction_engine.window_size, len(pending_urls))
                     )
+                    if window_size == 0:
+                        stats["budget_exhausted"] = True
+                        logger.info(
+                            "Crawl budget exhausted",
+                            domain=domain,
+                            skipped=len(pending_urls),
+                        )
+                        break
+                    to_extract = pending_urls[:window_size]
+                    pending_urls = pending_urls[window_size:]
 
-                    # Extract adaptively
-                    article = await self.extractor.extract_article_adaptive(
-                        crawl_result.get("html", ""),
-                        url,
+                    # Crawl + extract + validate concurrently
+                    outcomes = await self.extraction_engine.process_window(
+                        to_extract,
                         profile_dict,
-                    )
-
-                    # Validate
-                    is_valid, reason = self.extractor.validate_article(
-                        article,
                         self.min_word_count,
+                        http_client,
+                        scheduler=scheduler,
                     )
 
-                    extraction_results.append({
-                        **article,
-                        "_content_selector_used": article.get("_content_selector_used"),
-                        "_title_selector_used": article.get("_title_selector_used"),
-                        "_date_selector_used": article.get("_date_selector_used"),
-                    })
-
-                    # Log detailed rejection reasons
-                    if not is_valid:
-                        logger.debug(
-                            "Article validation failed",
-                            domain=domain,
-                            url=url,
-                            reason=reason,
-                            word_count=article.get("word_count", 0),
-                            has_title=bool(article.get("title")),
-                            has_content=bool(article.get("content")),
-                            min_word_count=self.min_word_count,
-                        )
-
-                    if is_valid:
-                        # Get published_time (datetime) and convert to date for database
-                        published_time = article.get("published_time")
-                        published_date = _convert_published_time_to_date(published_time)
-                        
-                        # Save to database
-                        if is_client_site:
-                            if not site_profile_id:
-                                site_profile = await get_site_profile_by_domain(
-                                    db_session,
-                                    domain,
-                                )
-                                if not site_profile:
-                                    raise ValueError(
-                                        f"Site profile not found for domain: {domain}"
-                                    )
-                                site_profile_id = site_profile.id
-
-                            saved_article = await create_client_article(
-                                db_session,
-                                site_profile_id=site_profile_id,
-                                url=url,
-                                url_hash=url_hash,
-                                title=article.get("title", ""),
-                                content_text=article.get("content", ""),
-                                author=article.get("author"),
-                                published_date=published_date,
-                                content_html=article.get("content_html"),
-                                word_count=article.get("word_count", 0),
-                                article_metadata={
-                                    "description": article.get("description", ""),
-                                },
-                            )
-                        else:
-                            saved_article = await create_competitor_article(
-                                db_session,
-                                domain=domain,
-                                url=url,
-                                url_hash=url_hash,
-                                title=article.get("title", ""),
-                                content_text=article.get("content", ""),
-                                author=article.get("author"),
-                                published_date=published_date,
-                                content_html=article.get("content_html"),
-                                word_count=article.get("word_count", 0),
-                                article_metadata={
-                                    "description": article.get("description", ""),
-                                },
-                            )
-
-                        # Index in Qdrant
-                        try:
-                            if is_client_site:
-                                collection_name = get_client_collection_name(domain)
-                            else:
-                                # Use client_domain to generate collection name if available
-                                if client_domain:
-                                    collection_name = get_competitor_collection_name(client_domain)
-                                else:
-                                    # Fallback to default collection name
-                                    collection_name = COLLECTION_NAME
-                            # Convert published_time to datetime if it's not already
-                            published_datetime = None
-                            if published_time:
-                                if isinstance(published_time, datetime):
-                                    published_datetime = published_time
-                                elif isinstance(published_time, str):
-                                    try:
-                                        published_datetime = datetime.fromisoformat(
-                                            published_time.replace("Z", "+00:00")
-                                        )
-                                    except (ValueError, AttributeError):
-                                        pass
-                                elif isinstance(published_time, date):
-                                    # Convert date to datetime at midnight UTC
-                                    published_datetime = datetime.combine(
-                                        published_time, datetime.min.time()
-                                    ).replace(tzinfo=timezone.utc)
-                            
-                            qdrant_point_id = qdrant_client.index_article(
-                                article_id=saved_article.id,
-                                domain=domain,
-                                title=article.get("title", ""),
-                                content_text=article.get("content", ""),
-                                url=url,
-                                url_hash=url_hash,
-                                published_date=published_datetime,
-                                author=article.get("author"),
-                                keywords=None,
-                                topic_id=None,
-                                check_duplicate=True,
-                                collection_name=collection_name,
-                            )
-
-                            if qdrant_point_id:
-                                if is_client_site:
-                                    await update_client_qdrant_point_id(
-                                        db_session,
-                                        saved_article,
-                                        qdrant_point_id,
-                                    )
-                                else:
-                                    await update_qdrant_point_id(
-                                        db_session,
-                                        saved_article,
-                                        qdrant_point_id,
-                                    )
-                        except Exception as e:
-                            logger.error("Qdrant indexing failed", error=str(e))
-                            # Log error to error_logs table
-                            try:
-                                await log_error_from_exception(
-                                    db_session=db_session,
-                                    exception=e,
-                                    component="qdrant",
-                                    context={
-                                        "article_id": saved_article.id,
-                                        "domain": domain,
-                                        "url": url,
-                                        "collection": collection_name,
-                                        "method": "index_article",
-                                    },
-                                    severity="error",
-                                    execution_id=execution_id,
-                                    domain=domain,
-                                    agent_name="enhanced_scraping",
-                                )
-                            except Exception as log_err:
-                                logger.error("Failed to log error to database", error=str(log_err))
-
-                        scraped_articles.append({
-                            "id": saved_article.id,
-                            "url": saved_article.url,
-                            "title": saved_article.title,
-                            "word_count": saved_article.word_count,
-                        })
-                        stats["valid"] += 1
-
-                        await update_url_validation(
-                            db_session,
-                            domain,
-                            url_hash,
-                            True,
-                            None,
-                            url_data["initial_score"],
-                        )
-                    else:
-                        await update_url_validation(
-                            db_session,
-                            domain,
-                            url_hash,
-                            False,
-                            reason,
-                            url_data["initial_score"],
-                        )
-
-                except Exception as e:
-                    logger.error("Error scraping article", url=url, error=str(e))
-                    # Log error to error_logs table
-                    try:
-                        await log_error_from_exception(
-                            db_session=db_session,
-                            exception=e,
-                            component="scraping",
-                            context={
-                                "url": url,
-                                "url_hash": url_hash,
-                                "domain": domain,
-                                "method": "extract_article_adaptive",
-                            },
-                            severity="error",
-                            execution_id=execution_id,
-                            domain=domain,
-                            agent_name="enhanced_scraping",
-                        )
-                    except Exception as log_err:
-                        logger.error("Failed to log error to database", error=str(log_err))
-                    
-                    await update_url_scrape_status(
+                    site_profile_id = await self._persist_window(
                         db_session,
-                        domain,
-                        url_hash,
-                        "error",
-                        str(e),
+                        outcomes,
+                        domain=domain,
+                        stats=stats,
+                        scraped_articles=scraped_articles,
+                        extraction_results=extraction_results,
+                        is_client_site=is_client_site,
+                        site_profile_id=site_profile_id,
+                        execution_id=execution_id,
+                        client_domain=client_domain,
                     )
-                    continue
 
             # FEEDBACK: Update profile with results
+            crawl_rate_state = scheduler.rate_controller.export(rate_host_key)
             if profile and extraction_results:
                 valid_count = stats["valid"]
                 total_scraped = stats["scraped"]
@@ -592,8 +440,13 @@ class EnhancedScrapingAgent(BaseAgent):
                     "total_urls_discovered": stats["discovered"],
                     "total_articles_valid": valid_count,
                     "success_rate": success_rate,
-                    "last_crawled_at": datetime.now(timezone.utc),
                 }
+                # Truncated run (max_articles or crawl budget): older unvisited
+                # sitemap entries must stay above the watermark
+                if sitemap_complete and not stats.get("budget_exhausted"):
+                    update_data["last_crawled_at"] = datetime.now(timezone.utc)
+                else:
+                    logger.info("Sitemap watermark kept (truncated run)", domain=domain)
 
                 if content_selectors:
                     update_data["content_selector"] = content_selectors.most_common(1)[0][0]
@@ -604,8 +457,14 @@ class EnhancedScrapingAgent(BaseAgent):
 
                 if valid_count > 0:
                     update_data["avg_article_word_count"] = total_word_count / valid_count
+                if crawl_rate_state:
+                    update_data["crawl_rate_state"] = crawl_rate_state
 
                 await update_site_discovery_profile(db_session, domain, update_data)
+            elif profile and crawl_rate_state:
+                await update_site_discovery_profile(
+                    db_session, domain, {"crawl_rate_state": crawl_rate_state}
+                )
 
             # Log final statistics
             duration = (datetime.now(timezone.utc) - start_time).total_seconds()
@@ -661,6 +520,11 @@ class EnhancedScrapingAgent(BaseAgent):
                         error=str(e),
                     )
 
+                # Precompute the audit snapshot (new client articles and summaries)
+                from python_scripts.api.routers.sites import refresh_audit_snapshot
+
+                await refresh_audit_snapshot(domain)
+
             return {
                 "domain": domain,
                 "articles": scraped_articles,
@@ -690,6 +554,344 @@ class EnhancedScrapingAgent(BaseAgent):
                 logger.error("Failed to log error to database", error=str(log_err))
             raise
 
+    async def _handle_scrape_error(
+        self,
+        db_session: AsyncSession,
+        exception: Exception,
+        url_data: Dict[str, Any],
+        domain: str,
+        execution_id: Optional[UUID],
+    ) -> None:
+        """Log a per-URL scraping error and mark the URL as failed."""
+        url = url_data["url"]
+        url_hash = url_data["url_hash"]
+        logger.error("Error scraping article", url=url, error=str(exception))
+        # Log error to error_logs table
+        try:
+            await log_error_from_exception(
+                db_session=db_session,
+                exception=exception,
+                component="scraping",
+                context={
+                    "url": url,
+                    "url_hash": url_hash,
+                    "domain": domain,
+                    "method": "extract_article_adaptive",
+                },
+                severity="error",
+                execution_id=execution_id,
+                domain=domain,
+                agent_name="enhanced_scraping",
+            )
+        except Exception as log_err:
+            logger.error("Failed to log error to database", error=str(log_err))
+
+        await update_url_scrape_status(
+            db_session,
+            domain,
+            url_hash,
+            "error",
+            str(exception),
+        )
+
+    async def _persist_window(
+        self,
+        db_session: AsyncSession,
+        outcomes: List[ExtractionOutcome],
+        domain: str,
+        stats: Dict[str, Any],
+        scraped_articles: List[Dict[str, Any]],
+        extraction_results: List[Dict[str, Any]],
+        is_client_site: bool,
+        site_profile_id: Optional[int],
+        execution_id: Optional[UUID],
+        client_domain: Optional[str],
+    ) -> Optional[int]:
+        """
+        Persist the outcomes of an extraction window.
+
+        Statuses and validations are written in URL order, valid articles are
+        inserted with one batched commit and indexed in Qdrant afterwards.
+
+        Returns:
+            Site profile ID (resolved lazily for client sites)
+        """
+        valid_outcomes: List[ExtractionOutcome] = []
+
+        for outcome in outcomes:
+            url_data = outcome.url_data
+            url_hash = url_data["url_hash"]
+
+            if not outcome.crawled:
+                if outcome.error is not None:
+                    await self._handle_scrape_error(
+                        db_session, outcome.error, url_data, domain, execution_id
+                    )
+                else:
+                    await update_url_scrape_status(
+                        db_session,
+                        domain,
+                        url_hash,
+                        "failed",
+                        outcome.crawl_error,
+                    )
+                continue
+
+            stats["scraped"] += 1
+            await update_url_scrape_status(
+                db_session,
+                domain,
+                url_hash,
+                "success",
+            )
+
+            if outcome.error is not None:
+                await self._handle_scrape_error(
+                    db_session, outcome.error, url_data, domain, execution_id
+                )
+                continue
+
+            article = outcome.article
+            extraction_results.append({
+                **article,
+                "_content_selector_used": article.get("_content_selector_used"),
+                "_title_selector_used": article.get("_title_selector_used"),
+                "_date_selector_used": article.get("_date_selector_used"),
+            })
+
+            if outcome.is_valid:
+                valid_outcomes.append(outcome)
+                continue
+
+            # Log detailed rejection reasons
+            logger.debug(
+                "Article validation failed",
+                domain=domain,
+                url=url_data["url"],
+                reason=outcome.reason,
+                word_count=article.get("word_count", 0),
+                has_title=bool(article.get("title")),
+                has_content=bool(article.get("content")),
+                min_word_count=self.min_word_count,
+            )
+            await update_url_validation(
+                db_session,
+                domain,
+                url_hash,
+                False,
+                outcome.reason,
+                url_data["initial_score"],
+            )
+
+        if not valid_outcomes:
+            return site_profile_id
+
+        if is_client_site and not site_profile_id:
+            site_profile = await get_site_profile_by_domain(db_session, domain)
+            if not site_profile:
+                error = ValueError(f"Site profile not found for domain: {domain}")
+                for outcome in valid_outcomes:
+                    await self._handle_scrape_error(
+                        db_session, error, outcome.url_data, domain, execution_id
+                    )
+                return site_profile_id
+            site_profile_id = site_profile.id
+
+        # Save to database (one transaction for the whole window)
+        articles_data = []
+        for outcome in valid_outcomes:
+            article = outcome.article
+            data = {
+                "url": outcome.url_data["url"],
+                "url_hash": outcome.url_data["url_hash"],
+                "title": article.get("title", ""),
+                "content_text": article.get("content", ""),
+                "author": article.get("author"),
+                "published_date": _convert_published_time_to_date(article.get("published_time")),
+                "content_html": article.get("content_html"),
+                "word_count": article.get("word_count", 0),
+                "article_metadata": {
+                    "description": article.get("description", ""),
+                },
+            }
+            if is_client_site:
+                data["site_profile_id"] = site_profile_id
+            else:
+                data["domain"] = domain
+            articles_data.append(data)
+
+        if is_client_site:
+            create_articles_batch = create_client_articles_batch
+        else:
+            create_articles_batch = create_competitor_articles_batch
+
+        # Inserts run in SAVEPOINTs: a failure only undoes its own rows, not
+        # the work flushed earlier in this session (URL statuses, error logs)
+        saved_pairs = []
+        try:
+            async with db_session.begin_nested():
+                saved = await create_articles_batch(db_session, articles_data)
+            saved_pairs = list(zip(valid_outcomes, saved))
+        except Exception as batch_error:
+            # Fall back to one insert per article so a single bad row does not
+            # discard the whole window
+            logger.warning(
+                "Batch article insert failed, falling back to single inserts",
+                domain=domain,
+                count=len(articles_data),
+                error=str(batch_error),
+            )
+            for outcome, data in zip(valid_outcomes, articles_data):
+                try:
+                    async with db_session.begin_nested():
+                        [saved_article] = await create_articles_batch(db_session, [data])
+                    saved_pairs.append((outcome, saved_article))
+                except Exception as e:
+                    await self._handle_scrape_error(
+                        db_session, e, outcome.url_data, domain, execution_id
+                    )
+
+        # Index in Qdrant
+        await self._index_saved_articles(
+            db_session,
+            saved_pairs,
+            domain=domain,
+            is_client_site=is_client_site,
+            execution_id=execution_id,
+            client_domain=client_domain,
+        )
+
+        for outcome, saved_article in saved_pairs:
+            scraped_articles.append({
+                "id": saved_article.id,
+                "url": saved_article.url,
+                "title": saved_article.title,
+                "word_count": saved_article.word_count,
+            })
+            stats["valid"] += 1
+
+            await update_url_validation(
+                db_session,
+                domain,
+                outcome.url_data["url_hash"],
+                True,
+                None,
+                outcome.url_data["initial_score"],
+            )
+
+        return site_profile_id
+
+    async def _index_saved_articles(
+        self,
+        db_session: AsyncSession,
+        saved_pairs: List[Tuple[ExtractionOutcome, Any]],
+        domain: str,
+        is_client_site: bool,
+        execution_id: Optional[UUID],
+        client_domain: Optional[str],
+    ) -> None:
+        """Index saved articles in Qdrant and store their point IDs in one commit."""
+        if not saved_pairs:
+            return
+
+        if is_client_site:
+            collection_name = get_client_collection_name(domain)
+        elif client_domain:
+            # Use client_domain to generate collection name if available
+            collection_name = get_competitor_collection_name(client_domain)
+        else:
+            # Fallback to default collection name
+            collection_name = COLLECTION_NAME
+
+        articles = [
+            {
+                "article_id": saved_article.id,
+                "domain": domain,
+                "title": outcome.article.get("title", ""),
+                "content_text": outcome.article.get("content", ""),
+                "url": saved_article.url,
+                "url_hash": saved_article.url_hash,
+                "published_date": _convert_published_time_to_datetime(
+                    outcome.article.get("published_time")
+                ),
+                "author": outcome.article.get("author"),
+            }
+            for outcome, saved_article in saved_pairs
+        ]
+
+        try:
+            # Embedding generation is blocking: keep it off the event loop
+            index_results = await asyncio.to_thread(
+                qdrant_client.index_articles_batch,
+                articles,
+                collection_name=collection_name,
+                check_duplicate=True,
+            )
+        except Exception as e:
+            for _, saved_article in saved_pairs:
+                await self._log_qdrant_error(
+                    db_session, e, saved_article, domain, collection_name, execution_id
+                )
+            return
+
+        point_ids = []
+        for (_, saved_article), index_result in zip(saved_pairs, index_results):
+            if index_result["point_id"]:
+                point_ids.append((saved_article, index_result["point_id"]))
+            elif index_result["error"]:
+                await self._log_qdrant_error(
+                    db_session,
+                    VectorStoreError(index_result["error"]),
+                    saved_article,
+                    domain,
+                    collection_name,
+                    execution_id,
+                )
+
+        try:
+            if is_client_site:
+                await update_client_qdrant_point_ids_batch(db_session, point_ids)
+            else:
+                await update_qdrant_point_ids_batch(db_session, point_ids)
+        except Exception as e:
+            await db_session.rollback()
+            for saved_article, _ in point_ids:
+                await self._log_qdrant_error(
+                    db_session, e, saved_article, domain, collection_name, execution_id
+                )
+
+    async def _log_qdrant_error(
+        self,
+        db_session: AsyncSession,
+        exception: Exception,
+        saved_article: Any,
+        domain: str,
+        collection_name: str,
+        execution_id: Optional[UUID],
+    ) -> None:
+        """Log a Qdrant indexing error without failing the scraping."""
+        logger.error("Qdrant indexing failed", error=str(exception))
+        # Log error to error_logs table
+        try:
+            await log_error_from_exception(
+                db_session=db_session,
+                exception=exception,
+                component="qdrant",
+                context={
+                    "article_id": saved_article.id,
+                    "domain": domain,
+                    "url": saved_article.url,
+                    "collection": collection_name,
+                    "method": "index_articles_batch",
+                },
+                severity="error",
+                execution_id=execution_id,
+                domain=domain,
+                agent_name="enhanced_scraping",
+            )
+        except Exception as log_err:
+            logger.error("Failed to log error to database", error=str(log_err))
+
     async def execute(
         self,
         execution_id: UUID,
@@ -716,6 +918,10 @@ class EnhancedScrapingAgent(BaseAgent):
         domains = input_data.get("domains", [])
         max_articles_per_domain = input_data.get("max_articles_per_domain", 500)
         client_domain = input_data.get("client_domain")
+        scheduler = kwargs.get("scheduler") or CrawlScheduler(
+            max_domains=input_data.get("max_parallel_domains"),
+            page_budget=input_data.get("page_budget"),
+        )
 
         logger.info(
             "Starting enhanced scraping workflow",
@@ -723,65 +929,40 @@ class EnhancedScrapingAgent(BaseAgent):
             domains=domains,
             max_articles_per_domain=max_articles_per_domain,
             client_domain=client_domain,
+            max_parallel_domains=scheduler.max_domains,
         )
 
-        all_results = {}
-        global_stats = {
-            "total_domains": len(domains),
-            "domains_with_articles": 0,
-            "domains_without_articles": 0,
-            "domains_with_errors": 0,
-            "total_articles_discovered": 0,
-            "total_articles_scraped": 0,
-            "total_articles_valid": 0,
-        }
-
-        for domain in domains:
-            try:
-                result = await self.discover_and_scrape_articles(
-                    db_session,
-                    domain,
-                    max_articles_per_domain,
-                    is_client_site=is_client_site,
-                    site_profile_id=site_profile_id,
-                    execution_id=execution_id,
-                    client_domain=client_domain,
-                )
-
-                all_results[domain] = result
-                stats = result.get("statistics", {})
-
-                global_stats["total_articles_discovered"] += stats.get("discovered", 0)
-                global_stats["total_articles_scraped"] += stats.get("scraped", 0)
-                global_stats["total_articles_valid"] += stats.get("valid", 0)
-
-                if stats.get("valid", 0) > 0:
-                    global_stats["domains_with_articles"] += 1
-                else:
-                    global_stats["domains_without_articles"] += 1
-
-            except Exception as e:
-                logger.error("Error scraping domain", domain=domain, error=str(e))
-                # Log error to error_logs table
+        # An AsyncSession cannot be shared by concurrent tasks: each domain
+        # gets its own session when several domains run at the same time.
+        session_factory = kwargs.get("session_factory")
+        if session_factory is None and scheduler.max_domains > 1 and len(domains) > 1:
+            from python_scripts.database.db_session import AsyncSessionLocal
+
+            session_factory = AsyncSessionLocal
+
+        async def scrape_domain(domain: str) -> Dict[str, Any]:
+            scrape_kwargs = {
+                "max_articles": max_articles_per_domain,
+                "is_client_site": is_client_site,
+                "site_profile_id": site_profile_id,
+                "execution_id": execution_id,
+                "client_domain": client_domain,
+                "scheduler": scheduler,
+            }
+            if session_factory is None:
+                return await self._scrape_domain(db_session, domain, **scrape_kwargs)
+            async with session_factory() as domain_session:
                 try:
-                    await log_error_from_exception(
-                        db_session=db_session,
-                        exception=e,
-                        component="scraping",
-                        context={
-                            "domain": domain,
-                            "method": "discover_and_scrape_articles",
-                        },
-                        severity="error",
-                        execution_id=execution_id,
-                        domain=domain,
-                        agent_name="enhanced_scraping",
-                    )
-                except Exception as log_err:
-                    logger.error("Failed to log error to database", error=str(log_err))
-                
-                all_results[domain] = {"articles": [], "statistics": {}}
-                global_stats["domains_with_errors"] += 1
+                    result = await self._scrape_domain(domain_session, domain, **scrape_kwargs)
+                    # Discovery log, profile feedback and URL statuses are only flushed
+                    await domain_session.commit()
+                except Exception:
+                    await domain_session.rollback()
+                    raise
+                return result
+
+        all_results = await scheduler.run(domains, scrape_domain)
+        global_stats = summarize_domain_results(all_results)
 
         return {
             "domains": domains,
@@ -790,3 +971,47 @@ class EnhancedScrapingAgent(BaseAgent):
             "statistics": global_stats,
         }
 
+    async def _scrape_domain(
+        self,
+        db_session: AsyncSession,
+        domain: str,
+        max_articles: int,
+        is_client_site: bool,
+        site_profile_id: Optional[int],
+        execution_id: Optional[UUID],
+        client_domain: Optional[str],
+        scheduler: CrawlScheduler,
+    ) -> Dict[str, Any]:
+        """Scrape one domain of a workflow, logging a failure instead of raising."""
+        try:
+            return await self.discover_and_scrape_articles(
+                db_session,
+                domain,
+                max_articles,
+                is_client_site=is_client_site,
+                site_profile_id=site_profile_id,
+                execution_id=execution_id,
+                client_domain=client_domain,
+                scheduler=scheduler,
+            )
+        except Exception as e:
+            logger.error("Error scraping domain", domain=domain, error=str(e))
+            # Log error to error_logs table
+            try:
+                await log_error_from_exception(
+                    db_session=db_session,
+                    exception=e,
+                    component="scraping",
+                    context={
+                        "domain": domain,
+                        "method": "discover_and_scrape_articles",
+                    },
+                    severity="error",
+                    execution_id=execution_id,
+                    domain=domain,
+                    agent_name="enhanced_scraping",
+                )
+            except Exception as log_err:
+                logger.error("Failed to log error to database", error=str(log_err))
+
+            return {"articles": [], "statistics": {}, "error": str(e)}
@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import update
 
@@ -134,6 +135,56 @@ async def save_url_discovery_score(
         return score
 
 
+async def save_url_discovery_scores_batch(
+    db_session: AsyncSession,
+    domain: str,
+    scores: List[Dict[str, Any]],
+    chunk_size: int = 500,
+) -> int:
+    """
+    Save or update several URL discovery scores with INSERT ... ON CONFLICT.
+
+    Args:
+        db_session: Database session
+        domain: Domain name
+        scores: Dictionaries with url, url_hash, source, initial_score,
+            score_breakdown and optional title_hint/date_hint/discovered_in
+        chunk_size: Rows per statement
+
+    Returns:
+        Number of rows written
+    """
+    rows = [
+        {
+            "domain": domain,
+            "url": score["url"],
+            "url_hash": score["url_hash"],
+            "discovery_source": score["source"],
+            "discovered_in": score.get("discovered_in"),
+            "initial_score": score["initial_score"],
+            "score_breakdown": score["score_breakdown"],
+            "title_hint": score.get("title_hint"),
+            "date_hint": score.get("date_hint"),
+        }
+        for score in scores
+    ]
+    for start in range(0, len(rows), chunk_size):
+        stmt = insert(UrlDiscoveryScore).values(rows[start : start + chunk_size])
+        stmt = stmt.on_conflict_do_update(
+            constraint="unique_url_discovery",
+            set_={
+                "initial_score": stmt.excluded.initial_score,
+                "score_breakdown": stmt.excluded.score_breakdown,
+                "discovered_in": stmt.excluded.discovered_in,
+                "title_hint": stmt.excluded.title_hint,
+                "date_hint": stmt.excluded.date_hint,
+            },
+        )
+        await db_session.execute(stmt)
+    await db_session.flush()
+    return len(rows)
+
+
 async def update_url_scrape_status(
     db_session: AsyncSession,
     domain: str,
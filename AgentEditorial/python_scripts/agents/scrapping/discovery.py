@@ -2,13 +2,14 @@
 
 import json
 import re
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 from urllib.parse import urljoin, urlparse
 
-import httpx
 from bs4 import BeautifulSoup
 
 from python_scripts.ingestion.detect_sitemaps import parse_sitemap
+from python_scripts.utils.http_client import pooled_client
 from python_scripts.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -70,25 +71,25 @@ class ArticleDiscovery:
         api_url = urljoin(base_url, posts_endpoint)
 
         try:
-            page = 1
-            per_page = 100  # WordPress max
-
-            while len(articles) < max_articles:
-                params = {
-                    "per_page": min(per_page, max_articles - len(articles)),
-                    "page": page,
-                    "orderby": "date",
-                    "order": "desc",
-                    "_fields": "id,date,modified,slug,title,excerpt,link,author,categories,tags",
-                }
-
-                async with httpx.AsyncClient(
-                    verify=False,
-                    timeout=self.timeout,
-                    follow_redirects=True,
-                    headers=DEFAULT_HEADERS,
-                ) as client:
-                    response = await client.get(api_url, params=params)
+            async with pooled_client("crawl") as client:
+                page = 1
+                per_page = 100  # WordPress max
+
+                while len(articles) < max_articles:
+                    params = {
+                        "per_page": min(per_page, max_articles - len(articles)),
+                        "page": page,
+                        "orderby": "date",
+                        "order": "desc",
+                        "_fields": "id,date,modified,slug,title,excerpt,link,author,categories,tags",
+                    }
+
+                    response = await client.get(
+                        api_url,
+                        params=params,
+                        headers=DEFAULT_HEADERS,
+                        timeout=self.timeout,
+                    )
                     if response.status_code != 200:
                         break
 
@@ -159,23 +160,23 @@ class ArticleDiscovery:
         api_url = urljoin(base_url, articles_endpoint)
 
         try:
-            offset = 0
-            per_page = 50  # Drupal default page limit
-
-            while len(articles) < max_articles:
-                params = {
-                    "page[limit]": min(per_page, max_articles - len(articles)),
-                    "page[offset]": offset,
-                    "sort": "-created",  # Sort by created date descending
-                }
-
-                async with httpx.AsyncClient(
-                    verify=False,
-                    timeout=self.timeout,
-                    follow_redirects=True,
-                    headers={**DEFAULT_HEADERS, "Accept": "application/vnd.api+json"},
-                ) as client:
-                    response = await client.get(api_url, params=params)
+            async with pooled_client("crawl") as client:
+                offset = 0
+                per_page = 50  # Drupal default page limit
+
+                while len(articles) < max_articles:
+                    params = {
+                        "page[limit]": min(per_page, max_articles - len(articles)),
+                        "page[offset]": offset,
+                        "sort": "-created",  # Sort by created date descending
+                    }
+
+                    response = await client.get(
+                        api_url,
+                        params=params,
+                        headers={**DEFAULT_HEADERS, "Accept": "application/vnd.api+json"},
+                        timeout=self.timeout,
+                    )
                     if response.status_code != 200:
                         break
 
@@ -207,16 +208,16 @@ class ArticleDiscovery:
                             break
 
                         attributes = item.get("attributes", {})
-                        
+                    
                         # Build article URL from path alias or node ID
                         path = attributes.get("path", {})
                         if isinstance(path, dict):
                             article_path = path.get("alias") or f"/node/{item.get('id', '')}"
                         else:
                             article_path = f"/node/{item.get('id', '')}"
-                        
+                    
                         article_url = urljoin(base_url, article_path)
-                        
+                    
                         articles.append({
                             "url": article_url,
                             "title": attributes.get("title", ""),
@@ -293,13 +294,12 @@ class ArticleDiscovery:
                 current_url = pagination_formats[0]
 
             try:
-                async with httpx.AsyncClient(
-                    verify=False,
-                    timeout=self.timeout,
-                    follow_redirects=True,
-                    headers=DEFAULT_HEADERS,
-                ) as client:
-                    response = await client.get(current_url)
+                async with pooled_client("crawl") as client:
+                    response = await client.get(
+                        current_url,
+                        headers=DEFAULT_HEADERS,
+                        timeout=self.timeout,
+                    )
                     if response.status_code != 200:
                         break
 
@@ -340,6 +340,7 @@ class ArticleDiscovery:
         self,
         sitemap_urls: List[str],
         max_articles: int = 100,
+        since: Optional[datetime] = None,
     ) -> List[str]:
         """
         Discover articles via sitemaps with intelligent filtering.
@@ -347,6 +348,7 @@ class ArticleDiscovery:
         Args:
             sitemap_urls: List of sitemap URLs
             max_articles: Maximum articles to discover
+            since: Skip sitemap entries whose <lastmod> is older (incremental mode)
 
         Returns:
             List of article URLs
@@ -358,7 +360,7 @@ class ArticleDiscovery:
                 break
 
             try:
-                urls = await parse_sitemap(sitemap_url)
+                urls = await parse_sitemap(sitemap_url, since=since)
                 # Filter and score URLs
                 filtered = await self._filter_sitemap_urls(urls, max_articles - len(all_urls))
                 all_urls.extend([url["url"] for url in filtered])
@@ -454,13 +456,12 @@ class ArticleDiscovery:
                 break
 
             try:
-                async with httpx.AsyncClient(
-                    verify=False,
-                    timeout=self.timeout,
-                    follow_redirects=True,
-                    headers=DEFAULT_HEADERS,
-                ) as client:
-                    response = await client.get(blog_page)
+                async with pooled_client("crawl") as client:
+                    response = await client.get(
+                        blog_page,
+                        headers=DEFAULT_HEADERS,
+                        timeout=self.timeout,
+                    )
                     if response.status_code != 200:
                         continue
 
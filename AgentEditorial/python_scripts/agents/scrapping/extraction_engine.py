@@ -0,0 +1,186 @@
+"""Phase 3: Bounded concurrent extraction engine (crawl + extract + validate)."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncContextManager, Dict, List, Optional
+
+import httpx
+
+from python_scripts.config.settings import settings
+from python_scripts.ingestion.crawl_pages import crawl_page_async
+from python_scripts.ingestion.rate_control import RateTicket
+from python_scripts.utils.http_client import pooled_client
+from python_scripts.utils.logging import get_logger
+
+from .extractor import AdaptiveExtractor
+
+if TYPE_CHECKING:
+    from .scheduler import CrawlScheduler
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ExtractionOutcome:
+    """Result of crawling and extracting a single URL."""
+
+    url_data: Dict[str, Any]
+    crawled: bool = False  # HTTP fetch succeeded
+    crawl_error: Optional[str] = None
+    article: Optional[Dict[str, Any]] = None
+    is_valid: bool = False
+    reason: Optional[str] = None
+    error: Optional[Exception] = None  # Unexpected exception (crawl or extraction)
+
+
+class PolitenessGate:
+    """Spaces out request start times for a single domain."""
+
+    def __init__(self, delay: float) -> None:
+        """
+        Initialize the gate.
+
+        Args:
+            delay: Minimum delay in seconds between two request starts
+        """
+        self.delay = max(0.0, delay)
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        """Wait until the next request slot is available."""
+        if self.delay <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.delay
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+
+class ConcurrentExtractionEngine:
+    """
+    Per-domain worker pool for phase 3 of the scraping pipeline.
+
+    Workers only do network and CPU work (crawl, extraction, validation): no
+    database session is touched here, because an AsyncSession cannot be shared
+    between concurrent tasks. The caller persists the outcomes sequentially,
+    window by window, in the original URL order.
+    """
+
+    def __init__(
+        self,
+        extractor: AdaptiveExtractor,
+        max_concurrency: Optional[int] = None,
+        politeness_delay: Optional[float] = None,
+        window_size: Optional[int] = None,
+        timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            extractor: Adaptive extractor used for every page
+            max_concurrency: Parallel workers (default: settings.scraping_max_concurrency)
+            politeness_delay: Delay between requests in seconds
+                (default: settings.scraping_politeness_delay)
+            window_size: URLs per persistence window (default: settings.scraping_write_batch_size)
+            timeout: HTTP timeout per page in seconds
+        """
+        self.extractor = extractor
+        self.max_concurrency = max(
+            1, max_concurrency if max_concurrency is not None else settings.scraping_max_concurrency
+        )
+        self.politeness_delay = (
+            politeness_delay if politeness_delay is not None else settings.scraping_politeness_delay
+        )
+        self.window_size = max(
+            1, window_size if window_size is not None else settings.scraping_write_batch_size
+        )
+        self.timeout = timeout
+
+    def create_client(self) -> AsyncContextManager[httpx.AsyncClient]:
+        """Get the HTTP client shared by all workers of a domain (pooled crawl client)."""
+        return pooled_client("crawl")
+
+    async def process_window(
+        self,
+        url_items: List[Dict[str, Any]],
+        profile: Dict[str, Any],
+        min_word_count: int,
+        client: httpx.AsyncClient,
+        scheduler: Optional["CrawlScheduler"] = None,
+    ) -> List[ExtractionOutcome]:
+        """
+        Crawl, extract and validate a window of URLs concurrently.
+
+        Args:
+            url_items: Scored URL dictionaries (must contain "url")
+            profile: Site discovery profile used by the extractor
+            min_word_count: Minimum word count for validation
+            client: Shared HTTP client
+            scheduler: Multi-domain scheduler whose per-host and global limits
+                replace the engine's own concurrency and delay
+
+        Returns:
+            One ExtractionOutcome per URL, in the same order as url_items
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        gate = PolitenessGate(self.politeness_delay)
+
+        async def worker(url_data: Dict[str, Any]) -> ExtractionOutcome:
+            if scheduler is not None:
+                async with scheduler.slot(url_data["url"]) as ticket:
+                    return await self._process_url(url_data, profile, min_word_count, client, ticket)
+            async with semaphore:
+                await gate.wait()
+                return await self._process_url(url_data, profile, min_word_count, client)
+
+        return list(await asyncio.gather(*(worker(item) for item in url_items)))
+
+    async def _process_url(
+        self,
+        url_data: Dict[str, Any],
+        profile: Dict[str, Any],
+        min_word_count: int,
+        client: httpx.AsyncClient,
+        ticket: Optional[RateTicket] = None,
+    ) -> ExtractionOutcome:
+        """Crawl, extract and validate a single URL (reporting the response to `ticket`)."""
+        outcome = ExtractionOutcome(url_data=url_data)
+        url = url_data["url"]
+
+        try:
+            crawl_result = await crawl_page_async(
+                url,
+                timeout=ticket.timeout(self.timeout) if ticket else self.timeout,
+                client=client,
+                keep_document=True,
+            )
+            if ticket is not None:
+                ticket.observe_result(crawl_result)
+            if not crawl_result.get("success"):
+                outcome.crawl_error = crawl_result.get("error")
+                return outcome
+
+            outcome.crawled = True
+
+            # The page parsed by the crawl is reused by the extractor
+            article = await self.extractor.extract_article_adaptive(
+                crawl_result.get("document") or crawl_result.get("html", ""),
+                url,
+                profile,
+            )
+            is_valid, reason = self.extractor.validate_article(article, min_word_count)
+
+            outcome.article = article
+            outcome.is_valid = is_valid
+            outcome.reason = reason
+
+        except Exception as e:
+            logger.debug("Extraction worker failed", url=url, error=str(e))
+            outcome.error = e
+
+        return outcome
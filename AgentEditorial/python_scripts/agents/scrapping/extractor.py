@@ -1,13 +1,12 @@
 """Phase 3: Adaptive article extraction with boilerplate removal."""
 
-import json
+import asyncio
 import re
 from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
 
 try:
     from trafilatura import extract
@@ -16,6 +15,7 @@ try:
 except ImportError:
     TRAFILATURA_AVAILABLE = False
 
+from python_scripts.ingestion.html_document import ParsedDocument
 from python_scripts.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -104,7 +104,7 @@ class AdaptiveExtractor:
 
     async def extract_article_adaptive(
         self,
-        html: str,
+        html: Union[str, ParsedDocument],
         url: str,
         profile: Dict[str, Any],
     ) -> Dict[str, Any]:
@@ -118,20 +118,47 @@ class AdaptiveExtractor:
         4. Fallback to generic CSS selectors
 
         Args:
-            html: HTML content
+            html: HTML content, or the page already parsed by crawl_page_async
+            url: Article URL
+            profile: Site discovery profile
+
+        Returns:
+            Dictionary with extracted article data including data quality metrics
+        """
+        # Parsing and Trafilatura are CPU-bound: run them in a worker
+        # thread so the event loop keeps serving other crawls meanwhile.
+        return await asyncio.to_thread(self.extract_article, html, url, profile)
+
+    def extract_article(
+        self,
+        html: Union[str, ParsedDocument],
+        url: str,
+        profile: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Synchronous implementation of extract_article_adaptive.
+
+        The page is parsed once (ParsedDocument); the BeautifulSoup view is
+        only built if a CSS selector fallback is needed.
+
+        Args:
+            html: HTML content, or the page already parsed
             url: Article URL
             profile: Site discovery profile
 
         Returns:
             Dictionary with extracted article data including data quality metrics
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = ParsedDocument.ensure(html, url)
+        html = document.html
+        # Read before Trafilatura, which is the last consumer of the tree
+        page_metadata = document.metadata
         article = {}
         extraction_method = "unknown"
 
         # 1. TRY TRAFILATURA FIRST (Best - removes header/footer/nav)
         if self.use_trafilatura:
-            trafilatura_content, trafilatura_metadata = self._extract_with_trafilatura(html, url)
+            trafilatura_content, trafilatura_metadata = self._extract_with_trafilatura(document, url)
             if trafilatura_content:
                 article["content"] = trafilatura_content
                 article["extraction_method"] = "trafilatura"
@@ -148,14 +175,14 @@ class AdaptiveExtractor:
                 logger.debug(f"Trafilatura extraction successful for {url}")
 
         # 2. Try structured data (JSON-LD, Open Graph)
-        jsonld = self._extract_jsonld_info(html, soup)
+        jsonld = self._extract_jsonld_info(page_metadata)
         if jsonld.get("is_article"):
             # Complement with JSON-LD if not already extracted
             for key, value in jsonld.get("metadata", {}).items():
                 if not article.get(key) and value:
                     article[key] = value
 
-        opengraph = self._extract_opengraph_info(html, soup)
+        opengraph = self._extract_opengraph_info(page_metadata)
         if opengraph.get("is_article"):
             # Complement with OG if not in other sources
             for key in ["title", "description", "published_time", "author"]:
@@ -164,7 +191,7 @@ class AdaptiveExtractor:
 
         # 3. Use profile selectors (if available and content not already extracted)
         if not article.get("content") and profile.get("content_selector"):
-            content = soup.select_one(profile["content_selector"])
+            content = document.soup.select_one(profile["content_selector"])
             if content:
                 article["content"] = self._clean_text(content.get_text())
                 article["content_html"] = str(content)
@@ -172,26 +199,26 @@ class AdaptiveExtractor:
                 extraction_method = "profile_selector"
 
         if profile.get("title_selector") and not article.get("title"):
-            title = soup.select_one(profile["title_selector"])
+            title = document.soup.select_one(profile["title_selector"])
             if title:
                 article["title"] = self._clean_text(title.get_text())
 
         if profile.get("date_selector") and not article.get("published_time"):
-            date = soup.select_one(profile["date_selector"])
+            date = document.soup.select_one(profile["date_selector"])
             if date:
                 parsed_date = self._extract_date(date)
                 if parsed_date:
                     article["published_time"] = parsed_date
 
         if profile.get("author_selector") and not article.get("author"):
-            author = soup.select_one(profile["author_selector"])
+            author = document.soup.select_one(profile["author_selector"])
             if author:
                 article["author"] = self._clean_text(author.get_text())
 
         # 4. Fallback to generic selectors
         if not article.get("content"):
             for selector in CONTENT_SELECTORS_PRIORITY:
-                content = soup.select_one(selector)
+                content = document.soup.select_one(selector)
                 if content and len(content.get_text(strip=True)) > 200:
                     article["content"] = self._clean_text(content.get_text())
                     article["content_html"] = str(content)
@@ -202,7 +229,7 @@ class AdaptiveExtractor:
 
         if not article.get("title"):
             for selector in TITLE_SELECTORS_PRIORITY:
-                title = soup.select_one(selector)
+                title = document.soup.select_one(selector)
                 if title:
                     article["title"] = self._clean_text(title.get_text())
                     article["_title_selector_used"] = selector
@@ -210,7 +237,7 @@ class AdaptiveExtractor:
 
         if not article.get("published_time"):
             for selector in DATE_SELECTORS_PRIORITY:
-                date = soup.select_one(selector)
+                date = document.soup.select_one(selector)
                 if date:
                     parsed_date = self._extract_date(date)
                     if parsed_date:
@@ -220,7 +247,7 @@ class AdaptiveExtractor:
 
         if not article.get("author"):
             for selector in AUTHOR_SELECTORS_PRIORITY:
-                author = soup.select_one(selector)
+                author = document.soup.select_one(selector)
                 if author:
                     article["author"] = self._clean_text(author.get_text())
                     article["_author_selector_used"] = selector
@@ -242,29 +269,22 @@ class AdaptiveExtractor:
 
     def _extract_jsonld_info(
         self,
-        html: str,
-        soup: BeautifulSoup,
+        page_metadata: Dict[str, Any],
     ) -> Dict[str, Any]:
-        """Extract JSON-LD information."""
+        """Extract JSON-LD information (blocks collected by ParsedDocument)."""
         info = {
             "is_article": False,
             "metadata": {},
         }
 
-        for script in soup.find_all("script", type="application/ld+json"):
-            try:
-                data = json.loads(script.string)
-
-                # Handle arrays
-                if isinstance(data, list):
-                    for item in data:
-                        if self._process_jsonld_item(item, info):
-                            break
-                else:
-                    self._process_jsonld_item(data, info)
-
-            except json.JSONDecodeError:
-                continue
+        for data in page_metadata.get("jsonld", []):
+            # Handle arrays
+            if isinstance(data, list):
+                for item in data:
+                    if isinstance(item, dict) and self._process_jsonld_item(item, info):
+                        break
+            elif isinstance(data, dict):
+                self._process_jsonld_item(data, info)
 
         return info
 
@@ -288,18 +308,10 @@ class AdaptiveExtractor:
 
     def _extract_opengraph_info(
         self,
-        html: str,
-        soup: BeautifulSoup,
+        page_metadata: Dict[str, Any],
     ) -> Dict[str, Any]:
-        """Extract Open Graph information."""
-        og_data = {}
-
-        for meta in soup.find_all("meta", property=True):
-            prop = meta.get("property", "")
-            content = meta.get("content", "")
-
-            if prop.startswith("og:") or prop.startswith("article:"):
-                og_data[prop] = content
+        """Extract Open Graph information (og:* and article:* collected by ParsedDocument)."""
+        og_data = page_metadata.get("opengraph", {})
 
         return {
             "is_article": og_data.get("og:type") == "article",
@@ -363,14 +375,16 @@ class AdaptiveExtractor:
 
     def _extract_with_trafilatura(
         self,
-        html: str,
+        document: ParsedDocument,
         url: str,
     ) -> Tuple[Optional[str], Dict[str, Any]]:
         """
         Extract clean content using Trafilatura (boilerplate removal).
 
+        Trafilatura works on the already parsed tree instead of the markup.
+
         Args:
-            html: HTML content
+            document: Parsed page
             url: Article URL
 
         Returns:
@@ -381,8 +395,9 @@ class AdaptiveExtractor:
 
         try:
             # Extract with metadata
+            # extract() prunes the tree it is given: pass it a copy
             clean_content = extract(
-                html,
+                document.copy_tree(),
                 include_comments=False,
                 include_tables=True,
                 no_fallback=False,
@@ -393,7 +408,7 @@ class AdaptiveExtractor:
 
             # Extract metadata separately
             from trafilatura.metadata import extract_metadata
-            metadata_obj = extract_metadata(html, url=url)
+            metadata_obj = extract_metadata(document.tree, url=url)
 
             metadata = {}
             if metadata_obj:
@@ -0,0 +1,190 @@
+"""URL frontier: canonical, deduplicated and scored discovery candidates."""
+
+import heapq
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from python_scripts.ingestion.crawl_pages import generate_url_hash
+from python_scripts.utils.logging import get_logger
+
+from .scorer import ArticleScorer
+
+logger = get_logger(__name__)
+
+# Query parameters that identify a campaign or a click, never a page
+TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "dclid",
+        "msclkid",
+        "yclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "_ga",
+        "_gl",
+        "_hsenc",
+        "_hsmi",
+        "mkt_tok",
+        "ref_src",
+    }
+)
+TRACKING_PREFIXES = ("utm_", "pk_", "mtm_")
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonicalize a discovered URL.
+
+    - Lowercases the scheme and host, drops default ports and the fragment
+    - Removes tracking parameters (utm_*, fbclid, gclid...) and sorts the others
+    - Uses "/" for an empty path
+
+    Trailing slashes and path case are left as is (the server may treat them
+    differently); generate_url_hash already ignores them for deduplication.
+
+    Args:
+        url: URL as discovered
+
+    Returns:
+        Canonical URL
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host if port is None or DEFAULT_PORTS.get(scheme) == port else f"{host}:{port}"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, netloc, parts.path or "/", urlencode(query), ""))
+
+
+@dataclass
+class FrontierEntry:
+    """A candidate URL with its discovery source and score."""
+
+    url: str
+    url_hash: str
+    source: str
+    initial_score: int = 0
+    score_breakdown: Dict[str, Any] = field(default_factory=dict)
+    title_hint: Optional[str] = None
+    date_hint: Optional[datetime] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the url_data dictionary used by the extraction phase."""
+        return {
+            "url": self.url,
+            "source": self.source,
+            "title_hint": self.title_hint,
+            "date_hint": self.date_hint,
+            "initial_score": self.initial_score,
+            "score_breakdown": self.score_breakdown,
+            "url_hash": self.url_hash,
+        }
+
+
+class UrlFrontier:
+    """
+    Discovery candidates of one domain.
+
+    URLs are canonicalized and deduplicated on their url_hash (the first
+    source to find a URL keeps it), then scored with ArticleScorer as they
+    are added.
+    """
+
+    def __init__(self, scorer: Optional[ArticleScorer] = None) -> None:
+        """
+        Initialize the frontier.
+
+        Args:
+            scorer: Scorer used on insertion (default: ArticleScorer())
+        """
+        self.scorer = scorer or ArticleScorer()
+        self._entries: Dict[str, FrontierEntry] = {}
+        self.duplicates = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[FrontierEntry]:
+        return iter(self._entries.values())
+
+    def __contains__(self, url: str) -> bool:
+        return generate_url_hash(canonicalize_url(url)) in self._entries
+
+    def add(
+        self,
+        url: str,
+        source: str,
+        title_hint: Optional[str] = None,
+        date_hint: Optional[datetime] = None,
+    ) -> bool:
+        """
+        Add a URL if it is not already in the frontier.
+
+        Args:
+            url: Discovered URL
+            source: Discovery source (api, rss, sitemap, heuristic)
+            title_hint: Title found by the source
+            date_hint: Publication date found by the source
+
+        Returns:
+            True if the URL was added, False if it was a duplicate
+        """
+        canonical = canonicalize_url(url)
+        url_hash = generate_url_hash(canonical)
+        if url_hash in self._entries:
+            self.duplicates += 1
+            return False
+
+        entry = FrontierEntry(
+            url=canonical,
+            url_hash=url_hash,
+            source=source,
+            title_hint=title_hint,
+            date_hint=date_hint,
+        )
+        entry.initial_score, entry.score_breakdown = self.scorer.calculate_article_score(
+            {"url": canonical, "source": source, "title_hint": title_hint}
+        )
+        self._entries[url_hash] = entry
+        return True
+
+    def add_many(self, urls: Iterable[str], source: str) -> int:
+        """
+        Add several URLs from the same source.
+
+        Returns:
+            Number of URLs added
+        """
+        return sum(self.add(url, source) for url in urls)
+
+    def ranked(self) -> List[FrontierEntry]:
+        """All entries by decreasing score (discovery order for equal scores)."""
+        return sorted(self._entries.values(), key=lambda entry: entry.initial_score, reverse=True)
+
+    def select(self, max_urls: int, min_score: int = 0) -> List[FrontierEntry]:
+        """
+        Select the best-scored URLs to scrape.
+
+        Args:
+            max_urls: Maximum number of URLs
+            min_score: Minimum score of a selected URL
+
+        Returns:
+            Entries by decreasing score (discovery order for equal scores)
+        """
+        eligible = (entry for entry in self._entries.values() if entry.initial_score >= min_score)
+        return heapq.nlargest(max_urls, eligible, key=lambda entry: entry.initial_score)
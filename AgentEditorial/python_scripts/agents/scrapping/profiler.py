@@ -1,13 +1,15 @@
 """Phase 0: Site profiling for optimized article discovery."""
 
 import re
+from contextlib import aclosing
 from typing import Any, Dict, List, Optional
 from urllib.parse import urljoin, urlparse
 
 import httpx
 from bs4 import BeautifulSoup
 
-from python_scripts.ingestion.detect_sitemaps import detect_sitemap_urls, parse_sitemap
+from python_scripts.ingestion.detect_sitemaps import detect_sitemap_urls, iter_sitemap_urls
+from python_scripts.utils.http_client import pooled_client
 from python_scripts.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -148,13 +150,12 @@ class SiteProfiler:
             response_headers = {}
             for attempt in range(3):  # 3 retries
                 try:
-                    async with httpx.AsyncClient(
-                        verify=False,
-                        timeout=self.timeout,
-                        follow_redirects=True,
-                        headers=DEFAULT_HEADERS,
-                    ) as client:
-                        response = await client.get(base_url)
+                    async with pooled_client("crawl") as client:
+                        response = await client.get(
+                            base_url,
+                            headers=DEFAULT_HEADERS,
+                            timeout=self.timeout,
+                        )
                         response_headers = response.headers
                         if response.status_code == 200:
                             html = response.text
@@ -295,13 +296,8 @@ class SiteProfiler:
         test_url = f"{base_url}/wp-json/wp/v2/posts?per_page=1"
 
         try:
-            async with httpx.AsyncClient(
-                verify=False,
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers=DEFAULT_HEADERS,
-            ) as client:
-                response = await client.get(test_url)
+            async with pooled_client("crawl") as client:
+                response = await client.get(test_url, headers=DEFAULT_HEADERS, timeout=self.timeout)
                 if response.status_code == 200:
                     return {
                         "posts": "/wp-json/wp/v2/posts",
@@ -326,15 +322,14 @@ class SiteProfiler:
         ]
 
         try:
-            async with httpx.AsyncClient(
-                verify=False,
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers=DEFAULT_HEADERS,
-            ) as client:
+            async with pooled_client("crawl") as client:
                 for test_url in test_urls:
                     try:
-                        response = await client.get(test_url)
+                        response = await client.get(
+                            test_url,
+                            headers=DEFAULT_HEADERS,
+                            timeout=self.timeout,
+                        )
                         if response.status_code == 200:
                             content_type = response.headers.get("content-type", "").lower()
                             if "json" in content_type:
@@ -366,13 +361,8 @@ class SiteProfiler:
         for path in SITEMAP_LOCATIONS:
             sitemap_url = urljoin(base_url, path)
             try:
-                async with httpx.AsyncClient(
-                    verify=False,
-                    timeout=5.0,
-                    follow_redirects=True,
-                    headers=DEFAULT_HEADERS,
-                ) as client:
-                    response = await client.head(sitemap_url)
+                async with pooled_client("crawl") as client:
+                    response = await client.head(sitemap_url, headers=DEFAULT_HEADERS, timeout=5.0)
                     if response.status_code == 200:
                         content_type = response.headers.get("content-type", "").lower()
                         if "xml" in content_type:
@@ -402,13 +392,8 @@ class SiteProfiler:
         for path in RSS_LOCATIONS:
             feed_url = urljoin(base_url, path)
             try:
-                async with httpx.AsyncClient(
-                    verify=False,
-                    timeout=5.0,
-                    follow_redirects=True,
-                    headers=DEFAULT_HEADERS,
-                ) as client:
-                    response = await client.head(feed_url)
+                async with pooled_client("crawl") as client:
+                    response = await client.head(feed_url, headers=DEFAULT_HEADERS, timeout=5.0)
                     if response.status_code == 200:
                         content_type = response.headers.get("content-type", "").lower()
                         if "xml" in content_type or "rss" in content_type or "atom" in content_type:
@@ -442,13 +427,8 @@ class SiteProfiler:
         for path in common_paths:
             page_url = urljoin(base_url, path)
             try:
-                async with httpx.AsyncClient(
-                    verify=False,
-                    timeout=5.0,
-                    follow_redirects=True,
-                    headers=DEFAULT_HEADERS,
-                ) as client:
-                    response = await client.head(page_url)
+                async with pooled_client("crawl") as client:
+                    response = await client.head(page_url, headers=DEFAULT_HEADERS, timeout=5.0)
                     if response.status_code == 200:
                         if page_url not in blog_pages:
                             blog_pages.append(page_url)
@@ -465,13 +445,12 @@ class SiteProfiler:
         # From RSS
         for rss_url in profile.get("rss_feeds", [])[:2]:  # Limit to 2 feeds
             try:
-                async with httpx.AsyncClient(
-                    verify=False,
-                    timeout=self.timeout,
-                    follow_redirects=True,
-                    headers=DEFAULT_HEADERS,
-                ) as client:
-                    response = await client.get(rss_url)
+                async with pooled_client("crawl") as client:
+                    response = await client.get(
+                        rss_url,
+                        headers=DEFAULT_HEADERS,
+                        timeout=self.timeout,
+                    )
                     if response.status_code == 200:
                         soup = BeautifulSoup(response.text, "xml")
                         for item in soup.find_all("item")[:10]:  # First 10 items
@@ -487,8 +466,12 @@ class SiteProfiler:
         if len(sample_urls) < 20:
             for sitemap_url in profile.get("sitemap_urls", [])[:1]:  # First sitemap
                 try:
-                    urls = await parse_sitemap(sitemap_url)
-                    sample_urls.extend(urls[:20])
+                    # Stop downloading as soon as the sample is complete
+                    async with aclosing(iter_sitemap_urls(sitemap_url)) as entries:
+                        async for entry in entries:
+                            sample_urls.append(entry.url)
+                            if len(sample_urls) >= 20:
+                                break
                     if len(sample_urls) >= 20:
                         break
                 except Exception:
@@ -560,13 +543,12 @@ class SiteProfiler:
         }
 
         try:
-            async with httpx.AsyncClient(
-                verify=False,
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers=DEFAULT_HEADERS,
-            ) as client:
-                response = await client.get(sample_url)
+            async with pooled_client("crawl") as client:
+                response = await client.get(
+                    sample_url,
+                    headers=DEFAULT_HEADERS,
+                    timeout=self.timeout,
+                )
                 if response.status_code != 200:
                     return None
 
@@ -0,0 +1,268 @@
+"""Multi-domain crawl scheduler: per-host politeness, global in-flight cap and page budget."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from python_scripts.config.settings import settings
+from python_scripts.ingestion.rate_control import (
+    HostRateController,
+    RateTicket,
+    host_rate_controller,
+    rate_host,
+)
+from python_scripts.ingestion.robots_txt import parse_robots_txt
+from python_scripts.utils.logging import get_logger
+
+from .extraction_engine import PolitenessGate
+
+logger = get_logger(__name__)
+
+
+# Hosts are scheduled under the same key as the rate controller
+host_key = rate_host
+
+
+class CrawlBudget:
+    """Pages a whole run may fetch, shared by all domains."""
+
+    def __init__(self, max_pages: Optional[int] = None) -> None:
+        """
+        Initialize the budget.
+
+        Args:
+            max_pages: Pages allowed for the run (None or 0: unlimited)
+        """
+        self.max_pages = max_pages or None
+        self.used = 0
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Pages left (None when unlimited)."""
+        if self.max_pages is None:
+            return None
+        return max(0, self.max_pages - self.used)
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether no page is left."""
+        return self.remaining == 0
+
+    def reserve(self, count: int) -> int:
+        """
+        Take up to `count` pages from the budget.
+
+        Returns:
+            Number of pages granted
+        """
+        granted = count if self.max_pages is None else min(count, self.remaining)
+        self.used += granted
+        return granted
+
+
+@dataclass
+class HostPolicy:
+    """Concurrency and request spacing applied to one host."""
+
+    host: str
+    delay: float
+    gate: PolitenessGate
+
+
+class CrawlScheduler:
+    """
+    Scrapes several domains at the same time.
+
+    Domains run concurrently (max_domains at once). Every page request goes
+    through slot(), which applies, in this order, the adaptive per-host
+    concurrency limit (HostRateController, capped by per_host_concurrency),
+    the per-host delay (scraping_politeness_delay, raised to the robots.txt
+    Crawl-delay of the host) and the global in-flight cap. The page budget is
+    shared by the whole run.
+    """
+
+    def __init__(
+        self,
+        max_domains: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        per_host_concurrency: Optional[int] = None,
+        politeness_delay: Optional[float] = None,
+        page_budget: Optional[int] = None,
+        respect_crawl_delay: bool = True,
+        rate_controller: Optional[HostRateController] = None,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_domains: Domains scraped at the same time
+                (default: settings.scraping_max_parallel_domains)
+            max_in_flight: Page requests in flight across all hosts
+                (default: settings.scraping_max_in_flight)
+            per_host_concurrency: Ceiling of the adaptive per-host concurrency
+                (default: settings.scraping_max_concurrency)
+            politeness_delay: Minimum delay between two requests to a host
+                (default: settings.scraping_politeness_delay)
+            page_budget: Pages fetched by the whole run, 0 or None for no limit
+                (default: settings.scraping_page_budget)
+            respect_crawl_delay: Apply the robots.txt Crawl-delay of each host
+            rate_controller: Per-host concurrency controller (default: the
+                process-level host_rate_controller, which keeps learned limits)
+        """
+        self.max_domains = max(
+            1, max_domains if max_domains is not None else settings.scraping_max_parallel_domains
+        )
+        self.max_in_flight = max(
+            1, max_in_flight if max_in_flight is not None else settings.scraping_max_in_flight
+        )
+        self.per_host_concurrency = max(
+            1, per_host_concurrency if per_host_concurrency is not None else settings.scraping_max_concurrency
+        )
+        self.politeness_delay = (
+            politeness_delay if politeness_delay is not None else settings.scraping_politeness_delay
+        )
+        self.respect_crawl_delay = respect_crawl_delay
+        self.rate_controller = rate_controller or host_rate_controller
+        self.budget = CrawlBudget(page_budget if page_budget is not None else settings.scraping_page_budget)
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        self._hosts: Dict[str, HostPolicy] = {}
+        self._report_lock = asyncio.Lock()
+
+    def _policy(self, host: str, delay: Optional[float] = None) -> HostPolicy:
+        policy = self._hosts.get(host)
+        if policy is None:
+            delay = self.politeness_delay if delay is None else delay
+            policy = HostPolicy(
+                host=host,
+                delay=delay,
+                gate=PolitenessGate(delay),
+            )
+            self._hosts[host] = policy
+        return policy
+
+    async def prepare_host(self, domain: str) -> HostPolicy:
+        """
+        Set up the policy of a host, reading its robots.txt Crawl-delay.
+
+        Args:
+            domain: Domain name
+
+        Returns:
+            Policy of the host
+        """
+        host = host_key(domain)
+        if host in self._hosts:
+            return self._hosts[host]
+
+        delay = self.politeness_delay
+        if self.respect_crawl_delay:
+            try:
+                parser = await parse_robots_txt(domain)
+                crawl_delay = parser.get_crawl_delay() if parser else None
+            except Exception as e:
+                logger.debug("Crawl-delay lookup failed", domain=domain, error=str(e))
+                crawl_delay = None
+            if crawl_delay:
+                delay = max(delay, min(float(crawl_delay), settings.scraping_max_crawl_delay))
+
+        policy = self._policy(host, delay)
+        logger.debug("Host policy", host=host, delay=policy.delay, concurrency=self.per_host_concurrency)
+        return policy
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[RateTicket]:
+        """
+        Hold a request slot for a URL (host limit, host delay, global cap).
+
+        The caller reports the response through the yielded ticket so that
+        the host limit adapts.
+        """
+        policy = self._policy(host_key(url))
+        async with self.rate_controller.slot(url, max_limit=self.per_host_concurrency) as ticket:
+            await policy.gate.wait()
+            async with self._in_flight:
+                yield ticket
+
+    async def run(
+        self,
+        domains: List[str],
+        scrape_domain: Callable[[str], Awaitable[Dict[str, Any]]],
+        on_domain_done: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Scrape domains concurrently.
+
+        Args:
+            domains: Domains to scrape (duplicates are scraped once)
+            scrape_domain: Coroutine scraping one domain and returning its result
+            on_domain_done: Coroutine called with (domain, result) as each
+                domain finishes; calls are serialized
+
+        Returns:
+            Result of each domain, in the order of `domains`. A domain whose
+            scrape raised gets {"articles": [], "statistics": {}, "error": ...}.
+        """
+        domains = list(dict.fromkeys(domains))
+        domain_slots = asyncio.Semaphore(self.max_domains)
+
+        async def run_domain(domain: str) -> Dict[str, Any]:
+            async with domain_slots:
+                await self.prepare_host(domain)
+                try:
+                    result = await scrape_domain(domain)
+                except Exception as e:
+                    logger.error("Error scraping domain", domain=domain, error=str(e))
+                    result = {"articles": [], "statistics": {}, "error": str(e)}
+            if on_domain_done is not None:
+                async with self._report_lock:
+                    try:
+                        await on_domain_done(domain, result)
+                    except Exception as e:
+                        logger.warning("Domain report failed", domain=domain, error=str(e))
+            return result
+
+        logger.info(
+            "Multi-domain crawl started",
+            domains=len(domains),
+            max_domains=self.max_domains,
+            max_in_flight=self.max_in_flight,
+            page_budget=self.budget.max_pages,
+        )
+        results = await asyncio.gather(*(run_domain(domain) for domain in domains))
+        logger.info("Multi-domain crawl complete", domains=len(domains), pages_used=self.budget.used)
+        return dict(zip(domains, results))
+
+
+def summarize_domain_results(results: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Aggregate per-domain scraping results into workflow statistics.
+
+    Args:
+        results: Result of each domain (statistics dict, "error" when it failed)
+
+    Returns:
+        Global statistics of the run
+    """
+    global_stats = {
+        "total_domains": len(results),
+        "domains_with_articles": 0,
+        "domains_without_articles": 0,
+        "domains_with_errors": 0,
+        "total_articles_discovered": 0,
+        "total_articles_scraped": 0,
+        "total_articles_valid": 0,
+    }
+    for result in results.values():
+        if result.get("error"):
+            global_stats["domains_with_errors"] += 1
+            continue
+        stats = result.get("statistics", {})
+        global_stats["total_articles_discovered"] += stats.get("discovered", 0)
+        global_stats["total_articles_scraped"] += stats.get("scraped", 0)
+        global_stats["total_articles_valid"] += stats.get("valid", 0)
+        if stats.get("valid", 0) > 0:
+            global_stats["domains_with_articles"] += 1
+        else:
+            global_stats["domains_without_articles"] += 1
+    return global_stats
@@ -1,7 +1,8 @@
 """Trend Pipeline Agent - Orchestrates the 4-stage hybrid trend extraction pipeline."""
 
+import asyncio
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 import numpy as np
@@ -9,15 +10,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from python_scripts.agents.base_agent import BaseAgent
 from python_scripts.agents.trend_pipeline.clustering import BertopicClusterer, ClusteringConfig, EmbeddingFetcher, OutlierHandler, TopicLabeler
+from python_scripts.agents.trend_pipeline import compute_tasks
 from python_scripts.agents.trend_pipeline.temporal import TemporalAnalyzer, TemporalConfig
-from python_scripts.agents.trend_pipeline.llm_enrichment import LLMEnricher, LLMEnrichmentConfig
+from python_scripts.agents.trend_pipeline.llm_enrichment import EnrichmentJob, EnrichmentScheduler, LLMEnricher, LLMEnrichmentConfig
 from python_scripts.agents.trend_pipeline.gap_analysis import GapAnalyzer, GapAnalysisConfig
 from python_scripts.database.crud_clusters import (
     create_topic_clusters_batch,
     create_topic_outliers_batch,
 )
 from python_scripts.database.models import TrendPipelineExecution
+from python_scripts.utils.compute_executor import compute_executor
 from python_scripts.utils.logging import get_logger
+from python_scripts.vectorstore.collection_cache import collection_cache
 from python_scripts.analysis.article_enrichment.topic_filters import (
     classify_topic_label,
 )
@@ -91,6 +95,11 @@ class TrendPipelineAgent(BaseAgent):
                 generate_visualizations=clustering_config.generate_visualizations,
                 save_centroids_to_qdrant=clustering_config.save_centroids_to_qdrant,
                 centroid_collection=clustering_config.centroid_collection,
+                incremental=clustering_config.incremental,
+                model_store_dir=clustering_config.model_store_dir,
+                refit_new_points_ratio=clustering_config.refit_new_points_ratio,
+                refit_drift_threshold=clustering_config.refit_drift_threshold,
+                refit_outlier_ratio=clustering_config.refit_outlier_ratio,
             )
         elif client_domain and clustering_config.embedding_collection == "competitor_articles":
             # If collection name is still default, regenerate it
@@ -141,15 +150,13 @@ class TrendPipelineAgent(BaseAgent):
         # Check if Qdrant collection exists
         try:
             client = self._embedding_fetcher.client
-            collections = client.get_collections().collections
-            collection_names = [c.name for c in collections]
 
-            if collection_name not in collection_names:
+            if not collection_cache.exists(client, collection_name):
                 # Collection doesn't exist - create it automatically
                 logger.warning(
                     "Collection does not exist, creating empty collection automatically",
                     collection=collection_name,
-                    available_collections=collection_names,
+                    available_collections=collection_cache.list_collections(client),
                 )
 
                 # Create the collection using qdrant_client wrapper
@@ -520,8 +527,9 @@ class TrendPipelineAgent(BaseAgent):
         time_window_days: int,
     ) -> Dict[str, Any]:
         """Execute Stage 1: Clustering."""
-        # Fetch embeddings from Qdrant
-        embeddings, metadata, document_ids = self._embedding_fetcher.fetch_embeddings(
+        # Fetch embeddings from Qdrant (blocking client, kept off the event loop)
+        embeddings, metadata, document_ids = await asyncio.to_thread(
+            self._embedding_fetcher.fetch_embeddings,
             domains=domains,
             max_age_days=time_window_days,
         )
@@ -562,10 +570,13 @@ class TrendPipelineAgent(BaseAgent):
         # Extract texts for clustering
         texts = [m.get("content_text", m.get("title", "")) for m in metadata]
         
-        # Run clustering
-        cluster_result = self._clusterer.cluster(
+        # Run clustering in the compute pool (reuses the stored model when only a few articles changed)
+        cluster_result = await compute_executor.run(
+            compute_tasks.run_clustering,
+            self.clustering_config,
             texts=texts,
             embeddings=embeddings,
+            document_ids=document_ids,
             metadata=metadata,
         )
         
@@ -574,7 +585,9 @@ class TrendPipelineAgent(BaseAgent):
         
         # Generate labels
         clusters = self._topic_labeler.generate_labels(cluster_result["clusters"])
-        clusters = self._topic_labeler.calculate_coherence_scores(
+        clusters = await compute_executor.run(
+            compute_tasks.run_coherence_scores,
+            self.clustering_config,
             clusters,
             embeddings=embeddings,
             topics=cluster_result["topics"],
@@ -632,6 +645,8 @@ class TrendPipelineAgent(BaseAgent):
             "documents": documents,
             "texts": texts,
             "total_articles": len(embeddings),
+            "clustering_mode": cluster_result.get("clustering_mode", "full"),
+            "refit_reason": cluster_result.get("refit_reason"),
         }
     
     async def _execute_stage_2_temporal(
@@ -653,7 +668,9 @@ class TrendPipelineAgent(BaseAgent):
             documents_by_topic[topic_id].append(doc)
         
         # Analyze temporal metrics
-        metrics = self._temporal_analyzer.analyze_all_topics(
+        metrics = await compute_executor.run(
+            compute_tasks.run_temporal_analysis,
+            self.temporal_config,
             clusters=clusters,
             documents_by_topic=documents_by_topic,
             centroids=centroids,
@@ -682,13 +699,12 @@ class TrendPipelineAgent(BaseAgent):
     ) -> Dict[str, Any]:
         """Execute Stage 3: LLM Enrichment."""
         from python_scripts.database.crud_llm_results import (
-            create_trend_analysis,
             create_article_recommendation,
+            create_article_recommendations_batch,
+            create_trend_analyses_batch,
+            create_trend_analysis,
         )
-        from python_scripts.database.crud_clusters import get_topic_cluster_by_topic_id
-        
-        # Build temporal lookup
-        temporal_lookup = {m["topic_id"]: m for m in temporal_metrics}
+        from python_scripts.database.crud_clusters import get_topic_clusters_by_topic_ids
         
         syntheses = []
         recommendations = []
@@ -707,100 +723,94 @@ class TrendPipelineAgent(BaseAgent):
             total_topics=len(temporal_metrics),
             topics_to_process=len(top_topics),
             max_topics_config=max_topics,
+            max_concurrent_topics=self.llm_config.max_concurrent_topics,
         )
         
+        # Pre-load database clusters of every topic in one query
+        clusters_by_topic = {c["topic_id"]: c for c in clusters}
+        db_clusters = await get_topic_clusters_by_topic_ids(
+            self.db_session,
+            analysis_id,
+            [m["topic_id"] for m in top_topics],
+        )
+        
+        jobs = []
         for metrics in top_topics:
             topic_id = metrics["topic_id"]
             
-            # Find cluster
-            cluster = next((c for c in clusters if c["topic_id"] == topic_id), None)
+            cluster = clusters_by_topic.get(topic_id)
             if not cluster:
                 continue
             
-            # Get database cluster record
-            db_cluster = await get_topic_cluster_by_topic_id(
-                self.db_session,
-                analysis_id,
-                topic_id,
-            )
+            db_cluster = db_clusters.get(topic_id)
             if not db_cluster:
                 logger.warning(f"Database cluster not found for topic {topic_id}, analysis_id={analysis_id}")
                 continue
             
-            # Extract keywords
-            keywords = [t["word"] for t in cluster.get("top_terms", {}).get("terms", [])[:10]]
+            jobs.append(EnrichmentJob(
+                priority=-metrics.get("potential_score", 0),
+                sequence=len(jobs),
+                topic_id=topic_id,
+                payload={"cluster": cluster, "metrics": metrics, "db_cluster_id": db_cluster.id},
+            ))
+        
+        # Analyze outliers for weak signals (runs alongside topic enrichment)
+        outlier_task = None
+        if outliers:
+            outlier_task = asyncio.create_task(
+                self._llm_enricher.analyze_outliers(outliers=outliers, texts=texts)
+            )
+        
+        # Enrich topics concurrently, highest potential first
+        # The topic timeout is applied inside _enrich_topic so that a finished
+        # synthesis survives when angle generation runs out of time
+        scheduler = EnrichmentScheduler(max_concurrency=self.llm_config.max_concurrent_topics)
+        try:
+            enriched = await scheduler.run(jobs, lambda job: self._enrich_topic(job, texts))
+        except BaseException:
+            if outlier_task:
+                outlier_task.cancel()
+            raise
+        
+        # Save results with one insert per table (no database access while enriching)
+        analyses_data = []
+        recommendations_data = []
+        for job, (synthesis, angles) in enriched:
+            db_cluster_id = job.payload["db_cluster_id"]
             
-            # Get representative docs
-            doc_indices = cluster.get("document_ids", {}).get("indices", [])[:3]
-            rep_docs = [texts[i] for i in doc_indices if i < len(texts)]
+            synthesis["topic_id"] = job.topic_id
+            syntheses.append(synthesis)
+            analyses_data.append({
+                "topic_cluster_id": db_cluster_id,
+                "synthesis": synthesis.get("synthesis", ""),
+                "saturated_angles": synthesis.get("saturated_angles"),
+                "opportunities": synthesis.get("opportunities"),
+                "llm_model_used": synthesis.get("llm_model_used", "unknown"),
+            })
             
-            try:
-                # Generate synthesis
-                synthesis = await self._llm_enricher.synthesize_trend(
-                    topic_label=cluster["label"],
-                    keywords=keywords,
-                    volume=cluster["size"],
-                    time_period=365,
-                    velocity=metrics.get("velocity", 1.0),
-                    velocity_trend=metrics.get("velocity_trend", "stable"),
-                    source_diversity=metrics.get("source_diversity", 1),
-                    representative_docs=rep_docs,
-                )
-                
-                synthesis["topic_id"] = topic_id
-                syntheses.append(synthesis)
-                
-                # Save trend analysis to database
-                try:
-                    await create_trend_analysis(
-                        db_session=self.db_session,
-                        topic_cluster_id=db_cluster.id,
-                        synthesis=synthesis.get("synthesis", ""),
-                        saturated_angles=synthesis.get("saturated_angles"),
-                        opportunities=synthesis.get("opportunities"),
-                        llm_model_used=synthesis.get("llm_model_used", "unknown"),
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to save trend analysis for topic {topic_id}", error=str(e))
-                
-                # Generate article angles
-                angles = await self._llm_enricher.generate_article_angles(
-                    topic_label=cluster["label"],
-                    keywords=keywords,
-                    saturated_angles=synthesis.get("saturated_angles", []),
-                    opportunities=synthesis.get("opportunities", []),
-                    num_angles=3,
-                )
-                
-                for angle in angles:
-                    angle["topic_cluster_id"] = topic_id
-                    recommendations.append(angle)
-                    
-                    # Save article recommendation to database
-                    try:
-                        await create_article_recommendation(
-                            db_session=self.db_session,
-                            topic_cluster_id=db_cluster.id,
-                            title=angle.get("title", ""),
-                            hook=angle.get("hook", ""),
-                            outline=angle.get("outline", {}),
-                            effort_level=angle.get("effort_level", "medium"),
-                            differentiation_score=angle.get("differentiation_score"),
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to save article recommendation for topic {topic_id}", error=str(e))
-                    
-            except Exception as e:
-                logger.warning(f"LLM enrichment failed for topic {topic_id}", error=str(e))
+            for angle in angles:
+                angle["topic_cluster_id"] = job.topic_id
+                recommendations.append(angle)
+                recommendations_data.append({
+                    "topic_cluster_id": db_cluster_id,
+                    "title": angle.get("title", ""),
+                    "hook": angle.get("hook", ""),
+                    "outline": angle.get("outline", {}),
+                    "effort_level": angle.get("effort_level", "medium"),
+                    "differentiation_score": angle.get("differentiation_score"),
+                })
+        
+        await self._save_rows(
+            create_trend_analyses_batch, create_trend_analysis, analyses_data, "trend analysis"
+        )
+        await self._save_rows(
+            create_article_recommendations_batch, create_article_recommendation, recommendations_data, "article recommendation"
+        )
         
-        # Analyze outliers for weak signals
         weak_signal_analysis = None
-        if outliers:
+        if outlier_task:
             try:
-                weak_signal_analysis = await self._llm_enricher.analyze_outliers(
-                    outliers=outliers,
-                    texts=texts,
-                )
+                weak_signal_analysis = await outlier_task
             except Exception as e:
                 logger.warning("Outlier analysis failed", error=str(e))
         
@@ -809,8 +819,115 @@ class TrendPipelineAgent(BaseAgent):
             "syntheses": syntheses,
             "recommendations": recommendations,
             "weak_signal_analysis": weak_signal_analysis,
+            "enrichment_stats": scheduler.get_stats(),
         }
     
+    async def _enrich_topic(
+        self,
+        job: EnrichmentJob,
+        texts: List[str],
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Generate the synthesis and article angles of one topic (no database access).
+        
+        The whole topic is bounded by topic_timeout_seconds. If angle generation
+        fails or runs out of time, the synthesis is still returned (without angles).
+        
+        Args:
+            job: Enrichment job (cluster and temporal metrics in its payload)
+            texts: Document texts
+            
+        Returns:
+            Tuple of (synthesis, article angles)
+        """
+        loop = asyncio.get_running_loop()
+        timeout = self.llm_config.topic_timeout_seconds
+        deadline = loop.time() + timeout if timeout else None
+        
+        def remaining() -> Optional[float]:
+            return None if deadline is None else max(0.0, deadline - loop.time())
+        
+        cluster = job.payload["cluster"]
+        metrics = job.payload["metrics"]
+        
+        # Extract keywords
+        keywords = [t["word"] for t in cluster.get("top_terms", {}).get("terms", [])[:10]]
+        
+        # Get representative docs
+        doc_indices = cluster.get("document_ids", {}).get("indices", [])[:3]
+        rep_docs = [texts[i] for i in doc_indices if i < len(texts)]
+        
+        # Generate synthesis (a timeout here fails the topic)
+        synthesis = await asyncio.wait_for(
+            self._llm_enricher.synthesize_trend(
+                topic_label=cluster["label"],
+                keywords=keywords,
+                volume=cluster["size"],
+                time_period=365,
+                velocity=metrics.get("velocity", 1.0),
+                velocity_trend=metrics.get("velocity_trend", "stable"),
+                source_diversity=metrics.get("source_diversity", 1),
+                representative_docs=rep_docs,
+            ),
+            timeout=remaining(),
+        )
+        
+        # Generate article angles (failures keep the synthesis)
+        try:
+            angles = await asyncio.wait_for(
+                self._llm_enricher.generate_article_angles(
+                    topic_label=cluster["label"],
+                    keywords=keywords,
+                    saturated_angles=synthesis.get("saturated_angles", []),
+                    opportunities=synthesis.get("opportunities", []),
+                    num_angles=3,
+                ),
+                timeout=remaining(),
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Article angles timed out, keeping synthesis", topic_id=job.topic_id, timeout=timeout)
+            angles = []
+        except Exception as e:
+            logger.warning("Failed to generate article angles, keeping synthesis", topic_id=job.topic_id, error=str(e))
+            angles = []
+        
+        return synthesis, angles
+    
+    async def _save_rows(
+        self,
+        create_batch: Any,
+        create_one: Any,
+        rows: List[Dict[str, Any]],
+        label: str,
+    ) -> None:
+        """
+        Save rows with one batch insert, falling back to one insert per row.
+        
+        Args:
+            create_batch: Batch CRUD function (db_session, rows)
+            create_one: Single-row CRUD function (db_session, **row)
+            rows: Rows to insert
+            label: Row type used in log messages
+        """
+        if not rows:
+            return
+        try:
+            await create_batch(self.db_session, rows)
+            return
+        except Exception as e:
+            logger.warning(f"Batch insert of {label} rows failed, saving row by row", count=len(rows), error=str(e))
+            await self.db_session.rollback()
+        
+        saved = 0
+        for row in rows:
+            try:
+                await create_one(self.db_session, **row)
+                saved += 1
+            except Exception as e:
+                logger.warning(f"Failed to save {label}", topic_cluster_id=row.get("topic_cluster_id"), error=str(e))
+                await self.db_session.rollback()
+        logger.info(f"Saved {label} rows individually", saved=saved, failed=len(rows) - saved)
+    
     async def _execute_stage_4_gap_analysis(
         self,
         analysis_id: int,
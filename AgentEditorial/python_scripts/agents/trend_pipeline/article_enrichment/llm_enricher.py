@@ -37,20 +37,33 @@ class ArticleLLMEnricher:
         self._llm_cache: Dict[str, Any] = {}
         self._toon_formatter = create_toon_formatter(enable_toon=enable_toon, log_savings=True)
     
-    def _get_llm(self, model_name: str, timeout: int = 300):
-        """Get or create LLM instance for a model."""
-        cache_key = f"{model_name}_{timeout}"
+    def _get_llm(self, model_name: str, timeout: int = 300, template: Optional[str] = None):
+        """Get or create LLM instance for a model (cached responses when template is set)."""
+        cache_key = f"{model_name}_{timeout}_{template}"
         if cache_key not in self._llm_cache:
             self._llm_cache[cache_key] = create_llm(
                 model_name=model_name,
                 temperature=0.7,
                 timeout=timeout,
+                cache_template=template,
+                cache_validate=self._is_json_response,
             )
         return self._llm_cache[cache_key]
     
-    async def _invoke_llm(self, prompt: str, model: str, timeout: int) -> str:
+    def _is_json_response(self, response: str) -> bool:
+        """Whether a response parses as JSON (unparsable responses are not cached)."""
+        result = self._parse_json_response(response)
+        return isinstance(result, dict) and "raw_response" not in result
+    
+    async def _invoke_llm(
+        self,
+        prompt: str,
+        model: str,
+        timeout: int,
+        template: Optional[str] = None,
+    ) -> str:
         """Invoke LLM asynchronously using thread pool."""
-        llm = self._get_llm(model, timeout)
+        llm = self._get_llm(model, timeout, template)
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
             self._executor,
@@ -143,6 +156,7 @@ class ArticleLLMEnricher:
                 prompt=prompt,
                 model=model,
                 timeout=self.config.outline_enrichment_timeout_seconds,
+                template="article_outline",
             )
             
             # Parse JSON response
@@ -242,6 +256,7 @@ class ArticleLLMEnricher:
                 prompt=prompt,
                 model=model,
                 timeout=self.config.angle_personalization_timeout_seconds,
+                template="article_hook",
             )
             
             # Parse JSON response
@@ -362,6 +377,7 @@ class ArticleLLMEnricher:
                 prompt=prompt,
                 model=model,
                 timeout=self.config.outline_enrichment_timeout_seconds,
+                template="article_complete",
             )
             
             # Parse JSON response
@@ -11,6 +11,8 @@ from umap import UMAP
 
 from python_scripts.agents.trend_pipeline.clustering.config import ClusteringConfig
 from python_scripts.agents.trend_pipeline.clustering.embedding_fetcher import EmbeddingFetcher
+from python_scripts.agents.trend_pipeline.clustering.model_store import ClusteringModelStore
+from python_scripts.agents.trend_pipeline.kernels import topic_centroids
 from python_scripts.config.settings import settings
 from python_scripts.utils.logging import get_logger
 from python_scripts.vectorstore.embeddings_utils import get_embedding_model
@@ -21,19 +23,35 @@ logger = get_logger(__name__)
 class BertopicClusterer:
     """BERTopic-based document clustering."""
     
-    def __init__(self, config: Optional[ClusteringConfig] = None):
+    def __init__(
+        self,
+        config: Optional[ClusteringConfig] = None,
+        load_embedding_model: bool = True,
+    ):
         """
         Initialize the clusterer.
         
         Args:
             config: Clustering configuration
+            load_embedding_model: Attach the sentence-transformers model to
+                BERTopic. When False, fits with precomputed embeddings do not
+                load it (compute workers); it is still loaded to embed texts
+                given without embeddings.
         """
         self.config = config or ClusteringConfig.default()
+        self.load_embedding_model = load_embedding_model
         self._model: Optional[BERTopic] = None
         self._embedding_fetcher = EmbeddingFetcher(self.config)
+        self._model_store = ClusteringModelStore(self.config.model_store_dir)
     
-    def _create_model(self) -> BERTopic:
-        """Create and configure BERTopic model."""
+    def _create_model(self, with_embedding_model: bool = True) -> BERTopic:
+        """
+        Create and configure BERTopic model.
+        
+        Args:
+            with_embedding_model: Attach the embedding model (only needed to
+                embed documents, not to fit precomputed embeddings)
+        """
         cfg = self.config
         
         # Configure UMAP
@@ -56,7 +74,7 @@ class BertopicClusterer:
         )
         
         # Get embedding model
-        embedding_model = get_embedding_model()
+        embedding_model = get_embedding_model() if with_embedding_model else None
         
         # Create BERTopic model
         model = BERTopic(
@@ -111,48 +129,20 @@ class BertopicClusterer:
         logger.info("Starting clustering", documents=len(texts))
         
         # Create model
-        self._model = self._create_model()
+        has_embeddings = embeddings is not None and len(embeddings) > 0
+        self._model = self._create_model(
+            with_embedding_model=self.load_embedding_model or not has_embeddings
+        )
         
         try:
             # Fit model
-            if embeddings is not None and len(embeddings) > 0:
+            if has_embeddings:
                 topics, probs = self._model.fit_transform(texts, embeddings)
             else:
                 topics, probs = self._model.fit_transform(texts)
             
-            # Get topic info
-            topic_info = self._model.get_topic_info()
-            
             # Process results
-            clusters = []
-            outlier_indices = []
-            
-            for idx, row in topic_info.iterrows():
-                topic_id = row["Topic"]
-                
-                if topic_id == -1:
-                    # Outlier topic
-                    outlier_count = row["Count"]
-                    continue
-                
-                # Get topic representation
-                topic_words = self._model.get_topic(topic_id)
-                top_terms = [
-                    {"word": word, "score": float(score)}
-                    for word, score in topic_words[:10]
-                ] if topic_words else []
-                
-                # Find documents in this topic
-                doc_indices = [i for i, t in enumerate(topics) if t == topic_id]
-                
-                clusters.append({
-                    "topic_id": int(topic_id),
-                    "label": row.get("Name", f"Topic_{topic_id}"),
-                    "size": int(row["Count"]),
-                    "top_terms": top_terms,
-                    "document_indices": doc_indices,
-                    "representative_docs": row.get("Representative_Docs", []),
-                })
+            clusters = self._build_clusters(topics)
             
             # Get outlier indices
             outlier_indices = [i for i, t in enumerate(topics) if t == -1]
@@ -185,6 +175,279 @@ class BertopicClusterer:
                 "outliers": [],
             }
     
+    def _build_clusters(self, topics: List[int]) -> List[Dict[str, Any]]:
+        """
+        Build cluster dictionaries from the fitted model and topic assignments.
+        
+        Args:
+            topics: Topic assignment of each document
+            
+        Returns:
+            List of clusters (topics without documents are skipped)
+        """
+        topic_info = self._model.get_topic_info()
+        
+        doc_indices_by_topic: Dict[int, List[int]] = {}
+        for i, t in enumerate(topics):
+            doc_indices_by_topic.setdefault(t, []).append(i)
+        
+        clusters = []
+        for idx, row in topic_info.iterrows():
+            topic_id = row["Topic"]
+            
+            if topic_id == -1:
+                # Outlier topic
+                continue
+            
+            # Find documents in this topic
+            doc_indices = doc_indices_by_topic.get(topic_id, [])
+            if not doc_indices:
+                continue
+            
+            # Get topic representation
+            topic_words = self._model.get_topic(topic_id)
+            top_terms = [
+                {"word": word, "score": float(score)}
+                for word, score in topic_words[:10]
+            ] if topic_words else []
+            
+            clusters.append({
+                "topic_id": int(topic_id),
+                "label": row.get("Name", f"Topic_{topic_id}"),
+                "size": len(doc_indices),
+                "top_terms": top_terms,
+                "document_indices": doc_indices,
+                "representative_docs": row.get("Representative_Docs", []),
+            })
+        
+        return clusters
+    
+    def _state_key(self) -> str:
+        """Key of the persisted clustering state (one per client domain)."""
+        return self.config.client_domain or self.config.embedding_collection or "default"
+    
+    def _config_fingerprint(self) -> str:
+        """Fingerprint of the parameters that require a refit when changed."""
+        return repr((self.config.umap, self.config.hdbscan, self.config.bertopic))
+    
+    def cluster_incremental(
+        self,
+        texts: List[str],
+        embeddings: np.ndarray,
+        document_ids: List[str],
+        metadata: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Cluster documents, reusing the model fitted by a previous run when possible.
+        
+        Documents already seen keep their stored topic, new documents are
+        assigned with approximate prediction (UMAP transform + HDBSCAN
+        approximate_predict through BERTopic.transform). A full refit is done
+        when there is no usable stored model, when the share of new or removed
+        documents exceeds refit_new_points_ratio, when too many new documents
+        are outliers, or when topic centroids drift beyond refit_drift_threshold.
+        
+        Args:
+            texts: List of document texts
+            embeddings: Document embeddings
+            document_ids: Document IDs (Qdrant point IDs), aligned with texts
+            metadata: Document metadata (optional)
+            
+        Returns:
+            Clustering results (same format as cluster), plus clustering_mode
+            ("incremental" or "full") and refit_reason
+        """
+        cfg = self.config
+        if (
+            not cfg.incremental
+            or embeddings is None
+            or len(embeddings) != len(texts)
+            or len(document_ids) != len(texts)
+            or len(texts) < cfg.min_articles
+        ):
+            return self.cluster(texts, embeddings, metadata)
+        
+        embeddings = np.asarray(embeddings)
+        doc_ids = [str(d) for d in document_ids]
+        key = self._state_key()
+        state = self._model_store.load(key)
+        
+        refit_reason = None
+        if state is None:
+            refit_reason = "no_stored_model"
+        elif state.get("config_fingerprint") != self._config_fingerprint():
+            refit_reason = "config_changed"
+        elif state.get("dimension") != embeddings.shape[1]:
+            refit_reason = "dimension_changed"
+        else:
+            fitted_ids = state["fitted_ids"]
+            current_ids = set(doc_ids)
+            new_count = sum(1 for d in doc_ids if d not in fitted_ids)
+            removed_count = sum(1 for d in fitted_ids if d not in current_ids)
+            change_ratio = (new_count + removed_count) / max(1, state["fit_size"])
+            if change_ratio > cfg.refit_new_points_ratio:
+                refit_reason = "new_points_ratio"
+            logger.info(
+                "Stored clustering model found",
+                key=key,
+                fitted_at=state.get("fitted_at"),
+                new_documents=new_count,
+                removed_documents=removed_count,
+                change_ratio=round(change_ratio, 3),
+            )
+        
+        if refit_reason is None:
+            result = self._assign_incremental(state, texts, embeddings, doc_ids)
+            refit_reason = result.get("refit_reason")
+            if result.get("success") and refit_reason is None:
+                state["assignments"] = {**state["assignments"], **dict(zip(doc_ids, result["topics"]))}
+                self._model_store.save(key, state)
+                return result
+        
+        logger.info("Full clustering refit", key=key, reason=refit_reason)
+        result = self.cluster(texts, embeddings, metadata)
+        if result.get("success"):
+            self._save_state(key, doc_ids, embeddings, result)
+        result["clustering_mode"] = "full"
+        result["refit_reason"] = refit_reason
+        return result
+    
+    def _assign_incremental(
+        self,
+        state: Dict[str, Any],
+        texts: List[str],
+        embeddings: np.ndarray,
+        doc_ids: List[str],
+    ) -> Dict[str, Any]:
+        """
+        Assign documents with a stored model (no refit).
+        
+        Returns:
+            Clustering results, or a dictionary with refit_reason when the
+            stored model no longer fits the corpus
+        """
+        cfg = self.config
+        model = state["model"]
+        assignments = state["assignments"]
+        
+        topics: List[int] = [assignments.get(d, -1) for d in doc_ids]
+        new_indices = [i for i, d in enumerate(doc_ids) if d not in assignments]
+        
+        try:
+            if new_indices:
+                new_topics, _ = model.transform(
+                    [texts[i] for i in new_indices],
+                    embeddings[new_indices],
+                )
+                for i, topic_id in zip(new_indices, new_topics):
+                    topics[i] = int(topic_id)
+                
+                new_outlier_ratio = sum(1 for t in new_topics if t == -1) / len(new_indices)
+                if (
+                    len(new_indices) >= cfg.hdbscan.min_cluster_size
+                    and new_outlier_ratio > cfg.refit_outlier_ratio
+                ):
+                    logger.info(
+                        "Too many new documents are outliers",
+                        new_documents=len(new_indices),
+                        outlier_ratio=round(new_outlier_ratio, 3),
+                    )
+                    return {"success": False, "refit_reason": "outlier_ratio"}
+            
+            centroids = self._calculate_centroids(embeddings, topics)
+            drift = self._centroid_drift(state["reference_centroids"], centroids, topics)
+            if drift > cfg.refit_drift_threshold:
+                logger.info("Topic centroids drifted", drift=round(drift, 4))
+                return {"success": False, "refit_reason": "drift"}
+            
+            self._model = model
+            clusters = self._build_clusters(topics)
+            outlier_indices = [i for i, t in enumerate(topics) if t == -1]
+            
+            logger.info(
+                "Incremental clustering complete",
+                num_topics=len(clusters),
+                num_outliers=len(outlier_indices),
+                new_documents=len(new_indices),
+                drift=round(drift, 4),
+            )
+            
+            return {
+                "success": True,
+                "topics": topics,
+                "probabilities": None,
+                "clusters": clusters,
+                "outlier_indices": outlier_indices,
+                "centroids": centroids,
+                "model": model,
+                "clustering_mode": "incremental",
+                "refit_reason": None,
+                "new_documents": len(new_indices),
+                "centroid_drift": drift,
+            }
+        except Exception as e:
+            logger.warning("Incremental assignment failed", error=str(e))
+            return {"success": False, "refit_reason": "prediction_failed"}
+    
+    def _centroid_drift(
+        self,
+        reference_centroids: Dict[int, np.ndarray],
+        centroids: Dict[int, np.ndarray],
+        topics: List[int],
+    ) -> float:
+        """
+        Size-weighted mean cosine distance between stored and current centroids.
+        
+        Args:
+            reference_centroids: Centroids at fit time
+            centroids: Current centroids
+            topics: Current topic assignments
+            
+        Returns:
+            Drift in [0, 2] (0 = no drift)
+        """
+        sizes: Dict[int, int] = {}
+        for t in topics:
+            sizes[t] = sizes.get(t, 0) + 1
+        
+        total_weight = 0
+        weighted_distance = 0.0
+        for topic_id, reference in reference_centroids.items():
+            current = centroids.get(topic_id)
+            if current is None:
+                continue
+            norm = np.linalg.norm(reference) * np.linalg.norm(current)
+            if norm == 0:
+                continue
+            distance = 1.0 - float(np.dot(reference, current) / norm)
+            weighted_distance += distance * sizes.get(topic_id, 0)
+            total_weight += sizes.get(topic_id, 0)
+        
+        return weighted_distance / total_weight if total_weight else 0.0
+    
+    def _save_state(
+        self,
+        key: str,
+        doc_ids: List[str],
+        embeddings: np.ndarray,
+        result: Dict[str, Any],
+    ) -> None:
+        """Persist the model and assignments of a full fit."""
+        topics = [int(t) for t in result["topics"]]
+        self._model_store.save(
+            key,
+            {
+                "model": result["model"],
+                "config_fingerprint": self._config_fingerprint(),
+                "dimension": int(embeddings.shape[1]),
+                "fitted_at": datetime.now().isoformat(),
+                "fit_size": len(doc_ids),
+                "fitted_ids": set(doc_ids),
+                "assignments": dict(zip(doc_ids, topics)),
+                "reference_centroids": result.get("centroids") or {},
+            },
+        )
+    
     def _calculate_centroids(
         self,
         embeddings: np.ndarray,
@@ -200,21 +463,7 @@ class BertopicClusterer:
         Returns:
             Dictionary mapping topic_id to centroid vector
         """
-        centroids = {}
-        unique_topics = set(topics)
-        
-        for topic_id in unique_topics:
-            if topic_id == -1:
-                continue
-            
-            # Get embeddings for this topic
-            topic_embeddings = embeddings[[i for i, t in enumerate(topics) if t == topic_id]]
-            
-            if len(topic_embeddings) > 0:
-                centroid = np.mean(topic_embeddings, axis=0)
-                centroids[topic_id] = centroid
-        
-        return centroids
+        return topic_centroids(embeddings, topics)
     
     def get_topic_hierarchy(self) -> Optional[Dict[str, Any]]:
         """
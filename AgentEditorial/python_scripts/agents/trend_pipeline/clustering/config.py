@@ -82,6 +82,14 @@ class ClusteringConfig:
     generate_visualizations: bool = True
     save_centroids_to_qdrant: bool = True
     centroid_collection: str = "topic_centroids"
+
+    # Incremental clustering: reuse the model fitted by a previous run and only
+    # assign new articles (approximate prediction), refit when thresholds are crossed
+    incremental: bool = True
+    model_store_dir: str = "cache/trend_models"
+    refit_new_points_ratio: float = 0.2  # (new + removed articles) / fitted articles
+    refit_drift_threshold: float = 0.15  # Mean centroid shift (cosine distance)
+    refit_outlier_ratio: float = 0.5  # Share of new articles predicted as outliers
     
     @classmethod
     def default(cls) -> "ClusteringConfig":
@@ -10,6 +10,7 @@ from qdrant_client.http import models as qdrant_models
 from python_scripts.agents.trend_pipeline.clustering.config import ClusteringConfig
 from python_scripts.config.settings import settings
 from python_scripts.utils.logging import get_logger
+from python_scripts.vectorstore.collection_cache import collection_cache
 
 logger = get_logger(__name__)
 
@@ -62,10 +63,7 @@ class EmbeddingFetcher:
         
         # Check if collection exists
         try:
-            collections = self.client.get_collections().collections
-            collection_names = [c.name for c in collections]
-            
-            if collection_name not in collection_names:
+            if not collection_cache.exists(self.client, collection_name):
                 logger.debug(
                     "Collection does not exist, skipping",
                     collection=collection_name,
@@ -367,10 +365,7 @@ class EmbeddingFetcher:
         
         try:
             # Check if collection exists, create if not
-            collections = self.client.get_collections().collections
-            collection_names = [c.name for c in collections]
-            
-            if collection_name not in collection_names:
+            if not collection_cache.exists(self.client, collection_name):
                 # Get vector dimension from first centroid
                 vector_size = centroids.shape[1] if len(centroids) > 0 else 1024
                 
@@ -381,6 +376,9 @@ class EmbeddingFetcher:
                         distance=qdrant_models.Distance.COSINE,
                     ),
                 )
+                collection_cache.mark_created(
+                    collection_name, vector_size, qdrant_models.Distance.COSINE
+                )
                 logger.info("Created centroid collection", collection=collection_name)
             
             # Prepare points
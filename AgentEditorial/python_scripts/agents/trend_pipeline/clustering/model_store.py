@@ -0,0 +1,99 @@
+"""Persistence of fitted clustering models for incremental runs (ETAGE 1)."""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import joblib
+
+from python_scripts.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the stored state layout changes (older states are ignored)
+STATE_VERSION = 1
+
+
+class ClusteringModelStore:
+    """
+    File store of fitted BERTopic models and their clustering state.
+
+    One state per key (client domain or collection name), containing the
+    fitted model (UMAP + HDBSCAN, without the embedding model), the topic
+    assignment of every fitted document and the reference centroids.
+    """
+
+    def __init__(self, base_dir: str):
+        """
+        Initialize the store.
+
+        Args:
+            base_dir: Directory where states are written
+        """
+        self.base_dir = Path(base_dir)
+
+    def _path(self, key: str) -> Path:
+        safe_key = re.sub(r"[^A-Za-z0-9_.-]", "_", key)
+        return self.base_dir / f"{safe_key}.joblib"
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the state of a key.
+
+        Args:
+            key: State key
+
+        Returns:
+            State dictionary or None if missing, unreadable or outdated
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            state = joblib.load(path)
+        except Exception as e:
+            logger.warning("Could not load clustering state", key=key, error=str(e))
+            return None
+
+        if state.get("version") != STATE_VERSION:
+            logger.info("Ignoring outdated clustering state", key=key, version=state.get("version"))
+            return None
+        return state
+
+    def save(self, key: str, state: Dict[str, Any]) -> bool:
+        """
+        Save the state of a key (the embedding model is never serialized).
+
+        Args:
+            key: State key
+            state: State dictionary (with a "model" entry)
+
+        Returns:
+            Success status
+        """
+        model = state.get("model")
+        embedding_model = getattr(model, "embedding_model", None)
+        path = self._path(key)
+
+        try:
+            self.base_dir.mkdir(parents=True, exist_ok=True)
+            if model is not None:
+                model.embedding_model = None
+            tmp_path = path.with_suffix(".tmp")
+            joblib.dump({**state, "version": STATE_VERSION}, tmp_path)
+            tmp_path.replace(path)
+            logger.info("Clustering state saved", key=key, path=str(path))
+            return True
+        except Exception as e:
+            logger.warning("Could not save clustering state", key=key, error=str(e))
+            return False
+        finally:
+            if model is not None:
+                model.embedding_model = embedding_model
+
+    def delete(self, key: str) -> None:
+        """Delete the state of a key (next run performs a full fit)."""
+        path = self._path(key)
+        if path.exists():
+            path.unlink()
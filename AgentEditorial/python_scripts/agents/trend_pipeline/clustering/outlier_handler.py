@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 
 from python_scripts.agents.trend_pipeline.clustering.config import ClusteringConfig
+from python_scripts.agents.trend_pipeline.kernels import nearest_centroids
 from python_scripts.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -44,33 +45,25 @@ class OutlierHandler:
             List of outlier documents with analysis
         """
         outliers = []
+        outlier_indices = [i for i, topic in enumerate(topics) if topic == -1]
         
-        for i, topic in enumerate(topics):
-            if topic != -1:
-                continue
-            
-            outlier = {
+        for i in outlier_indices:
+            outliers.append({
                 "index": i,
                 "document_id": document_ids[i] if i < len(document_ids) else str(i),
                 "metadata": metadata[i] if i < len(metadata) else {},
-            }
-            
-            # Calculate distance to nearest centroid if available
-            if embeddings is not None and centroids and len(centroids) > 0:
-                embedding = embeddings[i]
-                min_distance = float("inf")
-                nearest_topic = None
-                
-                for topic_id, centroid in centroids.items():
-                    distance = np.linalg.norm(embedding - centroid)
-                    if distance < min_distance:
-                        min_distance = distance
-                        nearest_topic = topic_id
-                
-                outlier["nearest_topic_id"] = nearest_topic
-                outlier["distance_to_nearest"] = float(min_distance)
-            
-            outliers.append(outlier)
+            })
+        
+        # Distance to nearest centroid (all outliers against all centroids in one matmul)
+        if outliers and embeddings is not None and centroids and len(centroids) > 0:
+            topic_ids = list(centroids.keys())
+            nearest, distances = nearest_centroids(
+                embeddings[outlier_indices],
+                np.vstack([centroids[t] for t in topic_ids]),
+            )
+            for outlier, position, distance in zip(outliers, nearest, distances):
+                outlier["nearest_topic_id"] = topic_ids[position]
+                outlier["distance_to_nearest"] = float(distance)
         
         logger.info(
             "Extracted outliers",
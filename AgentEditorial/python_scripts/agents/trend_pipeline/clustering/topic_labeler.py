@@ -3,6 +3,7 @@
 from typing import Any, Dict, List, Optional, Tuple
 
 from python_scripts.agents.trend_pipeline.clustering.config import ClusteringConfig
+from python_scripts.agents.trend_pipeline.kernels import segment_mean_pairwise_cosine
 from python_scripts.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -124,29 +125,11 @@ class TopicLabeler:
             return clusters
         
         try:
-            import numpy as np
-            from sklearn.metrics.pairwise import cosine_similarity
+            # Mean pairwise cosine similarity of every topic, in one pass
+            coherence = segment_mean_pairwise_cosine(embeddings, topics)
             
             for cluster in clusters:
-                topic_id = cluster["topic_id"]
-                
-                # Get embeddings for this topic
-                topic_indices = [i for i, t in enumerate(topics) if t == topic_id]
-                
-                if len(topic_indices) < 2:
-                    cluster["coherence_score"] = 1.0
-                    continue
-                
-                topic_embeddings = embeddings[topic_indices]
-                
-                # Calculate pairwise cosine similarities
-                similarities = cosine_similarity(topic_embeddings)
-                
-                # Average similarity (excluding diagonal)
-                n = len(similarities)
-                total_sim = (similarities.sum() - n) / (n * (n - 1)) if n > 1 else 1.0
-                
-                cluster["coherence_score"] = float(total_sim)
+                cluster["coherence_score"] = coherence.get(cluster["topic_id"], 1.0)
             
             return clusters
             
@@ -0,0 +1,82 @@
+"""CPU-bound pipeline tasks run in the compute executor worker processes.
+
+Each task rebuilds its component from the (picklable) config, so only the
+config, the inputs and the result cross the process boundary.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from python_scripts.agents.trend_pipeline.clustering import (
+    BertopicClusterer,
+    ClusteringConfig,
+    OutlierHandler,
+    TopicLabeler,
+)
+from python_scripts.agents.trend_pipeline.temporal import TemporalAnalyzer, TemporalConfig
+
+
+def run_clustering(
+    config: ClusteringConfig,
+    texts: List[str],
+    embeddings: np.ndarray,
+    document_ids: Optional[List[str]] = None,
+    metadata: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Run (incremental) BERTopic clustering.
+
+    The fitted model stays in the worker (it is persisted by the model
+    store) and is not sent back to the caller. Embeddings are precomputed,
+    so the worker does not load the sentence-transformers model.
+
+    Returns:
+        Clustering result of BertopicClusterer.cluster_incremental, without "model"
+    """
+    result = BertopicClusterer(config, load_embedding_model=False).cluster_incremental(
+        texts=texts,
+        embeddings=embeddings,
+        document_ids=document_ids,
+        metadata=metadata,
+    )
+    result.pop("model", None)
+    return result
+
+
+def run_coherence_scores(
+    config: ClusteringConfig,
+    clusters: List[Dict[str, Any]],
+    embeddings: np.ndarray,
+    topics: List[int],
+) -> List[Dict[str, Any]]:
+    """Compute cluster coherence scores (TopicLabeler.calculate_coherence_scores)."""
+    return TopicLabeler(config).calculate_coherence_scores(clusters, embeddings=embeddings, topics=topics)
+
+
+def run_potential_clusters(
+    config: ClusteringConfig,
+    outliers: List[Dict[str, Any]],
+    embeddings: np.ndarray,
+    min_cluster_size: int = 3,
+) -> List[Dict[str, Any]]:
+    """Find sub-clusters among outliers (OutlierHandler.find_potential_clusters)."""
+    return OutlierHandler(config).find_potential_clusters(
+        outliers, embeddings, min_cluster_size=min_cluster_size
+    )
+
+
+def run_temporal_analysis(
+    config: TemporalConfig,
+    clusters: List[Dict[str, Any]],
+    documents_by_topic: Dict[int, List[Dict[str, Any]]],
+    centroids: Optional[Dict[int, np.ndarray]] = None,
+    embeddings: Optional[np.ndarray] = None,
+) -> List[Dict[str, Any]]:
+    """Compute temporal metrics of every topic (TemporalAnalyzer.analyze_all_topics)."""
+    return TemporalAnalyzer(config).analyze_all_topics(
+        clusters=clusters,
+        documents_by_topic=documents_by_topic,
+        centroids=centroids,
+        embeddings=embeddings,
+    )
@@ -0,0 +1,229 @@
+"""Vectorized NumPy kernels shared by the trend pipeline stages.
+
+Per-topic computations (centroids, coherence, nearest centroid) are done
+with one pass over all documents (sparse indicator product, matmul)
+instead of one Python scan of the topic list per topic, which is
+O(topics x documents).
+"""
+
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+NOISE_TOPIC = -1
+
+
+def group_indices(labels: Sequence[int]) -> Dict[int, np.ndarray]:
+    """
+    Group document indices by label.
+
+    Args:
+        labels: Label of each document
+
+    Returns:
+        Dictionary mapping each label to the (sorted) indices of its documents
+    """
+    labels = np.asarray(labels)
+    if labels.size == 0:
+        return {}
+
+    order = np.argsort(labels, kind="stable")
+    unique, starts = np.unique(labels[order], return_index=True)
+    return {
+        int(label): indices
+        for label, indices in zip(unique, np.split(order, starts[1:]))
+    }
+
+
+def segment_sums(
+    values: np.ndarray,
+    labels: Sequence[int],
+    skip_noise: bool = True,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sum rows per label.
+
+    The sums are one sparse (labels x rows) indicator product, so rows are
+    neither copied nor sorted.
+
+    Args:
+        values: Row matrix (n x d)
+        labels: Label of each row
+        skip_noise: Ignore rows labelled NOISE_TOPIC
+
+    Returns:
+        Tuple of (unique labels, sums k x d, counts)
+    """
+    values = np.asarray(values)
+    labels = np.asarray(labels)
+    rows = np.flatnonzero(labels != NOISE_TOPIC) if skip_noise else np.arange(labels.size)
+    if rows.size == 0:
+        return np.empty(0, dtype=int), np.empty((0,) + values.shape[1:]), np.empty(0, dtype=int)
+
+    unique, inverse, counts = np.unique(labels[rows], return_inverse=True, return_counts=True)
+    dtype = values.dtype if np.issubdtype(values.dtype, np.floating) else np.float64
+    indicator = sparse.csr_matrix(
+        (np.ones(rows.size, dtype=dtype), (inverse, rows)),
+        shape=(unique.size, labels.size),
+    )
+    return unique, np.asarray(indicator @ values), counts
+
+
+def segment_means(
+    values: np.ndarray,
+    labels: Sequence[int],
+    skip_noise: bool = True,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Mean row per label.
+
+    Args:
+        values: Row matrix (n x d)
+        labels: Label of each row
+        skip_noise: Ignore rows labelled NOISE_TOPIC
+
+    Returns:
+        Tuple of (unique labels, means k x d, counts)
+    """
+    unique, sums, counts = segment_sums(values, labels, skip_noise=skip_noise)
+    return unique, sums / counts[:, None] if counts.size else sums, counts
+
+
+def topic_centroids(embeddings: np.ndarray, topics: Sequence[int]) -> Dict[int, np.ndarray]:
+    """
+    Centroid of each topic (noise topic excluded).
+
+    Args:
+        embeddings: Document embeddings
+        topics: Topic assignment of each document
+
+    Returns:
+        Dictionary mapping topic_id to centroid vector
+    """
+    unique, means, _ = segment_means(np.asarray(embeddings), topics)
+    return {int(topic_id): centroid for topic_id, centroid in zip(unique, means)}
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize rows (zero rows stay zero, float32 input stays float32)."""
+    matrix = np.asarray(matrix)
+    if not np.issubdtype(matrix.dtype, np.floating):
+        matrix = matrix.astype(np.float64)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def cosine_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Cosine similarity of every row of `a` with every row of `b` (one matmul)."""
+    return normalize_rows(a) @ normalize_rows(b).T
+
+
+def mean_pairwise_cosine(matrix: np.ndarray) -> float:
+    """
+    Mean cosine similarity of all pairs of distinct rows.
+
+    Uses sum_ij cos(i, j) = ||sum_i u_i||^2 (u_i normalized rows), so the
+    n x n similarity matrix is never built.
+
+    Args:
+        matrix: Row matrix (n x d)
+
+    Returns:
+        Mean pairwise similarity (1.0 when there are less than two rows)
+    """
+    n = len(matrix)
+    if n < 2:
+        return 1.0
+    total = normalize_rows(matrix).sum(axis=0, dtype=np.float64)
+    return float((total @ total - n) / (n * (n - 1)))
+
+
+def segment_mean_pairwise_cosine(
+    embeddings: np.ndarray,
+    topics: Sequence[int],
+) -> Dict[int, float]:
+    """
+    Mean pairwise cosine similarity within each topic (noise topic excluded).
+
+    Args:
+        embeddings: Document embeddings
+        topics: Topic assignment of each document
+
+    Returns:
+        Dictionary mapping topic_id to coherence (1.0 for topics with one document)
+    """
+    unique, sums, counts = segment_sums(normalize_rows(embeddings), topics)
+    squared = np.einsum("ij,ij->i", sums, sums)
+    pairs = counts * (counts - 1)
+    scores = np.divide(squared - counts, pairs, out=np.ones_like(squared), where=pairs > 0)
+    return {int(topic_id): float(score) for topic_id, score in zip(unique, scores)}
+
+
+def nearest_centroids(
+    embeddings: np.ndarray,
+    centroids: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nearest centroid (Euclidean) of each row, with one matmul.
+
+    Args:
+        embeddings: Row matrix (n x d)
+        centroids: Centroid matrix (k x d)
+
+    Returns:
+        Tuple of (index of the nearest centroid, distance to it)
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float64)
+    centroids = np.asarray(centroids, dtype=np.float64)
+    squared = (
+        np.einsum("ij,ij->i", embeddings, embeddings)[:, None]
+        - 2.0 * embeddings @ centroids.T
+        + np.einsum("ij,ij->i", centroids, centroids)[None, :]
+    )
+    nearest = squared.argmin(axis=1)
+    distances = np.sqrt(np.maximum(squared[np.arange(len(nearest)), nearest], 0.0))
+    return nearest, distances
+
+
+def reassign_by_similarity(
+    embeddings: np.ndarray,
+    topics: Sequence[int],
+    similarity_threshold: float,
+) -> Tuple[np.ndarray, int]:
+    """
+    Move documents to the most similar other topic centroid.
+
+    A document is reassigned when another centroid is more similar (cosine)
+    than its own and at least `similarity_threshold`. Noise documents are
+    left untouched.
+
+    Args:
+        embeddings: Document embeddings
+        topics: Topic assignment of each document
+        similarity_threshold: Minimum similarity to the new topic
+
+    Returns:
+        Tuple of (refined topics, number of reassigned documents)
+    """
+    topic_array = np.asarray(topics)
+    topic_ids, centroids, _ = segment_means(np.asarray(embeddings), topic_array)
+    refined = topic_array.copy()
+    if len(topic_ids) == 0:
+        return refined, 0
+
+    # Similarity of every document with every centroid (one matmul)
+    assigned = np.flatnonzero(topic_array != NOISE_TOPIC)
+    similarities = cosine_matrix(np.asarray(embeddings)[assigned], centroids)
+    rows = np.arange(len(assigned))
+    current_columns = np.searchsorted(topic_ids, topic_array[assigned])
+    current_similarity = similarities[rows, current_columns]
+
+    # Best other topic of each document
+    similarities[rows, current_columns] = -np.inf
+    best_columns = similarities.argmax(axis=1)
+    best_similarity = similarities[rows, best_columns]
+
+    reassign = (best_similarity > current_similarity) & (best_similarity >= similarity_threshold)
+    refined[assigned[reassign]] = topic_ids[best_columns[reassign]]
+    return refined, int(reassign.sum())
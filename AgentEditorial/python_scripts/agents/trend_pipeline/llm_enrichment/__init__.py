@@ -2,9 +2,12 @@
 
 from python_scripts.agents.trend_pipeline.llm_enrichment.config import LLMEnrichmentConfig
 from python_scripts.agents.trend_pipeline.llm_enrichment.llm_enricher import LLMEnricher
+from python_scripts.agents.trend_pipeline.llm_enrichment.scheduler import EnrichmentJob, EnrichmentScheduler
 
 __all__ = [
     "LLMEnrichmentConfig",
     "LLMEnricher",
+    "EnrichmentJob",
+    "EnrichmentScheduler",
 ]
 
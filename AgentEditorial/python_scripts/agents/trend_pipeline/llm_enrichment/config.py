@@ -23,6 +23,12 @@ class LLMEnrichmentConfig:
     angle_timeout_seconds: int = 60
     outlier_timeout_seconds: int = 60
     
+    # Concurrency (stage 3 scheduler)
+    max_concurrent_topics: int = 4  # Topics enriched in parallel
+    max_concurrent_per_model: int = 2  # In-flight calls per Ollama model
+    model_concurrency: Dict[str, int] = field(default_factory=dict)  # Per-model overrides
+    topic_timeout_seconds: int = 300  # Whole enrichment of one topic (synthesis + angles)
+    
     # Retry settings
     max_retries: int = 3
     retry_delay_seconds: int = 2
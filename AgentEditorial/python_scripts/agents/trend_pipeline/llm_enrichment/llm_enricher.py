@@ -29,29 +29,74 @@ class LLMEnricher:
             config: LLM enrichment configuration
         """
         self.config = config or LLMEnrichmentConfig.default()
-        self._executor = ThreadPoolExecutor(max_workers=2)
+        models = set(self.config.models.values()) | {self.config.fallback_model}
+        self._executor = ThreadPoolExecutor(
+            max_workers=sum(self._model_concurrency(m) for m in models),
+        )
         self._llm_cache: Dict[str, Any] = {}
+        self._model_semaphores: Dict[str, asyncio.Semaphore] = {}
     
-    def _get_llm(self, model_name: str, timeout: int = 300):
-        """Get or create LLM instance for a model."""
-        cache_key = f"{model_name}_{timeout}"
+    def _get_llm(self, model_name: str, timeout: int = 300, template: Optional[str] = None):
+        """Get or create LLM instance for a model (cached responses when template is set)."""
+        cache_key = f"{model_name}_{timeout}_{template}"
         if cache_key not in self._llm_cache:
             self._llm_cache[cache_key] = create_llm(
                 model_name=model_name,
                 temperature=0.7,
                 timeout=timeout,
+                cache_template=template,
+                cache_validate=self._is_json_response,
             )
         return self._llm_cache[cache_key]
     
-    async def _invoke_llm(self, prompt: str, model: str, timeout: int) -> str:
-        """Invoke LLM asynchronously using thread pool."""
-        llm = self._get_llm(model, timeout)
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
+    def _is_json_response(self, response: str) -> bool:
+        """Whether a response parses as JSON (unparsable responses are not cached)."""
+        result = self._parse_json_response(response)
+        return isinstance(result, dict) and "raw_response" not in result
+    
+    def _model_concurrency(self, model_name: str) -> int:
+        """Maximum number of in-flight calls for a model."""
+        return max(1, self.config.model_concurrency.get(model_name, self.config.max_concurrent_per_model))
+    
+    def _get_model_semaphore(self, model_name: str) -> asyncio.Semaphore:
+        """Get the semaphore limiting in-flight calls to a model."""
+        if model_name not in self._model_semaphores:
+            self._model_semaphores[model_name] = asyncio.Semaphore(self._model_concurrency(model_name))
+        return self._model_semaphores[model_name]
+    
+    async def _invoke_llm(
+        self,
+        prompt: str,
+        model: str,
+        timeout: int,
+        template: Optional[str] = None,
+    ) -> str:
+        """
+        Invoke LLM asynchronously using thread pool.
+        
+        At most `_model_concurrency(model)` calls run per model. The call is
+        abandoned after `timeout` seconds (asyncio.TimeoutError); its model
+        slot is only released once the underlying request has returned, so
+        abandoned calls still count against the limit.
+        """
+        llm = self._get_llm(model, timeout, template)
+        semaphore = self._get_model_semaphore(model)
+        await semaphore.acquire()
+        
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
             self._executor,
             llm.invoke,
             prompt,
         )
+        
+        def release(done: asyncio.Future) -> None:
+            semaphore.release()
+            if not done.cancelled():
+                done.exception()  # Mark the result of abandoned calls as retrieved
+        
+        future.add_done_callback(release)
+        return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
     
     async def synthesize_trend(
         self,
@@ -106,6 +151,7 @@ class LLMEnricher:
                 prompt=prompt,
                 model=model,
                 timeout=self.config.synthesis_timeout_seconds,
+                template="trend_synthesis",
             )
 
             # Parse JSON response
@@ -206,6 +252,7 @@ class LLMEnricher:
                 prompt=prompt,
                 model=model,
                 timeout=self.config.angle_timeout_seconds,
+                template="angle_generation",
             )
             
             # Parse JSON response
@@ -283,6 +330,7 @@ class LLMEnricher:
                 prompt=prompt,
                 model=model,
                 timeout=self.config.outlier_timeout_seconds,
+                template="outlier_analysis",
             )
             
             # Parse JSON response
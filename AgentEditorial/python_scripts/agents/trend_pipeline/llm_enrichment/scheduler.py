@@ -0,0 +1,109 @@
+"""Concurrent scheduler for per-topic LLM enrichment (ETAGE 3)."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from python_scripts.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(order=True)
+class EnrichmentJob:
+    """
+    One topic to enrich.
+
+    Jobs are ordered by priority (lowest first), then by submission order.
+    """
+
+    priority: float
+    sequence: int
+    topic_id: int = field(compare=False)
+    payload: Dict[str, Any] = field(compare=False, default_factory=dict)
+
+
+class EnrichmentScheduler:
+    """
+    Run enrichment jobs with a bounded number of workers.
+
+    Jobs are taken from a priority queue, each with an overall timeout. A
+    failed or timed out job is logged and skipped. Cancelling `run()` (or
+    calling `cancel()`) stops the workers; in-flight LLM calls are abandoned.
+    """
+
+    def __init__(self, max_concurrency: int = 4, job_timeout: Optional[float] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrency: Number of jobs processed at the same time
+            job_timeout: Timeout of one job in seconds (None = no timeout)
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.job_timeout = job_timeout
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self._cancelled = asyncio.Event()
+
+    def cancel(self) -> None:
+        """Stop taking new jobs (jobs in progress finish or time out)."""
+        self._cancelled.set()
+
+    async def run(
+        self,
+        jobs: List[EnrichmentJob],
+        handler: Callable[[EnrichmentJob], Awaitable[Any]],
+    ) -> List[Tuple[EnrichmentJob, Any]]:
+        """
+        Process jobs by priority.
+
+        Args:
+            jobs: Jobs to process
+            handler: Coroutine function processing one job
+
+        Returns:
+            (job, result) of every successful job, in priority order
+        """
+        queue: "asyncio.PriorityQueue[EnrichmentJob]" = asyncio.PriorityQueue()
+        for job in jobs:
+            queue.put_nowait(job)
+
+        results: Dict[int, Any] = {}
+
+        async def worker() -> None:
+            while not self._cancelled.is_set():
+                try:
+                    job = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    results[job.sequence] = await asyncio.wait_for(handler(job), timeout=self.job_timeout)
+                    self.completed += 1
+                except asyncio.TimeoutError:
+                    self.timed_out += 1
+                    logger.warning("Topic enrichment timed out", topic_id=job.topic_id, timeout=self.job_timeout)
+                except Exception as e:
+                    self.failed += 1
+                    logger.warning("Topic enrichment failed", topic_id=job.topic_id, error=str(e))
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.max_concurrency, len(jobs)))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+        logger.info(
+            "Topic enrichment complete",
+            jobs=len(jobs),
+            completed=self.completed,
+            failed=self.failed,
+            timed_out=self.timed_out,
+        )
+        return [(job, results[job.sequence]) for job in sorted(jobs) if job.sequence in results]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get job counters."""
+        return {"completed": self.completed, "failed": self.failed, "timed_out": self.timed_out}
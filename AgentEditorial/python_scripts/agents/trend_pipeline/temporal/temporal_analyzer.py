@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional
 
 import numpy as np
 
+from python_scripts.agents.trend_pipeline.kernels import mean_pairwise_cosine
 from python_scripts.agents.trend_pipeline.temporal.config import TemporalConfig
 from python_scripts.utils.logging import get_logger
 
@@ -351,21 +352,13 @@ class TemporalAnalyzer:
     ) -> Optional[float]:
         """Calculate intra-cluster cohesion."""
         try:
-            from sklearn.metrics.pairwise import cosine_similarity
-            
             # Get document indices
             indices = [doc.get("index") for doc in documents if doc.get("index") is not None]
             
             if len(indices) < 2:
                 return 1.0
             
-            topic_embeddings = embeddings[indices]
-            similarities = cosine_similarity(topic_embeddings)
-            
-            n = len(similarities)
-            total_sim = (similarities.sum() - n) / (n * (n - 1)) if n > 1 else 1.0
-            
-            return float(total_sim)
+            return mean_pairwise_cosine(embeddings[indices])
             
         except Exception as e:
             logger.warning("Could not calculate cohesion", error=str(e))
@@ -12,6 +12,7 @@ from hdbscan import HDBSCAN
 from sentence_transformers import SentenceTransformer
 from umap import UMAP
 
+from python_scripts.agents.trend_pipeline.kernels import reassign_by_similarity
 from python_scripts.config.settings import settings
 from python_scripts.utils.exceptions import TopicModelingError
 from python_scripts.utils.logging import get_logger
@@ -331,61 +332,13 @@ def refine_topic_assignments_with_similarity(
         
         embeddings = np.array(embeddings)
         
-        # Calculate topic centroids (mean embedding per topic)
-        topic_centroids = {}
-        topic_counts = {}
-        
-        for topic_id in set(topics):
-            if topic_id == -1:  # Skip noise topic
-                continue
-            
-            topic_indices = [i for i, t in enumerate(topics) if t == topic_id]
-            if topic_indices:
-                topic_embeddings = embeddings[topic_indices]
-                topic_centroids[topic_id] = np.mean(topic_embeddings, axis=0)
-                topic_counts[topic_id] = len(topic_indices)
-        
-        if not topic_centroids:
+        if all(t == -1 for t in topics):
             logger.warning("No valid topics found for refinement")
             return topics, {"reassigned": 0, "total": len(topics)}
         
-        # Refine assignments
-        refined_topics = topics.copy()
-        reassigned_count = 0
-        
-        for i, (text, current_topic, embedding) in enumerate(zip(texts, topics, embeddings)):
-            if current_topic == -1:  # Skip noise topic
-                continue
-            
-            # Calculate similarity with current topic centroid
-            if current_topic in topic_centroids:
-                current_centroid = topic_centroids[current_topic]
-                current_similarity = np.dot(embedding, current_centroid) / (
-                    np.linalg.norm(embedding) * np.linalg.norm(current_centroid)
-                )
-            else:
-                current_similarity = 0.0
-            
-            # Find best matching topic
-            best_topic = current_topic
-            best_similarity = current_similarity
-            
-            for topic_id, centroid in topic_centroids.items():
-                if topic_id == current_topic:
-                    continue
-                
-                similarity = np.dot(embedding, centroid) / (
-                    np.linalg.norm(embedding) * np.linalg.norm(centroid)
-                )
-                
-                if similarity > best_similarity and similarity >= similarity_threshold:
-                    best_topic = topic_id
-                    best_similarity = similarity
-            
-            # Reassign if better match found
-            if best_topic != current_topic:
-                refined_topics[i] = best_topic
-                reassigned_count += 1
+        # Compare every article with every topic centroid (vectorized)
+        refined, reassigned_count = reassign_by_similarity(embeddings, topics, similarity_threshold)
+        refined_topics = [int(t) for t in refined]
         
         logger.info(
             "Topic assignments refined with similarity",
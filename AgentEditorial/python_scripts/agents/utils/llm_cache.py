@@ -0,0 +1,386 @@
+"""Persistent LLM response cache.
+
+Responses are keyed by (model, temperature, prompt template id, hash of the
+normalized prompt) and stored in SQLite with a TTL. Only LLMs created with
+a `cache_template` and a temperature up to settings.llm_cache_max_temperature
+(see llm_factory.create_llm) go through the cache: those are the
+classification calls whose answer for a given input is reused as is, not
+the sampled generation calls. A `validate` callback keeps responses the
+caller cannot parse out of the cache.
+
+Saved tokens are estimated from the prompt and response lengths
+(CHARS_PER_TOKEN); saved seconds are the latency of the original call.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from python_scripts.config.settings import settings
+from python_scripts.utils.logging import get_logger
+from python_scripts.vectorstore.embedding_cache import normalize_text
+
+logger = get_logger(__name__)
+
+# Rough token estimate for Ollama models
+CHARS_PER_TOKEN = 4
+# Expired entries are purged every N writes
+PURGE_INTERVAL = 500
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens of a text."""
+    return max(1, len(text) // CHARS_PER_TOKEN) if text else 0
+
+
+def make_cache_key(model: str, temperature: float, template: str, prompt: str) -> str:
+    """
+    Build the cache key of a call.
+
+    Args:
+        model: Model name
+        temperature: Sampling temperature
+        template: Prompt template id
+        prompt: Rendered prompt
+
+    Returns:
+        Hex digest
+    """
+    prompt_hash = hashlib.sha256(normalize_text(prompt).encode("utf-8")).hexdigest()
+    raw = json.dumps([model, round(float(temperature), 3), template, prompt_hash])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedResponse:
+    """A cached LLM response."""
+
+    response: str
+    tokens: int
+    latency_seconds: float
+
+
+class LLMResponseCache:
+    """SQLite-backed LLM response cache with TTL and LRU eviction."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        """
+        Open (or create) the cache.
+
+        Args:
+            path: SQLite file (default: settings.llm_cache_path)
+            ttl_seconds: Lifetime of an entry (default: settings.llm_cache_ttl_hours)
+            max_entries: Maximum number of entries (default: settings.llm_cache_max_entries)
+        """
+        self.path = Path(path or settings.llm_cache_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.llm_cache_ttl_hours * 3600
+        self.max_entries = max_entries or settings.llm_cache_max_entries
+
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, model TEXT NOT NULL, template TEXT NOT NULL, "
+            "response TEXT NOT NULL, tokens INTEGER NOT NULL, latency REAL NOT NULL, "
+            "expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+        self._db.commit()
+
+    def _model_stats(self, model: str) -> Dict[str, float]:
+        return self._stats.setdefault(
+            model,
+            {"hits": 0, "misses": 0, "saved_tokens": 0, "saved_seconds": 0.0},
+        )
+
+    def get(self, key: str, model: str) -> Optional[CachedResponse]:
+        """
+        Look up a response.
+
+        Args:
+            key: Cache key (make_cache_key)
+            model: Model name (for statistics)
+
+        Returns:
+            Cached response, or None on miss or expired entry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT response, tokens, latency, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            stats = self._model_stats(model)
+            if row is None or row[3] < now:
+                stats["misses"] += 1
+                return None
+
+            self._db.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            stats["hits"] += 1
+            stats["saved_tokens"] += row[1]
+            stats["saved_seconds"] += row[2]
+            return CachedResponse(response=row[0], tokens=row[1], latency_seconds=row[2])
+
+    def put(
+        self,
+        key: str,
+        model: str,
+        template: str,
+        response: str,
+        tokens: int,
+        latency_seconds: float,
+    ) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key (make_cache_key)
+            model: Model name
+            template: Prompt template id
+            response: Response text
+            tokens: Estimated prompt + response tokens
+            latency_seconds: Duration of the call
+        """
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, model, template, response, tokens, latency, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, model, template, response, tokens, latency_seconds, now + self.ttl_seconds, now),
+            )
+            self._writes += 1
+            if self._writes % PURGE_INTERVAL == 0:
+                self._db.execute("DELETE FROM responses WHERE expires_at < ?", (now,))
+            self._evict()
+            self._db.commit()
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries above max_entries."""
+        (count,) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY last_access LIMIT ?)",
+                (excess,),
+            )
+
+    def clear(self, template: Optional[str] = None) -> None:
+        """Remove every entry (or the entries of one template)."""
+        with self._lock:
+            if template is None:
+                self._db.execute("DELETE FROM responses")
+            else:
+                self._db.execute("DELETE FROM responses WHERE template = ?", (template,))
+            self._db.commit()
+
+    def delete(self, key: str) -> None:
+        """Remove one entry."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entry count and, per model, hits, misses, hit rate,
+            saved tokens and saved seconds (since process start)
+        """
+        with self._lock:
+            (entries,) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+            models = {}
+            for model, stats in self._stats.items():
+                lookups = stats["hits"] + stats["misses"]
+                models[model] = {
+                    "hits": int(stats["hits"]),
+                    "misses": int(stats["misses"]),
+                    "hit_rate": round(stats["hits"] / lookups, 3) if lookups else 0.0,
+                    "saved_tokens": int(stats["saved_tokens"]),
+                    "saved_seconds": round(stats["saved_seconds"], 2),
+                }
+            return {"entries": entries, "max_entries": self.max_entries, "models": models}
+
+
+class CachedLLM:
+    """
+    LLM wrapper serving repeated prompts from the response cache.
+
+    Only string prompts passed to invoke/ainvoke are cached; every other
+    attribute is delegated to the wrapped LLM.
+    """
+
+    def __init__(
+        self,
+        llm: Any,
+        model_name: str,
+        temperature: float,
+        template: str,
+        cache: LLMResponseCache,
+        validate: Optional[Callable[[str], bool]] = None,
+    ) -> None:
+        """
+        Initialize the wrapper.
+
+        Args:
+            llm: Wrapped LLM (OllamaLLM)
+            model_name: Model name
+            temperature: Sampling temperature
+            template: Prompt template id
+            cache: Response cache
+            validate: Returns False for responses the caller rejects (they
+                are returned but not cached)
+        """
+        self.llm = llm
+        self.model_name = model_name
+        self.temperature = temperature
+        self.template = template
+        self.cache = cache
+        self.validate = validate
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+
+    def _key(self, prompt: str) -> str:
+        return make_cache_key(self.model_name, self.temperature, self.template, prompt)
+
+    def _store(self, key: str, prompt: str, response: Any, latency_seconds: float) -> None:
+        if not isinstance(response, str) or not response.strip():
+            return
+        try:
+            if self.validate is not None and not self.validate(response):
+                logger.debug("LLM response rejected, not cached", model=self.model_name, template=self.template)
+                return
+        except Exception as e:
+            logger.debug("LLM response validation failed, not cached", model=self.model_name, error=str(e))
+            return
+        try:
+            self.cache.put(
+                key,
+                self.model_name,
+                self.template,
+                response,
+                estimate_tokens(prompt) + estimate_tokens(response),
+                latency_seconds,
+            )
+        except Exception as e:
+            logger.warning("Could not store LLM response in cache", model=self.model_name, error=str(e))
+
+    def _lookup(self, key: str) -> Optional[str]:
+        try:
+            cached = self.cache.get(key, self.model_name)
+        except Exception as e:
+            logger.warning("LLM cache lookup failed", model=self.model_name, error=str(e))
+            return None
+        if cached is not None:
+            logger.debug("LLM response served from cache", model=self.model_name, template=self.template)
+            return cached.response
+        return None
+
+    def invalidate(self, prompt: str) -> None:
+        """Remove the cached response of a prompt (e.g. rejected after the call)."""
+        try:
+            self.cache.delete(self._key(prompt))
+        except Exception as e:
+            logger.warning("Could not remove LLM response from cache", model=self.model_name, error=str(e))
+
+    def invoke(self, input: Any, *args: Any, **kwargs: Any) -> Any:
+        """Invoke the LLM, or return the cached response of the same prompt."""
+        if not isinstance(input, str):
+            return self.llm.invoke(input, *args, **kwargs)
+
+        key = self._key(input)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        started = time.perf_counter()
+        response = self.llm.invoke(input, *args, **kwargs)
+        self._store(key, input, response, time.perf_counter() - started)
+        return response
+
+    async def ainvoke(self, input: Any, *args: Any, **kwargs: Any) -> Any:
+        """Invoke the LLM asynchronously, or return the cached response of the same prompt."""
+        if not isinstance(input, str):
+            return await self.llm.ainvoke(input, *args, **kwargs)
+
+        key = self._key(input)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        started = time.perf_counter()
+        response = await self.llm.ainvoke(input, *args, **kwargs)
+        self._store(key, input, response, time.perf_counter() - started)
+        return response
+
+
+def invalidate_cached_response(llm: Any, prompt: str) -> None:
+    """
+    Remove the cached response of a prompt the caller could not use.
+
+    Args:
+        llm: LLM returned by llm_factory.create_llm (no-op if not cached)
+        prompt: Rendered prompt
+    """
+    if isinstance(llm, CachedLLM):
+        llm.invalidate(prompt)
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """
+    Get the shared response cache (None if disabled or unavailable).
+
+    Returns:
+        LLMResponseCache instance or None
+    """
+    global _cache
+    if not settings.llm_cache_enabled:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = LLMResponseCache()
+            except Exception as e:
+                logger.warning("LLM response cache unavailable", error=str(e))
+                return None
+        return _cache
+
+
+def get_llm_cache_stats() -> Dict[str, Any]:
+    """
+    Get statistics of the shared response cache.
+
+    Returns:
+        Dictionary with enabled flag, TTL and per-model statistics
+    """
+    stats: Dict[str, Any] = {
+        "enabled": settings.llm_cache_enabled,
+        "ttl_hours": settings.llm_cache_ttl_hours,
+    }
+    if _cache is not None:
+        stats.update(_cache.get_stats())
+    return stats
@@ -1,9 +1,10 @@
 """LLM factory for creating Ollama LLM instances."""
 
-from typing import Optional
+from typing import Callable, Optional, Union
 
 from langchain_ollama import OllamaLLM
 
+from python_scripts.agents.utils.llm_cache import CachedLLM, get_llm_cache
 from python_scripts.config.settings import settings
 from python_scripts.utils.exceptions import LLMError
 from python_scripts.utils.logging import get_logger
@@ -15,7 +16,9 @@ def create_llm(
     model_name: str,
     temperature: float = 0.7,
     timeout: int = 300,
-) -> OllamaLLM:
+    cache_template: Optional[str] = None,
+    cache_validate: Optional[Callable[[str], bool]] = None,
+) -> Union[OllamaLLM, CachedLLM]:
     """
     Create an Ollama LLM instance.
 
@@ -23,9 +26,13 @@ def create_llm(
         model_name: Name of the model (e.g., "llama3:8b")
         temperature: Temperature for generation
         timeout: Request timeout in seconds
+        cache_template: Prompt template id; when set, responses are served
+            from the persistent LLM response cache for repeated prompts
+            (only up to settings.llm_cache_max_temperature)
+        cache_validate: Returns False for responses that must not be cached
 
     Returns:
-        OllamaLLM instance
+        OllamaLLM instance (wrapped in CachedLLM when cached)
     """
     try:
         llm = OllamaLLM(
@@ -35,23 +42,55 @@ def create_llm(
             timeout=timeout,
         )
         logger.info("LLM created", model=model_name, base_url=settings.ollama_base_url)
+        cache = None
+        if cache_template and temperature <= settings.llm_cache_max_temperature:
+            cache = get_llm_cache()
+        if cache is not None:
+            return CachedLLM(llm, model_name, temperature, cache_template, cache, validate=cache_validate)
         return llm
     except Exception as e:
         logger.error("Failed to create LLM", model=model_name, error=str(e))
         raise LLMError(f"Failed to create LLM {model_name}: {e}") from e
 
 
-def get_llama3_llm(temperature: float = 0.7) -> OllamaLLM:
+def get_llama3_llm(
+    temperature: float = 0.7,
+    cache_template: Optional[str] = None,
+    cache_validate: Optional[Callable[[str], bool]] = None,
+) -> Union[OllamaLLM, CachedLLM]:
     """Get llama3:8b LLM instance."""
-    return create_llm("llama3:8b", temperature=temperature)
+    return create_llm(
+        "llama3:8b",
+        temperature=temperature,
+        cache_template=cache_template,
+        cache_validate=cache_validate,
+    )
 
 
-def get_mistral_llm(temperature: float = 0.7) -> OllamaLLM:
+def get_mistral_llm(
+    temperature: float = 0.7,
+    cache_template: Optional[str] = None,
+    cache_validate: Optional[Callable[[str], bool]] = None,
+) -> Union[OllamaLLM, CachedLLM]:
     """Get mistral:7b LLM instance."""
-    return create_llm("mistral:7b", temperature=temperature)
+    return create_llm(
+        "mistral:7b",
+        temperature=temperature,
+        cache_template=cache_template,
+        cache_validate=cache_validate,
+    )
 
 
-def get_phi3_llm(temperature: float = 0.7) -> OllamaLLM:
+def get_phi3_llm(
+    temperature: float = 0.7,
+    cache_template: Optional[str] = None,
+    cache_validate: Optional[Callable[[str], bool]] = None,
+) -> Union[OllamaLLM, CachedLLM]:
     """Get phi3:medium LLM instance."""
-    return create_llm("phi3:medium", temperature=temperature)
+    return create_llm(
+        "phi3:medium",
+        temperature=temperature,
+        cache_template=cache_template,
+        cache_validate=cache_validate,
+    )
 
@@ -22,6 +22,9 @@ from python_scripts.api.routers import (
     trend_pipeline,
 )
 from python_scripts.config.settings import settings
+from python_scripts.ingestion.crawl_cache import crawl_cache
+from python_scripts.utils.compute_executor import compute_executor
+from python_scripts.utils.http_client import http_client_registry
 from python_scripts.utils.logging import setup_logging
 
 # Setup logging
@@ -76,11 +79,15 @@ if article_images_dir.exists():
 @app.on_event("startup")
 async def startup_event() -> None:
     """Startup event handler."""
-    pass
+    await http_client_registry.start()
+    await compute_executor.start()
+    await crawl_cache.start()
 
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
     """Shutdown event handler."""
-    pass
+    await crawl_cache.close()
+    await http_client_registry.close()
+    await compute_executor.shutdown()
 
@@ -1,7 +1,7 @@
 """API router for enhanced discovery endpoints."""
 
 import time
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
@@ -85,100 +85,100 @@ async def run_enhanced_scraping_background(
 
             # Import and run enhanced scraping agent
             from python_scripts.agents.scrapping import EnhancedScrapingAgent
+            from python_scripts.agents.scrapping.scheduler import (
+                CrawlScheduler,
+                summarize_domain_results,
+            )
 
             agent = EnhancedScrapingAgent(min_word_count=150)
 
-            all_results = {}
-            global_stats = {
-                "total_domains": len(domains),
-                "domains_with_articles": 0,
-                "domains_without_articles": 0,
-                "domains_with_errors": 0,
-                "total_articles_discovered": 0,
-                "total_articles_scraped": 0,
-                "total_articles_valid": 0,
-            }
-
-            for domain in domains:
-                try:
-                    # Get site_profile_id if client site and not provided
-                    current_site_profile_id = site_profile_id
-                    if is_client_site and not current_site_profile_id:
-                        site_profile = await get_site_profile_by_domain(db_session, domain)
-                        if not site_profile:
-                            logger.warning(
-                                "Site profile not found for client site",
-                                domain=domain,
-                            )
-                            all_results[domain] = {
-                                "articles": [],
-                                "statistics": {},
-                                "error": "Site profile not found. Please run editorial analysis first.",
-                            }
-                            global_stats["domains_with_errors"] += 1
-                            continue
-                        current_site_profile_id = site_profile.id
-
-                    result = await agent.discover_and_scrape_articles(
-                        db_session,
-                        domain,
-                        max_articles,
-                        is_client_site=is_client_site,
-                        site_profile_id=current_site_profile_id,
-                        force_reprofile=force_reprofile,
-                        client_domain=client_domain,
-                    )
-
-                    all_results[domain] = result
-                    stats = result.get("statistics", {})
-                    
-                    # Generate domain summaries after client scraping (issue #002)
-                    if is_client_site and stats.get("valid", 0) > 0:
-                        try:
-                            from python_scripts.api.routers.sites import (
-                                _save_domain_summaries_to_profile,
-                                _check_trend_pipeline,
-                            )
-                            from python_scripts.database.crud_profiles import get_site_profile_by_domain
-                            
-                            profile = await get_site_profile_by_domain(db_session, domain)
-                            if profile:
-                                # Get trend execution if available
-                                trend_exec = await _check_trend_pipeline(db_session, domain)
-                                await _save_domain_summaries_to_profile(
-                                    db_session,
-                                    profile,
-                                    trend_execution=trend_exec,
+            scheduler = CrawlScheduler()
+
+            async def scrape_domain(domain: str) -> Dict[str, Any]:
+                # Each domain uses its own session: domains run concurrently
+                async with AsyncSessionLocal() as domain_session:
+                    try:
+                        # Get site_profile_id if client site and not provided
+                        current_site_profile_id = site_profile_id
+                        if is_client_site and not current_site_profile_id:
+                            site_profile = await get_site_profile_by_domain(domain_session, domain)
+                            if not site_profile:
+                                logger.warning(
+                                    "Site profile not found for client site",
+                                    domain=domain,
                                 )
-                                logger.info(
-                                    "Domain summaries generated after client scraping",
+                                return {
+                                    "articles": [],
+                                    "statistics": {},
+                                    "error": "Site profile not found. Please run editorial analysis first.",
+                                }
+                            current_site_profile_id = site_profile.id
+
+                        result = await agent.discover_and_scrape_articles(
+                            domain_session,
+                            domain,
+                            max_articles,
+                            is_client_site=is_client_site,
+                            site_profile_id=current_site_profile_id,
+                            force_reprofile=force_reprofile,
+                            client_domain=client_domain,
+                            scheduler=scheduler,
+                        )
+                        stats = result.get("statistics", {})
+
+                        # Generate domain summaries after client scraping (issue #002)
+                        if is_client_site and stats.get("valid", 0) > 0:
+                            try:
+                                from python_scripts.api.routers.sites import (
+                                    _save_domain_summaries_to_profile,
+                                    _check_trend_pipeline,
+                                )
+
+                                profile = await get_site_profile_by_domain(domain_session, domain)
+                                if profile:
+                                    # Get trend execution if available
+                                    trend_exec = await _check_trend_pipeline(domain_session, domain)
+                                    await _save_domain_summaries_to_profile(
+                                        domain_session,
+                                        profile,
+                                        trend_execution=trend_exec,
+                                    )
+                                    logger.info(
+                                        "Domain summaries generated after client scraping",
+                                        domain=domain,
+                                    )
+                            except Exception as e:
+                                # Log but don't fail the scraping
+                                logger.warning(
+                                    "Failed to generate domain summaries after scraping",
                                     domain=domain,
+                                    error=str(e),
                                 )
-                        except Exception as e:
-                            # Log but don't fail the scraping
-                            logger.warning(
-                                "Failed to generate domain summaries after scraping",
-                                domain=domain,
-                                error=str(e),
-                            )
-
-                    global_stats["total_articles_discovered"] += stats.get("discovered", 0)
-                    global_stats["total_articles_scraped"] += stats.get("scraped", 0)
-                    global_stats["total_articles_valid"] += stats.get("valid", 0)
-
-                    if stats.get("valid", 0) > 0:
-                        global_stats["domains_with_articles"] += 1
-                    else:
-                        global_stats["domains_without_articles"] += 1
-
-                except Exception as e:
-                    logger.error("Error scraping domain", domain=domain, error=str(e))
-                    all_results[domain] = {
-                        "articles": [],
-                        "statistics": {},
-                        "error": str(e),
-                    }
-                    global_stats["domains_with_errors"] += 1
+
+                        # Discovery log, profile feedback and URL statuses are only flushed
+                        await domain_session.commit()
+                    except Exception:
+                        await domain_session.rollback()
+                        raise
+                    return result
+
+            completed_results: Dict[str, Dict[str, Any]] = {}
+
+            async def report_domain(domain: str, result: Dict[str, Any]) -> None:
+                # Partial results are visible on the execution while other domains run
+                completed_results[domain] = result
+                await update_workflow_execution(
+                    db_session,
+                    execution,
+                    output_data={
+                        "domains": domains,
+                        "results_by_domain": completed_results,
+                        "statistics": summarize_domain_results(completed_results),
+                    },
+                )
+
+            all_results = await scheduler.run(domains, scrape_domain, on_domain_done=report_domain)
+            global_stats = summarize_domain_results(all_results)
 
             workflow_result = {
                 "domains": domains,
@@ -2,6 +2,14 @@
 
 from fastapi import APIRouter
 
+from python_scripts.agents.utils.llm_cache import get_llm_cache_stats
+from python_scripts.ingestion.crawl_cache import crawl_cache
+from python_scripts.ingestion.rate_control import host_rate_controller
+from python_scripts.utils.compute_executor import compute_executor
+from python_scripts.utils.http_client import http_client_registry
+from python_scripts.vectorstore.collection_cache import collection_cache
+from python_scripts.vectorstore.embedding_cache import get_embedding_cache_stats
+
 router = APIRouter(prefix="/health", tags=["Health"])
 
 
@@ -53,3 +61,153 @@ async def health_check() -> dict:
         "service": "agent-editorial",
     }
 
+
+
+@router.get(
+    "/http-clients",
+    summary="HTTP client pool metrics",
+    description="Connection pool metrics of the shared crawling HTTP clients (open connections, reuse ratio, handshake times).",
+)
+async def http_clients_health() -> dict:
+    """
+    Shared HTTP client metrics.
+
+    Returns, for each client profile, the number of open and idle
+    connections, the connection reuse ratio and the average TCP/TLS
+    handshake time.
+
+    Returns:
+        Dictionary with global pool settings and per-profile metrics
+
+    Example:
+        ```bash
+        curl http://localhost:8000/api/v1/health/http-clients
+        ```
+    """
+    return http_client_registry.get_metrics()
+
+
+@router.get(
+    "/collections-cache",
+    summary="Qdrant collection cache metrics",
+    description="Hit/miss counters of the cache of known Qdrant collections.",
+)
+async def collections_cache_health() -> dict:
+    """
+    Qdrant collection cache statistics.
+
+    Returns:
+        Dictionary with hits, misses, refreshes, hit rate and known collections
+
+    Example:
+        ```bash
+        curl http://localhost:8000/api/v1/health/collections-cache
+        ```
+    """
+    return collection_cache.get_stats()
+
+
+@router.get(
+    "/embedding-cache",
+    summary="Embedding cache metrics",
+    description="Hit rate, bytes saved and store size of the persistent embedding cache.",
+)
+async def embedding_cache_health() -> dict:
+    """
+    Embedding cache statistics.
+
+    Returns:
+        Dictionary with enabled flag and, per model, hits, misses, hit rate,
+        bytes of text not re-embedded and store size
+
+    Example:
+        ```bash
+        curl http://localhost:8000/api/v1/health/embedding-cache
+        ```
+    """
+    return get_embedding_cache_stats()
+
+
+@router.get(
+    "/compute-executor",
+    summary="Compute executor metrics",
+    description="Queue depth and wall times of the process pool running CPU-bound clustering tasks.",
+)
+async def compute_executor_health() -> dict:
+    """
+    Compute executor statistics.
+
+    Returns:
+        Dictionary with pool state, in-flight tasks, queue depth, bytes passed
+        through shared memory and, per task, average wall and queue-wait times
+
+    Example:
+        ```bash
+        curl http://localhost:8000/api/v1/health/compute-executor
+        ```
+    """
+    return compute_executor.get_metrics()
+
+
+@router.get(
+    "/llm-cache",
+    summary="LLM response cache metrics",
+    description="Per-model hits, saved tokens and saved seconds of the persistent LLM response cache.",
+)
+async def llm_cache_health() -> dict:
+    """
+    LLM response cache statistics.
+
+    Returns:
+        Dictionary with enabled flag, TTL, entry count and, per model, hits,
+        misses, hit rate, saved tokens (estimated) and saved seconds
+
+    Example:
+        ```bash
+        curl http://localhost:8000/api/v1/health/llm-cache
+        ```
+    """
+    return get_llm_cache_stats()
+
+
+@router.get(
+    "/crawl-cache",
+    summary="Crawl cache metrics",
+    description="Hits per tier, revalidations and memory usage of the crawl cache.",
+)
+async def crawl_cache_health() -> dict:
+    """
+    Crawl cache statistics.
+
+    Returns:
+        Dictionary with in-memory and database hits, misses, 304
+        revalidations, memory usage and pending access statistics
+
+    Example:
+        ```bash
+        curl http://localhost:8000/api/v1/health/crawl-cache
+        ```
+    """
+    return crawl_cache.get_stats()
+
+
+@router.get(
+    "/crawl-hosts",
+    summary="Per-host crawl rate",
+    description="Live adaptive concurrency, latency and error rate of every crawled host.",
+)
+async def crawl_hosts_health() -> dict:
+    """
+    Per-host crawl rate table.
+
+    Returns:
+        Dictionary with, per host, the current concurrency limit, in-flight
+        requests, p50/p95 latency, error rate, backoffs and remaining
+        Retry-After pause
+
+    Example:
+        ```bash
+        curl http://localhost:8000/api/v1/health/crawl-hosts
+        ```
+    """
+    return host_rate_controller.get_stats()
@@ -3,6 +3,7 @@
 import asyncio
 import json
 import re
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
@@ -15,6 +16,7 @@ from python_scripts.agents.agent_orchestrator import EditorialAnalysisOrchestrat
 from python_scripts.api.dependencies import get_db_session as get_db
 from python_scripts.api.schemas.requests import SiteAnalysisRequest
 from python_scripts.api.schemas.responses import (
+    AuditSnapshotInfo,
     AuditStatusResponse,
     DataStatus,
     DomainDetail,
@@ -56,6 +58,7 @@ from python_scripts.database.crud_profiles import (
     update_site_profile,
 )
 from python_scripts.database.crud_temporal_metrics import get_temporal_metrics_by_topic_cluster
+from python_scripts.database.data_loader import RequestDataLoader
 from python_scripts.database.models import (
     ArticleRecommendation,
     ClientArticle,
@@ -1766,7 +1769,10 @@ async def _check_competitors(
 
 
 async def _check_competitor_articles(
-    db: AsyncSession, competitor_domains: List[str], client_domain: Optional[str] = None
+    db: AsyncSession,
+    competitor_domains: List[str],
+    client_domain: Optional[str] = None,
+    loader: Optional[RequestDataLoader] = None,
 ) -> tuple[int, bool]:
     """
     Count competitor articles and check if sufficient in both PostgreSQL AND Qdrant.
@@ -1782,23 +1788,26 @@ async def _check_competitor_articles(
         db: Database session
         competitor_domains: List of competitor domains
         client_domain: Client domain for generating Qdrant collection name
+        loader: Request data loader (counts in its own session, memoized);
+            db is used when not provided
 
     Returns:
         Tuple of (count, is_sufficient) where is_sufficient is True if:
         - PostgreSQL has >= 10 articles AND
         - Qdrant has >= 10 articles (ensuring consistency)
     """
-    from python_scripts.database.crud_articles import count_competitor_articles
+    from python_scripts.database.crud_articles import count_competitor_articles_by_domain
     from python_scripts.vectorstore.qdrant_client import qdrant_client, get_competitor_collection_name
 
     if not competitor_domains:
         return (0, False)
 
-    # Count articles in PostgreSQL
-    postgres_count = 0
-    for comp_domain in competitor_domains:
-        count = await count_competitor_articles(db, domain=comp_domain)
-        postgres_count += count
+    # Count articles in PostgreSQL (one grouped query for all the domains)
+    if loader is not None:
+        counts = await loader.count_competitor_articles(competitor_domains)
+    else:
+        counts = await count_competitor_articles_by_domain(db, competitor_domains)
+    postgres_count = sum(counts.values())
 
     # Check Qdrant collection if client_domain is provided
     qdrant_count = 0
@@ -1965,10 +1974,12 @@ def detect_audit_issues(
     keyword_sets = {}
     for article in client_articles:
         # Si l'article a des métadonnées keywords
-        if hasattr(article, "metadata") and article.metadata:
-            kw = article.metadata.get("keywords", [])
+        # ClientArticle.metadata est le MetaData SQLAlchemy : la colonne est article_metadata
+        article_metadata = getattr(article, "article_metadata", None)
+        if isinstance(article_metadata, dict):
+            kw = article_metadata.get("keywords", [])
             if kw:
-                domain_label = article.metadata.get("domain", "unknown")
+                domain_label = article_metadata.get("domain", "unknown")
                 if domain_label not in keyword_sets:
                     keyword_sets[domain_label] = set()
                 keyword_sets[domain_label].update(kw[:5])  # Top 5 keywords
@@ -2051,86 +2062,197 @@ def detect_audit_issues(
     return issues
 
 
-async def build_complete_audit_from_database(
-    db: AsyncSession,
-    domain: str,
+# ============================================================
+# Audit snapshot (GET /sites/{domain}/audit)
+# ============================================================
+
+# Bump to invalidate every stored snapshot when the payload format changes
+AUDIT_SNAPSHOT_VERSION = 1
+
+# Limits the snapshot is built with (maximum values accepted by the endpoint)
+AUDIT_SNAPSHOT_TOPICS_LIMIT = 50
+AUDIT_SNAPSHOT_TRENDING_LIMIT = 100
+
+# Sections of the snapshot and the sources they are built from.
+# The issues depend on every section and are recomputed on any rebuild.
+AUDIT_SNAPSHOT_SECTIONS: Dict[str, tuple] = {
+    "profile": ("profile",),
+    "domains": ("profile", "trend", "client_articles"),
+    "competitors": ("competitors",),
+    "trends": ("profile", "trend"),
+}
+
+
+def _audit_snapshot_sources(
     profile: SiteProfile,
     competitors_execution: Optional[Any],
     trend_execution: Optional[Any],
-    include_topics: bool = False,
-    include_trending: bool = True,
-    include_analyses: bool = True,
-    include_temporal: bool = True,
-    include_opportunities: bool = True,
-    topics_limit: int = 10,
-    trending_limit: int = 15,
-) -> SiteAuditResponse:
+    client_articles_count: int,
+) -> Dict[str, Any]:
     """
-    Build complete audit response from database data.
-    
-    All data is assumed to exist.
-    
+    Build the signature of the data an audit snapshot is built from.
+
     Args:
-        db: Database session
-        domain: Domain name
         profile: SiteProfile instance
         competitors_execution: WorkflowExecution for competitors (optional)
         trend_execution: TrendPipelineExecution (optional)
-        
+        client_articles_count: Number of client articles
+
     Returns:
-        Complete SiteAuditResponse
+        Dictionary of source versions (compared key by key)
+    """
+
+    def _version(identifier: Any, updated_at: Optional[datetime]) -> str:
+        return f"{identifier}:{updated_at.isoformat() if updated_at else ''}"
+
+    return {
+        "version": AUDIT_SNAPSHOT_VERSION,
+        "profile": _version(profile.id, profile.updated_at),
+        # Validating competitors rewrites output_data of the same execution
+        "competitors": (
+            _version(competitors_execution.execution_id, competitors_execution.updated_at)
+            if competitors_execution
+            else None
+        ),
+        "trend": str(trend_execution.execution_id) if trend_execution else None,
+        "client_articles": client_articles_count,
+    }
+
+
+def _stale_audit_sections(
+    stored_sources: Optional[Dict[str, Any]],
+    sources: Dict[str, Any],
+) -> List[str]:
+    """
+    List the snapshot sections whose sources changed.
+
+    Args:
+        stored_sources: Signature stored with the snapshot (None if no snapshot)
+        sources: Current signature (_audit_snapshot_sources)
+
+    Returns:
+        Names of the sections to rebuild (all of them for a missing or outdated snapshot)
+    """
+    if not stored_sources or stored_sources.get("version") != sources.get("version"):
+        return list(AUDIT_SNAPSHOT_SECTIONS)
+
+    changed = {key for key, value in sources.items() if stored_sources.get(key) != value}
+    return [
+        section
+        for section, depends_on in AUDIT_SNAPSHOT_SECTIONS.items()
+        if changed.intersection(depends_on)
+    ]
+
+
+async def _build_audit_profile_section(
+    db: AsyncSession,
+    domain: str,
+    profile: SiteProfile,
+) -> Dict[str, Any]:
+    """
+    Build the url, profile, audience and took_ms fields of an audit.
+
+    Args:
+        db: Database session
+        domain: Domain name
+        profile: SiteProfile instance
+
+    Returns:
+        Dictionary of audit fields
     """
-    from python_scripts.database.crud_client_articles import list_client_articles
-    from sqlalchemy import select, desc
     from python_scripts.database.models import WorkflowExecution
-    
-    # 1. URL
-    url = f"https://{domain}"
-    
-    # 2. Profile.style
+
     style = {
         "tone": profile.editorial_tone or "professionnel",
         "vocabulary": _map_language_level_to_vocabulary(profile.language_level),
         "format": _calculate_article_format(_safe_json_field(profile.content_structure)),
     }
-    
-    # 3. Profile.themes
+
     activity_domains = _safe_json_field(profile.activity_domains) or {}
-    themes = activity_domains.get("primary_domains", [])
-    
-    # 4. Domains (domaines d'activité détaillés)
-    domains_list = []
-    
-    # Récupérer les articles client pour calculer confidence et summary
-    client_articles = await list_client_articles(
-        db, site_profile_id=profile.id, limit=1000
-    )
-    
     # S'assurer que themes est une liste (peut être None ou vide)
-    if not themes:
-        themes = []
-    
-    # Pour chaque domaine d'activité
+    themes = activity_domains.get("primary_domains", []) or []
+
+    target_audience = _safe_json_field(profile.target_audience) or {}
+    audience = {
+        "type": target_audience.get("primary", "Professionnels IT"),
+        "level": _map_language_level_to_audience_level(profile.language_level),
+        "sectors": _extract_audience_sectors(target_audience),
+    }
+    # S'assurer que sectors est toujours une liste
+    if not isinstance(audience["sectors"], list):
+        audience["sectors"] = []
+
+    # took_ms (durée de la dernière analyse)
+    took_ms = 0
+    stmt = (
+        select(WorkflowExecution)
+        .where(
+            WorkflowExecution.workflow_type == "editorial_analysis",
+            WorkflowExecution.status == "completed",
+            WorkflowExecution.input_data["domain"].astext == domain,
+        )
+        .order_by(desc(WorkflowExecution.start_time))
+        .limit(1)
+    )
+    result = await db.execute(stmt)
+    last_execution = result.scalar_one_or_none()
+
+    if last_execution and last_execution.duration_seconds:
+        took_ms = last_execution.duration_seconds * 1000
+
+    return {
+        "url": f"https://{domain}",
+        "profile": {
+            "style": style,
+            "themes": themes,
+        },
+        "audience": audience,
+        "took_ms": took_ms,
+    }
+
+
+async def _build_audit_domains_section(
+    db: AsyncSession,
+    profile: SiteProfile,
+    trend_execution: Optional[Any],
+    client_articles: List[ClientArticle],
+    topics_limit: int = AUDIT_SNAPSHOT_TOPICS_LIMIT,
+) -> List[DomainDetail]:
+    """
+    Build the activity domains of an audit.
+
+    Args:
+        db: Database session
+        profile: SiteProfile instance
+        trend_execution: TrendPipelineExecution (optional)
+        client_articles: Client articles (confidence, summary and metrics)
+        topics_limit: Maximum number of topics per domain (0 to skip the topics)
+
+    Returns:
+        List of DomainDetail
+    """
+    activity_domains = _safe_json_field(profile.activity_domains) or {}
+    themes = activity_domains.get("primary_domains", []) or []
+    domain_details = activity_domains.get("domain_details", {})
+    total_articles = len(client_articles)
+
+    domains_list = []
     for domain_label in themes:
         # Calculer topics_count (nombre de clusters/topics pertinents du trend pipeline)
         topics_count = await _count_topics_for_domain(
             db, profile, trend_execution, domain_label
         )
-        
+
         # Calculer confidence (basé sur le nombre d'articles client correspondants)
         # Garder cette logique pour confidence car elle reflète la couverture du site client
         articles_count = _count_articles_for_domain(client_articles, domain_label)
-        total_articles = len(client_articles)
         if total_articles > 0:
             confidence = min(100, int((articles_count / total_articles) * 100))
         else:
             confidence = 0
-        
+
         # Try to read summary from domain_details (issue #002)
         domain_slug = _slugify(domain_label)
-        activity_domains_data = _safe_json_field(profile.activity_domains) or {}
-        domain_details = activity_domains_data.get("domain_details", {})
-
         summary = None
         if isinstance(domain_details, dict) and domain_slug in domain_details:
             domain_detail = domain_details[domain_slug]
@@ -2143,32 +2265,18 @@ async def build_complete_audit_from_database(
                 client_articles, domain_label, _safe_json_field(profile.keywords)
             )
 
-        # Always get topics and metrics to enrich the response (structure always present)
         topics = []
         metrics = None
-
         if trend_execution:
-            # Always calculate metrics (lightweight operation)
             metrics = await _get_domain_metrics(
                 db, profile, trend_execution, domain_label, client_articles
             )
-
-            # Get topics list if requested (can be heavy, so optional)
-            if include_topics:
+            if topics_limit > 0:
                 topics = await _get_topics_for_domain(
                     db, profile, trend_execution, domain_label, limit=topics_limit
                 )
-        else:
-            # If no trend_execution, still provide metrics structure with article count
-            # articles_count is already calculated above (line ~1966)
-            metrics = DomainMetrics(
-                total_articles=articles_count,
-                trending_topics=0,
-                avg_relevance=0.0,
-                top_keywords=[],
-            )
 
-        # Ensure metrics is never None (fallback if something went wrong)
+        # Metrics always present, with the article count when there is no trend pipeline
         if metrics is None:
             metrics = DomainMetrics(
                 total_articles=articles_count,
@@ -2183,102 +2291,444 @@ async def build_complete_audit_from_database(
 
         domains_list.append(
             DomainDetail(
-                id=_slugify(domain_label),
+                id=domain_slug,
                 label=domain_label,
                 confidence=confidence,
                 confidence_normalized=round(confidence_normalized, 3),
                 confidence_label=confidence_label,
-                topics_count=topics_count,  # Maintenant = nombre de clusters pertinents
+                topics_count=topics_count,  # Nombre de clusters pertinents
                 summary=summary,
-                topics=topics,  # Always a list (empty if include_topics=False)
-                metrics=metrics,  # Always present (never None)
+                topics=topics,
+                metrics=metrics,
             )
         )
-    
-    # 5. Audience
-    target_audience = _safe_json_field(profile.target_audience) or {}
-    audience = {
-        "type": target_audience.get("primary", "Professionnels IT"),
-        "level": _map_language_level_to_audience_level(profile.language_level),
-        "sectors": _extract_audience_sectors(target_audience),
+
+    return domains_list
+
+
+def _build_audit_competitors_section(competitors_execution: Optional[Any]) -> List[Dict[str, Any]]:
+    """
+    Build the competitors of an audit (top 5, by similarity then name).
+
+    Args:
+        competitors_execution: WorkflowExecution for competitors (optional)
+
+    Returns:
+        List of {"name", "similarity"} dictionaries
+    """
+    if not competitors_execution or not competitors_execution.output_data:
+        return []
+
+    competitors_data = competitors_execution.output_data.get("competitors", [])
+    # Concurrents validés OU tous les concurrents non exclus si aucun n'est validé
+    validated_competitors = [
+        comp for comp in competitors_data
+        if comp.get("validated", False) or comp.get("manual", False)
+    ]
+    competitors_to_use = validated_competitors if validated_competitors else [
+        comp for comp in competitors_data
+        if comp.get("domain") and not comp.get("excluded", False)
+    ]
+
+    competitors_list = []
+    for comp in competitors_to_use:
+        domain_name = comp.get("domain", "")
+        if domain_name:  # Ignorer les domaines vides
+            competitors_list.append({
+                "name": domain_name,
+                "similarity": int(comp.get("relevance_score", 0.0) * 100),
+            })
+
+    # Trier : d'abord par similarity (décroissant), puis par nom (alphabétique)
+    competitors_list.sort(key=lambda x: (-x["similarity"], x["name"]))
+    return competitors_list[:5]
+
+
+async def _build_audit_trend_sections(
+    db: AsyncSession,
+    profile: SiteProfile,
+    trend_execution: Optional[Any],
+    trending_limit: int = AUDIT_SNAPSHOT_TRENDING_LIMIT,
+) -> Dict[str, Any]:
+    """
+    Build the trending topics, trend analyses, temporal insights and editorial
+    opportunities sections of an audit.
+
+    Args:
+        db: Database session
+        profile: SiteProfile instance
+        trend_execution: TrendPipelineExecution (optional)
+        trending_limit: Maximum number of trending topics
+
+    Returns:
+        Dictionary of sections, keyed by SiteAuditResponse field
+    """
+    trending_topics = await _get_trending_topics(db, profile, trend_execution, limit=trending_limit)
+    trend_analyses = await _get_trend_analyses(db, trend_execution)
+    temporal_insights = await _get_temporal_insights(db, trend_execution)
+    opportunities = await _get_editorial_opportunities(db, profile, trend_execution)
+
+    return {
+        "trending_topics": TrendingTopicsSection(topics=trending_topics),
+        "trend_analyses": TrendAnalysesSection(analyses=trend_analyses),
+        "temporal_insights": TemporalInsightsSection(insights=temporal_insights),
+        "editorial_opportunities": EditorialOpportunitiesSection(recommendations=opportunities),
     }
-    # S'assurer que sectors est toujours une liste
-    if "sectors" not in audience or not isinstance(audience["sectors"], list):
-        audience["sectors"] = []
-    
-    # 6. Competitors (top 5, triés par similarity puis alphabétique)
-    competitors = []
-    if competitors_execution and competitors_execution.output_data:
-        competitors_data = competitors_execution.output_data.get("competitors", [])
-        # Filtrer et formater les concurrents validés OU tous les concurrents si aucun n'est validé
-        competitors_list = []
-        validated_competitors = [
-            comp for comp in competitors_data
-            if comp.get("validated", False) or comp.get("manual", False)
-        ]
-        
-        # Si aucun concurrent validé, utiliser tous les concurrents non exclus
-        competitors_to_use = validated_competitors if validated_competitors else [
-            comp for comp in competitors_data
-            if comp.get("domain") and not comp.get("excluded", False)
-        ]
-        
-        for comp in competitors_to_use:
-            relevance = comp.get("relevance_score", 0.0)
-            domain_name = comp.get("domain", "")
-            if domain_name:  # Ignorer les domaines vides
-                competitors_list.append({
-                    "name": domain_name,
-                    "similarity": int(relevance * 100),
-                })
-        
-        # Trier : d'abord par similarity (décroissant), puis par nom (alphabétique)
-        competitors_list.sort(key=lambda x: (-x["similarity"], x["name"]))
-        
-        # Prendre les 5 meilleurs
-        competitors = competitors_list[:5]
-    
-    # S'assurer que competitors est toujours une liste (pas None)
-    if competitors is None:
-        competitors = []
-    
-    # 7. took_ms (durée de la dernière analyse)
-    took_ms = 0
-    stmt = (
-        select(WorkflowExecution)
-        .where(
-            WorkflowExecution.workflow_type == "editorial_analysis",
-            WorkflowExecution.status == "completed",
-            WorkflowExecution.input_data["domain"].astext == domain,
+
+
+async def _build_audit_payload(
+    db: AsyncSession,
+    domain: str,
+    profile: SiteProfile,
+    competitors_execution: Optional[Any],
+    trend_execution: Optional[Any],
+    sections: List[str],
+    payload: Optional[Dict[str, Any]] = None,
+    topics_limit: int = AUDIT_SNAPSHOT_TOPICS_LIMIT,
+    trending_limit: int = AUDIT_SNAPSHOT_TRENDING_LIMIT,
+) -> Dict[str, Any]:
+    """
+    Build the given sections of an audit payload, keeping the others.
+
+    Args:
+        db: Database session
+        domain: Domain name
+        profile: SiteProfile instance
+        competitors_execution: WorkflowExecution for competitors (optional)
+        trend_execution: TrendPipelineExecution (optional)
+        sections: Sections to (re)build (AUDIT_SNAPSHOT_SECTIONS keys)
+        payload: Previous payload whose other sections are kept
+        topics_limit: Maximum number of topics per domain
+        trending_limit: Maximum number of trending topics
+
+    Returns:
+        JSON-serializable audit payload (SiteAuditResponse fields)
+    """
+    from python_scripts.database.crud_client_articles import list_client_articles
+
+    payload = dict(payload or {})
+    if not sections:
+        return payload
+
+    # Articles client : confidence/summary des domaines et détection des problèmes
+    client_articles = await list_client_articles(db, site_profile_id=profile.id, limit=1000)
+
+    if "profile" in sections:
+        payload.update(await _build_audit_profile_section(db, domain, profile))
+
+    if "domains" in sections:
+        domains_list = await _build_audit_domains_section(
+            db, profile, trend_execution, client_articles, topics_limit=topics_limit
         )
-        .order_by(desc(WorkflowExecution.start_time))
-        .limit(1)
-    )
-    result = await db.execute(stmt)
-    last_execution = result.scalar_one_or_none()
-    
-    if last_execution and last_execution.duration_seconds:
-        took_ms = last_execution.duration_seconds * 1000
+        payload["domains"] = [d.model_dump(mode="json") for d in domains_list]
+    else:
+        domains_list = [DomainDetail.model_validate(d) for d in payload.get("domains", [])]
 
-    # 8. Détection des problèmes (issues)
+    if "competitors" in sections:
+        payload["competitors"] = _build_audit_competitors_section(competitors_execution)
+
+    if "trends" in sections:
+        trend_sections = await _build_audit_trend_sections(
+            db, profile, trend_execution, trending_limit=trending_limit
+        )
+        for key, section in trend_sections.items():
+            payload[key] = section.model_dump(mode="json")
+
+    # Détection des problèmes (dépend de toutes les sections)
     issues = detect_audit_issues(
         domains_list=domains_list,
-        competitors=competitors,
+        competitors=payload.get("competitors", []),
         trend_execution=trend_execution,
         client_articles=client_articles,
     )
+    payload["issues"] = [issue.model_dump(mode="json") for issue in issues]
 
-    return SiteAuditResponse(
-        url=url,
-        profile={
-            "style": style,
-            "themes": themes,
-        },
-        domains=domains_list,
-        audience=audience,
-        competitors=competitors,
-        took_ms=took_ms,
-        issues=issues,
+    return payload
+
+
+def project_audit_payload(
+    payload: Dict[str, Any],
+    include_topics: bool = False,
+    include_trending: bool = True,
+    include_analyses: bool = True,
+    include_temporal: bool = True,
+    include_opportunities: bool = True,
+    topics_limit: int = 10,
+    trending_limit: int = 15,
+    snapshot: Optional[AuditSnapshotInfo] = None,
+) -> SiteAuditResponse:
+    """
+    Apply the include_* flags and limits of a request to an audit payload.
+
+    Args:
+        payload: Audit payload (_build_audit_payload)
+        include_topics: Include detailed topics in domains
+        include_trending: Include trending topics section
+        include_analyses: Include trend analyses section
+        include_temporal: Include temporal insights section
+        include_opportunities: Include editorial opportunities section
+        topics_limit: Maximum number of topics per domain
+        trending_limit: Maximum number of trending topics
+        snapshot: Freshness metadata of the snapshot the payload comes from
+
+    Returns:
+        SiteAuditResponse
+    """
+    domains = [
+        {
+            **domain_data,
+            "topics": (domain_data.get("topics") or [])[:topics_limit] if include_topics else [],
+        }
+        for domain_data in payload.get("domains", [])
+    ]
+
+    trending_topics = payload.get("trending_topics") if include_trending else None
+    if trending_topics is not None:
+        trending_topics = {
+            **trending_topics,
+            "topics": trending_topics.get("topics", [])[:trending_limit],
+        }
+
+    return SiteAuditResponse.model_validate(
+        {
+            **payload,
+            "domains": domains,
+            "trending_topics": trending_topics,
+            "trend_analyses": payload.get("trend_analyses") if include_analyses else None,
+            "temporal_insights": payload.get("temporal_insights") if include_temporal else None,
+            "editorial_opportunities": (
+                payload.get("editorial_opportunities") if include_opportunities else None
+            ),
+            "snapshot": snapshot,
+        }
+    )
+
+
+def _audit_snapshot_info(snapshot: Any, rebuilt_sections: List[str]) -> AuditSnapshotInfo:
+    """
+    Build the freshness metadata of a stored snapshot.
+
+    Args:
+        snapshot: SiteAuditSnapshot instance
+        rebuilt_sections: Sections rebuilt while serving the request
+
+    Returns:
+        AuditSnapshotInfo
+    """
+    built_at = snapshot.built_at
+    if built_at.tzinfo is None:
+        built_at = built_at.replace(tzinfo=timezone.utc)
+    return AuditSnapshotInfo(
+        built_at=built_at,
+        age_seconds=max(0.0, round((datetime.now(timezone.utc) - built_at).total_seconds(), 3)),
+        build_duration_ms=snapshot.build_duration_ms,
+        sources=snapshot.sources,
+        rebuilt_sections=rebuilt_sections,
+    )
+
+
+async def get_or_build_audit_snapshot(
+    db: AsyncSession,
+    domain: str,
+    profile: SiteProfile,
+    competitors_execution: Optional[Any],
+    trend_execution: Optional[Any],
+    client_articles_count: int,
+) -> tuple[Any, List[str]]:
+    """
+    Get the audit snapshot of a domain, rebuilding only its stale sections.
+
+    Args:
+        db: Database session
+        domain: Domain name
+        profile: SiteProfile instance
+        competitors_execution: WorkflowExecution for competitors (optional)
+        trend_execution: TrendPipelineExecution (optional)
+        client_articles_count: Number of client articles
+
+    Returns:
+        Tuple of (SiteAuditSnapshot, rebuilt sections)
+    """
+    from python_scripts.database.crud_audit_snapshots import (
+        get_audit_snapshot,
+        upsert_audit_snapshot,
+    )
+
+    sources = _audit_snapshot_sources(
+        profile, competitors_execution, trend_execution, client_articles_count
+    )
+    snapshot = await get_audit_snapshot(db, domain)
+    stale_sections = _stale_audit_sections(snapshot.sources if snapshot else None, sources)
+    if not stale_sections:
+        return snapshot, []
+
+    started = time.monotonic()
+    payload = await _build_audit_payload(
+        db,
+        domain,
+        profile,
+        competitors_execution,
+        trend_execution,
+        sections=stale_sections,
+        payload=snapshot.payload if snapshot else None,
+    )
+    build_duration_ms = int((time.monotonic() - started) * 1000)
+
+    snapshot = await upsert_audit_snapshot(
+        db,
+        domain=domain,
+        site_profile_id=profile.id,
+        payload=payload,
+        sources=sources,
+        build_duration_ms=build_duration_ms,
+    )
+    logger.info(
+        "Audit snapshot rebuilt",
+        domain=domain,
+        sections=stale_sections,
+        build_duration_ms=build_duration_ms,
+    )
+    return snapshot, stale_sections
+
+
+async def get_audit_from_snapshot(
+    db: AsyncSession,
+    domain: str,
+    profile: SiteProfile,
+    competitors_execution: Optional[Any],
+    trend_execution: Optional[Any],
+    client_articles_count: int,
+    include_topics: bool = False,
+    include_trending: bool = True,
+    include_analyses: bool = True,
+    include_temporal: bool = True,
+    include_opportunities: bool = True,
+    topics_limit: int = 10,
+    trending_limit: int = 15,
+) -> SiteAuditResponse:
+    """
+    Serve a site audit from its snapshot (rebuilt first if stale).
+
+    Args:
+        db: Database session
+        domain: Domain name
+        profile: SiteProfile instance
+        competitors_execution: WorkflowExecution for competitors (optional)
+        trend_execution: TrendPipelineExecution (optional)
+        client_articles_count: Number of client articles
+        include_topics: Include detailed topics in domains
+        include_trending: Include trending topics section
+        include_analyses: Include trend analyses section
+        include_temporal: Include temporal insights section
+        include_opportunities: Include editorial opportunities section
+        topics_limit: Maximum number of topics per domain
+        trending_limit: Maximum number of trending topics
+
+    Returns:
+        SiteAuditResponse with snapshot freshness metadata
+    """
+    snapshot, rebuilt_sections = await get_or_build_audit_snapshot(
+        db, domain, profile, competitors_execution, trend_execution, client_articles_count
+    )
+    return project_audit_payload(
+        snapshot.payload,
+        include_topics=include_topics,
+        include_trending=include_trending,
+        include_analyses=include_analyses,
+        include_temporal=include_temporal,
+        include_opportunities=include_opportunities,
+        topics_limit=topics_limit,
+        trending_limit=trending_limit,
+        snapshot=_audit_snapshot_info(snapshot, rebuilt_sections),
+    )
+
+
+async def refresh_audit_snapshot(domain: str) -> None:
+    """
+    Rebuild the stale sections of a domain's audit snapshot after a workflow.
+
+    Called when a scraping or trend pipeline execution completes, so that the
+    next GET /sites/{domain}/audit is served without rebuilding. Uses its own
+    session and never raises: a failure only leaves the rebuild to that request.
+
+    Args:
+        domain: Domain name
+    """
+    from python_scripts.database.db_session import AsyncSessionLocal
+
+    try:
+        async with AsyncSessionLocal() as db:
+            profile = await _check_site_profile(db, domain)
+            if not profile:
+                return
+            competitors_execution = await _check_competitors(db, domain)
+            trend_execution = await _check_trend_pipeline(db, domain)
+            client_articles_count, _ = await _check_client_articles(db, profile.id)
+            await get_or_build_audit_snapshot(
+                db,
+                domain,
+                profile,
+                competitors_execution,
+                trend_execution,
+                client_articles_count,
+            )
+    except Exception as e:
+        logger.warning("Failed to refresh audit snapshot", domain=domain, error=str(e))
+
+
+async def build_complete_audit_from_database(
+    db: AsyncSession,
+    domain: str,
+    profile: SiteProfile,
+    competitors_execution: Optional[Any],
+    trend_execution: Optional[Any],
+    include_topics: bool = False,
+    include_trending: bool = True,
+    include_analyses: bool = True,
+    include_temporal: bool = True,
+    include_opportunities: bool = True,
+    topics_limit: int = 10,
+    trending_limit: int = 15,
+) -> SiteAuditResponse:
+    """
+    Build complete audit response from database data, without the snapshot.
+
+    All data is assumed to exist. The API serves audits from the snapshot
+    (get_audit_from_snapshot); this builds every requested section directly.
+
+    Args:
+        db: Database session
+        domain: Domain name
+        profile: SiteProfile instance
+        competitors_execution: WorkflowExecution for competitors (optional)
+        trend_execution: TrendPipelineExecution (optional)
+
+    Returns:
+        Complete SiteAuditResponse
+    """
+    sections = ["profile", "domains", "competitors"]
+    if include_trending or include_analyses or include_temporal or include_opportunities:
+        sections.append("trends")
+
+    payload = await _build_audit_payload(
+        db,
+        domain,
+        profile,
+        competitors_execution,
+        trend_execution,
+        sections=sections,
+        topics_limit=topics_limit if include_topics else 0,
+        trending_limit=trending_limit,
+    )
+    return project_audit_payload(
+        payload,
+        include_topics=include_topics,
+        include_trending=include_trending,
+        include_analyses=include_analyses,
+        include_temporal=include_temporal,
+        include_opportunities=include_opportunities,
+        topics_limit=topics_limit,
+        trending_limit=trending_limit,
     )
 
 
@@ -4102,6 +4552,9 @@ async def run_missing_workflows_chain(
                 failed_count=len(failed_workflows),
                 failed_workflows=[w[0] for w in failed_workflows] if failed_workflows else [],
             )
+
+            # Précalculer le snapshot d'audit servi par GET /sites/{domain}/audit
+            await refresh_audit_snapshot(domain)
             
         except Exception as e:
             # Erreur critique (editorial_analysis ou autre erreur non gérée)
@@ -4370,6 +4823,11 @@ DOMAIN_REGEX = re.compile(
     2. If exists: retrieve and use it
     3. If missing: launch only the missing workflows
     
+    Complete audits are served from a precomputed per-domain snapshot, rebuilt
+    incrementally when a scraping or trend pipeline execution completes (or on
+    read, for the sections whose sources changed). The include_* flags and
+    limits are applied to the snapshot; the `snapshot` field gives its freshness.
+    
     Checks in order:
     - Site profile (site_profiles)
     - Competitors (workflow_executions with competitor_search)
@@ -4446,7 +4904,10 @@ async def get_site_audit(
     # ============================================================
     # ÉTAPE 2-5: Vérifications en parallèle (P1-1: parallélisation)
     # ============================================================
-    # Paralléliser les vérifications indépendantes pour améliorer les performances
+    # Paralléliser les vérifications indépendantes pour améliorer les performances.
+    # Une AsyncSession ne supporte pas l'usage concurrent : chaque vérification
+    # obtient sa propre session du pool via le data loader (lookups mémoïsés).
+    loader = RequestDataLoader()
     competitors_execution = None
     trend_execution = None
     competitor_articles_count = 0
@@ -4456,9 +4917,18 @@ async def get_site_audit(
         # Lancer les vérifications en parallèle
         try:
             results = await asyncio.gather(
-                _check_competitors(db, domain),
-                _check_trend_pipeline(db, domain),
-                _check_client_articles(db, profile.id),
+                loader.load(
+                    ("competitors", domain),
+                    lambda session: _check_competitors(session, domain),
+                ),
+                loader.load(
+                    ("trend_pipeline", domain),
+                    lambda session: _check_trend_pipeline(session, domain),
+                ),
+                loader.load(
+                    ("client_articles", profile.id),
+                    lambda session: _check_client_articles(session, profile.id),
+                ),
                 return_exceptions=True,
             )
             
@@ -4502,7 +4972,10 @@ async def get_site_audit(
     else:
         # Pas de profile : vérifier seulement les concurrents (sans dépendance)
         try:
-            competitors_execution = await _check_competitors(db, domain)
+            competitors_execution = await loader.load(
+                ("competitors", domain),
+                lambda session: _check_competitors(session, domain),
+            )
             if isinstance(competitors_execution, Exception):
                 logger.warning(
                     "Error checking competitors, assuming missing",
@@ -4544,7 +5017,7 @@ async def get_site_audit(
             # Compter les articles pour ces domaines (PostgreSQL + Qdrant)
             try:
                 count, is_sufficient = await _check_competitor_articles(
-                    db, competitor_domains, client_domain=domain
+                    db, competitor_domains, client_domain=domain, loader=loader
                 )
                 competitor_articles_count = count
                 needs_scraping = not is_sufficient
@@ -4607,13 +5080,14 @@ async def get_site_audit(
             missing_scraping=needs_scraping,
             missing_client_scraping=needs_client_scraping,
         )
-        # Les données essentielles sont disponibles : construire et retourner la réponse
-        return await build_complete_audit_from_database(
+        # Les données essentielles sont disponibles : servir le snapshot (reconstruit si périmé)
+        return await get_audit_from_snapshot(
             db,
             domain,
             profile,
             competitors_execution,
             trend_execution,
+            client_articles_count,
             include_topics=include_topics,
             include_trending=include_trending,
             include_analyses=include_analyses,
@@ -4632,13 +5106,14 @@ async def get_site_audit(
             missing_scraping=needs_scraping,
             missing_client_scraping=needs_client_scraping,
         )
-        # Les données essentielles sont disponibles : construire et retourner la réponse
-        return await build_complete_audit_from_database(
+        # Les données essentielles sont disponibles : servir le snapshot (reconstruit si périmé)
+        return await get_audit_from_snapshot(
             db,
             domain,
             profile,
             competitors_execution,
             trend_execution,
+            client_articles_count,
             include_topics=include_topics,
             include_trending=include_trending,
             include_analyses=include_analyses,
@@ -4846,13 +5321,14 @@ async def get_site_audit(
     # TOUTES LES DONNÉES SONT DISPONIBLES : Construire la réponse
     # ============================================================
     
-    # Récupérer les données complètes depuis la base
-    return await build_complete_audit_from_database(
+    # Servir le snapshot d'audit (sections périmées reconstruites)
+    return await get_audit_from_snapshot(
         db,
         domain,
         profile,
         competitors_execution,
         trend_execution,
+        client_articles_count,
         include_topics=include_topics,
         include_trending=include_trending,
         include_analyses=include_analyses,
@@ -335,6 +335,12 @@ async def run_trend_pipeline_task(
                 status="completed",
             )
         
+        # Precompute the audit snapshot served by GET /sites/{domain}/audit
+        if request.client_domain and result.get("success", False):
+            from python_scripts.api.routers.sites import refresh_audit_snapshot
+            
+            await refresh_audit_snapshot(request.client_domain)
+        
     except Exception as e:
         logger.error("Trend pipeline task failed", error=str(e), execution_id=execution_id)
         
@@ -426,6 +426,31 @@ class EditorialOpportunitiesSection(BaseModel):
     summary: Optional[Dict[str, Any]] = Field(None, description="Summary statistics")
 
 
+class AuditSnapshotInfo(BaseModel):
+    """Freshness metadata of the precomputed audit snapshot."""
+
+    built_at: datetime = Field(..., description="When the snapshot was last (re)built")
+    age_seconds: float = Field(..., description="Age of the snapshot when served", ge=0)
+    build_duration_ms: int = Field(..., description="Duration of the last (partial) rebuild", ge=0)
+    sources: Dict[str, Any] = Field(
+        ...,
+        description="Signature of the data the snapshot was built from",
+        examples=[
+            {
+                "version": 1,
+                "profile": "12:2026-10-16T08:00:00+00:00",
+                "competitors": "123e4567-e89b-12d3-a456-426614174000:2026-10-15T18:20:00+00:00",
+                "trend": "9b2f6c1e-4d7a-4f1b-8c3e-2a5d9e7f1b42",
+                "client_articles": 87,
+            }
+        ],
+    )
+    rebuilt_sections: List[str] = Field(
+        default_factory=list,
+        description="Sections rebuilt while serving this request (empty if the snapshot was fresh)",
+    )
+
+
 class SiteAuditResponse(BaseModel):
     """Response schema for complete site audit."""
 
@@ -478,6 +503,10 @@ class SiteAuditResponse(BaseModel):
         None,
         description="Editorial opportunities section (if include_opportunities=True)",
     )
+    snapshot: Optional[AuditSnapshotInfo] = Field(
+        None,
+        description="Freshness of the precomputed audit snapshot the response was served from",
+    )
 
 
 class AuditStatusResponse(BaseModel):
@@ -3,7 +3,7 @@
 import os
 from pathlib import Path
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional
+from typing import Dict, Optional
 
 # Find .env file - look in project root (AgentEditorial/)
 # Go up from python_scripts/config/settings.py -> python_scripts/config -> python_scripts -> AgentEditorial
@@ -54,6 +54,20 @@ class Settings(BaseSettings):
     # Qdrant
     qdrant_url: str = "http://localhost:6333"
     qdrant_api_key: Optional[str] = None
+    qdrant_collection_cache_ttl: float = 300.0  # Seconds before the known collections list is refreshed
+    qdrant_collection_negative_ttl: float = 10.0  # Seconds an unknown collection name is answered without refresh
+
+    # Embedding cache (content-hash keyed, persistent)
+    embedding_cache_enabled: bool = True
+    embedding_cache_dir: str = "cache/embeddings"
+    embedding_cache_dtype: str = "float16"  # float16 or float32
+    embedding_cache_max_entries: int = 200000
+    embedding_cache_max_mb: int = 1024  # Size cap of the vector file per model
+
+    # Compute executor (CPU-bound clustering off the API event loop)
+    compute_executor_enabled: bool = True  # False: run CPU-bound tasks in a thread
+    compute_workers: int = 2  # Worker processes (each holds its own model copies)
+    compute_shared_memory_min_bytes: int = 1024 * 1024  # Arrays from this size are passed via shared memory
 
     # Ollama
     # Default to 11435 if using Docker Compose (to avoid conflict with local Ollama on 11434)
@@ -62,6 +76,25 @@ class Settings(BaseSettings):
     # Default model for article generation / LLM-based features
     # Utilise un modèle plus standard déjà utilisé ailleurs dans le projet
     ollama_model: str = "llama3:8b"
+    # Scheduling of independent calls to several models (editorial analysis)
+    ollama_scheduling_mode: str = "auto"  # auto (VRAM-aware), concurrent or sequential
+    ollama_max_loaded_models: int = 3  # Keep in line with OLLAMA_MAX_LOADED_MODELS on the Ollama host
+    ollama_vram_budget_gb: Optional[float] = None  # VRAM available to Ollama (default: GPU total)
+    ollama_model_timeout: float = 300.0  # Timeout of one model call in seconds
+    ollama_model_timeouts: Dict[str, float] = {}  # Per-model overrides, e.g. {"phi3:medium": 420}
+
+    # LLM response cache (only for LLMs created with a cache_template)
+    llm_cache_enabled: bool = True
+    llm_cache_path: str = "cache/llm_responses.sqlite"
+    llm_cache_ttl_hours: float = 168.0  # One week
+    llm_cache_max_entries: int = 50000
+    llm_cache_max_temperature: float = 0.3  # Sampled calls above this temperature are not cached
+
+    # Competitor search result cache (normalized query + provider -> results)
+    competitor_search_cache_enabled: bool = True
+    competitor_search_cache_path: str = "cache/competitor_search.sqlite"
+    competitor_search_cache_ttl_hours: float = 72.0
+    competitor_search_cache_max_entries: int = 20000
 
     # API Keys (optional)
     tavily_api_key: Optional[str] = None
@@ -71,6 +104,43 @@ class Settings(BaseSettings):
     user_agent: str = "EditorialBot/1.0 (+https://your-site.com/bot)"
     crawl_delay_default: int = 2
     max_pages_per_domain: int = 100
+    # Concurrent extraction (phase 3 of the scraping agent)
+    scraping_max_concurrency: int = 5  # Parallel fetch/extract workers per domain
+    scraping_politeness_delay: float = 0.5  # Minimum delay (s) between two requests to a domain
+    scraping_write_batch_size: int = 20  # URLs per extraction window (batched DB/Qdrant writes)
+    robots_cache_ttl: float = 3600.0  # Seconds a parsed robots.txt is kept in memory per domain
+    # Multi-domain runs (several competitors scraped at the same time)
+    scraping_max_parallel_domains: int = 4  # Domains scraped concurrently
+    scraping_max_in_flight: int = 20  # Page requests in flight across all domains
+    scraping_page_budget: int = 0  # Pages fetched per run across all domains (0 = unlimited)
+    scraping_max_crawl_delay: float = 30.0  # Upper bound applied to a robots.txt Crawl-delay (s)
+    # Adaptive per-host concurrency (AIMD on latency, 429/503, timeouts, Retry-After)
+    crawl_rate_initial_limit: int = 2  # Starting concurrency of a host without learned limits
+    crawl_rate_window: int = 50  # Latency/error samples kept per host
+    crawl_rate_latency_tolerance: float = 1.5  # p95 / baseline ratio still considered flat
+    crawl_rate_backoff_factor: float = 0.5  # Concurrency multiplier on 429/503 or timeout
+    crawl_rate_max_retry_after: float = 300.0  # Longest Retry-After pause honored (s)
+    crawl_rate_timeout_multiplier: float = 4.0  # Request timeout = p95 latency x this factor...
+    crawl_rate_min_timeout: float = 5.0  # ...but never below this (s)
+    # Sitemaps (streamed, child sitemaps of an index fetched concurrently)
+    sitemap_max_concurrency: int = 4  # Child sitemaps downloaded at the same time
+    sitemap_max_depth: int = 3  # Nesting levels of sitemap indexes followed
+    sitemap_queue_size: int = 1000  # Parsed URLs buffered ahead of the consumer
+    sitemap_incremental: bool = False  # Skip entries older than the domain's last successful discovery
+
+    # Crawl cache (in-process LRU in front of the crawl_cache table)
+    crawl_cache_memory_max_mb: int = 64  # Size cap of the in-memory tier
+    crawl_cache_stats_flush_interval: float = 30.0  # Seconds between two writes of hit counts
+    crawl_cache_stats_batch_size: int = 200  # Pending entries triggering an immediate write
+    html_store_dir: str = "cache/html_blobs"  # Compressed raw HTML of cached pages (content-addressed)
+    html_store_compression_level: int = 3  # zstd level (zlib level when zstandard is missing)
+
+    # Shared HTTP clients (crawling and discovery)
+    http_max_connections: int = 100  # Total open connections per client profile
+    http_max_connections_per_host: int = 6  # Concurrent requests per host
+    http_keepalive_expiry: float = 30.0  # Idle keep-alive connection lifetime (s)
+    http2_enabled: bool = True  # Requires the h2 package (httpx[http2])
+    http_default_timeout: float = 30.0
 
     # Rate Limiting
     rate_limit_per_minute: int = 100
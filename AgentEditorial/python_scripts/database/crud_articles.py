@@ -1,7 +1,7 @@
 """CRUD operations for CompetitorArticle model (T100 - US5)."""
 
 from datetime import date, datetime, timezone, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
 from sqlalchemy import select, func, and_, or_
@@ -52,6 +52,31 @@ async def create_competitor_article(
     return article
 
 
+async def create_competitor_articles_batch(
+    db_session: AsyncSession,
+    articles_data: List[Dict[str, Any]],
+) -> List[CompetitorArticle]:
+    """
+    Create several competitor articles in a single transaction.
+
+    Args:
+        db_session: Database session
+        articles_data: List of dictionaries with the same fields as create_competitor_article
+
+    Returns:
+        Created CompetitorArticle instances (same order as articles_data)
+    """
+    if not articles_data:
+        return []
+
+    articles = [CompetitorArticle(**data) for data in articles_data]
+    db_session.add_all(articles)
+    await db_session.flush()
+    await db_session.commit()
+    logger.info("Competitor articles created in batch", count=len(articles))
+    return articles
+
+
 async def get_competitor_article_by_url(
     db_session: AsyncSession,
     url: str,
@@ -98,6 +123,37 @@ async def get_competitor_article_by_hash(
     return result.scalar_one_or_none()
 
 
+async def get_existing_competitor_article_hashes(
+    db_session: AsyncSession,
+    url_hashes: Iterable[str],
+    chunk_size: int = 1000,
+) -> Set[str]:
+    """
+    Get the URL hashes that already have a valid competitor article.
+
+    One query per chunk of hashes instead of one query per URL.
+
+    Args:
+        db_session: Database session
+        url_hashes: SHA256 hashes of the URLs to check
+        chunk_size: Hashes per IN (...) query
+
+    Returns:
+        Subset of url_hashes already stored
+    """
+    hashes = list(dict.fromkeys(url_hashes))
+    existing: Set[str] = set()
+    for start in range(0, len(hashes), chunk_size):
+        result = await db_session.execute(
+            select(CompetitorArticle.url_hash).where(
+                CompetitorArticle.url_hash.in_(hashes[start : start + chunk_size]),
+                CompetitorArticle.is_valid == True,  # noqa: E712
+            )
+        )
+        existing.update(result.scalars().all())
+    return existing
+
+
 async def get_competitor_article_by_id(
     db_session: AsyncSession,
     article_id: int,
@@ -199,6 +255,38 @@ async def count_competitor_articles(
     return result.scalar_one() or 0
 
 
+async def count_competitor_articles_by_domain(
+    db_session: AsyncSession,
+    domains: Iterable[str],
+) -> Dict[str, int]:
+    """
+    Count competitor articles of several domains with one COUNT ... GROUP BY.
+
+    Args:
+        db_session: Database session
+        domains: Domain names
+
+    Returns:
+        Dictionary mapping each domain to its article count (0 if none)
+    """
+    counts = {domain: 0 for domain in domains}
+    if not counts:
+        return counts
+
+    query = (
+        select(CompetitorArticle.domain, func.count(CompetitorArticle.id))
+        .where(
+            CompetitorArticle.is_valid == True,  # noqa: E712
+            CompetitorArticle.domain.in_(list(counts)),
+        )
+        .group_by(CompetitorArticle.domain)
+    )
+    result = await db_session.execute(query)
+    for domain, count in result.all():
+        counts[domain] = count
+    return counts
+
+
 async def update_competitor_article(
     db_session: AsyncSession,
     article: CompetitorArticle,
@@ -359,3 +447,24 @@ async def update_articles_topic_ids_batch(
         count=len(article_topic_mapping),
     )
 
+
+async def update_qdrant_point_ids_batch(
+    db_session: AsyncSession,
+    article_point_ids: List[Tuple[CompetitorArticle, UUID]],
+) -> None:
+    """
+    Update the Qdrant point IDs of several articles with a single commit.
+
+    Args:
+        db_session: Database session
+        article_point_ids: List of (CompetitorArticle instance, Qdrant point ID) tuples
+    """
+    if not article_point_ids:
+        return
+
+    now = datetime.now(timezone.utc)
+    for article, qdrant_point_id in article_point_ids:
+        article.qdrant_point_id = qdrant_point_id
+        article.updated_at = now
+    await db_session.commit()
+    logger.info("Qdrant point IDs updated in batch", count=len(article_point_ids))
@@ -0,0 +1,108 @@
+"""CRUD operations for SiteAuditSnapshot model."""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from python_scripts.database.models import SiteAuditSnapshot
+from python_scripts.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+async def get_audit_snapshot(
+    db_session: AsyncSession,
+    domain: str,
+) -> Optional[SiteAuditSnapshot]:
+    """
+    Get the audit snapshot of a domain (unique index lookup).
+
+    Args:
+        db_session: Database session
+        domain: Domain name
+
+    Returns:
+        SiteAuditSnapshot if found, None otherwise
+    """
+    result = await db_session.execute(
+        select(SiteAuditSnapshot).where(SiteAuditSnapshot.domain == domain)
+    )
+    return result.scalar_one_or_none()
+
+
+async def upsert_audit_snapshot(
+    db_session: AsyncSession,
+    domain: str,
+    site_profile_id: Optional[int],
+    payload: Dict[str, Any],
+    sources: Dict[str, Any],
+    build_duration_ms: int,
+) -> SiteAuditSnapshot:
+    """
+    Create or replace the audit snapshot of a domain with INSERT ... ON CONFLICT.
+
+    Concurrent rebuilds of the same domain (workflow hook and API request)
+    keep the last write instead of failing on the unique domain index.
+
+    Args:
+        db_session: Database session
+        domain: Domain name
+        site_profile_id: Site profile ID
+        payload: Complete audit payload (JSON-serializable)
+        sources: Signature of the executions the payload was built from
+        build_duration_ms: Time spent building the stale sections
+
+    Returns:
+        Stored SiteAuditSnapshot instance
+    """
+    now = datetime.now(timezone.utc)
+    stmt = insert(SiteAuditSnapshot).values(
+        domain=domain,
+        site_profile_id=site_profile_id,
+        payload=payload,
+        sources=sources,
+        built_at=now,
+        build_duration_ms=build_duration_ms,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SiteAuditSnapshot.domain],
+        set_={
+            "site_profile_id": stmt.excluded.site_profile_id,
+            "payload": stmt.excluded.payload,
+            "sources": stmt.excluded.sources,
+            "built_at": stmt.excluded.built_at,
+            "build_duration_ms": stmt.excluded.build_duration_ms,
+            "updated_at": now,
+        },
+    )
+    await db_session.execute(stmt)
+    await db_session.commit()
+
+    snapshot = await get_audit_snapshot(db_session, domain)
+    # The ORM identity map may hold an older version of the row
+    await db_session.refresh(snapshot)
+    logger.info(
+        "Audit snapshot saved",
+        domain=domain,
+        build_duration_ms=build_duration_ms,
+    )
+    return snapshot
+
+
+async def delete_audit_snapshot(
+    db_session: AsyncSession,
+    domain: str,
+) -> None:
+    """
+    Delete the audit snapshot of a domain (next read rebuilds it).
+
+    Args:
+        db_session: Database session
+        domain: Domain name
+    """
+    await db_session.execute(delete(SiteAuditSnapshot).where(SiteAuditSnapshot.domain == domain))
+    await db_session.commit()
+    logger.info("Audit snapshot deleted", domain=domain)
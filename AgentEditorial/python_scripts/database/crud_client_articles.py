@@ -1,7 +1,7 @@
 """CRUD operations for ClientArticle model."""
 
 from datetime import date, datetime, timezone, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
 from sqlalchemy import select, func, and_, or_
@@ -52,6 +52,31 @@ async def create_client_article(
     return article
 
 
+async def create_client_articles_batch(
+    db_session: AsyncSession,
+    articles_data: List[Dict[str, Any]],
+) -> List[ClientArticle]:
+    """
+    Create several client articles in a single transaction.
+
+    Args:
+        db_session: Database session
+        articles_data: List of dictionaries with the same fields as create_client_article
+
+    Returns:
+        Created ClientArticle instances (same order as articles_data)
+    """
+    if not articles_data:
+        return []
+
+    articles = [ClientArticle(**data) for data in articles_data]
+    db_session.add_all(articles)
+    await db_session.flush()
+    await db_session.commit()
+    logger.info("Client articles created in batch", count=len(articles))
+    return articles
+
+
 async def get_client_article_by_url(
     db_session: AsyncSession,
     url: str,
@@ -98,6 +123,37 @@ async def get_client_article_by_hash(
     return result.scalar_one_or_none()
 
 
+async def get_existing_client_article_hashes(
+    db_session: AsyncSession,
+    url_hashes: Iterable[str],
+    chunk_size: int = 1000,
+) -> Set[str]:
+    """
+    Get the URL hashes that already have a valid client article.
+
+    One query per chunk of hashes instead of one query per URL.
+
+    Args:
+        db_session: Database session
+        url_hashes: SHA256 hashes of the URLs to check
+        chunk_size: Hashes per IN (...) query
+
+    Returns:
+        Subset of url_hashes already stored
+    """
+    hashes = list(dict.fromkeys(url_hashes))
+    existing: Set[str] = set()
+    for start in range(0, len(hashes), chunk_size):
+        result = await db_session.execute(
+            select(ClientArticle.url_hash).where(
+                ClientArticle.url_hash.in_(hashes[start : start + chunk_size]),
+                ClientArticle.is_valid == True,  # noqa: E712
+            )
+        )
+        existing.update(result.scalars().all())
+    return existing
+
+
 async def get_client_article_by_id(
     db_session: AsyncSession,
     article_id: int,
@@ -266,3 +322,24 @@ async def update_qdrant_point_id(
     )
     return article
 
+
+async def update_qdrant_point_ids_batch(
+    db_session: AsyncSession,
+    article_point_ids: List[Tuple[ClientArticle, UUID]],
+) -> None:
+    """
+    Update the Qdrant point IDs of several articles with a single commit.
+
+    Args:
+        db_session: Database session
+        article_point_ids: List of (ClientArticle instance, Qdrant point ID) tuples
+    """
+    if not article_point_ids:
+        return
+
+    now = datetime.now(timezone.utc)
+    for article, qdrant_point_id in article_point_ids:
+        article.qdrant_point_id = qdrant_point_id
+        article.updated_at = now
+    await db_session.commit()
+    logger.info("Qdrant point IDs updated in batch", count=len(article_point_ids))
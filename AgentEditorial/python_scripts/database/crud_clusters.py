@@ -200,6 +200,35 @@ async def get_topic_cluster_by_topic_id(
     return result.scalar_one_or_none()
 
 
+async def get_topic_clusters_by_topic_ids(
+    db_session: AsyncSession,
+    analysis_id: int,
+    topic_ids: List[int],
+) -> Dict[int, TopicCluster]:
+    """
+    Get the topic clusters of several topics of an analysis in one query.
+    
+    Args:
+        db_session: Database session
+        analysis_id: Pipeline execution ID
+        topic_ids: BERTopic topic IDs
+        
+    Returns:
+        Dictionary mapping topic_id to TopicCluster (missing topics are absent)
+    """
+    if not topic_ids:
+        return {}
+    
+    result = await db_session.execute(
+        select(TopicCluster).where(
+            TopicCluster.analysis_id == analysis_id,
+            TopicCluster.topic_id.in_(topic_ids),
+            TopicCluster.is_valid == True,  # noqa: E712
+        )
+    )
+    return {cluster.topic_id: cluster for cluster in result.scalars().all()}
+
+
 async def update_topic_cluster(
     db_session: AsyncSession,
     cluster_id: int,
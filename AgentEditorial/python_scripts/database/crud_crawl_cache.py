@@ -2,10 +2,10 @@
 
 import hashlib
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from urllib.parse import urlparse
 
-from sqlalchemy import select, and_
+from sqlalchemy import and_, bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from python_scripts.database.models import CrawlCache
@@ -30,16 +30,21 @@ def generate_content_hash(content: str) -> str:
 async def get_crawl_cache(
     db_session: AsyncSession,
     url: str,
+    include_expired: bool = False,
 ) -> Optional[CrawlCache]:
     """
     Get cached crawl result for a URL (if not expired).
 
+    Read-only: access statistics are recorded in batches with
+    record_crawl_cache_hits (see ingestion.crawl_cache).
+
     Args:
         db_session: Database session
         url: URL to check
+        include_expired: Also return an expired entry (for revalidation)
 
     Returns:
-        CrawlCache if found and not expired, None otherwise
+        CrawlCache if found (and not expired), None otherwise
     """
     url_hash = generate_url_hash(url)
     
@@ -48,21 +53,77 @@ async def get_crawl_cache(
     )
     cached = result.scalar_one_or_none()
     
-    if cached:
-        # Check if cache is expired
-        if cached.expires_at < datetime.now(timezone.utc):
-            logger.debug("Crawl cache expired", url=url)
-            return None
-        
-        # Update access metadata
-        cached.last_accessed = datetime.now(timezone.utc)
-        cached.cache_hit_count += 1
-        await db_session.commit()
-        await db_session.refresh(cached)
-        
-        return cached
+    if cached and not include_expired and cached.expires_at < datetime.now(timezone.utc):
+        logger.debug("Crawl cache expired", url=url)
+        return None
     
-    return None
+    return cached
+
+
+async def record_crawl_cache_hits(
+    db_session: AsyncSession,
+    hits: Dict[str, Tuple[int, datetime]],
+) -> int:
+    """
+    Add cache hits and update last access times in one batch.
+
+    Args:
+        db_session: Database session
+        hits: (hit count, last access time) per URL hash
+
+    Returns:
+        Number of entries updated
+    """
+    if not hits:
+        return 0
+
+    table = CrawlCache.__table__
+    statement = (
+        update(table)
+        .where(table.c.url_hash == bindparam("b_url_hash"))
+        .values(
+            cache_hit_count=table.c.cache_hit_count + bindparam("b_hits"),
+            last_accessed=bindparam("b_last_accessed"),
+        )
+    )
+    await db_session.execute(
+        statement,
+        [
+            {"b_url_hash": url_hash, "b_hits": count, "b_last_accessed": last_accessed}
+            for url_hash, (count, last_accessed) in hits.items()
+        ],
+    )
+    await db_session.commit()
+    return len(hits)
+
+
+async def refresh_crawl_cache_expiry(
+    db_session: AsyncSession,
+    url: str,
+    cached_metadata: Optional[Dict[str, Any]] = None,
+) -> datetime:
+    """
+    Extend the TTL of an entry whose content was revalidated (HTTP 304).
+
+    Args:
+        db_session: Database session
+        url: Cached URL
+        cached_metadata: Updated metadata (validators), None to keep it
+
+    Returns:
+        New expiration date
+    """
+    expires_at = datetime.now(timezone.utc) + timedelta(days=CACHE_TTL_DAYS)
+    values: Dict[str, Any] = {"expires_at": expires_at, "last_accessed": datetime.now(timezone.utc)}
+    if cached_metadata is not None:
+        values["cached_metadata"] = cached_metadata
+
+    await db_session.execute(
+        update(CrawlCache).where(CrawlCache.url_hash == generate_url_hash(url)).values(**values)
+    )
+    await db_session.commit()
+    logger.debug("Crawl cache revalidated", url=url)
+    return expires_at
 
 
 async def create_or_update_crawl_cache(
@@ -130,6 +191,64 @@ async def create_or_update_crawl_cache(
     return cached
 
 
+async def get_crawl_cache_with_inline_html(
+    db_session: AsyncSession,
+    after_id: int = 0,
+    limit: int = 200,
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Get entries still holding raw HTML in their metadata (keyset pagination).
+
+    Args:
+        db_session: Database session
+        after_id: Only return entries with a greater id
+        limit: Maximum number of entries
+
+    Returns:
+        (id, cached_metadata) ordered by id
+    """
+    result = await db_session.execute(
+        select(CrawlCache.id, CrawlCache.cached_metadata)
+        .where(
+            and_(
+                CrawlCache.id > after_id,
+                CrawlCache.cached_metadata.has_key("html"),
+            )
+        )
+        .order_by(CrawlCache.id)
+        .limit(limit)
+    )
+    return [(row_id, metadata or {}) for row_id, metadata in result.all()]
+
+
+async def update_crawl_cache_metadata(
+    db_session: AsyncSession,
+    metadata_by_id: Dict[int, Dict[str, Any]],
+) -> int:
+    """
+    Replace the metadata of several entries in one batch.
+
+    Args:
+        db_session: Database session
+        metadata_by_id: New cached_metadata per entry id
+
+    Returns:
+        Number of entries updated
+    """
+    if not metadata_by_id:
+        return 0
+
+    table = CrawlCache.__table__
+    await db_session.execute(
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values(cached_metadata=bindparam("b_metadata")),
+        [{"b_id": row_id, "b_metadata": metadata} for row_id, metadata in metadata_by_id.items()],
+    )
+    await db_session.commit()
+    return len(metadata_by_id)
+
+
 async def delete_crawl_cache(
     db_session: AsyncSession,
     url: str,
@@ -1,6 +1,6 @@
 """CRUD operations for LLM enrichment results (TrendAnalysis, ArticleRecommendation)."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import select
@@ -90,6 +90,54 @@ async def create_article_recommendation(
     return article_reco
 
 
+async def create_trend_analyses_batch(
+    db_session: AsyncSession,
+    analyses_data: List[Dict[str, Any]],
+) -> List[TrendAnalysis]:
+    """
+    Create several trend analysis records in a single transaction.
+    
+    Args:
+        db_session: Database session
+        analyses_data: List of dictionaries with the same fields as create_trend_analysis
+        
+    Returns:
+        Created TrendAnalysis instances (same order as analyses_data)
+    """
+    if not analyses_data:
+        return []
+    
+    analyses = [TrendAnalysis(**data) for data in analyses_data]
+    db_session.add_all(analyses)
+    await db_session.commit()
+    logger.info("Created trend analyses batch", count=len(analyses))
+    return analyses
+
+
+async def create_article_recommendations_batch(
+    db_session: AsyncSession,
+    recommendations_data: List[Dict[str, Any]],
+) -> List[ArticleRecommendation]:
+    """
+    Create several article recommendation records in a single transaction.
+    
+    Args:
+        db_session: Database session
+        recommendations_data: List of dictionaries with the same fields as create_article_recommendation
+        
+    Returns:
+        Created ArticleRecommendation instances (same order as recommendations_data)
+    """
+    if not recommendations_data:
+        return []
+    
+    recommendations = [ArticleRecommendation(**data) for data in recommendations_data]
+    db_session.add_all(recommendations)
+    await db_session.commit()
+    logger.info("Created article recommendations batch", count=len(recommendations))
+    return recommendations
+
+
 async def get_trend_analyses_by_topic_cluster(
     db_session: AsyncSession,
     topic_cluster_id: int,
@@ -0,0 +1,121 @@
+"""Request-scoped data loader for concurrent database lookups.
+
+An AsyncSession must not be used by several tasks at once: checks run with
+asyncio.gather() on the request session either serialize or fail. The loader
+runs each lookup in its own pooled session instead, and memoizes lookups by
+key, so identical lookups made while serving a request share one query
+(including lookups still in flight).
+
+Competitor article counts are batched: the domains not loaded yet are counted
+with one COUNT ... GROUP BY query.
+
+Usage:
+    loader = RequestDataLoader()
+    competitors, trend = await asyncio.gather(
+        loader.load(("competitors", domain), lambda session: check_competitors(session, domain)),
+        loader.load(("trend", domain), lambda session: check_trend(session, domain)),
+    )
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from python_scripts.database.crud_articles import count_competitor_articles_by_domain
+from python_scripts.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Takes a session and runs the lookup
+Lookup = Callable[[AsyncSession], Awaitable[T]]
+
+
+class RequestDataLoader:
+    """Runs lookups in their own sessions and memoizes them for one request."""
+
+    def __init__(self, session_factory: Optional[Callable[[], Any]] = None) -> None:
+        """
+        Initialize the loader.
+
+        Args:
+            session_factory: Factory returning an AsyncSession context manager
+                (default: AsyncSessionLocal, backed by the engine pool)
+        """
+        if session_factory is None:
+            from python_scripts.database.db_session import AsyncSessionLocal
+
+            session_factory = AsyncSessionLocal
+        self._session_factory = session_factory
+        self._lookups: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._article_counts: Dict[str, "asyncio.Future[Dict[str, int]]"] = {}
+
+    async def _run(self, lookup: Lookup) -> Any:
+        """Run a lookup in a dedicated session."""
+        async with self._session_factory() as session:
+            return await lookup(session)
+
+    async def load(self, key: Hashable, lookup: Lookup) -> Any:
+        """
+        Run a lookup once per key.
+
+        Args:
+            key: Identity of the lookup (e.g. ("competitors", domain))
+            lookup: Coroutine function taking the session to use
+
+        Returns:
+            Result of the lookup (shared by every caller with the same key)
+        """
+        future = self._lookups.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._run(lookup))
+            self._lookups[key] = future
+            future.add_done_callback(lambda done: self._forget_failure(self._lookups, key, done))
+        # A cancelled caller must not cancel the lookup shared with the others
+        return await asyncio.shield(future)
+
+    async def count_competitor_articles(self, domains: Iterable[str]) -> Dict[str, int]:
+        """
+        Count the competitor articles of several domains.
+
+        The domains not counted yet in this request are counted together with
+        one grouped query.
+
+        Args:
+            domains: Domain names
+
+        Returns:
+            Dictionary mapping each domain to its article count
+        """
+        domains = list(dict.fromkeys(domains))
+        missing = [domain for domain in domains if domain not in self._article_counts]
+        if missing:
+            batch = asyncio.ensure_future(
+                self._run(lambda session: count_competitor_articles_by_domain(session, missing))
+            )
+            for domain in missing:
+                self._article_counts[domain] = batch
+                batch.add_done_callback(
+                    lambda done, domain=domain: self._forget_failure(
+                        self._article_counts, domain, done
+                    )
+                )
+
+        batches: List["asyncio.Future[Dict[str, int]]"] = []
+        for domain in domains:
+            if all(self._article_counts[domain] is not batch for batch in batches):
+                batches.append(self._article_counts[domain])
+
+        counts: Dict[str, int] = {}
+        for batch_counts in await asyncio.shield(asyncio.gather(*batches)):
+            counts.update(batch_counts)
+        return {domain: counts.get(domain, 0) for domain in domains}
+
+    @staticmethod
+    def _forget_failure(memo: Dict[Any, Any], key: Hashable, future: "asyncio.Future[Any]") -> None:
+        """Drop a failed lookup so that a later call retries it."""
+        if future.cancelled() or future.exception() is not None:
+            if memo.get(key) is future:
+                del memo[key]
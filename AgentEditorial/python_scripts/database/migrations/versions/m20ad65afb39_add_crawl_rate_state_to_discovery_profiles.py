@@ -0,0 +1,40 @@
+"""Add crawl_rate_state column to site_discovery_profiles.
+
+Stores the per-host crawl rate learned by the adaptive rate controller
+(concurrency, p95 latency, error rate) so that the next run starts from it.
+
+Revision ID: m20ad65afb39
+Revises: l10ad65afb38
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "m20ad65afb39"
+down_revision: Union[str, None] = "l10ad65afb38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add crawl_rate_state column to site_discovery_profiles."""
+    op.add_column(
+        "site_discovery_profiles",
+        sa.Column(
+            "crawl_rate_state",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Remove crawl_rate_state column from site_discovery_profiles."""
+    op.drop_column("site_discovery_profiles", "crawl_rate_state")
@@ -0,0 +1,82 @@
+"""Add site_audit_snapshots table.
+
+Stores one precomputed GET /sites/{domain}/audit payload per domain, with the
+signature of the executions it was built from, so that the endpoint serves
+reads with one indexed lookup.
+
+Revision ID: n30ad65afb40
+Revises: m20ad65afb39
+Create Date: 2026-10-16 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "n30ad65afb40"
+down_revision: Union[str, None] = "m20ad65afb39"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create site_audit_snapshots table."""
+    op.create_table(
+        "site_audit_snapshots",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("domain", sa.String(length=255), nullable=False),
+        sa.Column("site_profile_id", sa.Integer(), nullable=True),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("sources", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "built_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("build_duration_ms", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(
+            ["site_profile_id"],
+            ["site_profiles.id"],
+            ondelete="CASCADE",
+        ),
+    )
+    op.create_index(
+        "ix_site_audit_snapshots_domain",
+        "site_audit_snapshots",
+        ["domain"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_site_audit_snapshots_site_profile_id",
+        "site_audit_snapshots",
+        ["site_profile_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop site_audit_snapshots table."""
+    op.drop_index(
+        "ix_site_audit_snapshots_site_profile_id",
+        table_name="site_audit_snapshots",
+    )
+    op.drop_index("ix_site_audit_snapshots_domain", table_name="site_audit_snapshots")
+    op.drop_table("site_audit_snapshots")
@@ -958,6 +958,8 @@ class SiteDiscoveryProfile(Base, TimestampMixin):
     total_articles_valid: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     success_rate: Mapped[float] = mapped_column(Numeric(5, 4), default=0.0, nullable=False)
     avg_article_word_count: Mapped[Optional[float]] = mapped_column(Numeric(10, 2), nullable=True)
+    # Débit de crawl appris (concurrence, latence p95, taux d'erreur)
+    crawl_rate_state: Mapped[dict] = mapped_column(JSONB, default={}, nullable=False)
 
     # Métadonnées
     last_profiled_at: Mapped[Optional[datetime]] = mapped_column(
@@ -1251,3 +1253,34 @@ class ArticleLearningData(Base, TimestampMixin):
     )
     site_profile: Mapped[Optional["SiteProfile"]] = relationship("SiteProfile")
 
+
+
+# 20. site_audit_snapshots (Precomputed GET /sites/{domain}/audit)
+class SiteAuditSnapshot(Base, TimestampMixin):
+    """Materialized site audit, rebuilt when its source executions change."""
+
+    __tablename__ = "site_audit_snapshots"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    domain: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    site_profile_id: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        ForeignKey("site_profiles.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+
+    # Audit complet (limites maximales), projeté selon les include_* à la lecture
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    # Signature des sources (profil, concurrents, pipeline de tendances, articles client)
+    sources: Mapped[dict] = mapped_column(JSONB, nullable=False)
+
+    built_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    build_duration_ms: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Relationships
+    site_profile: Mapped[Optional["SiteProfile"]] = relationship("SiteProfile")
@@ -1,15 +1,29 @@
 """Article detector based on HTML content analysis."""
 
 import re
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
+from python_scripts.ingestion.html_document import INVISIBLE_TAGS, ParsedDocument
 from python_scripts.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Text nodes of an element, without scripts and styles
+_ELEMENT_TEXT = etree.XPath(
+    ".//text()[not(" + " or ".join(f"ancestor::{tag}" for tag in INVISIBLE_TAGS) + ")]"
+)
+# Text nodes of <body> outside of page chrome (header, footer, navigation...)
+_BODY_TEXT = etree.XPath(
+    ".//text()[normalize-space() and not("
+    + " or ".join(
+        f"ancestor::{tag}" for tag in ("header", "footer", "nav", "aside") + INVISIBLE_TAGS
+    )
+    + ")]"
+)
+
 
 class ArticleDetector:
     """
@@ -36,24 +50,27 @@ class ArticleDetector:
 
     def detect(
         self,
-        html: str,
+        html: Union[str, ParsedDocument],
         url: Optional[str] = None,
     ) -> Tuple[bool, float, Dict[str, any]]:
         """
         Detect if a page is an article.
         
         Args:
-            html: HTML content of the page
+            html: HTML content of the page, or the page already parsed
             url: Optional URL for context
             
         Returns:
             Tuple (is_article, confidence_score, metadata)
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = ParsedDocument.ensure(html, url)
+        tree = document.tree
+        # Elements with a class attribute, in document order (scanned by several checks)
+        classed = tree.xpath("//*[@class]")
         scores = {}
         
         # 1. Check for <article> tag (strong signal)
-        article_tags = soup.find_all("article")
+        article_tags = tree.xpath("//article")
         has_article_tag = len(article_tags) > 0
         scores["article_tag"] = 0.4 if has_article_tag else 0.0
         
@@ -67,24 +84,24 @@ class ArticleDetector:
         ]
         article_class_score = 0.0
         for pattern in article_class_patterns:
-            if soup.find(class_=re.compile(pattern, re.I)):
+            if _find_by_class(classed, pattern) is not None:
                 article_class_score = 0.2
                 break
         scores["article_class"] = article_class_score
         
         # 3. Check for title (h1)
-        h1_tags = soup.find_all("h1")
+        h1_tags = tree.xpath("//h1")
         has_h1 = len(h1_tags) > 0
         scores["has_title"] = 0.15 if has_h1 else 0.0
         
         # 4. Check for publication date
         date_indicators = [
-            soup.find("time"),
-            soup.find(class_=re.compile(r"date|published|pub-date", re.I)),
-            soup.find(attrs={"itemprop": "datePublished"}),
-            soup.find("meta", property="article:published_time"),
+            tree.find(".//time"),
+            _find_by_class(classed, r"date|published|pub-date"),
+            tree.find(".//*[@itemprop='datePublished']"),
+            tree.find(".//meta[@property='article:published_time']"),
         ]
-        has_date = any(date_indicators)
+        has_date = any(element is not None for element in date_indicators)
         scores["has_date"] = 0.1 if has_date else 0.0
         
         # 5. Check content length
@@ -93,41 +110,38 @@ class ArticleDetector:
         
         # Strategy 1: <article> tag
         if article_tags:
-            content_text = article_tags[0].get_text(separator=" ", strip=True)
+            content_text = _element_text(article_tags[0])
         else:
             # Strategy 2: Common content classes
             for class_name in ["content", "post-content", "article-content", "entry-content", "post-body"]:
-                content_elem = soup.find(class_=re.compile(class_name, re.I))
-                if content_elem:
-                    content_text = content_elem.get_text(separator=" ", strip=True)
+                content_elem = _find_by_class(classed, class_name)
+                if content_elem is not None:
+                    content_text = _element_text(content_elem)
                     if len(content_text) > 100:
                         break
             
             # Strategy 3: <main> tag
             if not content_text:
-                main_tag = soup.find("main")
-                if main_tag:
-                    content_text = main_tag.get_text(separator=" ", strip=True)
+                main_tag = tree.find(".//main")
+                if main_tag is not None:
+                    content_text = _element_text(main_tag)
         
-        # Fallback: body content (remove unwanted elements)
+        # Fallback: body content (without header, footer, navigation...)
         if not content_text:
-            body = soup.find("body")
-            if body:
-                # Remove unwanted elements
-                for tag in body.find_all(["header", "footer", "nav", "aside", "script", "style"]):
-                    tag.decompose()
-                content_text = body.get_text(separator=" ", strip=True)
+            body = tree.find(".//body")
+            if body is not None:
+                content_text = " ".join(piece.strip() for piece in _BODY_TEXT(body))
         
         word_count = len(content_text.split())
         scores["word_count"] = min(0.15, (word_count / self.min_word_count) * 0.15) if word_count >= self.min_word_count else 0.0
         
         # 6. Check for author information
         author_indicators = [
-            soup.find("meta", attrs={"name": "author"}),
-            soup.find("meta", property="article:author"),
-            soup.find(class_=re.compile(r"author|byline", re.I)),
+            tree.find(".//meta[@name='author']"),
+            tree.find(".//meta[@property='article:author']"),
+            _find_by_class(classed, r"author|byline"),
         ]
-        has_author = any(author_indicators)
+        has_author = any(element is not None for element in author_indicators)
         scores["has_author"] = 0.05 if has_author else 0.0
         
         # Calculate total score
@@ -152,12 +166,26 @@ class ArticleDetector:
         return is_article, total_score, metadata
 
 
-def quick_detect(html: str, url: Optional[str] = None) -> bool:
+def _find_by_class(elements: List[Any], pattern: str) -> Optional[Any]:
+    """First element whose class attribute matches a pattern (case-insensitive)."""
+    regex = re.compile(pattern, re.I)
+    for element in elements:
+        if regex.search(element.get("class", "")):
+            return element
+    return None
+
+
+def _element_text(element: Any) -> str:
+    """Text of an element, stripped pieces joined by spaces (scripts and styles excluded)."""
+    return " ".join(piece.strip() for piece in _ELEMENT_TEXT(element) if piece.strip())
+
+
+def quick_detect(html: Union[str, ParsedDocument], url: Optional[str] = None) -> bool:
     """
     Quick detection function for convenience.
     
     Args:
-        html: HTML content
+        html: HTML content, or the page already parsed
         url: Optional URL
         
     Returns:
@@ -0,0 +1,456 @@
+"""Two-tier crawl cache: in-process LRU in front of the crawl_cache table.
+
+Reads are served from memory when possible and never write to the
+database: hit counts and last access times are accumulated in memory and
+flushed in batches, from a separate session, by a background task (or
+when a batch is full).
+
+Expired entries are kept so that the crawler can revalidate them with
+If-None-Match / If-Modified-Since: a 304 response only extends the TTL,
+the page is neither downloaded nor parsed again.
+
+Raw HTML is not stored in the row: it goes to the HtmlBlobStore and the row
+keeps its reference (cached_metadata["html_ref"]). It is only loaded and
+decompressed by get_html(), when a caller needs the markup.
+
+An AsyncSession cannot be used by several tasks at once; the crawler
+shares one session between concurrent page crawls, so every database
+operation on a caller's session goes through run_locked().
+"""
+
+import asyncio
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from python_scripts.config.settings import settings
+from python_scripts.database import crud_crawl_cache
+from python_scripts.ingestion.html_store import HtmlBlobStore, get_html_store
+from python_scripts.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_session_locks: "weakref.WeakKeyDictionary[AsyncSession, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+def session_lock(db_session: AsyncSession) -> asyncio.Lock:
+    """Get the lock serializing the use of a shared session."""
+    lock = _session_locks.get(db_session)
+    if lock is None:
+        lock = _session_locks[db_session] = asyncio.Lock()
+    return lock
+
+
+async def run_locked(db_session: AsyncSession, operation: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run a database operation on a shared session, under its lock.
+
+    The operation is shielded from the cancellation of the caller (crawl
+    timeouts, early stops): a statement in flight completes and the lock is
+    released afterwards, so the session is never left in a half-done flush.
+
+    Args:
+        db_session: Shared session
+        operation: Coroutine function using the session
+
+    Returns:
+        Result of the operation
+    """
+
+    async def locked() -> T:
+        async with session_lock(db_session):
+            return await operation()
+
+    task = asyncio.ensure_future(locked())
+    # Errors of operations whose caller was cancelled are still retrieved
+    task.add_done_callback(lambda done: done.cancelled() or done.exception())
+    return await asyncio.shield(task)
+
+
+@dataclass
+class CachedPage:
+    """A cached crawl result."""
+
+    url: str
+    content: str
+    metadata: Dict[str, Any]
+    expires_at: datetime
+    size: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Approximate size in characters (content and string metadata such as html)
+        self.size = len(self.content) + sum(
+            len(value) for value in self.metadata.values() if isinstance(value, str)
+        )
+
+    @property
+    def is_expired(self) -> bool:
+        """Whether the entry must be revalidated before use."""
+        return self.expires_at < datetime.now(timezone.utc)
+
+    def revalidation_headers(self) -> Dict[str, str]:
+        """Conditional request headers built from the stored validators."""
+        headers = {}
+        if self.metadata.get("etag"):
+            headers["If-None-Match"] = self.metadata["etag"]
+        if self.metadata.get("last_modified"):
+            headers["If-Modified-Since"] = self.metadata["last_modified"]
+        return headers
+
+
+class CrawlCacheLayer:
+    """In-process LRU (bounded by size) over the crawl_cache table."""
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        flush_batch_size: Optional[int] = None,
+        session_factory: Optional[Callable[[], Any]] = None,
+        html_store: Optional[HtmlBlobStore] = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Size cap of the in-memory tier (default: settings.crawl_cache_memory_max_mb)
+            flush_interval: Seconds between two flushes of access statistics
+                (default: settings.crawl_cache_stats_flush_interval)
+            flush_batch_size: Pending entries triggering an immediate flush
+                (default: settings.crawl_cache_stats_batch_size)
+            session_factory: Factory of the sessions used to flush statistics
+                (default: AsyncSessionLocal)
+            html_store: Store of the raw HTML (default: get_html_store())
+        """
+        self.max_bytes = max_bytes if max_bytes is not None else settings.crawl_cache_memory_max_mb * 1024 * 1024
+        self.flush_interval = flush_interval or settings.crawl_cache_stats_flush_interval
+        self.flush_batch_size = flush_batch_size or settings.crawl_cache_stats_batch_size
+        self._session_factory = session_factory
+        self._html_store = html_store
+
+        self._entries: "OrderedDict[str, CachedPage]" = OrderedDict()
+        self._bytes = 0
+        self._pending_hits: Dict[str, Tuple[int, datetime]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._periodic_task: Optional[asyncio.Task] = None
+
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.flushed_hits = 0
+
+    @property
+    def html_store(self) -> HtmlBlobStore:
+        """Store of the raw HTML."""
+        if self._html_store is None:
+            self._html_store = get_html_store()
+        return self._html_store
+
+    # In-memory tier
+
+    def _remember(self, url_hash: str, page: CachedPage) -> None:
+        previous = self._entries.pop(url_hash, None)
+        if previous is not None:
+            self._bytes -= previous.size
+        if page.size > self.max_bytes:
+            return
+        self._entries[url_hash] = page
+        self._bytes += page.size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+
+    def invalidate(self, url: str) -> None:
+        """Drop a URL from the in-memory tier."""
+        page = self._entries.pop(crud_crawl_cache.generate_url_hash(url), None)
+        if page is not None:
+            self._bytes -= page.size
+
+    # Cache operations
+
+    async def get(self, db_session: AsyncSession, url: str) -> Optional[CachedPage]:
+        """
+        Get the cached page of a URL, expired or not.
+
+        Only fresh entries count as hits; callers revalidate expired ones.
+
+        Args:
+            db_session: Session used on in-memory miss
+            url: Crawled URL
+
+        Returns:
+            CachedPage or None
+        """
+        url_hash = crud_crawl_cache.generate_url_hash(url)
+        page = self._entries.get(url_hash)
+        if page is not None:
+            self._entries.move_to_end(url_hash)
+            self.memory_hits += 1
+        else:
+            cached = await run_locked(
+                db_session,
+                lambda: crud_crawl_cache.get_crawl_cache(db_session, url, include_expired=True),
+            )
+            if cached is None:
+                self.misses += 1
+                return None
+            page = CachedPage(
+                url=url,
+                content=cached.cached_content,
+                metadata=dict(cached.cached_metadata or {}),
+                expires_at=cached.expires_at,
+            )
+            self._remember(url_hash, page)
+            self.db_hits += 1
+
+        if not page.is_expired:
+            self._record_hit(url_hash)
+        return page
+
+    async def put(
+        self,
+        db_session: AsyncSession,
+        url: str,
+        content: str,
+        metadata: Dict[str, Any],
+    ) -> CachedPage:
+        """
+        Store a crawl result in both tiers.
+
+        The "html" metadata is moved to the HTML store and replaced by its
+        reference ("html_ref").
+
+        Args:
+            db_session: Session used for the write
+            url: Crawled URL
+            content: Extracted text
+            metadata: Metadata (title, description, html, status code, validators)
+
+        Returns:
+            Cached page
+        """
+        metadata = dict(metadata)
+        html = metadata.pop("html", None)
+        if html:
+            metadata["html_ref"] = await asyncio.to_thread(self.html_store.put, html)
+
+        cached = await run_locked(
+            db_session,
+            lambda: crud_crawl_cache.create_or_update_crawl_cache(
+                db_session=db_session,
+                url=url,
+                cached_content=content,
+                cached_metadata=metadata,
+            ),
+        )
+        page = CachedPage(url=url, content=content, metadata=dict(metadata), expires_at=cached.expires_at)
+        self._remember(crud_crawl_cache.generate_url_hash(url), page)
+        return page
+
+    async def get_html(self, page: CachedPage) -> str:
+        """
+        Load the raw HTML of a cached page.
+
+        Args:
+            page: Cached page
+
+        Returns:
+            Raw HTML ("" if not stored)
+        """
+        if page.metadata.get("html"):
+            # Row written before the HTML store, not migrated yet
+            return page.metadata["html"]
+        ref = page.metadata.get("html_ref")
+        if not ref:
+            return ""
+        try:
+            return await asyncio.to_thread(self.html_store.get, ref) or ""
+        except Exception as e:
+            logger.warning("Failed to load cached HTML", url=page.url, error=str(e))
+            return ""
+
+    async def refresh(
+        self,
+        db_session: AsyncSession,
+        page: CachedPage,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CachedPage:
+        """
+        Extend the TTL of a page confirmed unchanged by the server (304).
+
+        Args:
+            db_session: Session used for the write
+            page: Revalidated page
+            etag: ETag sent with the 304, if any
+            last_modified: Last-Modified sent with the 304, if any
+
+        Returns:
+            Refreshed page
+        """
+        metadata = dict(page.metadata)
+        if etag:
+            metadata["etag"] = etag
+        if last_modified:
+            metadata["last_modified"] = last_modified
+        changed = metadata != page.metadata
+
+        expires_at = await run_locked(
+            db_session,
+            lambda: crud_crawl_cache.refresh_crawl_cache_expiry(
+                db_session,
+                page.url,
+                cached_metadata=metadata if changed else None,
+            ),
+        )
+        refreshed = CachedPage(url=page.url, content=page.content, metadata=metadata, expires_at=expires_at)
+        self._remember(crud_crawl_cache.generate_url_hash(page.url), refreshed)
+        self.revalidated += 1
+        return refreshed
+
+    # Access statistics
+
+    def _record_hit(self, url_hash: str) -> None:
+        count, _ = self._pending_hits.get(url_hash, (0, None))
+        self._pending_hits[url_hash] = (count + 1, datetime.now(timezone.utc))
+        if len(self._pending_hits) >= self.flush_batch_size and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.create_task(self.flush())
+
+    async def flush(self) -> int:
+        """
+        Write pending hit counts and access times in one batch.
+
+        Returns:
+            Number of entries updated
+        """
+        async with self._flush_lock:
+            if not self._pending_hits:
+                return 0
+            pending, self._pending_hits = self._pending_hits, {}
+            factory = self._session_factory
+            if factory is None:
+                from python_scripts.database.db_session import AsyncSessionLocal
+
+                factory = AsyncSessionLocal
+            try:
+                async with factory() as db_session:
+                    updated = await crud_crawl_cache.record_crawl_cache_hits(db_session, pending)
+            except Exception as e:
+                # Statistics only: merge back and retry on the next flush
+                for url_hash, (count, last_accessed) in pending.items():
+                    current, _ = self._pending_hits.get(url_hash, (0, None))
+                    self._pending_hits[url_hash] = (current + count, last_accessed)
+                logger.warning("Failed to flush crawl cache statistics", entries=len(pending), error=str(e))
+                return 0
+            self.flushed_hits += sum(count for count, _ in pending.values())
+            logger.debug("Crawl cache statistics flushed", entries=updated)
+            return updated
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def start(self) -> None:
+        """Start the periodic flush of access statistics."""
+        if self._periodic_task is None or self._periodic_task.done():
+            self._periodic_task = asyncio.create_task(self._flush_periodically())
+
+    async def close(self) -> None:
+        """Stop the periodic flush and write pending statistics."""
+        if self._periodic_task is not None:
+            self._periodic_task.cancel()
+            try:
+                await self._periodic_task
+            except asyncio.CancelledError:
+                pass
+            self._periodic_task = None
+        await self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits per tier, misses, revalidations, memory usage
+            and pending statistics
+        """
+        lookups = self.memory_hits + self.db_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "memory_hit_rate": round(self.memory_hits / lookups, 3) if lookups else 0.0,
+            "revalidated": self.revalidated,
+            "memory_entries": len(self._entries),
+            "memory_bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "pending_hits": len(self._pending_hits),
+            "flushed_hits": self.flushed_hits,
+            "html_store": self._html_store.get_stats() if self._html_store is not None else None,
+        }
+
+
+async def migrate_inline_html(
+    db_session: AsyncSession,
+    html_store: Optional[HtmlBlobStore] = None,
+    batch_size: int = 200,
+    dry_run: bool = False,
+) -> Dict[str, int]:
+    """
+    Move the raw HTML of existing crawl_cache rows to the HTML store.
+
+    Rows are processed by increasing id, one batch (and one commit) at a time,
+    so the migration can be interrupted and resumed.
+
+    Args:
+        db_session: Database session
+        html_store: Target store (default: get_html_store())
+        batch_size: Rows per batch
+        dry_run: Only count rows and bytes, write nothing
+
+    Returns:
+        Statistics (rows, inline_bytes, stored_bytes, deduplicated)
+    """
+    store = html_store or get_html_store()
+    stats = {"rows": 0, "inline_bytes": 0, "stored_bytes": 0, "deduplicated": 0}
+    after_id = 0
+
+    while True:
+        rows = await crud_crawl_cache.get_crawl_cache_with_inline_html(db_session, after_id, batch_size)
+        if not rows:
+            break
+        updates: Dict[int, Dict[str, Any]] = {}
+        for row_id, metadata in rows:
+            after_id = row_id
+            metadata = dict(metadata)
+            html = metadata.pop("html", None) or ""
+            stats["rows"] += 1
+            stats["inline_bytes"] += len(html.encode("utf-8"))
+            if dry_run:
+                continue
+            if html:
+                written, deduplicated = store.stored_bytes, store.deduplicated
+                metadata["html_ref"] = await asyncio.to_thread(store.put, html)
+                stats["stored_bytes"] += store.stored_bytes - written
+                stats["deduplicated"] += store.deduplicated - deduplicated
+            updates[row_id] = metadata
+
+        if updates:
+            await crud_crawl_cache.update_crawl_cache_metadata(db_session, updates)
+        logger.info("Crawl cache HTML batch migrated", rows=stats["rows"], last_id=after_id, dry_run=dry_run)
+
+    return stats
+
+
+crawl_cache = CrawlCacheLayer()
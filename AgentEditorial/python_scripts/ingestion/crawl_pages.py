@@ -4,13 +4,21 @@ import asyncio
 import re
 import warnings
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
 import httpx
 from bs4 import BeautifulSoup
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from python_scripts.ingestion.crawl_cache import CachedPage, crawl_cache
+from python_scripts.ingestion.html_document import ParsedDocument
+from python_scripts.ingestion.rate_control import (
+    CONGESTION_STATUS,
+    host_rate_controller,
+    parse_retry_after,
+)
+from python_scripts.utils.http_client import pooled_client
 from python_scripts.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -18,7 +26,6 @@ logger = get_logger(__name__)
 # Suppress SSL warnings for development
 warnings.filterwarnings("ignore", message=".*certificate.*")
 
-
 async def check_robots_txt(url: str, timeout: float = 5.0) -> bool:
     """
     Check if robots.txt allows crawling the URL.
@@ -34,8 +41,8 @@ async def check_robots_txt(url: str, timeout: float = 5.0) -> bool:
         parsed = urlparse(url)
         robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
         
-        async with httpx.AsyncClient(verify=False, timeout=timeout) as client:
-            response = await client.get(robots_url)
+        async with pooled_client("crawl") as client:
+            response = await client.get(robots_url, timeout=timeout)
             if response.status_code == 404:
                 return True  # No robots.txt means allowed
             
@@ -50,11 +57,31 @@ async def check_robots_txt(url: str, timeout: float = 5.0) -> bool:
         return True  # Allow by default if we can't check
 
 
+def _cached_result(result: Dict[str, Any], page: CachedPage) -> Dict[str, Any]:
+    """Fill a crawl result from a cached page."""
+    result["success"] = True
+    result["text"] = page.content
+    result["cached"] = True
+    result["title"] = page.metadata.get("title", "")
+    result["description"] = page.metadata.get("description", "")
+    result["status_code"] = page.metadata.get("status_code", 200)
+    return result
+
+
+def _parse_fetched_page(html: str, url: str) -> Tuple[ParsedDocument, str, str, str]:
+    """Parse a fetched page once: (document, title, description, text)."""
+    document = ParsedDocument(html, url)
+    return document, document.title, document.description, document.text()
+
+
 async def crawl_page_async(
     url: str,
     timeout: float = 30.0,
     check_cache: bool = True,
     db_session: Optional[AsyncSession] = None,
+    client: Optional[httpx.AsyncClient] = None,
+    include_html: bool = True,
+    keep_document: bool = False,
 ) -> Dict[str, Any]:
     """
     Crawl a single page and extract content with optional caching.
@@ -64,6 +91,11 @@ async def crawl_page_async(
         timeout: Request timeout in seconds
         check_cache: Whether to check cache
         db_session: Database session (optional, for caching)
+        client: HTTP client to use (optional, defaults to the pooled crawl client)
+        include_html: Load the raw HTML of cached pages (stored compressed);
+            False when only the text is used
+        keep_document: Return the parsed page in result["document"]
+            (ParsedDocument) so that extraction does not parse it again
         
     Returns:
         Dictionary with crawl results
@@ -79,80 +111,71 @@ async def crawl_page_async(
         "error": None,
         "crawled_at": datetime.now(timezone.utc).isoformat(),
     }
+    validators: Dict[str, Optional[str]] = {}
     
     # Check cache if enabled and db_session provided
+    cached_page = None
     if check_cache and db_session:
-        from python_scripts.database.crud_crawl_cache import get_crawl_cache
-        
-        cached = await get_crawl_cache(db_session, url)
-        if cached:
+        cached_page = await crawl_cache.get(db_session, url)
+        if cached_page and not cached_page.is_expired:
             logger.debug("Using cached crawl result", url=url)
-            result["success"] = True
-            result["text"] = cached.cached_content
-            result["cached"] = True
-            
-            # Extract metadata if available
-            if cached.cached_metadata:
-                result["title"] = cached.cached_metadata.get("title", "")
-                result["description"] = cached.cached_metadata.get("description", "")
-                result["html"] = cached.cached_metadata.get("html", "")
-                result["status_code"] = cached.cached_metadata.get("status_code", 200)
-            
+            result = _cached_result(result, cached_page)
+            if include_html:
+                result["html"] = await crawl_cache.get_html(cached_page)
+                if keep_document:
+                    result["document"] = await asyncio.to_thread(ParsedDocument, result["html"], url)
             return result
     
+    # Expired entry: conditional request, a 304 only extends the TTL
+    headers = cached_page.revalidation_headers() if cached_page else {}
+    
     try:
-        async with httpx.AsyncClient(
-            verify=False,
-            timeout=timeout,
-            follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
+        if client is None:
+            async with pooled_client("crawl") as own_client:
+                response = await own_client.get(url, timeout=timeout, headers=headers)
+        else:
+            response = await client.get(url, timeout=timeout, headers=headers)
+
+        if response.status_code == 304 and cached_page:
+            cached_page = await crawl_cache.refresh(
+                db_session,
+                cached_page,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+            )
+            logger.debug("Crawl cache revalidated", url=url)
+            result = _cached_result(result, cached_page)
+            result["revalidated"] = True
+            if include_html:
+                result["html"] = await crawl_cache.get_html(cached_page)
+                if keep_document:
+                    result["document"] = await asyncio.to_thread(ParsedDocument, result["html"], url)
+            return result
+
+        result["status_code"] = response.status_code
+        
+        if response.status_code == 200:
+            html = response.text
+            result["html"] = html
+            result["success"] = True
+            validators = {
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
             }
-        ) as client:
-            response = await client.get(url)
-            result["status_code"] = response.status_code
             
-            if response.status_code == 200:
-                html = response.text
-                result["html"] = html
-                result["success"] = True
-                
-                # Extract title
-                import re
-                title_match = re.search(r"<title[^>]*>([^<]+)</title>", html, re.IGNORECASE)
-                if title_match:
-                    result["title"] = title_match.group(1).strip()
-                
-                # Extract meta description
-                desc_match = re.search(
-                    r'<meta[^>]+name=["\']description["\'][^>]+content=["\']([^"\']+)["\']',
-                    html,
-                    re.IGNORECASE
-                )
-                if not desc_match:
-                    desc_match = re.search(
-                        r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+name=["\']description["\']',
-                        html,
-                        re.IGNORECASE
-                    )
-                if desc_match:
-                    result["description"] = desc_match.group(1).strip()
-                
-                # Extract text content (basic)
-                # Remove scripts and styles
-                text = re.sub(r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
-                text = re.sub(r"<style[^>]*>.*?</style>", "", text, flags=re.DOTALL | re.IGNORECASE)
-                # Remove HTML tags
-                text = re.sub(r"<[^>]+>", " ", text)
-                # Clean whitespace
-                text = re.sub(r"\s+", " ", text).strip()
-                result["text"] = text[:10000]  # Limit text length
-                
-            else:
-                result["error"] = f"HTTP {response.status_code}"
-                
+            # Parsed once, off the event loop: title, description and text come from the same tree
+            document, title, description, text = await asyncio.to_thread(_parse_fetched_page, html, url)
+            result["title"] = title
+            result["description"] = description
+            result["text"] = text[:10000]  # Limit text length
+            if keep_document:
+                result["document"] = document
+            
+        else:
+            result["error"] = f"HTTP {response.status_code}"
+            if response.status_code in CONGESTION_STATUS:
+                result["retry_after"] = parse_retry_after(response.headers.get("retry-after"))
+            
     except httpx.TimeoutException:
         result["error"] = "Timeout"
     except httpx.ConnectError as e:
@@ -164,17 +187,16 @@ async def crawl_page_async(
     # Save to cache if successful and db_session provided
     if result["success"] and db_session and check_cache:
         try:
-            from python_scripts.database.crud_crawl_cache import create_or_update_crawl_cache
-            
-            await create_or_update_crawl_cache(
-                db_session=db_session,
-                url=url,
-                cached_content=result["text"],
-                cached_metadata={
+            await crawl_cache.put(
+                db_session,
+                url,
+                result["text"],
+                {
                     "title": result["title"],
                     "description": result["description"],
                     "html": result.get("html", ""),
                     "status_code": result.get("status_code", 200),
+                    **validators,
                 },
             )
         except Exception as e:
@@ -190,6 +212,7 @@ async def crawl_with_permissions(
     use_cache: bool = True,
     respect_robots: bool = True,
     timeout: float = 30.0,
+    include_html: bool = True,
 ) -> Dict[str, Any]:
     """
     Crawl a page with permission checks (robots.txt) using cached permissions.
@@ -200,6 +223,7 @@ async def crawl_with_permissions(
         use_cache: Whether to use cache
         respect_robots: Whether to respect robots.txt
         timeout: Request timeout
+        include_html: Load the raw HTML of cached pages
         
     Returns:
         Dictionary with crawl results
@@ -209,45 +233,27 @@ async def crawl_with_permissions(
         parsed = urlparse(url)
         domain = parsed.netloc
         
-        # Use parse_robots_txt with caching if db_session is provided
-        if db_session:
-            from python_scripts.ingestion.robots_txt import parse_robots_txt
-            
-            parser = await parse_robots_txt(
-                domain=domain,
-                db_session=db_session,
-                use_cache=use_cache,
-            )
-            
-            if parser:
-                # Check if URL is allowed
-                if not parser.is_allowed(url):
-                    return {
-                        "url": url,
-                        "success": False,
-                        "error": "Blocked by robots.txt",
-                        "html": "",
-                        "text": "",
-                        "title": "",
-                        "description": "",
-                        "status_code": None,
-                        "crawled_at": datetime.now(timezone.utc).isoformat(),
-                    }
-        else:
-            # Fallback to simple check if no db_session
-            allowed = await check_robots_txt(url)
-            if not allowed:
-                return {
-                    "url": url,
-                    "success": False,
-                    "error": "Blocked by robots.txt",
-                    "html": "",
-                    "text": "",
-                    "title": "",
-                    "description": "",
-                    "status_code": None,
-                    "crawled_at": datetime.now(timezone.utc).isoformat(),
-                }
+        # Parsed robots.txt are cached per domain (in memory, then scraping_permissions)
+        from python_scripts.ingestion.robots_txt import parse_robots_txt
+        
+        parser = await parse_robots_txt(
+            domain=domain,
+            db_session=db_session,
+            use_cache=use_cache,
+        )
+        
+        if parser and not parser.is_allowed(url):
+            return {
+                "url": url,
+                "success": False,
+                "error": "Blocked by robots.txt",
+                "html": "",
+                "text": "",
+                "title": "",
+                "description": "",
+                "status_code": None,
+                "crawled_at": datetime.now(timezone.utc).isoformat(),
+            }
     
     # Crawl the page (with cache support if db_session provided)
     return await crawl_page_async(
@@ -255,6 +261,7 @@ async def crawl_with_permissions(
         timeout=timeout,
         check_cache=use_cache,
         db_session=db_session,
+        include_html=include_html,
     )
 
 
@@ -265,6 +272,8 @@ async def crawl_multiple_pages(
     respect_robots: bool = True,
     timeout: float = 30.0,
     max_concurrent: int = 5,
+    include_html: bool = True,
+    adaptive: bool = True,
 ) -> List[Dict[str, Any]]:
     """
     Crawl multiple pages concurrently.
@@ -274,8 +283,11 @@ async def crawl_multiple_pages(
         db_session: Database session (optional)
         use_cache: Whether to use cache
         respect_robots: Whether to respect robots.txt
-        timeout: Request timeout per page
-        max_concurrent: Maximum concurrent requests
+        timeout: Maximum request timeout per page
+        max_concurrent: Maximum concurrent requests (all hosts)
+        include_html: Load the raw HTML of cached pages
+        adaptive: Limit each host with host_rate_controller (concurrency and
+            timeout adapted to the host's latency and 429/503 responses)
         
     Returns:
         List of crawl results
@@ -283,14 +295,29 @@ async def crawl_multiple_pages(
     semaphore = asyncio.Semaphore(max_concurrent)
     
     async def crawl_with_semaphore(url: str) -> Dict[str, Any]:
-        async with semaphore:
-            return await crawl_with_permissions(
-                url,
-                db_session=db_session,
-                use_cache=use_cache,
-                respect_robots=respect_robots,
-                timeout=timeout,
-            )
+        if not adaptive:
+            async with semaphore:
+                return await crawl_with_permissions(
+                    url,
+                    db_session=db_session,
+                    use_cache=use_cache,
+                    respect_robots=respect_robots,
+                    timeout=timeout,
+                    include_html=include_html,
+                )
+        # Host slot first: a global slot is not held while the host is busy
+        async with host_rate_controller.slot(url) as ticket:
+            async with semaphore:
+                result = await crawl_with_permissions(
+                    url,
+                    db_session=db_session,
+                    use_cache=use_cache,
+                    respect_robots=respect_robots,
+                    timeout=ticket.timeout(timeout),
+                    include_html=include_html,
+                )
+            ticket.observe_result(result)
+            return result
     
     tasks = [crawl_with_semaphore(url) for url in urls]
     results = await asyncio.gather(*tasks, return_exceptions=True)
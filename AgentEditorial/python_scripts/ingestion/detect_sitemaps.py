@@ -1,18 +1,174 @@
-"""Sitemap detection and parsing utilities."""
-
-import re
-from typing import List, Optional
-from urllib.parse import urljoin, urlparse
+"""Sitemap detection and parsing utilities.
+
+Sitemaps are read as a stream: response bytes are fed to an incremental XML
+parser (gunzipped on the fly for .xml.gz sitemaps) and each <url> element is
+released once read, so a 50k-URL sitemap never sits in memory as a tree.
+Child sitemaps of an index are fetched concurrently, with a bound.
+"""
+
+import asyncio
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Iterable, List, Optional, Set, Tuple, Union
+from urllib.parse import urljoin
 from xml.etree import ElementTree
 
 import httpx
 
 from python_scripts.config.settings import settings
 from python_scripts.utils.exceptions import CrawlingError
+from python_scripts.utils.http_client import pooled_client
 from python_scripts.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+@dataclass(frozen=True)
+class SitemapEntry:
+    """A <url> (or child <sitemap>) record of a sitemap."""
+
+    url: str
+    lastmod: Optional[datetime] = None
+
+
+def parse_lastmod(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a W3C datetime <lastmod> value.
+
+    Args:
+        value: Raw value ("2024-01-01", "2024-01-01T10:00:00Z", ...)
+
+    Returns:
+        Timezone-aware datetime (UTC when no offset is given), or None if invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child_text(elem: ElementTree.Element, name: str) -> Optional[str]:
+    """Text of a sitemap child element, with or without the sitemap namespace."""
+    text = elem.findtext(f"{SITEMAP_NS}{name}")
+    if text is None:
+        text = elem.findtext(name)
+    return text.strip() if text else None
+
+
+class SitemapStreamParser:
+    """
+    Incremental sitemap parser fed with raw response bytes.
+
+    Gzip content is detected from its magic bytes (whatever the URL or the
+    Content-Type says) and decompressed on the fly. feed() and close()
+    return the ("url" | "sitemap", SitemapEntry) records completed so far.
+    """
+
+    def __init__(self, sitemap_url: str) -> None:
+        """
+        Initialize the parser.
+
+        Args:
+            sitemap_url: URL of the sitemap (for error messages)
+        """
+        self.sitemap_url = sitemap_url
+        self.kind: Optional[str] = None  # "urlset" or "sitemapindex"
+        self.is_gzip = False
+        self._parser = ElementTree.XMLPullParser(events=("start", "end"))
+        self._decompressor: Optional[Any] = None
+        self._head = b""
+        self._sniffed = False
+        self._root: Optional[ElementTree.Element] = None
+
+    def feed(self, chunk: bytes) -> List[Tuple[str, SitemapEntry]]:
+        """Feed raw bytes and return the records completed by them."""
+        if not self._sniffed:
+            self._head += chunk
+            if len(self._head) < len(GZIP_MAGIC):
+                return []
+            chunk, self._head = self._head, b""
+            self._sniffed = True
+            if chunk.startswith(GZIP_MAGIC):
+                self.is_gzip = True
+                self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if self._decompressor is not None:
+            try:
+                chunk = self._decompressor.decompress(chunk)
+            except zlib.error as e:
+                raise CrawlingError(f"Invalid gzip sitemap {self.sitemap_url}: {e}") from e
+        return self._parse(chunk)
+
+    def close(self) -> List[Tuple[str, SitemapEntry]]:
+        """Flush the pending bytes and check that the document is complete."""
+        records = []
+        if self._head:
+            self._sniffed = True
+            records.extend(self._parse(self._head))
+            self._head = b""
+        if self._decompressor is not None:
+            records.extend(self._parse(self._decompressor.flush()))
+        try:
+            self._parser.close()
+        except ElementTree.ParseError as e:
+            raise CrawlingError(f"Failed to parse sitemap {self.sitemap_url}: {e}") from e
+        records.extend(self._drain())
+        if self.kind is None:
+            raise CrawlingError(f"Sitemap is empty: {self.sitemap_url}")
+        return records
+
+    def _parse(self, data: bytes) -> List[Tuple[str, SitemapEntry]]:
+        if not data:
+            return []
+        try:
+            self._parser.feed(data)
+        except ElementTree.ParseError as e:
+            raise CrawlingError(f"Failed to parse sitemap {self.sitemap_url}: {e}") from e
+        return self._drain()
+
+    def _drain(self) -> List[Tuple[str, SitemapEntry]]:
+        records = []
+        try:
+            events = list(self._parser.read_events())
+        except ElementTree.ParseError as e:
+            raise CrawlingError(f"Failed to parse sitemap {self.sitemap_url}: {e}") from e
+
+        for event, elem in events:
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+                    self.kind = _local_name(elem.tag)
+                    if self.kind not in ("urlset", "sitemapindex"):
+                        raise CrawlingError(
+                            f"Sitemap content is not a sitemap (<{self.kind}>): {self.sitemap_url}"
+                        )
+                continue
+
+            name = _local_name(elem.tag)
+            if elem.tag not in (f"{SITEMAP_NS}{name}", name) or name not in ("url", "sitemap"):
+                continue
+            loc = _child_text(elem, "loc")
+            if loc:
+                records.append((name, SitemapEntry(url=loc, lastmod=parse_lastmod(_child_text(elem, "lastmod")))))
+            # Release the records already read
+            del self._root[:]
+        return records
+
 
 async def detect_sitemap_urls(domain: str) -> List[str]:
     """
@@ -35,8 +191,8 @@ async def detect_sitemap_urls(domain: str) -> List[str]:
     # Try robots.txt first
     try:
         robots_url = f"{base_url}/robots.txt"
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(robots_url, follow_redirects=True)
+        async with pooled_client("default") as client:
+            response = await client.get(robots_url, timeout=10.0)
             if response.status_code == 200:
                 # Parse Sitemap directives
                 for line in response.text.split("\n"):
@@ -50,30 +206,182 @@ async def detect_sitemap_urls(domain: str) -> List[str]:
 
     # Try common sitemap locations
     common_paths = ["/sitemap.xml", "/sitemap_index.xml", "/sitemaps/sitemap.xml"]
-    for path in common_paths:
-        sitemap_url = urljoin(base_url, path)
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.head(sitemap_url, follow_redirects=True)
+    async with pooled_client("default") as client:
+        for path in common_paths:
+            sitemap_url = urljoin(base_url, path)
+            try:
+                response = await client.head(sitemap_url, timeout=10.0)
                 if response.status_code == 200:
                     if sitemap_url not in sitemap_urls:
                         sitemap_urls.append(sitemap_url)
-        except Exception:
-            continue
+            except Exception:
+                continue
 
     return sitemap_urls
 
 
-async def parse_sitemap(sitemap_url: str) -> List[str]:
+async def stream_sitemap(
+    client: httpx.AsyncClient,
+    sitemap_url: str,
+) -> AsyncIterator[Tuple[str, SitemapEntry]]:
+    """
+    Stream the records of one sitemap (no recursion into child sitemaps).
+
+    Args:
+        client: HTTP client
+        sitemap_url: URL of the sitemap (.xml or .xml.gz)
+
+    Yields:
+        ("url", entry) for a <urlset>, ("sitemap", entry) for a <sitemapindex>
+
+    Raises:
+        CrawlingError: If the sitemap is not accessible or is not a valid sitemap
+    """
+    parser = SitemapStreamParser(sitemap_url)
+    async with client.stream("GET", sitemap_url, timeout=30.0) as response:
+        if response.status_code != 200:
+            raise CrawlingError(f"Sitemap not accessible: {sitemap_url}")
+
+        # Check Content-Type to ensure it's XML, not HTML
+        content_type = response.headers.get("content-type", "").lower()
+        if "html" in content_type and "xml" not in content_type:
+            # If redirected to HTML page, log and skip
+            final_url = str(response.url)
+            logger.warning(
+                "Sitemap redirected to HTML page",
+                original_url=sitemap_url,
+                final_url=final_url,
+                content_type=content_type,
+            )
+            raise CrawlingError(f"Sitemap redirected to HTML page: {final_url}")
+
+        async for chunk in response.aiter_bytes():
+            for record in parser.feed(chunk):
+                yield record
+
+    for record in parser.close():
+        yield record
+
+
+async def iter_sitemap_urls(
+    sitemap_urls: Union[str, Iterable[str]],
+    since: Optional[datetime] = None,
+    max_concurrency: Optional[int] = None,
+    strict: bool = True,
+) -> AsyncIterator[SitemapEntry]:
+    """
+    Stream the URLs of sitemaps, following sitemap indexes.
+
+    Child sitemaps are fetched concurrently (at most max_concurrency at a
+    time) and URLs are yielded as soon as they are parsed, in no particular
+    order across sitemaps. A sitemap is only fetched once per call.
+
+    Incremental mode: with `since`, child sitemaps and URLs whose <lastmod>
+    is older are skipped (entries without <lastmod> are always kept).
+
+    Args:
+        sitemap_urls: Sitemap URL or URLs
+        since: Only keep entries modified after this date (incremental mode)
+        max_concurrency: Concurrent sitemap downloads (default: settings.sitemap_max_concurrency)
+        strict: Raise if a top-level sitemap fails (child failures are always logged and skipped)
+
+    Yields:
+        SitemapEntry for each page URL
+
+    Raises:
+        CrawlingError: If a top-level sitemap cannot be read and strict is True
+    """
+    roots = [sitemap_urls] if isinstance(sitemap_urls, str) else list(sitemap_urls)
+    if since is not None and since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    semaphore = asyncio.Semaphore(max_concurrency or settings.sitemap_max_concurrency)
+    # Bounded: parsing pauses while the consumer is behind
+    queue: asyncio.Queue = asyncio.Queue(maxsize=settings.sitemap_queue_size)
+    finished = object()
+    seen: Set[str] = set()
+    tasks: Set[asyncio.Task] = set()
+    stats = {"sitemaps": 0, "failed": 0, "urls": 0, "skipped_urls": 0, "skipped_sitemaps": 0}
+    pending = 0
+    closing = False
+
+    async with pooled_client("default") as client:
+
+        def schedule(url: str, depth: int) -> None:
+            nonlocal pending
+            if url in seen:
+                return
+            seen.add(url)
+            pending += 1
+            task = asyncio.create_task(fetch(url, depth))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        async def fetch(url: str, depth: int) -> None:
+            nonlocal pending
+            try:
+                async with semaphore:
+                    count = 0
+                    async for kind, entry in stream_sitemap(client, url):
+                        if since is not None and entry.lastmod is not None and entry.lastmod < since:
+                            stats["skipped_sitemaps" if kind == "sitemap" else "skipped_urls"] += 1
+                            continue
+                        if kind == "sitemap":
+                            if depth >= settings.sitemap_max_depth:
+                                logger.warning("Sitemap index too deep, child skipped", sitemap_url=entry.url)
+                                continue
+                            schedule(entry.url, depth + 1)
+                        else:
+                            count += 1
+                            await queue.put(entry)
+                    stats["sitemaps"] += 1
+                    logger.debug("Sitemap parsed", sitemap_url=url, url_count=count)
+            except Exception as e:
+                stats["failed"] += 1
+                if not isinstance(e, CrawlingError):
+                    e = CrawlingError(f"Failed to fetch sitemap {url}: {e}")
+                logger.warning("Failed to parse sitemap", sitemap_url=url, error=str(e))
+                if depth == 0 and strict:
+                    await queue.put(e)
+            finally:
+                pending -= 1
+                if pending == 0 and not closing:
+                    await queue.put(finished)
+
+        for root in roots:
+            schedule(root, 0)
+        if not pending:
+            return
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is finished:
+                    break
+                if isinstance(item, CrawlingError):
+                    raise item
+                stats["urls"] += 1
+                yield item
+        finally:
+            closing = True
+            for task in list(tasks):
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            logger.info("Sitemaps parsed", sitemap_url=roots[0] if len(roots) == 1 else roots, since=since, **stats)
+
+
+async def parse_sitemap(sitemap_url: str, since: Optional[datetime] = None) -> List[str]:
     """
     Parse a sitemap XML and extract URLs.
 
     Supports:
     - Regular sitemaps (<urlset>)
-    - Sitemap indexes (<sitemapindex>)
+    - Sitemap indexes (<sitemapindex>), children fetched concurrently
+    - Gzipped sitemaps (.xml.gz)
 
     Args:
         sitemap_url: URL of the sitemap
+        since: Skip entries whose <lastmod> is older (incremental mode)
 
     Returns:
         List of URLs found in the sitemap
@@ -81,77 +389,16 @@ async def parse_sitemap(sitemap_url: str) -> List[str]:
     Raises:
         CrawlingError: If parsing fails
     """
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(sitemap_url, follow_redirects=True)
-            if response.status_code != 200:
-                raise CrawlingError(f"Sitemap not accessible: {sitemap_url}")
-
-            # Check Content-Type to ensure it's XML, not HTML
-            content_type = response.headers.get("content-type", "").lower()
-            if "html" in content_type and "xml" not in content_type:
-                # If redirected to HTML page, log and skip
-                final_url = str(response.url)
-                logger.warning(
-                    "Sitemap redirected to HTML page",
-                    original_url=sitemap_url,
-                    final_url=final_url,
-                    content_type=content_type,
-                )
-                raise CrawlingError(f"Sitemap redirected to HTML page: {final_url}")
-
-            xml_content = response.text
-            
-            # Additional check: verify it's actually XML (starts with <?xml or <urlset or <sitemapindex)
-            xml_content_stripped = xml_content.strip()
-            if not (xml_content_stripped.startswith("<?xml") or 
-                    xml_content_stripped.startswith("<urlset") or 
-                    xml_content_stripped.startswith("<sitemapindex")):
-                final_url = str(response.url)
-                logger.warning(
-                    "Sitemap content is not XML",
-                    original_url=sitemap_url,
-                    final_url=final_url,
-                    content_preview=xml_content[:200],
-                )
-                raise CrawlingError(f"Sitemap content is not valid XML: {final_url}")
-            
-            root = ElementTree.fromstring(xml_content)
-
-            urls = []
-
-            # Check if it's a sitemap index
-            if root.tag.endswith("sitemapindex"):
-                # Parse sitemap index - recursively fetch nested sitemaps
-                for sitemap_elem in root.findall(".//{http://www.sitemaps.org/schemas/sitemap/0.9}sitemap"):
-                    loc_elem = sitemap_elem.find("{http://www.sitemaps.org/schemas/sitemap/0.9}loc")
-                    if loc_elem is not None and loc_elem.text:
-                        nested_urls = await parse_sitemap(loc_elem.text.strip())
-                        urls.extend(nested_urls)
-            else:
-                # Regular sitemap - extract URLs
-                for url_elem in root.findall(".//{http://www.sitemaps.org/schemas/sitemap/0.9}url"):
-                    loc_elem = url_elem.find("{http://www.sitemaps.org/schemas/sitemap/0.9}loc")
-                    if loc_elem is not None and loc_elem.text:
-                        urls.append(loc_elem.text.strip())
-
-            logger.info("Sitemap parsed", sitemap_url=sitemap_url, url_count=len(urls))
-            return urls
-
-    except ElementTree.ParseError as e:
-        logger.error("Failed to parse sitemap XML", sitemap_url=sitemap_url, error=str(e))
-        raise CrawlingError(f"Failed to parse sitemap {sitemap_url}: {e}") from e
-    except Exception as e:
-        logger.error("Failed to fetch sitemap", sitemap_url=sitemap_url, error=str(e))
-        raise CrawlingError(f"Failed to fetch sitemap {sitemap_url}: {e}") from e
+    return [entry.url async for entry in iter_sitemap_urls(sitemap_url, since=since)]
 
 
-async def get_sitemap_urls(domain: str) -> List[str]:
+async def get_sitemap_urls(domain: str, since: Optional[datetime] = None) -> List[str]:
     """
     Get all URLs from sitemaps for a domain.
 
     Args:
         domain: Domain name (without protocol)
+        since: Skip entries whose <lastmod> is older (incremental mode)
 
     Returns:
         List of all URLs found in sitemaps
@@ -161,24 +408,13 @@ async def get_sitemap_urls(domain: str) -> List[str]:
         logger.warning("No sitemaps found", domain=domain)
         return []
 
-    all_urls = []
-    for sitemap_url in sitemap_urls:
-        try:
-            urls = await parse_sitemap(sitemap_url)
-            all_urls.extend(urls)
-        except CrawlingError as e:
-            logger.warning("Failed to parse sitemap", sitemap_url=sitemap_url, error=str(e))
-            continue
-
     # Remove duplicates while preserving order
     seen = set()
     unique_urls = []
-    for url in all_urls:
-        if url not in seen:
-            seen.add(url)
-            unique_urls.append(url)
+    async for entry in iter_sitemap_urls(sitemap_urls, since=since, strict=False):
+        if entry.url not in seen:
+            seen.add(entry.url)
+            unique_urls.append(entry.url)
 
     logger.info("Sitemap URLs extracted", domain=domain, total_urls=len(unique_urls))
     return unique_urls
-
-
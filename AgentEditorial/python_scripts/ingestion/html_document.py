@@ -0,0 +1,151 @@
+"""HTML page parsed once and shared by the crawl and extraction stages.
+
+The page is parsed a single time with lxml. Page metadata (title, meta
+description/author, Open Graph, article:*, JSON-LD, canonical link) is
+collected in one traversal of that tree, Trafilatura receives the tree
+instead of re-parsing the markup, and the BeautifulSoup view needed by the
+CSS selector fallbacks is only built when one of them actually runs.
+"""
+
+import copy
+import json
+import re
+from typing import Any, Dict, List, Optional, Union
+
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from python_scripts.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Elements whose text is never part of the visible page
+INVISIBLE_TAGS = ("script", "style", "noscript", "template")
+_VISIBLE_TEXT = etree.XPath(
+    "//text()[not(" + " or ".join(f"ancestor::{tag}" for tag in INVISIBLE_TAGS) + ")]"
+)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _parse_html(html: str) -> lxml.html.HtmlElement:
+    """Parse markup into an lxml document (an empty document if unparsable)."""
+    if html and html.strip():
+        try:
+            return lxml.html.document_fromstring(html)
+        except ValueError:
+            # Unicode string with an XML encoding declaration
+            try:
+                return lxml.html.document_fromstring(html.encode("utf-8"))
+            except (ValueError, etree.ParserError):
+                pass
+        except etree.ParserError:
+            pass
+    return lxml.html.document_fromstring("<html><body></body></html>")
+
+
+class ParsedDocument:
+    """
+    HTML page parsed once with lxml.
+
+    `tree` must be treated as read-only: consumers that modify a tree get
+    copy_tree().
+    """
+
+    def __init__(self, html: str, url: Optional[str] = None) -> None:
+        """
+        Parse a page.
+
+        Args:
+            html: Raw HTML
+            url: Page URL
+        """
+        self.html = html or ""
+        self.url = url
+        self.tree = _parse_html(self.html)
+        self._soup: Optional[BeautifulSoup] = None
+        self._metadata: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def ensure(cls, source: Union[str, "ParsedDocument"], url: Optional[str] = None) -> "ParsedDocument":
+        """Return `source` if it is already parsed, otherwise parse it."""
+        if isinstance(source, ParsedDocument):
+            return source
+        return cls(source, url)
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """BeautifulSoup view of the page (built with lxml on first use)."""
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, "lxml")
+        return self._soup
+
+    def copy_tree(self) -> lxml.html.HtmlElement:
+        """Independent copy of the tree, for consumers that modify it."""
+        return copy.deepcopy(self.tree)
+
+    def text(self) -> str:
+        """Visible text of the page, whitespace collapsed."""
+        return _WHITESPACE.sub(" ", " ".join(_VISIBLE_TEXT(self.tree))).strip()
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """
+        Page metadata, collected in one traversal of the tree.
+
+        Returns:
+            Dictionary with title, description, author, canonical, opengraph
+            (og:* and article:* properties) and jsonld (list of decoded blocks)
+        """
+        if self._metadata is None:
+            self._metadata = self._collect_metadata()
+        return self._metadata
+
+    @property
+    def title(self) -> str:
+        """Content of the <title> element."""
+        return self.metadata["title"]
+
+    @property
+    def description(self) -> str:
+        """Content of the description meta tag."""
+        return self.metadata["description"]
+
+    def _collect_metadata(self) -> Dict[str, Any]:
+        metadata: Dict[str, Any] = {
+            "title": "",
+            "description": "",
+            "author": None,
+            "canonical": None,
+            "opengraph": {},
+            "jsonld": [],
+        }
+        opengraph: Dict[str, str] = metadata["opengraph"]
+        jsonld: List[Any] = metadata["jsonld"]
+
+        for element in self.tree.iter("title", "meta", "script", "link"):
+            tag = element.tag
+            if tag == "title":
+                if not metadata["title"]:
+                    metadata["title"] = (element.text_content() or "").strip()
+            elif tag == "meta":
+                prop = element.get("property", "")
+                if prop.startswith(("og:", "article:")):
+                    opengraph[prop] = element.get("content", "")
+                name = (element.get("name") or "").lower()
+                if name == "description" and not metadata["description"]:
+                    metadata["description"] = (element.get("content") or "").strip()
+                elif name == "author" and not metadata["author"]:
+                    metadata["author"] = (element.get("content") or "").strip() or None
+            elif tag == "script":
+                if (element.get("type") or "").strip().lower() != "application/ld+json":
+                    continue
+                try:
+                    jsonld.append(json.loads(element.text or ""))
+                except ValueError:
+                    logger.debug("Invalid JSON-LD block", url=self.url)
+            elif tag == "link":
+                if "canonical" in (element.get("rel") or "").lower().split() and not metadata["canonical"]:
+                    metadata["canonical"] = element.get("href")
+
+        return metadata
@@ -0,0 +1,248 @@
+"""Content-addressed, compressed storage for crawled HTML.
+
+Raw HTML is stored once per distinct page body, keyed by the SHA-256 of the
+markup and compressed with zstd (zlib when the zstandard package is not
+installed). The crawl_cache rows only keep the reference ("<codec>:<hash>")
+in cached_metadata["html_ref"]; URLs serving identical pages share a blob.
+
+Storage goes through a BlobBackend so that the local filesystem backend can
+be replaced (object storage, shared volume).
+"""
+
+import hashlib
+import importlib.util
+import os
+import tempfile
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from python_scripts.config.settings import settings
+from python_scripts.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+ZSTD_AVAILABLE = importlib.util.find_spec("zstandard") is not None
+DEFAULT_CODEC = "zstd" if ZSTD_AVAILABLE else "zlib"
+
+
+class BlobBackend(ABC):
+    """Key/value storage for compressed blobs."""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """Check if a blob exists."""
+        pass
+
+    @abstractmethod
+    def read(self, key: str) -> Optional[bytes]:
+        """Read a blob (None if missing)."""
+        pass
+
+    @abstractmethod
+    def write(self, key: str, data: bytes) -> None:
+        """Write a blob (atomically replacing an existing one)."""
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """Delete a blob, returning whether it existed."""
+        pass
+
+
+class LocalBlobBackend(BlobBackend):
+    """Blobs stored as files under a root directory, sharded by key prefix."""
+
+    def __init__(self, root: str) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            root: Root directory (created if needed)
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key[2:4] / key
+
+    def exists(self, key: str) -> bool:
+        """Check if a blob exists."""
+        return self._path(key).exists()
+
+    def read(self, key: str) -> Optional[bytes]:
+        """Read a blob (None if missing)."""
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def write(self, key: str, data: bytes) -> None:
+        """Write a blob through a temporary file and an atomic rename."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def delete(self, key: str) -> bool:
+        """Delete a blob, returning whether it existed."""
+        try:
+            self._path(key).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+
+def parse_ref(ref: str) -> Tuple[str, str]:
+    """Split a reference into (codec, digest)."""
+    codec, _, digest = ref.partition(":")
+    if not digest or codec not in ("zstd", "zlib"):
+        raise ValueError(f"Invalid HTML reference: {ref}")
+    return codec, digest
+
+
+class HtmlBlobStore:
+    """Deduplicated, compressed HTML store."""
+
+    def __init__(
+        self,
+        backend: Optional[BlobBackend] = None,
+        level: Optional[int] = None,
+        codec: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            backend: Blob backend (default: LocalBlobBackend(settings.html_store_dir))
+            level: Compression level (default: settings.html_store_compression_level)
+            codec: "zstd" or "zlib" (default: zstd when installed)
+        """
+        self.backend = backend or LocalBlobBackend(settings.html_store_dir)
+        self.level = level if level is not None else settings.html_store_compression_level
+        self.codec = codec or DEFAULT_CODEC
+        if self.codec == "zstd" and not ZSTD_AVAILABLE:
+            raise ValueError("zstd codec requires the zstandard package")
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.writes = 0
+        self.deduplicated = 0
+        self.reads = 0
+        self.raw_bytes = 0
+        self.stored_bytes = 0
+
+    def _zstd(self) -> Tuple[Any, Any]:
+        """Per-thread zstd (de)compressors (they are not thread-safe)."""
+        if not hasattr(self._local, "zstd"):
+            import zstandard
+
+            self._local.zstd = (
+                zstandard.ZstdCompressor(level=self.level),
+                zstandard.ZstdDecompressor(),
+            )
+        return self._local.zstd
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.codec == "zstd":
+            return self._zstd()[0].compress(data)
+        return zlib.compress(data, min(max(self.level, 1), 9))
+
+    def _decompress(self, codec: str, data: bytes) -> bytes:
+        if codec == "zstd":
+            return self._zstd()[1].decompress(data)
+        return zlib.decompress(data)
+
+    def put(self, html: str) -> str:
+        """
+        Store an HTML document (no-op if the same document is already stored).
+
+        Args:
+            html: Raw HTML
+
+        Returns:
+            Reference to keep in cached_metadata["html_ref"]
+        """
+        raw = html.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        key = f"{digest}.{self.codec}"
+        if self.backend.exists(key):
+            with self._lock:
+                self.deduplicated += 1
+        else:
+            compressed = self._compress(raw)
+            self.backend.write(key, compressed)
+            with self._lock:
+                self.writes += 1
+                self.raw_bytes += len(raw)
+                self.stored_bytes += len(compressed)
+        return f"{self.codec}:{digest}"
+
+    def get(self, ref: str) -> Optional[str]:
+        """
+        Load an HTML document.
+
+        Args:
+            ref: Reference returned by put()
+
+        Returns:
+            Raw HTML, or None if the blob is missing
+        """
+        codec, digest = parse_ref(ref)
+        data = self.backend.read(f"{digest}.{codec}")
+        if data is None:
+            logger.warning("HTML blob missing", ref=ref)
+            return None
+        with self._lock:
+            self.reads += 1
+        return self._decompress(codec, data).decode("utf-8")
+
+    def delete(self, ref: str) -> bool:
+        """Delete a stored document (callers make sure it is no longer referenced)."""
+        codec, digest = parse_ref(ref)
+        return self.backend.delete(f"{digest}.{codec}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics (since process start).
+
+        Returns:
+            Dictionary with writes, deduplicated writes, reads and compression ratio
+        """
+        with self._lock:
+            return {
+                "codec": self.codec,
+                "writes": self.writes,
+                "deduplicated": self.deduplicated,
+                "reads": self.reads,
+                "raw_bytes": self.raw_bytes,
+                "stored_bytes": self.stored_bytes,
+                "compression_ratio": round(self.raw_bytes / self.stored_bytes, 2) if self.stored_bytes else 0.0,
+            }
+
+
+_store: Optional[HtmlBlobStore] = None
+_store_lock = threading.Lock()
+
+
+def get_html_store() -> HtmlBlobStore:
+    """
+    Get the shared HTML store.
+
+    Returns:
+        HtmlBlobStore instance
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = HtmlBlobStore()
+        return _store
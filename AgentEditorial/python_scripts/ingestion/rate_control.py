@@ -0,0 +1,407 @@
+"""Adaptive per-host rate control for crawling.
+
+Each host gets a concurrency limit driven AIMD-style by what the crawl
+observes: the limit grows by one request per round while the p95 latency
+stays close to the host's baseline, shrinks slightly when latency climbs,
+and is cut multiplicatively on 429/503 responses and timeouts. A Retry-After
+header pauses the host. Timeouts follow the observed latency of the host.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from python_scripts.config.settings import settings
+from python_scripts.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Responses meaning "slow down"
+CONGESTION_STATUS = frozenset({429, 503})
+# Latency samples needed before latency drives the limit or the timeout
+MIN_SAMPLES = 5
+
+
+def rate_host(url_or_domain: str) -> str:
+    """Host a URL or domain is rate-controlled under (lowercase, without "www.")."""
+    host = urlsplit(url_or_domain).hostname if "//" in url_or_domain else url_or_domain
+    host = (host or "").strip().lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Header value (delay in seconds or HTTP date)
+
+    Returns:
+        Delay in seconds, or None if absent or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class HostRateState:
+    """Limit, in-flight requests and recent observations of one host."""
+
+    def __init__(self, host: str, limit: float, max_limit: int, window: int) -> None:
+        self.host = host
+        self.max_limit = max(1, max_limit)
+        self.limit = min(float(self.max_limit), max(1.0, limit))
+        self.in_flight = 0
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.errors_window: Deque[bool] = deque(maxlen=window)
+        self.baseline_p95: Optional[float] = None
+        self.completed_in_round = 0
+        self.saturated = False  # The limit was reached during the current round
+        self.last_decrease = 0.0
+        self.blocked_until = 0.0
+        self.requests = 0
+        self.errors = 0
+        self.backoffs = 0
+        self.condition = asyncio.Condition()
+
+    @property
+    def capacity(self) -> int:
+        """Requests allowed in flight."""
+        return max(1, int(self.limit))
+
+    def percentile(self, q: float, last: Optional[int] = None) -> Optional[float]:
+        """Latency percentile (seconds) of the window, or of its `last` samples."""
+        samples = list(self.latencies)
+        return _percentile(samples[-last:] if last else samples, q)
+
+    @property
+    def error_rate(self) -> float:
+        """Share of errors among recent requests."""
+        if not self.errors_window:
+            return 0.0
+        return sum(self.errors_window) / len(self.errors_window)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Row of the live per-host table."""
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(0.95)
+        return {
+            "host": self.host,
+            "limit": round(self.limit, 2),
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "p50_ms": round(p50 * 1000) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000) if p95 is not None else None,
+            "error_rate": round(self.error_rate, 3),
+            "requests": self.requests,
+            "errors": self.errors,
+            "backoffs": self.backoffs,
+            "blocked_for_s": round(max(0.0, self.blocked_until - time.monotonic()), 1),
+        }
+
+
+class RateTicket:
+    """A request slot of a host; the crawl reports its outcome through it."""
+
+    def __init__(self, controller: "HostRateController", state: HostRateState) -> None:
+        self.controller = controller
+        self.state = state
+        self.started = time.monotonic()
+        self.observed = False
+
+    def timeout(self, default: float) -> float:
+        """Request timeout for the host (see HostRateController.timeout_for)."""
+        return self.controller.timeout_for(self.state.host, default)
+
+    def observe(
+        self,
+        status_code: Optional[int] = None,
+        error: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Report the outcome of the request.
+
+        Args:
+            status_code: HTTP status (None when no response was received)
+            error: Crawl error ("Timeout", "Connection error: ..."), if any
+            retry_after: Retry-After delay in seconds, if the server sent one
+        """
+        if self.observed:
+            return
+        self.observed = True
+        latency = time.monotonic() - self.started
+        state = self.state
+        if status_code in CONGESTION_STATUS or error == "Timeout":
+            self.controller._record_congestion(state, self.started, retry_after)
+        elif (status_code is not None and status_code >= 500) or (
+            status_code is None and error and error.startswith("Connection error")
+        ):
+            self.controller._record_error(state)
+        elif status_code is not None:
+            self.controller._record_success(state, latency)
+
+    def observe_result(self, result: Dict[str, Any]) -> None:
+        """Report a crawl_page_async result (cached results are not observations)."""
+        if result.get("cached"):
+            self.observed = True
+            return
+        self.observe(
+            status_code=result.get("status_code"),
+            error=result.get("error"),
+            retry_after=result.get("retry_after"),
+        )
+
+
+class HostRateController:
+    """
+    Process-level AIMD concurrency controller, one state per host.
+
+    - Additive increase: after a round of `limit` successful requests during
+      which the limit was reached, +1 if the recent p95 latency is within
+      `latency_tolerance` of the host baseline
+    - Latency decrease: x0.8 when the recent p95 exceeds that bound
+    - Multiplicative decrease: x`backoff_factor` on 429/503 or a timeout,
+      once per burst (requests started before the last decrease are ignored)
+    - Retry-After pauses new requests to the host
+    """
+
+    def __init__(
+        self,
+        initial_limit: Optional[int] = None,
+        max_limit: Optional[int] = None,
+        window: Optional[int] = None,
+        latency_tolerance: Optional[float] = None,
+        backoff_factor: Optional[float] = None,
+        max_retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the controller.
+
+        Args:
+            initial_limit: Starting concurrency of an unknown host
+                (default: settings.crawl_rate_initial_limit)
+            max_limit: Default concurrency ceiling per host
+                (default: settings.scraping_max_concurrency)
+            window: Latency/error samples kept per host (default: settings.crawl_rate_window)
+            latency_tolerance: p95 / baseline ratio still considered flat
+                (default: settings.crawl_rate_latency_tolerance)
+            backoff_factor: Limit multiplier on congestion (default: settings.crawl_rate_backoff_factor)
+            max_retry_after: Longest Retry-After pause honored in seconds
+                (default: settings.crawl_rate_max_retry_after)
+        """
+        self.initial_limit = initial_limit if initial_limit is not None else settings.crawl_rate_initial_limit
+        self.max_limit = max_limit if max_limit is not None else settings.scraping_max_concurrency
+        self.window = window if window is not None else settings.crawl_rate_window
+        self.latency_tolerance = (
+            latency_tolerance if latency_tolerance is not None else settings.crawl_rate_latency_tolerance
+        )
+        self.backoff_factor = (
+            backoff_factor if backoff_factor is not None else settings.crawl_rate_backoff_factor
+        )
+        self.max_retry_after = (
+            max_retry_after if max_retry_after is not None else settings.crawl_rate_max_retry_after
+        )
+        self._hosts: Dict[str, HostRateState] = {}
+
+    def state(self, host: str, max_limit: Optional[int] = None) -> HostRateState:
+        """
+        Get (or create) the state of a host.
+
+        Args:
+            host: Host name (see rate_host)
+            max_limit: Concurrency ceiling to apply to the host
+        """
+        state = self._hosts.get(host)
+        if state is None:
+            ceiling = max_limit if max_limit is not None else self.max_limit
+            state = self._hosts[host] = HostRateState(host, self.initial_limit, ceiling, self.window)
+        elif max_limit is not None and max_limit != state.max_limit:
+            state.max_limit = max(1, max_limit)
+            state.limit = min(state.limit, float(state.max_limit))
+        return state
+
+    def seed(self, host: str, saved: Optional[Dict[str, Any]]) -> None:
+        """
+        Start a host from limits learned by a previous run.
+
+        Ignored once the host has live observations in this process.
+
+        Args:
+            host: Host name
+            saved: Dictionary produced by export()
+        """
+        if not isinstance(saved, dict) or not saved.get("concurrency"):
+            return
+        state = self.state(host)
+        if state.requests:
+            return
+        try:
+            state.limit = min(float(state.max_limit), max(1.0, float(saved["concurrency"])))
+            if saved.get("p95_latency_ms"):
+                state.baseline_p95 = float(saved["p95_latency_ms"]) / 1000
+        except (TypeError, ValueError):
+            logger.debug("Invalid saved crawl rate", host=host, saved=saved)
+
+    def export(self, host: str) -> Optional[Dict[str, Any]]:
+        """
+        Learned limits of a host, to persist in site_discovery_profiles.
+
+        Returns:
+            Dictionary with concurrency, p95_latency_ms, error_rate and
+            updated_at, or None if the host was not crawled
+        """
+        state = self._hosts.get(host)
+        if state is None or not state.requests:
+            return None
+        p95 = state.percentile(0.95)
+        return {
+            "concurrency": round(state.limit, 2),
+            "p95_latency_ms": round(p95 * 1000) if p95 is not None else None,
+            "error_rate": round(state.error_rate, 3),
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def timeout_for(self, host: str, default: float) -> float:
+        """
+        Request timeout for a host: a multiple of its p95 latency, bounded by
+        settings.crawl_rate_min_timeout and `default`.
+        """
+        state = self._hosts.get(host)
+        if state is None or len(state.latencies) < MIN_SAMPLES:
+            return default
+        p95 = state.percentile(0.95) or 0.0
+        adaptive = max(settings.crawl_rate_min_timeout, p95 * settings.crawl_rate_timeout_multiplier)
+        return min(default, adaptive)
+
+    @asynccontextmanager
+    async def slot(self, url: str, max_limit: Optional[int] = None) -> AsyncIterator[RateTicket]:
+        """
+        Hold one of the request slots of the URL's host.
+
+        Waits for a Retry-After pause to end and for the host to be under its
+        limit. The caller reports the outcome with ticket.observe(); a timeout
+        raised inside the block counts as congestion.
+
+        Args:
+            url: Requested URL
+            max_limit: Concurrency ceiling of the host
+        """
+        state = self.state(rate_host(url), max_limit)
+        while True:
+            pause = state.blocked_until - time.monotonic()
+            if pause <= 0:
+                break
+            await asyncio.sleep(pause)
+
+        async with state.condition:
+            await state.condition.wait_for(lambda: state.in_flight < state.capacity)
+            state.in_flight += 1
+            if state.in_flight >= state.capacity:
+                state.saturated = True
+
+        ticket = RateTicket(self, state)
+        try:
+            yield ticket
+        except (asyncio.TimeoutError, httpx.TimeoutException):
+            ticket.observe(error="Timeout")
+            raise
+        finally:
+            async with state.condition:
+                state.in_flight -= 1
+                state.condition.notify_all()
+
+    def _record_success(self, state: HostRateState, latency: float) -> None:
+        state.requests += 1
+        state.latencies.append(latency)
+        state.errors_window.append(False)
+        state.completed_in_round += 1
+        if state.completed_in_round < state.capacity or len(state.latencies) < MIN_SAMPLES:
+            return
+
+        recent_p95 = state.percentile(0.95, last=max(MIN_SAMPLES, 2 * state.capacity))
+        if state.baseline_p95 is None:
+            state.baseline_p95 = recent_p95
+        if recent_p95 > state.baseline_p95 * self.latency_tolerance:
+            self._set_limit(state, state.limit * 0.8, "latency", p95=recent_p95)
+        else:
+            if state.saturated and state.limit < state.max_limit:
+                self._set_limit(state, state.limit + 1, "increase", p95=recent_p95)
+            # The baseline follows slow drifts of the host's normal latency
+            state.baseline_p95 = 0.9 * state.baseline_p95 + 0.1 * recent_p95
+        state.completed_in_round = 0
+        state.saturated = state.in_flight >= state.capacity
+
+    def _record_error(self, state: HostRateState) -> None:
+        state.requests += 1
+        state.errors += 1
+        state.errors_window.append(True)
+
+    def _record_congestion(self, state: HostRateState, started: float, retry_after: Optional[float]) -> None:
+        self._record_error(state)
+        now = time.monotonic()
+        if retry_after:
+            state.blocked_until = max(state.blocked_until, now + min(retry_after, self.max_retry_after))
+        # One decrease per burst: requests already in flight at the last
+        # decrease were sent at the old rate
+        if started < state.last_decrease:
+            return
+        state.last_decrease = now
+        state.backoffs += 1
+        self._set_limit(state, state.limit * self.backoff_factor, "backoff", retry_after=retry_after)
+        state.completed_in_round = 0
+        state.saturated = False
+
+    def _set_limit(self, state: HostRateState, limit: float, reason: str, **context: Any) -> None:
+        previous = state.capacity
+        state.limit = min(float(state.max_limit), max(1.0, limit))
+        if state.capacity != previous:
+            logger.debug(
+                "Host concurrency changed",
+                host=state.host,
+                reason=reason,
+                previous=previous,
+                limit=state.capacity,
+                **context,
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Live per-host table.
+
+        Returns:
+            Dictionary with the host rows, busiest hosts first
+        """
+        rows = [state.to_dict() for state in self._hosts.values()]
+        rows.sort(key=lambda row: (-row["in_flight"], row["host"]))
+        return {"hosts": rows, "total_in_flight": sum(row["in_flight"] for row in rows)}
+
+    def clear(self) -> None:
+        """Forget every host."""
+        self._hosts.clear()
+
+
+host_rate_controller = HostRateController()
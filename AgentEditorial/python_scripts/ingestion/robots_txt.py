@@ -1,24 +1,128 @@
 """Robots.txt parser and caching (T101 - US5)."""
 
+import asyncio
 import re
+import time
 import warnings
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
-import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Suppress SSL warnings for development
 warnings.filterwarnings("ignore", message="Unverified HTTPS request")
 
 from python_scripts.config.settings import settings
+from python_scripts.ingestion.crawl_cache import run_locked
 from python_scripts.utils.exceptions import CrawlingError
+from python_scripts.utils.http_client import pooled_client
 from python_scripts.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+# Key of the rules stored on a trie node (children are keyed by character)
+_RULES = None
+
+
+class RobotsRule:
+    """One Allow/Disallow rule, compiled once."""
+
+    __slots__ = ("pattern", "allow", "length", "regex")
+
+    def __init__(self, pattern: str, allow: bool) -> None:
+        """
+        Compile a rule.
+
+        Args:
+            pattern: Path pattern ("*" matches any sequence, a final "$" anchors the end)
+            allow: True for Allow, False for Disallow
+        """
+        self.pattern = pattern
+        self.allow = allow
+        self.length = len(pattern)
+        anchored = pattern.endswith("$")
+        body = pattern[:-1] if anchored else pattern
+        if "*" in body or anchored:
+            regex = ".*".join(re.escape(part) for part in body.split("*"))
+            self.regex: Optional[re.Pattern] = re.compile(regex + ("\\Z" if anchored else ""), re.DOTALL)
+        else:
+            # Plain prefix: reaching its trie node is a match
+            self.regex = None
+
+    @property
+    def literal_prefix(self) -> str:
+        """Part of the pattern before the first wildcard."""
+        return self.pattern.rstrip("$").split("*", 1)[0]
+
+
+class RobotsRuleMatcher:
+    """
+    Longest-match Allow/Disallow matcher for one user agent.
+
+    Rules are stored in a character trie keyed by their literal prefix
+    (the part before the first "*"). Matching a path walks the trie once
+    along the path: only rules whose prefix starts the path are candidates,
+    and only candidates with wildcards or "$" run their compiled regex.
+    The longest matching pattern wins; on a tie, Allow wins.
+    """
+
+    def __init__(self, allowed: List[str], disallowed: List[str]) -> None:
+        """
+        Build the trie.
+
+        Args:
+            allowed: Allow patterns
+            disallowed: Disallow patterns
+        """
+        self._root: dict = {}
+        self.rule_count = 0
+        for pattern in disallowed:
+            self._add(RobotsRule(pattern, allow=False))
+        for pattern in allowed:
+            self._add(RobotsRule(pattern, allow=True))
+
+    def _add(self, rule: RobotsRule) -> None:
+        node = self._root
+        for char in rule.literal_prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(_RULES, []).append(rule)
+        self.rule_count += 1
+
+    def is_allowed(self, path: str) -> bool:
+        """
+        Check a path (with its query string).
+
+        Args:
+            path: URL path, starting with "/"
+
+        Returns:
+            False if the longest matching rule is a Disallow
+        """
+        best_length = -1
+        allowed = True
+        node = self._root
+        index = 0
+        path_length = len(path)
+        while True:
+            rules = node.get(_RULES)
+            if rules:
+                for rule in rules:
+                    if rule.length < best_length or (rule.length == best_length and (allowed or not rule.allow)):
+                        continue
+                    if rule.regex is None or rule.regex.match(path):
+                        best_length = rule.length
+                        allowed = rule.allow
+            if index == path_length:
+                break
+            node = node.get(path[index])
+            if node is None:
+                break
+            index += 1
+        return allowed
+
+
 class RobotsTxtParser:
     """Parser for robots.txt files."""
 
@@ -28,16 +132,19 @@ class RobotsTxtParser:
         self.base_url = base_url
         self.user_agents: dict[str, dict] = {}
         self.default_rules: dict = {}
+        self._matchers: Dict[str, RobotsRuleMatcher] = {}
         self._parse()
 
     def _parse(self) -> None:
-        """Parse robots.txt content."""
-        current_ua = None
+        """Parse robots.txt content and compile the rules of each user agent."""
+        # Consecutive User-agent lines share the rules that follow them
+        current_group: List[str] = []
+        group_has_rules = False
         lines = self.content.split("\n")
 
         for line in lines:
-            line = line.strip()
-            if not line or line.startswith("#"):
+            line = line.split("#", 1)[0].strip()
+            if not line:
                 continue
 
             if ":" not in line:
@@ -48,58 +155,48 @@ class RobotsTxtParser:
             value = value.strip()
 
             if key == "user-agent":
-                current_ua = value
-                if current_ua not in self.user_agents:
-                    self.user_agents[current_ua] = {
+                if group_has_rules:
+                    current_group = []
+                    group_has_rules = False
+                current_group.append(value)
+                if value not in self.user_agents:
+                    self.user_agents[value] = {
                         "disallowed": [],
                         "allowed": [],
                         "crawl-delay": None,
                     }
-            elif key == "disallow" and current_ua:
-                if value:
-                    self.user_agents[current_ua]["disallowed"].append(value)
-            elif key == "allow" and current_ua:
-                if value:
-                    self.user_agents[current_ua]["allowed"].append(value)
-            elif key == "crawl-delay" and current_ua:
-                try:
-                    self.user_agents[current_ua]["crawl-delay"] = int(float(value))
-                except ValueError:
-                    pass
+            elif key in ("disallow", "allow", "crawl-delay") and current_group:
+                group_has_rules = True
+                for user_agent in current_group:
+                    rules = self.user_agents[user_agent]
+                    if key == "disallow" and value:
+                        rules["disallowed"].append(value)
+                    elif key == "allow" and value:
+                        rules["allowed"].append(value)
+                    elif key == "crawl-delay":
+                        try:
+                            rules["crawl-delay"] = int(float(value))
+                        except ValueError:
+                            pass
 
         # Extract default rules (for * user-agent)
         if "*" in self.user_agents:
             self.default_rules = self.user_agents["*"]
 
+        for user_agent, rules in self.user_agents.items():
+            self._matchers[user_agent.lower()] = RobotsRuleMatcher(rules["allowed"], rules["disallowed"])
+
     def is_allowed(self, url: str, user_agent: str = "*") -> bool:
         """Check if URL is allowed for user agent."""
-        rules = self.user_agents.get(user_agent, self.default_rules)
-        if not rules:
+        matcher = self._matchers.get(user_agent.lower()) or self._matchers.get("*")
+        if matcher is None or matcher.rule_count == 0:
             return True
 
         parsed_url = urlparse(url)
-        path = parsed_url.path
-
-        # Check disallowed paths
-        for disallowed in rules.get("disallowed", []):
-            if self._path_matches(path, disallowed):
-                # Check if there's an allow rule that overrides
-                allowed = False
-                for allowed_path in rules.get("allowed", []):
-                    if self._path_matches(path, allowed_path):
-                        allowed = True
-                        break
-                if not allowed:
-                    return False
-
-        return True
-
-    def _path_matches(self, path: str, pattern: str) -> bool:
-        """Check if path matches pattern."""
-        # Convert pattern to regex
-        pattern = pattern.replace("*", ".*")
-        pattern = pattern.replace("$", "\\$")
-        return bool(re.match(pattern, path))
+        path = parsed_url.path or "/"
+        if parsed_url.query:
+            path = f"{path}?{parsed_url.query}"
+        return matcher.is_allowed(path)
 
     def get_crawl_delay(self, user_agent: str = "*") -> Optional[int]:
         """Get crawl delay for user agent."""
@@ -112,16 +209,76 @@ class RobotsTxtParser:
         return rules.get("disallowed", []) if rules else []
 
 
+class RobotsCache:
+    """
+    Process-level TTL cache of parsed robots.txt, keyed by domain.
+
+    Missing robots.txt files are cached too (as None: everything allowed).
+    Concurrent lookups of an uncached domain wait for a single fetch.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, max_entries: int = 10000) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry is kept (default: settings.robots_cache_ttl)
+            max_entries: Maximum number of domains (oldest entries are dropped)
+        """
+        self.ttl = ttl if ttl is not None else settings.robots_cache_ttl
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[float, Optional[RobotsTxtParser]]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, domain: str) -> Tuple[bool, Optional[RobotsTxtParser]]:
+        """
+        Look up a domain.
+
+        Returns:
+            (found, parser); parser is None for a domain without robots.txt
+        """
+        entry = self._entries.get(domain)
+        if entry is None or entry[0] < time.monotonic():
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, entry[1]
+
+    def set(self, domain: str, parser: Optional[RobotsTxtParser]) -> None:
+        """Store the parser of a domain."""
+        if domain not in self._entries and len(self._entries) >= self.max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[domain] = (time.monotonic() + self.ttl, parser)
+
+    def lock(self, domain: str) -> asyncio.Lock:
+        """Get the lock serializing the fetch of a domain."""
+        lock = self._locks.get(domain)
+        if lock is None:
+            lock = self._locks[domain] = asyncio.Lock()
+        return lock
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+        self._locks.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache counters."""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+robots_cache = RobotsCache()
+
+
 async def fetch_robots_txt(domain: str) -> Optional[str]:
     """Fetch robots.txt for a domain."""
     try:
         url = f"https://{domain}/robots.txt"
-        # Disable SSL verification for development (can be configured via settings)
-        async with httpx.AsyncClient(
-            timeout=10.0,
-            verify=False,  # Disable SSL verification for development
-        ) as client:
-            response = await client.get(url, follow_redirects=True)
+        # Crawl profile: SSL verification disabled for development
+        async with pooled_client("crawl") as client:
+            response = await client.get(url, timeout=10.0)
             if response.status_code == 200:
                 return response.text
             return None
@@ -138,6 +295,9 @@ async def parse_robots_txt(
     """
     Fetch and parse robots.txt for a domain with caching (T101 - US5).
     
+    Parsed files are kept in the process-level robots_cache; the
+    scraping_permissions table is only read on a miss.
+    
     Args:
         domain: Domain name
         db_session: Database session for caching (optional)
@@ -146,11 +306,34 @@ async def parse_robots_txt(
     Returns:
         RobotsTxtParser instance or None
     """
+    if use_cache:
+        found, parser = robots_cache.get(domain)
+        if found:
+            return parser
+
+    async with robots_cache.lock(domain):
+        # Another task may have loaded the domain while we were waiting
+        if use_cache:
+            found, parser = robots_cache.get(domain)
+            if found:
+                return parser
+
+        parser = await _load_robots_txt(domain, db_session, use_cache)
+        robots_cache.set(domain, parser)
+        return parser
+
+
+async def _load_robots_txt(
+    domain: str,
+    db_session: Optional[AsyncSession],
+    use_cache: bool,
+) -> Optional[RobotsTxtParser]:
+    """Load robots.txt from scraping_permissions or the site, and store it."""
     # Check cache if enabled and db_session provided
     if use_cache and db_session:
         from python_scripts.database.crud_permissions import get_scraping_permission
         
-        cached = await get_scraping_permission(db_session, domain)
+        cached = await run_locked(db_session, lambda: get_scraping_permission(db_session, domain))
         if cached:
             logger.debug("Using cached robots.txt", domain=domain)
             # Reconstruct parser from cached data
@@ -178,15 +361,17 @@ async def parse_robots_txt(
         test_paths = ["/", "/blog/", "/articles/"]
         scraping_allowed = any(parser.is_allowed(f"https://{domain}{path}") for path in test_paths)
         
-        await create_or_update_scraping_permission(
+        await run_locked(
             db_session,
-            domain=domain,
-            scraping_allowed=scraping_allowed,
-            disallowed_paths=disallowed_paths,
-            crawl_delay=crawl_delay,
-            robots_txt_content=content,
+            lambda: create_or_update_scraping_permission(
+                db_session,
+                domain=domain,
+                scraping_allowed=scraping_allowed,
+                disallowed_paths=disallowed_paths,
+                crawl_delay=crawl_delay,
+                robots_txt_content=content,
+            ),
         )
         logger.info("Robots.txt cached", domain=domain)
     
     return parser
-
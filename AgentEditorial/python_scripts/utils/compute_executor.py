@@ -0,0 +1,363 @@
+"""Process pool for CPU-bound work (clustering, NumPy) off the API event loop.
+
+Tasks are module-level callables submitted with `await compute_executor.run(...)`.
+Large NumPy arrays passed as arguments (the embedding matrix) are copied
+once into shared memory and attached by the worker instead of being
+pickled through the pool pipe.
+
+Workers are started with the "spawn" method (safe with the threads of the
+API process) and pre-warmed: heavy modules are imported when the pool
+starts, not on the first request. When the pool is disabled or broken,
+tasks run in a thread so the event loop is never blocked.
+"""
+
+import asyncio
+import importlib
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from python_scripts.config.settings import settings
+from python_scripts.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Modules imported by every worker when the pool starts
+WARMUP_MODULES = (
+    "numpy",
+    "sklearn.metrics.pairwise",
+    "umap",
+    "hdbscan",
+    "bertopic",
+    "python_scripts.agents.trend_pipeline.compute_tasks",
+)
+
+
+@dataclass(frozen=True)
+class SharedArrayRef:
+    """Reference to a NumPy array stored in shared memory."""
+
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+# ----------------------------------------------------------------------
+# Worker side
+# ----------------------------------------------------------------------
+
+# Segments whose buffers were still referenced when the task returned
+_deferred_segments: List[shared_memory.SharedMemory] = []
+
+
+def _init_worker(modules: Sequence[str]) -> None:
+    """Worker initializer: configure logging and import heavy modules."""
+    from python_scripts.utils.logging import setup_logging
+
+    setup_logging()
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            continue
+
+
+def _ping() -> bool:
+    """No-op task used to start every worker."""
+    return True
+
+
+def _attach(ref: SharedArrayRef, segments: List[shared_memory.SharedMemory]) -> np.ndarray:
+    """Attach a shared array (read-only view) in the worker."""
+    # Spawned workers share the parent's resource tracker: the parent unlinks the segment
+    segment = shared_memory.SharedMemory(name=ref.name)
+    segments.append(segment)
+    array = np.ndarray(ref.shape, dtype=np.dtype(ref.dtype), buffer=segment.buf)
+    array.flags.writeable = False
+    return array
+
+
+def _close_segments(segments: List[shared_memory.SharedMemory]) -> None:
+    """Close segments, deferring those still referenced by live arrays."""
+    for segment in segments:
+        try:
+            segment.close()
+        except BufferError:
+            _deferred_segments.append(segment)
+
+
+def _run_in_worker(
+    func: Callable[..., Any],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> Tuple[Any, float]:
+    """Resolve shared arrays, run the task and return (result, run time in seconds)."""
+    pending = list(_deferred_segments)
+    _deferred_segments.clear()
+    _close_segments(pending)
+
+    segments: List[shared_memory.SharedMemory] = []
+    resolved_args = tuple(_attach(a, segments) if isinstance(a, SharedArrayRef) else a for a in args)
+    resolved_kwargs = {
+        k: _attach(v, segments) if isinstance(v, SharedArrayRef) else v for k, v in kwargs.items()
+    }
+
+    started = time.perf_counter()
+    try:
+        result = func(*resolved_args, **resolved_kwargs)
+    finally:
+        del resolved_args, resolved_kwargs
+        _close_segments(segments)
+    return result, time.perf_counter() - started
+
+
+# ----------------------------------------------------------------------
+# Parent side
+# ----------------------------------------------------------------------
+
+
+class ComputeExecutorMetrics:
+    """Queue depth and wall-time metrics of the compute executor."""
+
+    def __init__(self) -> None:
+        """Initialize counters."""
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.max_queue_depth = 0
+        self.fallback_runs = 0
+        self.shared_bytes = 0
+        self.tasks: Dict[str, Dict[str, float]] = {}
+
+    def record(self, task: str, wall_seconds: float, run_seconds: float) -> None:
+        """Record the timings of a completed task."""
+        stats = self.tasks.setdefault(
+            task,
+            {"count": 0, "wall_seconds_total": 0.0, "run_seconds_total": 0.0, "wall_seconds_max": 0.0},
+        )
+        stats["count"] += 1
+        stats["wall_seconds_total"] += wall_seconds
+        stats["run_seconds_total"] += run_seconds
+        stats["wall_seconds_max"] = max(stats["wall_seconds_max"], wall_seconds)
+
+    def to_dict(self, workers: int) -> Dict[str, Any]:
+        """Export metrics as a dictionary."""
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "in_flight": self.in_flight,
+            "queue_depth": max(0, self.in_flight - workers),
+            "max_queue_depth": self.max_queue_depth,
+            "fallback_runs": self.fallback_runs,
+            "shared_bytes": self.shared_bytes,
+            "tasks": {
+                name: {
+                    "count": int(stats["count"]),
+                    "avg_wall_seconds": round(stats["wall_seconds_total"] / stats["count"], 3),
+                    "avg_queue_wait_seconds": round(
+                        (stats["wall_seconds_total"] - stats["run_seconds_total"]) / stats["count"], 3
+                    ),
+                    "max_wall_seconds": round(stats["wall_seconds_max"], 3),
+                }
+                for name, stats in self.tasks.items()
+            },
+        }
+
+
+class ComputeExecutor:
+    """Lifecycle-managed process pool for CPU-bound tasks."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        enabled: Optional[bool] = None,
+        shared_memory_min_bytes: Optional[int] = None,
+        warmup_modules: Sequence[str] = WARMUP_MODULES,
+    ) -> None:
+        """
+        Initialize the executor (the pool is created by start() or on first use).
+
+        Args:
+            max_workers: Worker processes (default: settings.compute_workers)
+            enabled: Use a process pool (default: settings.compute_executor_enabled);
+                when False, tasks run in a thread
+            shared_memory_min_bytes: Arrays at least this large go through shared
+                memory (default: settings.compute_shared_memory_min_bytes)
+            warmup_modules: Modules imported by each worker at startup
+        """
+        self.max_workers = max(1, max_workers or settings.compute_workers)
+        self.enabled = settings.compute_executor_enabled if enabled is None else enabled
+        self.shared_memory_min_bytes = (
+            shared_memory_min_bytes
+            if shared_memory_min_bytes is not None
+            else settings.compute_shared_memory_min_bytes
+        )
+        self.warmup_modules = tuple(warmup_modules)
+        self.metrics = ComputeExecutorMetrics()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._start_lock = asyncio.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the process pool is started."""
+        return self._pool is not None
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.warmup_modules,),
+        )
+
+    async def start(self) -> None:
+        """Start and pre-warm the worker processes (called from the API startup hook)."""
+        async with self._start_lock:
+            if not self.enabled or self._pool is not None:
+                return
+
+            self._pool = self._create_pool()
+            loop = asyncio.get_running_loop()
+            started = time.perf_counter()
+            try:
+                await asyncio.gather(
+                    *(loop.run_in_executor(self._pool, _ping) for _ in range(self.max_workers))
+                )
+                logger.info(
+                    "Compute executor started",
+                    workers=self.max_workers,
+                    warmup_seconds=round(time.perf_counter() - started, 2),
+                )
+            except Exception as e:
+                logger.warning("Compute executor warmup failed", error=str(e))
+
+    async def shutdown(self) -> None:
+        """Stop the worker processes (called from the API shutdown hook)."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+            logger.info("Compute executor stopped")
+
+    def _share(
+        self,
+        value: Any,
+        segments: List[shared_memory.SharedMemory],
+    ) -> Any:
+        """Move a large NumPy array into shared memory, return other values as is."""
+        if not isinstance(value, np.ndarray) or value.nbytes < self.shared_memory_min_bytes:
+            return value
+        if value.dtype == object or value.nbytes == 0:
+            return value
+
+        segment = shared_memory.SharedMemory(create=True, size=value.nbytes)
+        segments.append(segment)
+        np.ndarray(value.shape, dtype=value.dtype, buffer=segment.buf)[...] = value
+        self.metrics.shared_bytes += value.nbytes
+        return SharedArrayRef(name=segment.name, shape=value.shape, dtype=value.dtype.str)
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a CPU-bound task without blocking the event loop.
+
+        Args:
+            func: Module-level (picklable) callable
+            *args: Positional arguments (large NumPy arrays are shared)
+            **kwargs: Keyword arguments (large NumPy arrays are shared)
+
+        Returns:
+            Task result
+        """
+        task_name = getattr(func, "__qualname__", repr(func))
+        self.metrics.submitted += 1
+        self.metrics.in_flight += 1
+        self.metrics.max_queue_depth = max(
+            self.metrics.max_queue_depth, self.metrics.in_flight - self.max_workers
+        )
+        started = time.perf_counter()
+
+        try:
+            if self.enabled:
+                if self._pool is None:
+                    await self.start()
+                try:
+                    result, run_seconds = await self._run_in_pool(func, args, kwargs)
+                except BrokenProcessPool as e:
+                    logger.warning("Compute pool broken, running task in a thread", task=task_name, error=str(e))
+                    pool, self._pool = self._pool, None
+                    if pool is not None:
+                        pool.shutdown(wait=False, cancel_futures=True)
+                    result, run_seconds = await self._run_in_thread(func, args, kwargs)
+            else:
+                result, run_seconds = await self._run_in_thread(func, args, kwargs)
+        except Exception:
+            self.metrics.failed += 1
+            raise
+        finally:
+            self.metrics.in_flight -= 1
+
+        wall_seconds = time.perf_counter() - started
+        self.metrics.completed += 1
+        self.metrics.record(task_name, wall_seconds, run_seconds)
+        logger.debug(
+            "Compute task completed",
+            task=task_name,
+            wall_seconds=round(wall_seconds, 3),
+            run_seconds=round(run_seconds, 3),
+        )
+        return result
+
+    async def _run_in_pool(
+        self,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Any, float]:
+        segments: List[shared_memory.SharedMemory] = []
+        try:
+            shared_args = tuple(self._share(a, segments) for a in args)
+            shared_kwargs = {k: self._share(v, segments) for k, v in kwargs.items()}
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._pool, _run_in_worker, func, shared_args, shared_kwargs
+            )
+        finally:
+            for segment in segments:
+                segment.close()
+                segment.unlink()
+
+    async def _run_in_thread(
+        self,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Any, float]:
+        self.metrics.fallback_runs += 1
+        started = time.perf_counter()
+        result = await asyncio.to_thread(func, *args, **kwargs)
+        return result, time.perf_counter() - started
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get executor metrics.
+
+        Returns:
+            Dictionary with pool state, queue depth and per-task wall times
+        """
+        return {
+            "enabled": self.enabled,
+            "running": self.is_running,
+            "workers": self.max_workers,
+            **self.metrics.to_dict(self.max_workers),
+        }
+
+
+# Global instance
+compute_executor = ComputeExecutor()
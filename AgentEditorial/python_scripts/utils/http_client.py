@@ -0,0 +1,382 @@
+"""Process-wide pooled HTTP clients for crawling and discovery.
+
+All crawlers share one httpx.AsyncClient per profile so that TCP/TLS
+connections are kept alive and reused (HTTP/2 when available) instead of
+opening a new client, and a new handshake, for every fetch.
+
+The registry is started and closed by the FastAPI startup/shutdown hooks.
+Outside the API process (scripts, tests), pooled_client() falls back to a
+short-lived client with the same configuration.
+"""
+
+import asyncio
+import importlib.util
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Set, Tuple
+
+import httpx
+
+from python_scripts.config.settings import settings
+from python_scripts.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Browser-like headers used for page crawling
+BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+# Client profiles: keyword arguments passed to httpx.AsyncClient
+CLIENT_PROFILES: Dict[str, Dict[str, Any]] = {
+    # Page crawling, discovery APIs, RSS, robots.txt
+    "crawl": {
+        "verify": False,
+        "follow_redirects": True,
+        "headers": BROWSER_HEADERS,
+    },
+    # Generic fetches (sitemaps) with certificate verification
+    "default": {
+        "verify": True,
+        "follow_redirects": True,
+    },
+}
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class HttpClientMetrics:
+    """Connection reuse and handshake metrics for one client profile."""
+
+    def __init__(self) -> None:
+        """Initialize counters."""
+        self.requests = 0
+        self.errors = 0
+        self.new_connections = 0
+        self.tls_handshakes = 0
+        self.handshake_seconds_total = 0.0
+        self.waiting_for_host_slot = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Share of requests served on an already open connection."""
+        if self.requests == 0:
+            return 0.0
+        return max(0.0, 1.0 - self.new_connections / self.requests)
+
+    @property
+    def avg_handshake_ms(self) -> float:
+        """Average TCP + TLS handshake time in milliseconds."""
+        if self.new_connections == 0:
+            return 0.0
+        return self.handshake_seconds_total / self.new_connections * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export metrics as a dictionary."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "new_connections": self.new_connections,
+            "tls_handshakes": self.tls_handshakes,
+            "reuse_ratio": round(self.reuse_ratio, 3),
+            "avg_handshake_ms": round(self.avg_handshake_ms, 1),
+            "waiting_for_host_slot": self.waiting_for_host_slot,
+        }
+
+
+class _HostSlotStream(httpx.AsyncByteStream):
+    """Response stream that releases the per-host slot once closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class PooledTransport(httpx.AsyncBaseTransport):
+    """
+    Transport enforcing a per-host connection limit and collecting metrics.
+
+    Wraps httpx.AsyncHTTPTransport: the global pool limits are handled by
+    httpcore, the per-host limit by one semaphore per host. Handshake times
+    and new connections are measured through the httpcore trace extension.
+    """
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_connections_per_host: int,
+        keepalive_expiry: float,
+        http2: bool,
+        verify: bool = True,
+    ) -> None:
+        self._transport = httpx.AsyncHTTPTransport(
+            verify=verify,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+        self.max_connections_per_host = max(1, max_connections_per_host)
+        self.metrics = HttpClientMetrics()
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    def _get_host_slot(self, host: str) -> asyncio.Semaphore:
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_slots[host] = slot
+        return slot
+
+    def _make_trace(self) -> Callable[[str, Dict[str, Any]], Any]:
+        """Build a trace callback measuring connection setup of one request."""
+        started: Dict[str, float] = {}
+        metrics = self.metrics
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.started":
+                started["connect"] = time.perf_counter()
+                metrics.new_connections += 1
+            elif event_name == "connection.start_tls.started":
+                started["tls"] = time.perf_counter()
+            elif event_name == "connection.connect_tcp.complete" and "connect" in started:
+                metrics.handshake_seconds_total += time.perf_counter() - started.pop("connect")
+            elif event_name == "connection.start_tls.complete" and "tls" in started:
+                metrics.handshake_seconds_total += time.perf_counter() - started.pop("tls")
+                metrics.tls_handshakes += 1
+
+        return trace
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        slot = self._get_host_slot(host)
+        if slot.locked():
+            self.metrics.waiting_for_host_slot += 1
+        await slot.acquire()
+
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                slot.release()
+
+        request.extensions["trace"] = self._make_trace()
+        self.metrics.requests += 1
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self.metrics.errors += 1
+            release()
+            raise
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_HostSlotStream(response.stream, release),
+            extensions=response.extensions,
+        )
+
+    def get_pool_state(self) -> Dict[str, int]:
+        """Return the number of open and idle connections in the pool."""
+        pool = getattr(self._transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []) or [])
+        idle = 0
+        for connection in connections:
+            try:
+                if connection.is_idle():
+                    idle += 1
+            except Exception:
+                continue
+        return {
+            "open_connections": len(connections),
+            "idle_connections": idle,
+            "active_hosts": sum(1 for s in self._host_slots.values() if s.locked()),
+        }
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class HttpClientRegistry:
+    """Lifecycle-managed registry of shared HTTP clients (one per profile)."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._transports: Dict[str, PooledTransport] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._started = False
+        # Closing tasks of clients left by a previous event loop
+        self._closing: Set["asyncio.Future[None]"] = set()
+
+    @property
+    def is_started(self) -> bool:
+        """Whether shared clients are enabled in this process."""
+        return self._started
+
+    def build_client(self, profile: str = "crawl") -> httpx.AsyncClient:
+        """
+        Build a new client for a profile (not registered in the registry).
+
+        Args:
+            profile: Profile name (see CLIENT_PROFILES)
+
+        Returns:
+            Configured httpx.AsyncClient, owned by the caller
+        """
+        client, _ = self._build(profile)
+        return client
+
+    def _build(self, profile: str) -> Tuple[httpx.AsyncClient, PooledTransport]:
+        """Build a client and its instrumented transport."""
+        options = dict(CLIENT_PROFILES.get(profile, CLIENT_PROFILES["default"]))
+        verify = options.pop("verify", True)
+        transport = PooledTransport(
+            max_connections=settings.http_max_connections,
+            max_connections_per_host=settings.http_max_connections_per_host,
+            keepalive_expiry=settings.http_keepalive_expiry,
+            http2=settings.http2_enabled and HTTP2_AVAILABLE,
+            verify=verify,
+        )
+        client = httpx.AsyncClient(
+            transport=transport,
+            timeout=settings.http_default_timeout,
+            **options,
+        )
+        return client, transport
+
+    async def start(self) -> None:
+        """Enable shared clients (called from the API startup hook)."""
+        self._started = True
+        self._loop = asyncio.get_running_loop()
+        logger.info(
+            "HTTP client registry started",
+            http2=settings.http2_enabled and HTTP2_AVAILABLE,
+            max_connections=settings.http_max_connections,
+            max_connections_per_host=settings.http_max_connections_per_host,
+        )
+
+    async def close(self) -> None:
+        """Close every shared client (called from the API shutdown hook)."""
+        clients = list(self._clients.items())
+        self._clients.clear()
+        self._transports.clear()
+        self._started = False
+        for profile, client in clients:
+            await self._close_client(profile, client)
+        logger.info("HTTP client registry closed", clients_closed=len(clients))
+
+    @staticmethod
+    async def _close_client(profile: str, client: httpx.AsyncClient) -> None:
+        """Close a client, logging failures."""
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning("Failed to close HTTP client", profile=profile, error=str(e))
+
+    def _close_stale_clients(self, old_loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """
+        Close the clients created on a previous event loop (best effort).
+
+        They are closed on their own loop when it still runs (other thread),
+        otherwise from the current loop, which releases what can be released.
+        """
+        clients = list(self._clients.items())
+        self._clients.clear()
+        self._transports.clear()
+        for profile, client in clients:
+            if old_loop is not None and old_loop.is_running() and not old_loop.is_closed():
+                asyncio.run_coroutine_threadsafe(self._close_client(profile, client), old_loop)
+            else:
+                task = asyncio.ensure_future(self._close_client(profile, client))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+        if clients:
+            logger.debug("HTTP clients of a previous event loop closed", clients=len(clients))
+
+    def get_client(self, profile: str = "crawl") -> httpx.AsyncClient:
+        """
+        Get the shared client of a profile, creating it on first use.
+
+        Clients are bound to the event loop that created them: if called from
+        another loop (e.g. a script using asyncio.run twice), the old clients
+        are closed and fresh clients are created for the current loop.
+
+        Args:
+            profile: Profile name (see CLIENT_PROFILES)
+
+        Returns:
+            Shared httpx.AsyncClient (must not be closed by the caller)
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._close_stale_clients(self._loop)
+            self._loop = loop
+
+        client = self._clients.get(profile)
+        if client is None or client.is_closed:
+            client, transport = self._build(profile)
+            self._clients[profile] = client
+            self._transports[profile] = transport
+        return client
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Return connection metrics for every profile.
+
+        Returns:
+            Dictionary with open connections, reuse ratio and handshake times per profile
+        """
+        profiles = {}
+        for profile, transport in self._transports.items():
+            profiles[profile] = {
+                **transport.metrics.to_dict(),
+                **transport.get_pool_state(),
+            }
+        return {
+            "started": self._started,
+            "http2": settings.http2_enabled and HTTP2_AVAILABLE,
+            "max_connections": settings.http_max_connections,
+            "max_connections_per_host": settings.http_max_connections_per_host,
+            "profiles": profiles,
+        }
+
+
+# Global instance
+http_client_registry = HttpClientRegistry()
+
+
+@asynccontextmanager
+async def pooled_client(profile: str = "crawl") -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Yield an HTTP client for a profile.
+
+    Uses the shared client when the registry is started, otherwise a
+    short-lived client closed on exit.
+
+    Args:
+        profile: Profile name (see CLIENT_PROFILES)
+
+    Yields:
+        httpx.AsyncClient
+    """
+    if http_client_registry.is_started:
+        yield http_client_registry.get_client(profile)
+    else:
+        async with http_client_registry.build_client(profile) as client:
+            yield client
@@ -0,0 +1,183 @@
+"""Process-wide cache of known Qdrant collections and their vector configs."""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from python_scripts.config.settings import settings
+from python_scripts.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class CollectionCache:
+    """
+    TTL cache of the collections that exist on the Qdrant server.
+
+    Listing collections is one request returning every collection, and the
+    list grows with one collection per client domain. The cache keeps the
+    known names for `ttl` seconds and is updated in place when this process
+    creates or deletes a collection. A name missing from the cache triggers
+    a refresh (a collection may have been created by another process); the
+    miss itself is then remembered for `negative_ttl` seconds, so repeated
+    lookups of an unknown name do not reload the list every time.
+
+    Vector configs (size, distance) are fetched lazily per collection.
+    Thread-safe: the wrapper is also used from worker threads.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, negative_ttl: Optional[float] = None) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds before the collection list is refreshed
+                (default: settings.qdrant_collection_cache_ttl)
+            negative_ttl: Seconds an unknown name is reported missing without
+                refresh (default: settings.qdrant_collection_negative_ttl)
+        """
+        self.ttl = ttl if ttl is not None else settings.qdrant_collection_cache_ttl
+        self.negative_ttl = (
+            negative_ttl if negative_ttl is not None else settings.qdrant_collection_negative_ttl
+        )
+        self._collections: Dict[str, Optional[Dict[str, Any]]] = {}
+        # Unknown names -> time of the refresh that did not find them
+        self._missing: Dict[str, float] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    def _is_fresh(self) -> bool:
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl
+
+    def _refresh(self, client: Any) -> None:
+        """Reload the collection list from the server (keeps known vector configs)."""
+        names = [c.name for c in client.get_collections().collections]
+        self._collections = {name: self._collections.get(name) for name in names}
+        self._missing = {}
+        self._loaded_at = time.monotonic()
+        self.refreshes += 1
+        logger.debug("Collection cache refreshed", collections=len(names))
+
+    def exists(self, client: Any, collection_name: str) -> bool:
+        """
+        Check if a collection exists.
+
+        Args:
+            client: QdrantClient used on cache miss
+            collection_name: Collection name
+
+        Returns:
+            True if the collection exists
+        """
+        with self._lock:
+            if self._is_fresh() and collection_name in self._collections:
+                self.hits += 1
+                return True
+            missed_at = self._missing.get(collection_name)
+            if missed_at is not None and time.monotonic() - missed_at < self.negative_ttl:
+                self.hits += 1
+                return False
+            self.misses += 1
+            self._refresh(client)
+            if collection_name in self._collections:
+                return True
+            self._missing[collection_name] = self._loaded_at
+            return False
+
+    def list_collections(self, client: Any) -> List[str]:
+        """
+        List collection names (refreshed if the cache is stale).
+
+        Args:
+            client: QdrantClient used on cache miss
+
+        Returns:
+            Collection names
+        """
+        with self._lock:
+            if self._is_fresh():
+                self.hits += 1
+            else:
+                self.misses += 1
+                self._refresh(client)
+            return list(self._collections)
+
+    def get_vector_config(self, client: Any, collection_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the vector config of a collection.
+
+        Args:
+            client: QdrantClient used on cache miss
+            collection_name: Collection name
+
+        Returns:
+            Dictionary with size and distance, None if the collection does not exist
+        """
+        if not self.exists(client, collection_name):
+            return None
+
+        with self._lock:
+            config = self._collections.get(collection_name)
+            if config is not None:
+                return config
+
+            info = client.get_collection(collection_name)
+            vectors = info.config.params.vectors
+            config = {
+                "size": getattr(vectors, "size", None),
+                "distance": getattr(vectors, "distance", None),
+            }
+            self._collections[collection_name] = config
+            return config
+
+    def mark_created(
+        self,
+        collection_name: str,
+        vector_size: Optional[int] = None,
+        distance: Optional[Any] = None,
+    ) -> None:
+        """Record a collection created by this process."""
+        with self._lock:
+            self._missing.pop(collection_name, None)
+            self._collections[collection_name] = (
+                {"size": vector_size, "distance": distance} if vector_size is not None else None
+            )
+
+    def mark_deleted(self, collection_name: str) -> None:
+        """Record a collection deleted by this process."""
+        with self._lock:
+            self._collections.pop(collection_name, None)
+            self._missing[collection_name] = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Drop the cached list (next lookup reloads it)."""
+        with self._lock:
+            self._collections = {}
+            self._missing = {}
+            self._loaded_at = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, refreshes, hit rate and known collections
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "known_collections": len(self._collections),
+                "fresh": self._is_fresh(),
+                "ttl_seconds": self.ttl,
+            }
+
+
+# Global instance shared by the Qdrant wrapper and the trend pipeline
+collection_cache = CollectionCache()
@@ -0,0 +1,362 @@
+"""Persistent content-hash embedding cache.
+
+Embeddings are keyed by (model name, hash of the normalized text) so that
+an unchanged text is never embedded twice, across runs and scripts.
+
+Layout of a model store (one directory per model under
+settings.embedding_cache_dir):
+- vectors.bin: fixed-size rows (float16 or float32), memory-mapped
+- index.sqlite: key -> row slot, with last access time for LRU eviction
+- meta.json: model name, dimension, dtype
+
+The store grows by doubling up to its cap (max entries / max bytes), then
+evicts the least recently used rows. A store is meant to be written by one
+process at a time.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from python_scripts.config.settings import settings
+from python_scripts.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Initial number of rows of a new store
+INITIAL_CAPACITY = 1024
+# Access times are written to the index every N hits
+ACCESS_FLUSH_INTERVAL = 256
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text before hashing (whitespace only: the model is case-sensitive)."""
+    return _WHITESPACE_RE.sub(" ", text or "").strip()
+
+
+def text_hash(text: str) -> str:
+    """Hash of the normalized text."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Memory-mapped LRU embedding store for one model."""
+
+    def __init__(
+        self,
+        model_name: str,
+        cache_dir: Optional[str] = None,
+        dtype: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """
+        Open (or create) the store of a model.
+
+        Args:
+            model_name: Embedding model name
+            cache_dir: Base directory (default: settings.embedding_cache_dir)
+            dtype: "float16" or "float32" (default: settings.embedding_cache_dtype)
+            max_entries: Maximum number of embeddings (default: settings.embedding_cache_max_entries)
+            max_bytes: Maximum size of the vector file (default: settings.embedding_cache_max_mb)
+        """
+        self.model_name = model_name
+        base_dir = Path(cache_dir or settings.embedding_cache_dir)
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+        self.path = base_dir / safe_name
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        self.dtype = np.dtype(dtype or settings.embedding_cache_dtype)
+        self.max_entries = max_entries or settings.embedding_cache_max_entries
+        self.max_bytes = max_bytes or settings.embedding_cache_max_mb * 1024 * 1024
+
+        self.dimension: Optional[int] = None
+        self.capacity = 0
+        self._vectors: Optional[np.memmap] = None
+        self._lru: "OrderedDict[str, int]" = OrderedDict()
+        self._pending_access: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_saved = 0  # Text bytes not re-embedded thanks to hits
+
+        self._db = sqlite3.connect(str(self.path / "index.sqlite"), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, slot INTEGER NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._db.commit()
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    @property
+    def _vectors_file(self) -> Path:
+        return self.path / "vectors.bin"
+
+    @property
+    def _meta_file(self) -> Path:
+        return self.path / "meta.json"
+
+    def _max_capacity(self) -> int:
+        row_bytes = (self.dimension or 1) * self.dtype.itemsize
+        return max(1, min(self.max_entries, self.max_bytes // row_bytes))
+
+    def _load(self) -> None:
+        """Load metadata, index and vector file of an existing store."""
+        if not self._meta_file.exists():
+            return
+
+        meta = json.loads(self._meta_file.read_text())
+        if meta.get("dtype") != self.dtype.name:
+            logger.warning(
+                "Embedding cache dtype changed, resetting store",
+                model=self.model_name,
+                previous=meta.get("dtype"),
+                current=self.dtype.name,
+            )
+            self.clear()
+            return
+
+        self.dimension = meta["dimension"]
+        self.capacity = meta["capacity"]
+        self._vectors = np.memmap(
+            self._vectors_file, dtype=self.dtype, mode="r+", shape=(self.capacity, self.dimension)
+        )
+        rows = self._db.execute("SELECT key, slot FROM entries ORDER BY last_access").fetchall()
+        self._lru = OrderedDict((key, slot) for key, slot in rows if slot < self.capacity)
+        logger.info(
+            "Embedding cache loaded",
+            model=self.model_name,
+            entries=len(self._lru),
+            capacity=self.capacity,
+            dtype=self.dtype.name,
+        )
+
+    def _write_meta(self) -> None:
+        self._meta_file.write_text(
+            json.dumps(
+                {
+                    "model": self.model_name,
+                    "dimension": self.dimension,
+                    "dtype": self.dtype.name,
+                    "capacity": self.capacity,
+                }
+            )
+        )
+
+    def _resize(self, capacity: int) -> None:
+        """Grow the vector file to `capacity` rows and remap it."""
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._vectors = None
+        with open(self._vectors_file, "ab") as f:
+            f.truncate(capacity * self.dimension * self.dtype.itemsize)
+        self.capacity = capacity
+        self._vectors = np.memmap(
+            self._vectors_file, dtype=self.dtype, mode="r+", shape=(capacity, self.dimension)
+        )
+        self._write_meta()
+
+    def _allocate_slot(self) -> int:
+        """Get a free row, growing the store or evicting the LRU entry."""
+        used = len(self._lru)
+        if used < self.capacity:
+            return used
+
+        max_capacity = self._max_capacity()
+        if self.capacity < max_capacity:
+            self._resize(min(max_capacity, max(INITIAL_CAPACITY, self.capacity * 2)))
+            return used
+
+        evicted_key, slot = self._lru.popitem(last=False)
+        self._pending_access.pop(evicted_key, None)
+        self._db.execute("DELETE FROM entries WHERE key = ?", (evicted_key,))
+        self.evictions += 1
+        return slot
+
+    def _flush_access(self) -> None:
+        if not self._pending_access:
+            return
+        self._db.executemany(
+            "UPDATE entries SET last_access = ? WHERE key = ?",
+            [(ts, key) for key, ts in self._pending_access.items()],
+        )
+        self._db.commit()
+        self._pending_access.clear()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Look up embeddings for several texts.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            Embedding (list of floats) for each cached text, None for misses
+        """
+        results: List[Optional[List[float]]] = []
+        with self._lock:
+            now = time.time()
+            for text in texts:
+                key = text_hash(text)
+                slot = self._lru.get(key)
+                if slot is None or self._vectors is None:
+                    self.misses += 1
+                    results.append(None)
+                    continue
+                self._lru.move_to_end(key)
+                self._pending_access[key] = now
+                self.hits += 1
+                self.bytes_saved += len(text.encode("utf-8"))
+                results.append(np.asarray(self._vectors[slot], dtype=np.float32).tolist())
+
+            if len(self._pending_access) >= ACCESS_FLUSH_INTERVAL:
+                self._flush_access()
+        return results
+
+    def get(self, text: str) -> Optional[List[float]]:
+        """Look up the embedding of a single text (None on miss)."""
+        return self.get_many([text])[0]
+
+    def put_many(self, texts: Sequence[str], embeddings: Sequence[Sequence[float]]) -> None:
+        """
+        Store embeddings for several texts.
+
+        Args:
+            texts: Source texts
+            embeddings: Embedding of each text
+        """
+        if not texts:
+            return
+
+        with self._lock:
+            if self.dimension is None:
+                self.dimension = len(embeddings[0])
+                self._resize(min(INITIAL_CAPACITY, self._max_capacity()))
+
+            now = time.time()
+            rows = []
+            for text, embedding in zip(texts, embeddings):
+                if len(embedding) != self.dimension:
+                    continue
+                key = text_hash(text)
+                slot = self._lru.get(key)
+                if slot is None:
+                    slot = self._allocate_slot()
+                self._vectors[slot] = np.asarray(embedding, dtype=self.dtype)
+                self._lru[key] = slot
+                self._lru.move_to_end(key)
+                rows.append((key, slot, now))
+
+            self._vectors.flush()
+            self._db.executemany(
+                "INSERT OR REPLACE INTO entries (key, slot, last_access) VALUES (?, ?, ?)", rows
+            )
+            self._db.commit()
+            self._flush_access()
+
+    def put(self, text: str, embedding: Sequence[float]) -> None:
+        """Store the embedding of a single text."""
+        self.put_many([text], [embedding])
+
+    def clear(self) -> None:
+        """Remove every cached embedding."""
+        with self._lock:
+            self._vectors = None
+            self._lru.clear()
+            self._pending_access.clear()
+            self._db.execute("DELETE FROM entries")
+            self._db.commit()
+            for file in (self._vectors_file, self._meta_file):
+                if file.exists():
+                    file.unlink()
+            self.dimension = None
+            self.capacity = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit rate, bytes saved and store size
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "model": self.model_name,
+                "entries": len(self._lru),
+                "capacity": self.capacity,
+                "max_capacity": self._max_capacity() if self.dimension else None,
+                "dtype": self.dtype.name,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "bytes_saved": self.bytes_saved,
+                "store_bytes": self.capacity * (self.dimension or 0) * self.dtype.itemsize,
+            }
+
+
+_caches: Dict[str, EmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(model_name: str) -> Optional[EmbeddingCache]:
+    """
+    Get the cache of a model (None if the cache is disabled or unavailable).
+
+    Args:
+        model_name: Embedding model name
+
+    Returns:
+        EmbeddingCache instance or None
+    """
+    if not settings.embedding_cache_enabled:
+        return None
+
+    with _caches_lock:
+        cache = _caches.get(model_name)
+        if cache is None:
+            try:
+                cache = EmbeddingCache(model_name)
+            except Exception as e:
+                logger.warning(
+                    "Embedding cache unavailable, embeddings will not be cached",
+                    model=model_name,
+                    error=str(e),
+                )
+                return None
+            _caches[model_name] = cache
+        return cache
+
+
+def get_embedding_cache_stats() -> Dict[str, Any]:
+    """
+    Get statistics of every open embedding cache.
+
+    Returns:
+        Dictionary with enabled flag and per-model statistics
+    """
+    return {
+        "enabled": settings.embedding_cache_enabled,
+        "models": {name: cache.get_stats() for name, cache in _caches.items()},
+    }
@@ -1,11 +1,12 @@
 """Embeddings utilities using Sentence-Transformers."""
 
-from typing import List
+from typing import List, Optional
 
 from sentence_transformers import SentenceTransformer
 
 from python_scripts.utils.exceptions import VectorStoreError
 from python_scripts.utils.logging import get_logger
+from python_scripts.vectorstore.embedding_cache import EmbeddingCache, get_embedding_cache
 
 logger = get_logger(__name__)
 
@@ -69,28 +70,67 @@ def get_embedding_model() -> SentenceTransformer:
 
 
 def generate_embedding(text: str) -> List[float]:
-    """Generate embedding for a single text."""
+    """Generate embedding for a single text (served from the embedding cache when possible)."""
+    cache = get_embedding_cache(EMBEDDING_MODEL_NAME)
+    if cache is not None:
+        cached = cache.get(text)
+        if cached is not None:
+            return cached
+
     try:
         model = get_embedding_model()
-        embedding = model.encode(text, normalize_embeddings=True)
-        return embedding.tolist()
+        embedding = model.encode(text, normalize_embeddings=True).tolist()
     except Exception as e:
         logger.error("Failed to generate embedding", error=str(e))
         raise VectorStoreError(f"Failed to generate embedding: {e}") from e
 
+    if cache is not None:
+        _store_in_cache(cache, [text], [embedding])
+    return embedding
+
 
 def generate_embeddings_batch(texts: List[str], batch_size: int = 32) -> List[List[float]]:
-    """Generate embeddings for multiple texts in batch."""
-    try:
-        model = get_embedding_model()
-        embeddings = model.encode(
-            texts,
-            batch_size=batch_size,
-            normalize_embeddings=True,
-            show_progress_bar=False,
+    """Generate embeddings for multiple texts in batch (only cache misses are encoded)."""
+    if not texts:
+        return []
+
+    cache = get_embedding_cache(EMBEDDING_MODEL_NAME)
+    embeddings: List[Optional[List[float]]] = (
+        cache.get_many(texts) if cache is not None else [None] * len(texts)
+    )
+    missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+    if missing:
+        try:
+            model = get_embedding_model()
+            computed = model.encode(
+                [texts[i] for i in missing],
+                batch_size=batch_size,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            ).tolist()
+        except Exception as e:
+            logger.error("Failed to generate embeddings batch", error=str(e))
+            raise VectorStoreError(f"Failed to generate embeddings batch: {e}") from e
+
+        for i, embedding in zip(missing, computed):
+            embeddings[i] = embedding
+
+        if cache is not None:
+            _store_in_cache(cache, [texts[i] for i in missing], computed)
+
+    if cache is not None:
+        logger.debug(
+            "Embeddings batch generated",
+            total=len(texts),
+            cache_hits=len(texts) - len(missing),
         )
-        return embeddings.tolist()
-    except Exception as e:
-        logger.error("Failed to generate embeddings batch", error=str(e))
-        raise VectorStoreError(f"Failed to generate embeddings batch: {e}") from e
+    return embeddings
 
+
+def _store_in_cache(cache: EmbeddingCache, texts: List[str], embeddings: List[List[float]]) -> None:
+    """Store embeddings in the cache (failures never break embedding generation)."""
+    try:
+        cache.put_many(texts, embeddings)
+    except Exception as e:
+        logger.warning("Failed to store embeddings in cache", error=str(e))
@@ -4,17 +4,23 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
+import numpy as np
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
     Distance,
     PointStruct,
+    QueryRequest,
     VectorParams,
 )
 
 from python_scripts.config.settings import settings
 from python_scripts.utils.exceptions import VectorStoreError
 from python_scripts.utils.logging import get_logger
-from python_scripts.vectorstore.embeddings_utils import generate_embedding
+from python_scripts.vectorstore.collection_cache import collection_cache
+from python_scripts.vectorstore.embeddings_utils import (
+    generate_embedding,
+    generate_embeddings_batch,
+)
 
 logger = get_logger(__name__)
 
@@ -24,6 +30,42 @@ COLLECTION_NAME = "competitor_articles"
 CLIENT_COLLECTION_NAME = "client_articles"
 # Similarity threshold for duplicate detection (0.92 = 92% similarity)
 DUPLICATE_THRESHOLD = 0.92
+# Batch indexing: points per upsert request and queries per duplicate-check request
+UPSERT_CHUNK_SIZE = 128
+DUPLICATE_QUERY_CHUNK_SIZE = 64
+# Content characters used for article embeddings
+EMBEDDING_CONTENT_CHARS = 2000
+
+
+def _build_article_payload(
+    article_id: int,
+    domain: str,
+    title: str,
+    url: str,
+    url_hash: str,
+    published_date: Optional[datetime] = None,
+    author: Optional[str] = None,
+    keywords: Optional[dict] = None,
+    topic_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Build the Qdrant payload stored with an article point."""
+    payload = {
+        "article_id": article_id,
+        "domain": domain,
+        "title": title,
+        "url": url,
+        "url_hash": url_hash,
+        "author": author,
+        "topic_id": topic_id,
+    }
+
+    if published_date:
+        payload["published_date"] = published_date.isoformat()
+
+    if keywords:
+        payload["keywords"] = keywords
+
+    return payload
 
 
 def get_client_collection_name(domain: str) -> str:
@@ -94,6 +136,7 @@ class QdrantClientWrapper:
                     distance=distance,
                 ),
             )
+            collection_cache.mark_created(collection_name, vector_size, distance)
             logger.info(
                 "Collection created",
                 collection=collection_name,
@@ -108,14 +151,28 @@ class QdrantClientWrapper:
             raise VectorStoreError(f"Failed to create collection: {e}") from e
 
     def collection_exists(self, collection_name: str) -> bool:
-        """Check if collection exists."""
+        """Check if collection exists (cached, see collection_cache)."""
         try:
-            collections = self.client.get_collections().collections
-            return any(c.name == collection_name for c in collections)
+            return collection_cache.exists(self.client, collection_name)
         except Exception as e:
             logger.error("Failed to check collection existence", error=str(e))
             return False
 
+    def delete_collection(self, collection_name: str) -> None:
+        """Delete a Qdrant collection."""
+        try:
+            self.client.delete_collection(collection_name=collection_name)
+            collection_cache.mark_deleted(collection_name)
+            logger.info("Collection deleted", collection=collection_name)
+        except Exception as e:
+            collection_cache.invalidate()
+            logger.error(
+                "Failed to delete collection",
+                collection=collection_name,
+                error=str(e),
+            )
+            raise VectorStoreError(f"Failed to delete collection: {e}") from e
+
     def ensure_collection_exists(
         self,
         collection_name: str,
@@ -125,25 +182,47 @@ class QdrantClientWrapper:
         """
         Ensure collection exists, create it if it doesn't.
         
+        An existing collection whose vector size differs from `vector_size`
+        (cached config, see collection_cache) is reported, since upserts of
+        the current embeddings will be rejected by Qdrant.
+        
         Args:
             collection_name: Name of the collection
             vector_size: Vector dimension size (default: 1024 for mxbai-embed-large-v1)
             distance: Distance metric (default: COSINE)
         """
-        if not self.collection_exists(collection_name):
-            logger.info(
-                "Collection does not exist, creating it",
-                collection=collection_name,
-                vector_size=vector_size,
-            )
-            self.create_collection(
-                collection_name=collection_name,
-                vector_size=vector_size,
-                distance=distance,
-            )
-            logger.info(
-                "Collection created automatically",
+        if self.collection_exists(collection_name):
+            self._check_vector_size(collection_name, vector_size)
+            return
+
+        logger.info(
+            "Collection does not exist, creating it",
+            collection=collection_name,
+            vector_size=vector_size,
+        )
+        self.create_collection(
+            collection_name=collection_name,
+            vector_size=vector_size,
+            distance=distance,
+        )
+        logger.info(
+            "Collection created automatically",
+            collection=collection_name,
+        )
+
+    def _check_vector_size(self, collection_name: str, vector_size: int) -> None:
+        """Warn when an existing collection does not have the expected vector size."""
+        try:
+            config = collection_cache.get_vector_config(self.client, collection_name)
+        except Exception as e:
+            logger.debug("Could not read collection vector config", collection=collection_name, error=str(e))
+            return
+        if config and config.get("size") not in (None, vector_size):
+            logger.warning(
+                "Collection vector size mismatch",
                 collection=collection_name,
+                collection_size=config["size"],
+                expected_size=vector_size,
             )
 
     def upsert_points(
@@ -334,7 +413,7 @@ class QdrantClientWrapper:
         
         try:
             # Generate embedding from title + content
-            text_for_embedding = f"{title}\n{content_text[:2000]}"  # Limit content for embedding
+            text_for_embedding = f"{title}\n{content_text[:EMBEDDING_CONTENT_CHARS]}"
             embedding = generate_embedding(text_for_embedding)
             
             # Check for duplicates if enabled
@@ -356,21 +435,17 @@ class QdrantClientWrapper:
             point_id = uuid4()
             
             # Prepare payload
-            payload = {
-                "article_id": article_id,
-                "domain": domain,
-                "title": title,
-                "url": url,
-                "url_hash": url_hash,
-                "author": author,
-                "topic_id": topic_id,
-            }
-            
-            if published_date:
-                payload["published_date"] = published_date.isoformat()
-            
-            if keywords:
-                payload["keywords"] = keywords
+            payload = _build_article_payload(
+                article_id=article_id,
+                domain=domain,
+                title=title,
+                url=url,
+                url_hash=url_hash,
+                published_date=published_date,
+                author=author,
+                keywords=keywords,
+                topic_id=topic_id,
+            )
             
             # Create point
             point = PointStruct(
@@ -403,6 +478,221 @@ class QdrantClientWrapper:
             # Don't raise - allow scraping to continue even if indexing fails
             return None
 
+    def index_articles_batch(
+        self,
+        articles: List[Dict[str, Any]],
+        collection_name: Optional[str] = None,
+        check_duplicate: bool = True,
+        threshold: float = DUPLICATE_THRESHOLD,
+        embedding_batch_size: int = 32,
+        upsert_chunk_size: int = UPSERT_CHUNK_SIZE,
+    ) -> List[Dict[str, Any]]:
+        """
+        Index many articles with batched embeddings, duplicate checks and upserts.
+
+        Same semantics as calling index_article for each article in order:
+        an article similar to an already indexed point, or to an earlier
+        article of the same batch, is reported as duplicate with the point ID
+        of the original.
+
+        Args:
+            articles: Article dictionaries with the index_article arguments
+                (article_id, domain, title, content_text, url, url_hash and
+                optionally published_date, author, keywords, topic_id)
+            collection_name: Collection name (default: COLLECTION_NAME)
+            check_duplicate: Whether to check for duplicates before indexing
+            threshold: Similarity threshold for duplicates (default: 0.92)
+            embedding_batch_size: Texts per embedding forward pass
+            upsert_chunk_size: Points per upsert request
+
+        Returns:
+            One outcome per article, in input order: dictionary with
+            article_id, status ("indexed", "duplicate" or "error"),
+            point_id, duplicate_score and error
+        """
+        target_collection = collection_name or COLLECTION_NAME
+        outcomes: List[Dict[str, Any]] = [
+            {
+                "article_id": article.get("article_id"),
+                "status": "error",
+                "point_id": None,
+                "duplicate_score": None,
+                "error": None,
+            }
+            for article in articles
+        ]
+        if not articles:
+            return outcomes
+
+        try:
+            embeddings = generate_embeddings_batch(
+                [
+                    f"{article.get('title', '')}\n"
+                    f"{(article.get('content_text') or '')[:EMBEDDING_CONTENT_CHARS]}"
+                    for article in articles
+                ],
+                batch_size=embedding_batch_size,
+            )
+            self.ensure_collection_exists(target_collection)
+        except Exception as e:
+            logger.error(
+                "Failed to prepare batch indexing",
+                collection=target_collection,
+                count=len(articles),
+                error=str(e),
+            )
+            for outcome in outcomes:
+                outcome["error"] = str(e)
+            return outcomes
+
+        duplicates: List[Optional[Dict[str, Any]]] = [None] * len(articles)
+        if check_duplicate:
+            duplicates = self._find_duplicates_batch(target_collection, embeddings, threshold)
+
+        # Articles accepted so far in this batch (normalized embeddings: dot = cosine)
+        accepted_vectors: List[np.ndarray] = []
+        accepted_point_ids: List[UUID] = []
+        points: List[PointStruct] = []
+        point_indexes: List[int] = []
+
+        for index, (article, embedding) in enumerate(zip(articles, embeddings)):
+            outcome = outcomes[index]
+            duplicate = duplicates[index]
+
+            if check_duplicate and duplicate is None and accepted_vectors:
+                scores = np.stack(accepted_vectors) @ np.asarray(embedding, dtype=np.float32)
+                best = int(np.argmax(scores))
+                if scores[best] >= threshold:
+                    duplicate = {"point_id": accepted_point_ids[best], "score": float(scores[best])}
+
+            if duplicate:
+                outcome["status"] = "duplicate"
+                outcome["point_id"] = duplicate["point_id"]
+                outcome["duplicate_score"] = duplicate["score"]
+                continue
+
+            try:
+                point_id = uuid4()
+                points.append(
+                    PointStruct(
+                        id=point_id,
+                        vector=embedding,
+                        payload=_build_article_payload(
+                            article_id=article["article_id"],
+                            domain=article["domain"],
+                            title=article.get("title", ""),
+                            url=article["url"],
+                            url_hash=article["url_hash"],
+                            published_date=article.get("published_date"),
+                            author=article.get("author"),
+                            keywords=article.get("keywords"),
+                            topic_id=article.get("topic_id"),
+                        ),
+                    )
+                )
+            except Exception as e:
+                outcome["error"] = str(e)
+                continue
+
+            point_indexes.append(index)
+            outcome["point_id"] = point_id
+            accepted_vectors.append(np.asarray(embedding, dtype=np.float32))
+            accepted_point_ids.append(point_id)
+
+        chunk_size = max(1, upsert_chunk_size)
+        for start in range(0, len(points), chunk_size):
+            chunk_indexes = point_indexes[start:start + chunk_size]
+            try:
+                self.client.upsert(
+                    collection_name=target_collection,
+                    points=points[start:start + chunk_size],
+                )
+                for index in chunk_indexes:
+                    outcomes[index]["status"] = "indexed"
+            except Exception as e:
+                logger.error(
+                    "Failed to upsert points chunk",
+                    collection=target_collection,
+                    count=len(chunk_indexes),
+                    error=str(e),
+                )
+                for index in chunk_indexes:
+                    outcomes[index]["point_id"] = None
+                    outcomes[index]["error"] = str(e)
+
+        logger.info(
+            "Articles batch indexed in Qdrant",
+            collection=target_collection,
+            total=len(articles),
+            indexed=sum(1 for o in outcomes if o["status"] == "indexed"),
+            duplicates=sum(1 for o in outcomes if o["status"] == "duplicate"),
+            errors=sum(1 for o in outcomes if o["status"] == "error"),
+        )
+
+        return outcomes
+
+    def _find_duplicates_batch(
+        self,
+        collection_name: str,
+        embeddings: List[List[float]],
+        threshold: float,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Check many embeddings against a collection with batched queries.
+
+        Args:
+            collection_name: Collection name (must exist)
+            embeddings: Embedding vectors to check
+            threshold: Similarity threshold
+
+        Returns:
+            For each embedding, duplicate point info (point_id, score) or None
+        """
+        duplicates: List[Optional[Dict[str, Any]]] = [None] * len(embeddings)
+
+        try:
+            collection_info = self.client.get_collection(collection_name)
+            if getattr(collection_info, "points_count", 0) == 0:
+                return duplicates
+        except Exception:
+            # If we can't get collection info, proceed with queries anyway
+            pass
+
+        for start in range(0, len(embeddings), DUPLICATE_QUERY_CHUNK_SIZE):
+            chunk = embeddings[start:start + DUPLICATE_QUERY_CHUNK_SIZE]
+            try:
+                responses = self.client.query_batch_points(
+                    collection_name=collection_name,
+                    requests=[
+                        QueryRequest(
+                            query=embedding,
+                            limit=1,
+                            score_threshold=threshold,
+                            with_payload=False,
+                        )
+                        for embedding in chunk
+                    ],
+                )
+            except Exception as e:
+                # Don't raise, just log - indexing should continue
+                logger.error(
+                    "Failed to check duplicates batch",
+                    collection=collection_name,
+                    count=len(chunk),
+                    error=str(e),
+                )
+                continue
+
+            for offset, response in enumerate(responses):
+                points = getattr(response, "points", None) or []
+                if points and points[0].score >= threshold:
+                    duplicates[start + offset] = {
+                        "point_id": points[0].id,
+                        "score": points[0].score,
+                    }
+
+        return duplicates
+
     def get_embeddings_by_article_ids(
         self,
         article_ids: List[int],
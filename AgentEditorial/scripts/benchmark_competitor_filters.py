@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""Benchmark des filtres d'exclusion de la recherche de concurrents.
+
+Compare, sur des résultats de recherche synthétiques, les anciennes
+implémentations (une boucle `pattern in texte` par pattern et par catégorie)
+aux matchers compilés de python_scripts.agents.competitor.matcher :
+1. CompetitorSearchConfig.get_exclusion_reason
+2. PreFilter.filter
+3. JobSiteFilter / DirectoryFilter / MediaFilter
+4. ContentFilter.validate_business_content
+5. Chaîne de l'agent (pré-filtre, médias, contenu, avec matcher partagé)
+6. ComprehensiveFilter.filter (chaîne complète)
+
+Les sorties des deux versions sont comparées résultat par résultat. Les
+anciennes versions parcouraient des sets : quand plusieurs patterns d'une même
+liste correspondent, la référence les parcourt ici du plus spécifique (le plus
+long) au moins spécifique, comme le matcher, pour que la comparaison soit
+déterministe.
+
+Usage:
+    python scripts/benchmark_competitor_filters.py --results 10000
+    python scripts/benchmark_competitor_filters.py --no-automaton  # sans pyahocorasick
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_scripts.agents.competitor import matcher
+from python_scripts.agents.competitor.config import CompetitorSearchConfig
+from python_scripts.agents.competitor.filters import (
+    ComprehensiveFilter,
+    ContentFilter,
+    DirectoryFilter,
+    JobSiteFilter,
+    MediaFilter,
+    PreFilter,
+    share_matcher,
+)
+
+
+# ----------------------------------------------------------------------
+# Anciennes implémentations (référence)
+# ----------------------------------------------------------------------
+
+
+def _specific_first(patterns: Iterable[str]) -> List[str]:
+    return sorted(patterns, key=lambda pattern: (-len(pattern), pattern))
+
+
+class LegacyConfig(CompetitorSearchConfig):
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        # Sets parcourus par les anciennes boucles : ordre fixé (plus spécifique d'abord)
+        for attribute in (
+            "excluded_tlds", "excluded_tools", "excluded_media", "excluded_listing_platforms",
+            "excluded_job_sites", "excluded_directories",
+        ):
+            setattr(self, attribute, dict.fromkeys(_specific_first(getattr(self, attribute))))
+
+    def get_exclusion_reason(self, domain: str) -> Optional[Tuple[str, str]]:
+        domain_lower = domain.lower()
+        for tld in self.excluded_tlds:
+            if domain_lower.endswith(tld):
+                return ("tld", f"TLD exclu: {tld}")
+        exact = [
+            (self.excluded_job_sites, "job_site", "Site d'emploi"),
+            (self.excluded_ecommerce, "ecommerce", "E-commerce"),
+            (self.excluded_universities, "university", "Université/École"),
+            (self.excluded_public_services, "public_service", "Service public"),
+            (self.excluded_business_sale, "business_sale", "Reprise/Vente entreprise"),
+            (self.excluded_directories, "directory", "Annuaire"),
+            (self.excluded_domains, "domain", "Domaine exclu"),
+        ]
+        for domains, category, label in exact:
+            if domains and domain_lower in domains:
+                return (category, f"{label}: {domain_lower}")
+        substrings = [
+            (self.excluded_tools, "tool", "Outil SEO/Analytics"),
+            (self.excluded_media, "media", "Média/Presse"),
+            (self.excluded_listing_platforms, "listing_platform", "Plateforme de listing"),
+        ]
+        for patterns, category, label in substrings:
+            for pattern in patterns or ():
+                if pattern in domain_lower:
+                    return (category, f"{label}: {pattern}")
+        if any(p in domain_lower for p in ["emploi", "job", "recrutement", "carriere", "career"]):
+            return ("job_pattern", "Pattern emploi détecté dans domaine")
+        if any(p in domain_lower for p in ["univ-", "universite", ".ac-", "ecole-", "ens-", "insa-"]):
+            return ("university_pattern", "Pattern université détecté dans domaine")
+        if any(p in domain_lower for p in [".gouv.", "service-public", "servicepublic"]):
+            return ("public_pattern", "Pattern service public détecté dans domaine")
+        return None
+
+
+class LegacyPreFilter(PreFilter):
+    def filter(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        filtered = []
+        for result in results:
+            url = result.get("url", "")
+            if not url or url.lower().endswith(".pdf"):
+                continue
+            domain = self._extract_domain(url)
+            if not domain or self.config.get_exclusion_reason(domain):
+                continue
+            combined_text = f"{result.get('title', '').lower()} {result.get('snippet', '').lower()}"
+            if any(
+                self._legacy_matches(domain, combined_text, patterns)
+                for _, patterns in self.content_categories
+            ):
+                continue
+            result["domain"] = domain
+            filtered.append(result)
+        return filtered
+
+    @staticmethod
+    def _legacy_matches(domain: str, combined_text: str, patterns: Dict[str, List[str]]) -> bool:
+        domain_matches = sum(1 for p in patterns.get("domain", []) if p in domain)
+        if domain_matches >= 2:
+            return True
+        keyword_matches = sum(1 for kw in patterns.get("keywords", []) if kw in combined_text)
+        return (domain_matches >= 1 and keyword_matches >= 1) or keyword_matches >= 3
+
+
+class LegacyJobSiteFilter(JobSiteFilter):
+    def is_job_site(self, result: Dict[str, Any]) -> Tuple[bool, str]:
+        domain = result.get("domain", "").lower()
+        title = result.get("title", "").lower()
+        snippet = result.get("snippet", "").lower()
+        combined_text = f"{title} {snippet}"
+
+        # Check excluded job sites from config
+        if self.config.excluded_job_sites:
+            for job_site in self.config.excluded_job_sites:
+                if job_site in domain or domain == job_site:
+                    return True, f"Site d'emploi exclu (config): {job_site}"
+
+        # Check for job patterns in domain
+        domain_matches = [p for p in self.job_domain_patterns if p in domain]
+        if len(domain_matches) >= 2:
+            return True, f"Patterns emploi dans domaine: {domain_matches}"
+
+        # Check for job patterns in content
+        content_matches = [p for p in self.job_content_patterns if p in combined_text]
+        
+        # Domain partial match + content match = job site
+        if len(domain_matches) >= 1 and len(content_matches) >= 2:
+            return True, f"Domaine ({domain_matches}) + contenu ({content_matches[:2]})"
+        
+        # Strong content match = likely job posting
+        if len(content_matches) >= 4:
+            return True, f"Patterns emploi forts dans contenu: {content_matches[:3]}"
+
+        return False, "Pas un site d'emploi"
+
+
+class LegacyDirectoryFilter(DirectoryFilter):
+    def is_directory(self, result: Dict[str, Any]) -> Tuple[bool, str]:
+        domain = result.get("domain", "").lower()
+        title = result.get("title", "").lower()
+        snippet = result.get("snippet", "").lower()
+        combined_text = f"{title} {snippet}"
+
+        # Check excluded directories from config
+        if self.config.excluded_directories:
+            for directory in self.config.excluded_directories:
+                if directory in domain or domain == directory:
+                    return True, f"Annuaire exclu (config): {directory}"
+
+        # Check for directory patterns in domain
+        domain_matches = [p for p in self.directory_domain_patterns if p in domain]
+        if len(domain_matches) >= 1:
+            return True, f"Pattern annuaire dans domaine: {domain_matches}"
+
+        # Check for directory patterns in content
+        content_matches = [p for p in self.directory_content_patterns if p in combined_text]
+        
+        # Strong content match with directory indicators
+        if len(content_matches) >= 3:
+            return True, f"Patterns annuaire forts dans contenu: {content_matches[:3]}"
+
+        return False, "Pas un annuaire"
+
+
+class LegacyMediaFilter(MediaFilter):
+    def is_media_site(self, result: Dict[str, Any]) -> Tuple[bool, str]:
+        domain = result.get("domain", "").lower()
+        title = result.get("title", "").lower()
+        snippet = result.get("snippet", "").lower()
+        combined_text = f"{title} {snippet}"
+
+        # Check excluded media domains from config
+        if self.config.excluded_media:
+            for media in self.config.excluded_media:
+                if media in domain:
+                    return True, f"Média exclu (config): {media}"
+
+        # Check for media patterns in domain
+        domain_matches = [p for p in self.media_domain_patterns if p in domain]
+        if len(domain_matches) >= 2:
+            return True, f"Patterns média dans domaine: {domain_matches}"
+
+        # Check for media patterns in content
+        content_matches = [p for p in self.media_content_patterns if p in combined_text]
+        
+        # Domain partial match + content match = media
+        if len(domain_matches) >= 1 and len(content_matches) >= 2:
+            return True, f"Domaine ({domain_matches}) + contenu ({content_matches[:2]})"
+        
+        # Strong content match = likely media
+        if len(content_matches) >= 4:
+            return True, f"Patterns média forts dans contenu: {content_matches[:3]}"
+
+        return False, "Pas un média"
+
+
+class LegacyContentFilter(ContentFilter):
+    def validate_business_content(self, result: Dict[str, Any]) -> Tuple[bool, str]:
+        domain = result.get("domain", "").lower()
+        combined_text = (
+            f"{result.get('title', '').lower()} {result.get('snippet', '').lower()} "
+            f"{result.get('description', '').lower()}"
+        )
+        negative_score = sum(
+            1 for keywords in self.negative_keywords.values() for kw in keywords if kw in combined_text
+        )
+        if negative_score >= 3:
+            return False, "negative"
+        if self.config.get_exclusion_reason(domain):
+            return False, "excluded"
+        positive_score = sum(
+            1
+            for keywords in self.positive_keywords.values()
+            for kw in keywords
+            if kw in combined_text or kw in domain
+        )
+        if any(ind in combined_text or ind in domain for ind in self.esn_strong_indicators):
+            positive_score += 3
+        if result.get("enriched", False):
+            positive_score += 1
+        if positive_score >= 2:
+            return True, "positive"
+        if result.get("enriched", False) and negative_score < 2:
+            return True, "enriched"
+        if result.get("is_esn", False) and result.get("esn_confidence", 0) > 0.5:
+            return True, "esn"
+        return False, "rejected"
+
+
+class LegacyComprehensiveFilter(ComprehensiveFilter):
+    def __init__(self, config: CompetitorSearchConfig) -> None:
+        super().__init__(config)
+        self.pre_filter = LegacyPreFilter(config)
+        self.content_filter = LegacyContentFilter(config)
+        self.media_filter = LegacyMediaFilter(config)
+        self.job_filter = LegacyJobSiteFilter(config)
+        self.directory_filter = LegacyDirectoryFilter(config)
+
+
+# ----------------------------------------------------------------------
+# Données synthétiques
+# ----------------------------------------------------------------------
+
+NEUTRAL_WORDS = [
+    "agence", "conseil", "solutions", "digital", "web", "studio", "groupe", "tech",
+    "data", "cloud", "lyon", "paris", "nantes", "services", "expert", "informatique",
+    "développement", "infogérance", "cybersécurité", "accompagnement", "projets",
+]
+
+
+def generate_results(count: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    config = CompetitorSearchConfig()
+    pre_filter = PreFilter(config)
+    exact_domains = sorted(config.get_all_excluded_domains())
+    domain_patterns = sorted({p for _, c in pre_filter.content_categories for p in c["domain"]})
+    keywords = sorted({k for _, c in pre_filter.content_categories for k in c["keywords"]})
+    tlds = sorted(config.excluded_tlds) + [".fr"] * 20 + [".com"] * 5
+
+    results = []
+    for index in range(count):
+        draw = rng.random()
+        if draw < 0.15:
+            domain = rng.choice(exact_domains)
+        else:
+            words = rng.sample(NEUTRAL_WORDS, 2)
+            if draw < 0.45:
+                words.append(rng.choice(domain_patterns).strip(".-"))
+            domain = "-".join(words) + str(index % 50) + rng.choice(tlds)
+        text_words = rng.sample(NEUTRAL_WORDS, 8) + rng.sample(keywords, rng.choice([0, 0, 1, 2, 3, 4]))
+        rng.shuffle(text_words)
+        results.append({
+            "url": f"https://www.{domain}/{rng.choice(['', 'services', 'blog/post', 'doc.pdf'])}",
+            "title": " ".join(text_words[:5]).capitalize(),
+            "snippet": " ".join(text_words[5:]),
+            "description": " ".join(rng.sample(NEUTRAL_WORDS, 6)),
+            "enriched": rng.random() < 0.5,
+        })
+    return results
+
+
+# ----------------------------------------------------------------------
+# Mesures
+# ----------------------------------------------------------------------
+
+
+def _time(func: Callable[[], object], repeat: int) -> Tuple[float, object]:
+    best, output = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = func()
+        best = min(best, time.perf_counter() - started)
+    return best, output
+
+
+def agent_chain(filters: List[Any], results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Enchaînement de CompetitorSearchAgent : pré-filtre, médias, puis validation du contenu
+    pre_filter, media_filter, content_filter = filters
+    return content_filter.filter(media_filter.filter(pre_filter.filter(results)))
+
+
+def _copy(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [dict(result) for result in results]
+
+
+def run_benchmark(count: int, repeat: int, seed: int) -> int:
+    results = generate_results(count, seed)
+    domains = [PreFilter._extract_domain(None, r["url"]) for r in results]
+    with_domain = [dict(r, domain=d) for r, d in zip(results, domains)]
+
+    started = time.perf_counter()
+    config = CompetitorSearchConfig()
+    config.get_matcher()
+    compiled = {
+        "pre": PreFilter(config),
+        "job": JobSiteFilter(config),
+        "directory": DirectoryFilter(config),
+        "media": MediaFilter(config),
+        "content": ContentFilter(config),
+        "all": ComprehensiveFilter(config),
+        "agent": [PreFilter(config), MediaFilter(config), ContentFilter(config)],
+    }
+    share_matcher(compiled["agent"])
+    compile_seconds = time.perf_counter() - started
+    legacy_config = LegacyConfig()
+    legacy = {
+        "pre": LegacyPreFilter(legacy_config),
+        "job": LegacyJobSiteFilter(legacy_config),
+        "directory": LegacyDirectoryFilter(legacy_config),
+        "media": LegacyMediaFilter(legacy_config),
+        "content": LegacyContentFilter(legacy_config),
+        "all": LegacyComprehensiveFilter(legacy_config),
+        "agent": [LegacyPreFilter(legacy_config), LegacyMediaFilter(legacy_config), LegacyContentFilter(legacy_config)],
+    }
+
+    def cases(filters: Dict[str, Any], cfg: CompetitorSearchConfig) -> List[Tuple[str, Callable[[], object]]]:
+        def cold(func: Callable[[], object]) -> Callable[[], object]:
+            # Mesure à froid : ni les domaines ni les textes ne sont déjà mémoïsés
+            def run() -> object:
+                if cfg._matcher is not None:
+                    cfg._matcher._scans.clear()
+                for f in [filters["all"].pre_filter] + filters["agent"]:
+                    f.content_matcher._cache.clear()
+                return func()
+
+            return run
+
+        return [
+            ("exclusion_reason", cold(lambda: [cfg.get_exclusion_reason(d) for d in domains])),
+            ("pre_filter", cold(lambda: [r["url"] for r in filters["pre"].filter(_copy(results))])),
+            ("job_site_filter", cold(lambda: [filters["job"].is_job_site(r) for r in with_domain])),
+            ("directory_filter", cold(lambda: [filters["directory"].is_directory(r) for r in with_domain])),
+            ("media_filter", cold(lambda: [filters["media"].is_media_site(r) for r in with_domain])),
+            (
+                "content_filter",
+                cold(lambda: [filters["content"].validate_business_content(r)[0] for r in with_domain]),
+            ),
+            ("agent_chain", cold(lambda: [r["url"] for r in agent_chain(filters["agent"], _copy(results))])),
+            (
+                "comprehensive",
+                cold(lambda: [r["url"] for r in filters["all"].filter(_copy(results), "exemple.fr")]),
+            ),
+        ]
+
+    print(f"\n{count} résultats synthétiques (compilation des matchers : {compile_seconds * 1000:.1f} ms)")
+    print(f"{'étape':<20} {'legacy (s)':>12} {'compilé (s)':>12} {'speedup':>9} {'écarts':>7}")
+    mismatches_total = 0
+    for (name, legacy_func), (_, compiled_func) in zip(cases(legacy, legacy_config), cases(compiled, config)):
+        legacy_seconds, legacy_output = _time(legacy_func, repeat)
+        compiled_seconds, compiled_output = _time(compiled_func, repeat)
+        mismatches = abs(len(legacy_output) - len(compiled_output)) + sum(
+            1 for a, b in zip(legacy_output, compiled_output) if a != b
+        )
+        mismatches_total += mismatches
+        print(
+            f"{name:<20} {legacy_seconds:>12.3f} {compiled_seconds:>12.3f} "
+            f"{legacy_seconds / compiled_seconds:>8.1f}x {mismatches:>7}"
+        )
+    return mismatches_total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark des filtres d'exclusion concurrents")
+    parser.add_argument("--results", type=int, nargs="+", default=[10000], help="Nombres de résultats")
+    parser.add_argument("--repeat", type=int, default=3, help="Répétitions (meilleur temps)")
+    parser.add_argument("--seed", type=int, default=42, help="Graine des données synthétiques")
+    parser.add_argument(
+        "--no-automaton", action="store_true", help="Ignorer pyahocorasick (repli regex / sous-chaînes)"
+    )
+    args = parser.parse_args()
+
+    if args.no_automaton:
+        matcher.AHOCORASICK_AVAILABLE = False
+    print(f"Backend par défaut : {'automaton' if matcher.AHOCORASICK_AVAILABLE else 'regex / substring'}")
+
+    mismatches = sum(run_benchmark(count, args.repeat, args.seed) for count in args.results)
+    if mismatches:
+        print(f"\n⚠️  {mismatches} écart(s) entre l'ancienne et la nouvelle implémentation")
+        sys.exit(1)
+    print("\n✅ Sorties identiques")
+
+
+if __name__ == "__main__":
+    main()
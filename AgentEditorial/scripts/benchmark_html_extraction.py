@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Benchmark de la chaîne parse → extraction → validation des pages.
+
+Compare, sur un corpus de pages enregistrées, l'ancienne chaîne (une
+analyse par étape : regex de crawl_page_async, BeautifulSoup html.parser,
+Trafilatura sur le HTML brut pour le texte puis pour les métadonnées,
+parcours séparés JSON-LD / Open Graph) à la chaîne actuelle, où la page est
+analysée une seule fois avec lxml (ParsedDocument) et partagée par toutes
+les étapes.
+
+Corpus :
+- --pages DIR : fichiers *.html / *.htm d'un répertoire
+- par défaut : le HTML compressé du cache de crawl (settings.html_store_dir)
+
+Usage:
+    python scripts/benchmark_html_extraction.py --pages ./pages --repeat 3
+    python scripts/benchmark_html_extraction.py --limit 500
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from bs4 import BeautifulSoup
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_scripts.agents.scrapping.extractor import TRAFILATURA_AVAILABLE, AdaptiveExtractor
+from python_scripts.ingestion.html_document import ParsedDocument
+from python_scripts.ingestion.html_store import get_html_store
+
+
+# ----------------------------------------------------------------------
+# Ancienne chaîne (référence)
+# ----------------------------------------------------------------------
+
+
+def legacy_crawl_fields(html: str) -> Dict[str, str]:
+    """Titre, description et texte tels qu'extraits par les regex de crawl_page_async."""
+    fields = {"title": "", "description": "", "text": ""}
+    title_match = re.search(r"<title[^>]*>([^<]+)</title>", html, re.IGNORECASE)
+    if title_match:
+        fields["title"] = title_match.group(1).strip()
+    desc_match = re.search(
+        r'<meta[^>]+name=["\']description["\'][^>]+content=["\']([^"\']+)["\']', html, re.IGNORECASE
+    ) or re.search(r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+name=["\']description["\']', html, re.IGNORECASE)
+    if desc_match:
+        fields["description"] = desc_match.group(1).strip()
+    text = re.sub(r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
+    text = re.sub(r"<style[^>]*>.*?</style>", "", text, flags=re.DOTALL | re.IGNORECASE)
+    text = re.sub(r"<[^>]+>", " ", text)
+    fields["text"] = re.sub(r"\s+", " ", text).strip()[:10000]
+    return fields
+
+
+class LegacyDocument(ParsedDocument):
+    """
+    Document reproduisant l'ancienne chaîne : BeautifulSoup html.parser
+    construit d'emblée, Trafilatura recevant le HTML brut (deux analyses),
+    JSON-LD et Open Graph lus par deux parcours BeautifulSoup.
+    """
+
+    def __init__(self, html: str, url: str) -> None:
+        self.html = html
+        self.url = url
+        self.tree = html  # Trafilatura ré-analyse la chaîne
+        self._soup = BeautifulSoup(html, "html.parser")
+        self._metadata = None
+
+    def copy_tree(self) -> str:  # type: ignore[override]
+        return self.html
+
+    def _collect_metadata(self) -> Dict[str, Any]:
+        jsonld = []
+        for script in self._soup.find_all("script", type="application/ld+json"):
+            try:
+                jsonld.append(json.loads(script.string))
+            except (TypeError, ValueError):
+                continue
+        opengraph = {}
+        for meta in self._soup.find_all("meta", property=True):
+            prop = meta.get("property", "")
+            if prop.startswith("og:") or prop.startswith("article:"):
+                opengraph[prop] = meta.get("content", "")
+        return {"title": "", "description": "", "author": None, "canonical": None, "opengraph": opengraph, "jsonld": jsonld}
+
+
+def legacy_pipeline(extractor: AdaptiveExtractor, html: str, url: str) -> Tuple[Dict[str, Any], bool]:
+    legacy_crawl_fields(html)
+    article = extractor.extract_article(LegacyDocument(html, url), url, {})
+    is_valid, _ = extractor.validate_article(article)
+    return article, is_valid
+
+
+# ----------------------------------------------------------------------
+# Chaîne actuelle
+# ----------------------------------------------------------------------
+
+
+def shared_pipeline(extractor: AdaptiveExtractor, html: str, url: str) -> Tuple[Dict[str, Any], bool]:
+    document = ParsedDocument(html, url)
+    _ = (document.title, document.description, document.text()[:10000])
+    article = extractor.extract_article(document, url, {})
+    is_valid, _ = extractor.validate_article(article)
+    return article, is_valid
+
+
+def load_corpus(pages_dir: str, limit: int) -> List[Tuple[str, str]]:
+    """Charge les pages : (nom, html)."""
+    pages = []
+    if pages_dir:
+        for path in sorted(Path(pages_dir).iterdir()):
+            if path.suffix.lower() in (".html", ".htm"):
+                pages.append((path.name, path.read_text(encoding="utf-8", errors="replace")))
+            if len(pages) >= limit:
+                break
+        return pages
+
+    store = get_html_store()
+    root = Path(getattr(store.backend, "root", "."))
+    for path in sorted(root.rglob("*.z*")):
+        digest, _, codec = path.name.partition(".")
+        if codec not in ("zstd", "zlib"):
+            continue
+        html = store.get(f"{codec}:{digest}")
+        if html:
+            pages.append((digest[:12], html))
+        if len(pages) >= limit:
+            break
+    return pages
+
+
+def _time(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark parse → extraction → validation")
+    parser.add_argument("--pages", default="", help="Répertoire de pages *.html (défaut : stockage HTML du cache)")
+    parser.add_argument("--limit", type=int, default=200, help="Nombre maximum de pages")
+    parser.add_argument("--repeat", type=int, default=3, help="Répétitions (meilleur temps)")
+    args = parser.parse_args()
+
+    pages = load_corpus(args.pages, args.limit)
+    if not pages:
+        print("Aucune page trouvée.")
+        sys.exit(1)
+
+    extractor = AdaptiveExtractor()
+    total_bytes = sum(len(html) for _, html in pages)
+    print(f"\n{len(pages)} pages, {total_bytes / 1024 / 1024:.1f} Mo de HTML, Trafilatura: {TRAFILATURA_AVAILABLE}")
+
+    legacy_seconds = _time(lambda: [legacy_pipeline(extractor, html, name) for name, html in pages], args.repeat)
+    shared_seconds = _time(lambda: [shared_pipeline(extractor, html, name) for name, html in pages], args.repeat)
+
+    # Concordance des résultats
+    same_validity = same_title = close_word_count = 0
+    for name, html in pages:
+        legacy_article, legacy_valid = legacy_pipeline(extractor, html, name)
+        shared_article, shared_valid = shared_pipeline(extractor, html, name)
+        same_validity += legacy_valid == shared_valid
+        same_title += legacy_article.get("title") == shared_article.get("title")
+        legacy_words = legacy_article.get("word_count", 0)
+        close_word_count += abs(legacy_words - shared_article.get("word_count", 0)) <= max(5, legacy_words * 0.05)
+
+    print(f"{'chaîne':<12} {'total (s)':>10} {'ms/page':>9}")
+    print(f"{'ancienne':<12} {legacy_seconds:>10.3f} {legacy_seconds * 1000 / len(pages):>9.2f}")
+    print(f"{'partagée':<12} {shared_seconds:>10.3f} {shared_seconds * 1000 / len(pages):>9.2f}")
+    print(f"Accélération: {legacy_seconds / shared_seconds:.2f}x")
+    print(
+        f"Concordance: validité {same_validity}/{len(pages)}, titre {same_title}/{len(pages)}, "
+        f"nombre de mots (±5%) {close_word_count}/{len(pages)}\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
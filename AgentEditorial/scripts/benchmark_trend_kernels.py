@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Benchmark des kernels NumPy du trend pipeline.
+
+Compare, sur des embeddings synthétiques, les anciennes implémentations
+(une passe Python sur toute la liste des topics par topic) aux kernels
+vectorisés de python_scripts.agents.trend_pipeline.kernels :
+1. Centroïdes par topic
+2. Cohérence (similarité cosinus moyenne intra-topic)
+3. Centroïde le plus proche des outliers
+4. Réaffectation par similarité (refine_topic_assignments_with_similarity)
+
+Usage:
+    python scripts/benchmark_trend_kernels.py --sizes 10000 50000 100000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_scripts.agents.trend_pipeline.kernels import (
+    nearest_centroids,
+    reassign_by_similarity,
+    segment_mean_pairwise_cosine,
+    topic_centroids,
+)
+
+
+# ----------------------------------------------------------------------
+# Anciennes implémentations (référence)
+# ----------------------------------------------------------------------
+
+
+def legacy_centroids(embeddings: np.ndarray, topics: List[int]) -> Dict[int, np.ndarray]:
+    centroids = {}
+    for topic_id in set(topics):
+        if topic_id == -1:
+            continue
+        centroids[topic_id] = np.mean(embeddings[[i for i, t in enumerate(topics) if t == topic_id]], axis=0)
+    return centroids
+
+
+def legacy_coherence(embeddings: np.ndarray, topics: List[int]) -> Dict[int, float]:
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    scores = {}
+    for topic_id in set(topics):
+        if topic_id == -1:
+            continue
+        topic_indices = [i for i, t in enumerate(topics) if t == topic_id]
+        similarities = cosine_similarity(embeddings[topic_indices])
+        n = len(similarities)
+        scores[topic_id] = float((similarities.sum() - n) / (n * (n - 1))) if n > 1 else 1.0
+    return scores
+
+
+def legacy_nearest(embeddings: np.ndarray, topics: List[int], centroids: Dict[int, np.ndarray]) -> List[int]:
+    nearest = []
+    for i, topic in enumerate(topics):
+        if topic != -1:
+            continue
+        distances = {t: np.linalg.norm(embeddings[i] - c) for t, c in centroids.items()}
+        nearest.append(min(distances, key=distances.get))
+    return nearest
+
+
+def legacy_refine(embeddings: np.ndarray, topics: List[int], threshold: float) -> List[int]:
+    centroids = legacy_centroids(embeddings, topics)
+    refined = topics.copy()
+    for i, (current, embedding) in enumerate(zip(topics, embeddings)):
+        if current == -1:
+            continue
+        norm = np.linalg.norm(embedding)
+        current_centroid = centroids[current]
+        best_topic = current
+        best = np.dot(embedding, current_centroid) / (norm * np.linalg.norm(current_centroid))
+        for topic_id, centroid in centroids.items():
+            if topic_id == current:
+                continue
+            similarity = np.dot(embedding, centroid) / (norm * np.linalg.norm(centroid))
+            if similarity > best and similarity >= threshold:
+                best_topic, best = topic_id, similarity
+        refined[i] = best_topic
+    return refined
+
+
+# ----------------------------------------------------------------------
+# Kernels vectorisés
+# ----------------------------------------------------------------------
+
+
+def kernel_nearest(embeddings: np.ndarray, topics: List[int], centroids: Dict[int, np.ndarray]) -> np.ndarray:
+    outliers = np.flatnonzero(np.asarray(topics) == -1)
+    return nearest_centroids(embeddings[outliers], np.vstack(list(centroids.values())))[0]
+
+
+def _time(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_benchmark(size: int, dimension: int, num_topics: int, repeat: int, legacy: bool) -> None:
+    rng = np.random.default_rng(size)
+    embeddings = rng.normal(size=(size, dimension)).astype(np.float32)
+    topics = rng.integers(-1, num_topics, size=size).tolist()
+    centroids = topic_centroids(embeddings, topics)
+
+    cases = [
+        ("centroids", lambda: legacy_centroids(embeddings, topics), lambda: topic_centroids(embeddings, topics)),
+        ("coherence", lambda: legacy_coherence(embeddings, topics), lambda: segment_mean_pairwise_cosine(embeddings, topics)),
+        ("nearest_centroid", lambda: legacy_nearest(embeddings, topics, centroids), lambda: kernel_nearest(embeddings, topics, centroids)),
+        ("refine_assignments", lambda: legacy_refine(embeddings, topics, 0.7), lambda: reassign_by_similarity(embeddings, topics, 0.7)),
+    ]
+
+    print(f"\n{size} documents, {dimension} dimensions, {num_topics} topics")
+    print(f"{'stage':<20} {'legacy (s)':>12} {'kernel (s)':>12} {'speedup':>9}")
+    for name, legacy_func, kernel_func in cases:
+        kernel_seconds = _time(kernel_func, repeat)
+        if legacy:
+            legacy_seconds = _time(legacy_func, 1)
+            print(f"{name:<20} {legacy_seconds:>12.3f} {kernel_seconds:>12.3f} {legacy_seconds / kernel_seconds:>8.1f}x")
+        else:
+            print(f"{name:<20} {'-':>12} {kernel_seconds:>12.3f} {'-':>9}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark des kernels NumPy du trend pipeline")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000, 100000], help="Nombres de documents")
+    parser.add_argument("--dimension", type=int, default=1024, help="Dimension des embeddings (mxbai: 1024)")
+    parser.add_argument("--topics", type=int, default=50, help="Nombre de topics")
+    parser.add_argument("--repeat", type=int, default=3, help="Répétitions des kernels (meilleur temps)")
+    parser.add_argument("--no-legacy", action="store_true", help="Ne pas mesurer les anciennes implémentations")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run_benchmark(size, args.dimension, args.topics, args.repeat, legacy=not args.no_legacy)
+
+
+if __name__ == "__main__":
+    main()
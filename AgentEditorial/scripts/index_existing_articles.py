@@ -13,7 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from python_scripts.database.db_session import AsyncSessionLocal
 from python_scripts.database.models import CompetitorArticle
-from python_scripts.database.crud_articles import update_qdrant_point_id
+from python_scripts.database.crud_articles import update_qdrant_point_ids_batch
 from python_scripts.vectorstore.qdrant_client import qdrant_client
 from python_scripts.utils.logging import setup_logging, get_logger
 
@@ -63,58 +63,70 @@ async def index_existing_articles(
             logger.info("No articles to index")
             return stats
         
-        for i, article in enumerate(articles, 1):
+        for start in range(0, len(articles), batch_size):
+            batch = articles[start:start + batch_size]
             try:
-                # Indexer l'article
-                qdrant_point_id = qdrant_client.index_article(
-                    article_id=article.id,
-                    domain=article.domain,
-                    title=article.title,
-                    content_text=article.content_text,
-                    url=article.url,
-                    url_hash=article.url_hash,
-                    published_date=article.published_date,
-                    author=article.author,
-                    keywords=article.keywords,
-                    topic_id=article.topic_id,
+                # Indexer le batch (embeddings, doublons et upserts groupés)
+                results = qdrant_client.index_articles_batch(
+                    [
+                        {
+                            "article_id": article.id,
+                            "domain": article.domain,
+                            "title": article.title,
+                            "content_text": article.content_text,
+                            "url": article.url,
+                            "url_hash": article.url_hash,
+                            "published_date": article.published_date,
+                            "author": article.author,
+                            "keywords": article.keywords,
+                            "topic_id": article.topic_id,
+                        }
+                        for article in batch
+                    ],
                     check_duplicate=True,
                 )
-                
-                if qdrant_point_id:
-                    # Mettre à jour l'article avec le point_id
-                    await update_qdrant_point_id(db_session, article, qdrant_point_id)
+            except Exception as e:
+                stats["errors"] += len(batch)
+                logger.error(
+                    "Failed to index batch",
+                    batch_start=start,
+                    batch_size=len(batch),
+                    error=str(e),
+                )
+                continue
+
+            point_ids = []
+            for article, index_result in zip(batch, results):
+                if index_result["status"] == "indexed":
                     stats["indexed"] += 1
-                    
-                    if stats["indexed"] % 10 == 0:
-                        logger.info(
-                            "Progress",
-                            indexed=stats["indexed"],
-                            total=len(articles),
-                            progress_pct=round((stats["indexed"] / len(articles)) * 100, 1),
-                        )
-                else:
-                    # Doublon détecté
+                elif index_result["status"] == "duplicate":
+                    # Doublon détecté: l'article pointe vers le point existant
                     stats["duplicates"] += 1
                     logger.debug(
                         "Article is duplicate",
                         article_id=article.id,
                         domain=article.domain,
                     )
-                
-                # Commit périodique pour éviter les transactions trop longues
-                if i % batch_size == 0:
-                    await db_session.commit()
-                    logger.debug("Batch committed", batch_size=batch_size)
-                    
-            except Exception as e:
-                stats["errors"] += 1
-                logger.error(
-                    "Failed to index article",
-                    article_id=article.id,
-                    domain=article.domain,
-                    error=str(e),
-                )
-                continue
+                else:
+                    stats["errors"] += 1
+                    logger.error(
+                        "Failed to index article",
+                        article_id=article.id,
+                        domain=article.domain,
+                        error=index_result["error"],
+                    )
+                    continue
+                point_ids.append((article, index_result["point_id"]))
+
+            # Mettre à jour les point_id du batch (un commit par batch)
+            await update_qdrant_point_ids_batch(db_session, point_ids)
+
+            logger.info(
+                "Progress",
+                indexed=stats["indexed"],
+                total=len(articles),
+                progress_pct=round((min(start + batch_size, len(articles)) / len(articles)) * 100, 1),
+            )
         
         # Commit final
         await db_session.commit()
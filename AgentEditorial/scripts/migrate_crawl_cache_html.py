@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Script de migration du HTML brut de crawl_cache vers le stockage compressé.
+
+Pour chaque entrée de crawl_cache dont cached_metadata contient encore "html" :
+1. Le HTML est compressé (zstd) et écrit dans le stockage adressé par contenu
+   (settings.html_store_dir), une seule fois par page identique
+2. cached_metadata["html"] est remplacé par la référence cached_metadata["html_ref"]
+
+Les entrées sont traitées par lots (un commit par lot) : le script peut être
+interrompu et relancé.
+
+Usage:
+    python scripts/migrate_crawl_cache_html.py --dry-run
+    python scripts/migrate_crawl_cache_html.py --batch-size 500
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_scripts.database.db_session import AsyncSessionLocal
+from python_scripts.ingestion.crawl_cache import migrate_inline_html
+from python_scripts.ingestion.html_store import get_html_store
+from python_scripts.utils.logging import get_logger, setup_logging
+
+setup_logging()
+logger = get_logger(__name__)
+
+
+async def main(batch_size: int, dry_run: bool) -> dict:
+    """
+    Migre le HTML brut de crawl_cache.
+
+    Args:
+        batch_size: Nombre d'entrées par lot
+        dry_run: Compte seulement les entrées et les octets, sans rien écrire
+
+    Returns:
+        Statistiques de migration
+    """
+    store = get_html_store()
+    print(f"\n{'='*60}")
+    print("Migration du HTML de crawl_cache")
+    print(f"{'='*60}")
+    print(f"Stockage: {getattr(store.backend, 'root', store.backend)}")
+    print(f"Codec: {store.codec} (niveau {store.level})")
+    print(f"Mode: {'simulation' if dry_run else 'migration'}")
+    print(f"{'='*60}\n")
+
+    async with AsyncSessionLocal() as db_session:
+        stats = await migrate_inline_html(db_session, store, batch_size=batch_size, dry_run=dry_run)
+
+    inline_mb = stats["inline_bytes"] / 1024 / 1024
+    stored_mb = stats["stored_bytes"] / 1024 / 1024
+    print(f"Entrées traitées: {stats['rows']}")
+    print(f"HTML en ligne: {inline_mb:.1f} Mo")
+    if not dry_run:
+        print(f"HTML stocké (compressé): {stored_mb:.1f} Mo")
+        print(f"Pages dédupliquées: {stats['deduplicated']}")
+    print()
+
+    logger.info("Crawl cache HTML migration completed", dry_run=dry_run, **stats)
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Déplace le HTML de crawl_cache vers le stockage compressé")
+    parser.add_argument("--batch-size", type=int, default=200, help="Entrées par lot (défaut: 200)")
+    parser.add_argument("--dry-run", action="store_true", help="Simulation : compte sans écrire")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(main(args.batch_size, args.dry_run))
+    except KeyboardInterrupt:
+        print("\n\nMigration interrompue (les lots déjà traités sont conservés).")
+        sys.exit(1)
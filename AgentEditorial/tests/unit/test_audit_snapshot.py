@@ -0,0 +1,226 @@
+"""Unit tests for the precomputed site audit snapshot."""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Dict
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from python_scripts.api.routers import sites
+from python_scripts.api.schemas.responses import (
+    AuditSnapshotInfo,
+    DomainDetail,
+    DomainMetrics,
+    TopicSummary,
+    TrendingTopic,
+)
+
+CRUD = "python_scripts.database.crud_audit_snapshots"
+
+
+def _topic(index: int) -> Dict[str, Any]:
+    return TopicSummary(
+        id=f"topic-{index}", title=f"Topic {index}", summary="Synthèse", keywords=["cloud"]
+    ).model_dump(mode="json")
+
+
+def _trending(index: int) -> Dict[str, Any]:
+    return TrendingTopic(
+        id=f"trend-{index}",
+        title=f"Trend {index}",
+        growth_rate=10.0,
+        volume=5,
+        source_diversity=2,
+        keywords=["cloud"],
+    ).model_dump(mode="json")
+
+
+def _domain(label: str, topics: int) -> Dict[str, Any]:
+    return DomainDetail(
+        id=label.lower(),
+        label=label,
+        confidence=40,
+        topics_count=topics,
+        summary=f"Articles {label}",
+        topics=[_topic(i) for i in range(topics)],
+        metrics=DomainMetrics(
+            total_articles=4, trending_topics=1, avg_relevance=50.0, top_keywords=["cloud"]
+        ),
+    ).model_dump(mode="json")
+
+
+def _payload() -> Dict[str, Any]:
+    return {
+        "url": "https://innosys.fr",
+        "profile": {"style": {"tone": "expert"}, "themes": ["Cloud", "Sécurité"]},
+        "domains": [_domain("Cloud", 20), _domain("Sécurité", 3)],
+        "audience": {"type": "DSI", "level": "Expert", "sectors": []},
+        "competitors": [{"name": "concurrent.fr", "similarity": 80}],
+        "took_ms": 1200,
+        "issues": [],
+        "trending_topics": {"topics": [_trending(i) for i in range(30)]},
+        "trend_analyses": {"analyses": []},
+        "temporal_insights": {"insights": []},
+        "editorial_opportunities": {"recommendations": []},
+    }
+
+
+def _sources(**overrides: Any) -> Dict[str, Any]:
+    values = {
+        "version": sites.AUDIT_SNAPSHOT_VERSION,
+        "profile": "1:2026-10-16T08:00:00+00:00",
+        "competitors": "exec-1:2026-10-15T18:00:00+00:00",
+        "trend": "trend-1",
+        "client_articles": 12,
+    }
+    values.update(overrides)
+    return values
+
+
+@pytest.mark.unit
+class TestStaleAuditSections:
+    """Test _stale_audit_sections."""
+
+    def test_missing_or_outdated_snapshot_rebuilds_everything(self) -> None:
+        """Test the rebuild of every section without snapshot or on a version change."""
+        every_section = list(sites.AUDIT_SNAPSHOT_SECTIONS)
+
+        assert sites._stale_audit_sections(None, _sources()) == every_section
+        assert sites._stale_audit_sections(_sources(version=0), _sources()) == every_section
+
+    def test_only_dependent_sections_are_stale(self) -> None:
+        """Test the section/source dependencies."""
+        stored = _sources()
+
+        assert sites._stale_audit_sections(stored, _sources()) == []
+        assert sites._stale_audit_sections(stored, _sources(competitors="exec-2:")) == ["competitors"]
+        assert sites._stale_audit_sections(stored, _sources(trend="trend-2")) == ["domains", "trends"]
+        assert sites._stale_audit_sections(stored, _sources(client_articles=13)) == ["domains"]
+
+
+@pytest.mark.unit
+class TestProjectAuditPayload:
+    """Test project_audit_payload."""
+
+    def test_defaults_drop_topics_and_truncate_trending(self) -> None:
+        """Test the default projection (no topics, 15 trending topics)."""
+        audit = sites.project_audit_payload(_payload())
+
+        assert [d.topics for d in audit.domains] == [[], []]
+        assert [d.topics_count for d in audit.domains] == [20, 3]
+        assert len(audit.trending_topics.topics) == 15
+        assert audit.trend_analyses is not None
+        assert audit.snapshot is None
+
+    def test_flags_and_limits(self) -> None:
+        """Test topics and trending limits, excluded sections and freshness metadata."""
+        payload = _payload()
+        info = AuditSnapshotInfo(
+            built_at=datetime.now(timezone.utc),
+            age_seconds=3.0,
+            build_duration_ms=850,
+            sources=_sources(),
+        )
+
+        audit = sites.project_audit_payload(
+            payload,
+            include_topics=True,
+            include_analyses=False,
+            include_opportunities=False,
+            topics_limit=5,
+            trending_limit=40,
+            snapshot=info,
+        )
+
+        assert [len(d.topics) for d in audit.domains] == [5, 3]
+        assert len(audit.trending_topics.topics) == 30
+        assert audit.trend_analyses is None and audit.editorial_opportunities is None
+        assert audit.temporal_insights is not None
+        assert audit.snapshot.build_duration_ms == 850
+        # The stored payload is left untouched
+        assert len(payload["domains"][0]["topics"]) == 20
+
+    def test_snapshot_info_reports_age(self) -> None:
+        """Test the age of a snapshot stored with a naive timestamp."""
+        built_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+        snapshot = SimpleNamespace(
+            built_at=built_at.replace(tzinfo=None), build_duration_ms=10, sources=_sources()
+        )
+
+        info = sites._audit_snapshot_info(snapshot, ["competitors"])
+
+        assert 299 <= info.age_seconds <= 310
+        assert info.rebuilt_sections == ["competitors"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGetOrBuildAuditSnapshot:
+    """Test get_or_build_audit_snapshot."""
+
+    @staticmethod
+    def _inputs() -> Dict[str, Any]:
+        updated_at = datetime(2026, 10, 16, 8, tzinfo=timezone.utc)
+        return {
+            "profile": SimpleNamespace(id=1, updated_at=updated_at),
+            "competitors_execution": SimpleNamespace(
+                execution_id=uuid4(),
+                updated_at=updated_at,
+                output_data={
+                    "competitors": [
+                        {"domain": "b.fr", "relevance_score": 0.7, "validated": True},
+                        {"domain": "a.fr", "relevance_score": 0.9, "validated": True},
+                    ]
+                },
+            ),
+            "trend_execution": SimpleNamespace(execution_id=uuid4()),
+            "client_articles_count": 12,
+        }
+
+    async def test_fresh_snapshot_is_served_without_rebuild(self) -> None:
+        """Test that a matching signature performs no build."""
+        inputs = self._inputs()
+        sources = sites._audit_snapshot_sources(**inputs)
+        stored = SimpleNamespace(payload=_payload(), sources=sources)
+        build = AsyncMock()
+
+        with patch(f"{CRUD}.get_audit_snapshot", AsyncMock(return_value=stored)), patch(
+            f"{CRUD}.upsert_audit_snapshot", AsyncMock()
+        ) as upsert, patch.object(sites, "_build_audit_payload", build):
+            snapshot, rebuilt = await sites.get_or_build_audit_snapshot(None, "innosys.fr", **inputs)
+
+        assert snapshot is stored and rebuilt == []
+        build.assert_not_awaited()
+        upsert.assert_not_awaited()
+
+    async def test_only_stale_sections_are_rebuilt(self) -> None:
+        """Test an incremental rebuild after a new competitor search."""
+        inputs = self._inputs()
+        previous = sites._audit_snapshot_sources(**inputs)
+        previous["competitors"] = "older-execution:"
+        stored = SimpleNamespace(payload=_payload(), sources=previous)
+        upsert = AsyncMock(side_effect=lambda db, **kwargs: SimpleNamespace(**kwargs))
+
+        with patch(f"{CRUD}.get_audit_snapshot", AsyncMock(return_value=stored)), patch(
+            f"{CRUD}.upsert_audit_snapshot", upsert
+        ), patch(
+            "python_scripts.database.crud_client_articles.list_client_articles",
+            AsyncMock(return_value=[]),
+        ), patch.object(sites, "_build_audit_domains_section", AsyncMock()) as domains, patch.object(
+            sites, "_build_audit_trend_sections", AsyncMock()
+        ) as trends:
+            snapshot, rebuilt = await sites.get_or_build_audit_snapshot(None, "innosys.fr", **inputs)
+
+        assert rebuilt == ["competitors"]
+        domains.assert_not_awaited()
+        trends.assert_not_awaited()
+        assert snapshot.payload["competitors"] == [
+            {"name": "a.fr", "similarity": 90},
+            {"name": "b.fr", "similarity": 70},
+        ]
+        assert snapshot.payload["domains"] == stored.payload["domains"]
+        assert snapshot.sources == sites._audit_snapshot_sources(**inputs)
+        # Issues are recomputed from the kept domains and the new competitors
+        assert {issue["code"] for issue in snapshot.payload["issues"]} == {"INSUFFICIENT_ARTICLES"}
@@ -0,0 +1,99 @@
+"""Unit tests for the Qdrant collection cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, VectorParams
+
+from python_scripts.vectorstore.collection_cache import CollectionCache
+
+
+@pytest.fixture
+def client() -> MagicMock:
+    """In-memory Qdrant client wrapped to count collection listings."""
+    qdrant = QdrantClient(":memory:")
+    qdrant.create_collection("existing", vectors_config=VectorParams(size=8, distance=Distance.COSINE))
+    wrapped = MagicMock(wraps=qdrant)
+    return wrapped
+
+
+@pytest.mark.unit
+class TestCollectionCache:
+    """Test CollectionCache."""
+
+    def test_known_collection_is_served_from_cache(self, client: MagicMock) -> None:
+        """Test that repeated lookups list collections only once."""
+        cache = CollectionCache(ttl=60)
+
+        assert all(cache.exists(client, "existing") for _ in range(5))
+
+        assert client.get_collections.call_count == 1
+        assert cache.get_stats()["hits"] == 4
+        assert cache.get_stats()["misses"] == 1
+
+    def test_unknown_collection_and_ttl_refresh(self, client: MagicMock) -> None:
+        """Test that unknown names and expired entries trigger a refresh."""
+        cache = CollectionCache(ttl=0)
+
+        assert not cache.exists(client, "missing")
+        assert cache.exists(client, "existing")
+
+        assert client.get_collections.call_count == 2
+
+    def test_create_and_delete_update_cache(self, client: MagicMock) -> None:
+        """Test that collections created or deleted locally update the cache."""
+        cache = CollectionCache(ttl=60)
+        cache.exists(client, "existing")
+
+        cache.mark_created("new", 8, Distance.COSINE)
+        assert cache.exists(client, "new")
+        assert cache.get_vector_config(client, "new") == {"size": 8, "distance": Distance.COSINE}
+
+        cache.mark_deleted("existing")
+        client.delete_collection("existing")
+        assert not cache.exists(client, "existing")
+
+    def test_vector_config_is_fetched_once(self, client: MagicMock) -> None:
+        """Test that vector configs are loaded lazily and memoized."""
+        cache = CollectionCache(ttl=60)
+
+        first = cache.get_vector_config(client, "existing")
+        second = cache.get_vector_config(client, "existing")
+
+        assert first == second
+        assert first["size"] == 8
+        assert client.get_collection.call_count == 1
+        assert cache.get_vector_config(client, "missing") is None
+
+    def test_unknown_collection_is_cached_briefly(self, client: MagicMock) -> None:
+        """Test the negative cache of unknown names and its invalidation on create."""
+        cache = CollectionCache(ttl=60, negative_ttl=60)
+
+        assert not any(cache.exists(client, "missing") for _ in range(5))
+        assert client.get_collections.call_count == 1
+
+        cache.mark_created("missing", 8, Distance.COSINE)
+        assert cache.exists(client, "missing")
+
+        expired = CollectionCache(ttl=60, negative_ttl=0)
+        expired.exists(client, "missing")
+        expired.exists(client, "missing")
+        assert client.get_collections.call_count == 3
+
+    def test_ensure_collection_exists_checks_the_vector_size(self, client: MagicMock) -> None:
+        """Test that the wrapper validates existing collections with the cached config."""
+        from python_scripts.vectorstore import qdrant_client
+
+        wrapper = qdrant_client.QdrantClientWrapper.__new__(qdrant_client.QdrantClientWrapper)
+        wrapper.client = client
+        with patch.object(qdrant_client, "collection_cache", CollectionCache(ttl=60)), patch.object(
+            qdrant_client, "logger"
+        ) as logger:
+            wrapper.ensure_collection_exists("existing", vector_size=8)
+            wrapper.ensure_collection_exists("existing", vector_size=1024)
+
+        assert client.get_collection.call_count == 1
+        client.create_collection.assert_not_called()
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args.kwargs["collection_size"] == 8
@@ -0,0 +1,102 @@
+"""Unit tests for concurrent homepage enrichment of competitor candidates."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from python_scripts.agents.competitor.config import CompetitorSearchConfig
+from python_scripts.agents.competitor.enricher import CandidateEnricher
+
+MODULE = "python_scripts.agents.competitor.enricher"
+
+
+def _homepage(domain: str) -> dict:
+    return {
+        "success": True,
+        "html": f'<meta name="description" content="{domain} : conseil et développement web">',
+        "text": "Nos services: conseil, développement web et cloud pour les entreprises.",
+    }
+
+
+def _fake_embedding(text: str) -> list:
+    # Unit vectors: the target and "fast" candidates are aligned
+    return [1.0, 0.0] if "fast" in text or text.startswith("target") else [0.0, 1.0]
+
+
+def _make_enricher(**config) -> CandidateEnricher:
+    return CandidateEnricher(CompetitorSearchConfig(**config), db_session=MagicMock())
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCandidateEnricher:
+    """Test CandidateEnricher.enrich_candidates."""
+
+    async def test_homepages_are_crawled_concurrently_with_deadlines(self) -> None:
+        """Test the bounded pool, per-candidate deadline and original order."""
+        in_flight = {"now": 0, "max": 0}
+
+        async def fake_crawl(url, **kwargs):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            try:
+                await asyncio.sleep(1.0 if "hang" in url else 0.02)
+            finally:
+                in_flight["now"] -= 1
+            return _homepage(url)
+
+        enricher = _make_enricher(enrichment_concurrency=3, enrichment_timeout=0.2, enrichment_target=0)
+        candidates = [{"domain": f"site{i}.fr"} for i in range(7)] + [{"domain": "hang.fr"}, {"domain": ""}]
+
+        started = time.monotonic()
+        with patch(f"{MODULE}.crawl_with_permissions", side_effect=fake_crawl):
+            enriched = await enricher.enrich_candidates(candidates)
+
+        assert time.monotonic() - started < 0.6
+        assert in_flight["max"] == 3
+        assert [c["domain"] for c in enriched] == [f"site{i}.fr" for i in range(7)] + ["hang.fr"]
+        assert all(c["enriched"] for c in enriched[:7])
+        assert enriched[0]["services"] and "conseil" in enriched[0]["activity_keywords"]
+        assert enriched[-1]["enriched"] is False
+
+    async def test_early_return_once_the_best_ranked_candidates_are_enriched(self) -> None:
+        """Test that the stop waits for the top-ranked candidates, not the first finishers."""
+
+        async def fake_crawl(url, **kwargs):
+            await asyncio.sleep(0.2 if "slow" in url else 2.0 if "hang" in url else 0.01)
+            return _homepage(url)
+
+        enricher = _make_enricher(enrichment_concurrency=10, enrichment_target=3)
+        candidates = [{"domain": d} for d in ["fast1.fr", "slow1.fr", "fast2.fr", "hang1.fr", "fast3.fr"]]
+
+        started = time.monotonic()
+        with patch(f"{MODULE}.crawl_with_permissions", side_effect=fake_crawl):
+            enriched = await enricher.enrich_candidates(candidates)
+
+        assert 0.2 <= time.monotonic() - started < 0.6
+        # Lower-ranked pages already parsed are kept, the ones still loading are dropped
+        assert [c["enriched"] for c in enriched] == [True, True, True, False, True]
+        assert enriched[3]["enrichment_skipped"] is True
+
+    async def test_similarity_is_computed_as_pages_arrive(self) -> None:
+        """Test incremental embeddings, reused by calculate_semantic_similarity."""
+
+        async def fake_crawl(url, **kwargs):
+            return _homepage(url)
+
+        enricher = _make_enricher(enrichment_target=0)
+        candidates = [{"domain": "fast.fr"}, {"domain": "other.fr"}]
+
+        with patch(f"{MODULE}.crawl_with_permissions", side_effect=fake_crawl), patch(
+            f"{MODULE}.generate_embedding", side_effect=_fake_embedding
+        ) as embed_one, patch(f"{MODULE}.generate_embeddings_batch") as embed_batch:
+            enriched = await enricher.enrich_candidates(candidates, target_text="target profile")
+            assert [c["semantic_similarity"] for c in enriched] == [1.0, 0.0]
+
+            enricher.calculate_semantic_similarity("target profile", enriched)
+
+        embed_batch.assert_not_called()
+        assert embed_one.call_count == 3
+        assert [c["semantic_similarity"] for c in enriched] == [1.0, 0.0]
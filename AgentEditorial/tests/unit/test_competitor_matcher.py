@@ -0,0 +1,115 @@
+"""Unit tests for the compiled competitor exclusion matchers."""
+
+import random
+
+import pytest
+
+from python_scripts.agents.competitor.config import CompetitorSearchConfig
+from python_scripts.agents.competitor.filters import DirectoryFilter, JobSiteFilter, PreFilter
+from python_scripts.agents.competitor.matcher import KeywordMatcher, SuffixMatcher, ordered_hits
+
+
+@pytest.mark.unit
+class TestKeywordMatcher:
+    """Test KeywordMatcher and SuffixMatcher."""
+
+    @pytest.fixture(params=["automaton", "regex", "substring"])
+    def backend(self, request) -> str:
+        """Each matching backend (the automaton needs pyahocorasick)."""
+        if request.param == "automaton":
+            pytest.importorskip("ahocorasick")
+        return request.param
+
+    def test_overlapping_and_nested_patterns(self, backend: str) -> None:
+        """Test that every occurring pattern is returned, like a substring scan."""
+        patterns = ["annuaire", "annuaire des", "recrute", "recrutement", "cv", "emploi", "pole-emploi", "é"]
+        matcher = KeywordMatcher(patterns, backend=backend)
+        text = "pole-emploi : annuaire des offres, recrutement et cv. école"
+
+        assert matcher.find_all(text) == {p for p in patterns if p in text}
+        assert ordered_hits(["cv", "job", "cv", "recrute"], matcher.find_all(text)) == ["cv", "cv", "recrute"]
+        assert KeywordMatcher([], backend=backend).find_all(text) == frozenset()
+
+    @pytest.mark.parametrize("cache_size", [0, 10])
+    def test_ordered_hits_keep_list_order(self, backend: str, cache_size: int) -> None:
+        """Test KeywordMatcher.ordered_hits with and without the direct list check."""
+        patterns = ["recrutement", "cv", "job", "recrute", "cv"]
+        matcher = KeywordMatcher(patterns, cache_size=cache_size, backend=backend)
+        text = "offres de recrutement, envoyez votre cv"
+
+        assert matcher.ordered_hits(patterns, text) == [p for p in patterns if p in text]
+        assert matcher.ordered_hits(["job"], text) == []
+
+    def test_random_texts_match_a_substring_scan(self, backend: str) -> None:
+        """Test equivalence with the naive scan on random texts over a small alphabet."""
+        rng = random.Random(7)
+        patterns = ["".join(rng.choice("abc.") for _ in range(rng.randint(1, 4))) for _ in range(40)]
+        matcher = KeywordMatcher(patterns, cache_size=100, backend=backend)
+
+        for _ in range(300):
+            text = "".join(rng.choice("abcd.") for _ in range(rng.randint(0, 30)))
+            assert matcher.find_all(text) == {p for p in patterns if p in text}
+
+    def test_suffix_matcher_returns_the_longest_suffix(self) -> None:
+        """Test the reversed suffix trie."""
+        matcher = SuffixMatcher([".gov", ".gouv.fr", ".fr", ".edu.fr"])
+
+        assert matcher.longest_match("impots.gouv.fr") == ".gouv.fr"
+        assert matcher.longest_match("site.edu.fr") == ".edu.fr"
+        assert matcher.longest_match("exemple.fr") == ".fr"
+        assert matcher.longest_match("exemple.com") is None
+
+
+@pytest.mark.unit
+class TestExclusionMatcher:
+    """Test exclusion reasons computed from the compiled config."""
+
+    def test_reasons_follow_the_rule_precedence(self) -> None:
+        """Test TLD, exact domains, config patterns and built-in domain patterns."""
+        config = CompetitorSearchConfig()
+
+        assert config.get_exclusion_reason("Impots.GOUV.fr") == ("tld", "TLD exclu: .gouv.fr")
+        assert config.get_exclusion_reason("indeed.fr") == ("job_site", "Site d'emploi: indeed.fr")
+        assert config.get_exclusion_reason("ahrefs.fr") == ("tool", "Outil SEO/Analytics: ahrefs")
+        assert config.get_exclusion_reason("appvizer.fr") == (
+            "listing_platform",
+            "Plateforme de listing: appvizer.fr",
+        )
+        assert config.get_exclusion_reason("mon-job-ideal.fr") == (
+            "job_pattern",
+            "Pattern emploi détecté dans domaine",
+        )
+        assert config.get_exclusion_reason("ecole-du-web.fr") == (
+            "university_pattern",
+            "Pattern université détecté dans domaine",
+        )
+        assert config.get_exclusion_reason("agence-exemple.fr") is None
+
+    def test_matcher_is_rebuilt_when_a_list_changes(self) -> None:
+        """Test the per-config compilation and its invalidation."""
+        config = CompetitorSearchConfig()
+        matcher = config.get_matcher()
+
+        assert config.get_matcher() is matcher
+        config.excluded_tools.add("exemple-seo")
+        assert config.get_matcher() is not matcher
+        assert config.get_exclusion_reason("exemple-seo.fr") == ("tool", "Outil SEO/Analytics: exemple-seo")
+
+    def test_filters_use_the_compiled_rules(self) -> None:
+        """Test content categories and config lists used as substrings by the filters."""
+        config = CompetitorSearchConfig()
+        results = [
+            {"url": "https://www.agence-exemple.fr/", "title": "Agence web", "snippet": "Développement"},
+            {"url": "https://talent-job.fr/offres", "title": "Jobs", "snippet": "Offres"},
+            {"url": "https://rapport.pdf", "title": "PDF", "snippet": ""},
+        ]
+
+        kept = PreFilter(config).filter(results)
+        is_job, job_reason = JobSiteFilter(config).is_job_site({"domain": "emploi.lefigaro.fr"})
+        is_directory, _ = DirectoryFilter(config).is_directory(
+            {"domain": "agence.fr", "title": "Annuaire des agences", "snippet": "Classement, top 10"}
+        )
+
+        assert [r["domain"] for r in kept] == ["agence-exemple.fr"]
+        assert is_job and job_reason == "Site d'emploi exclu (config): emploi.lefigaro.fr"
+        assert is_directory
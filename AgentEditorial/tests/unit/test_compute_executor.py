@@ -0,0 +1,86 @@
+"""Unit tests for the compute executor (process pool for CPU-bound tasks)."""
+
+import numpy as np
+import pytest
+
+from python_scripts.utils.compute_executor import ComputeExecutor, SharedArrayRef
+
+
+def _column_sums(matrix: np.ndarray, scale: float = 1.0) -> np.ndarray:
+    """Task: column sums of a matrix."""
+    return matrix.sum(axis=0) * scale
+
+
+def _describe(matrix: np.ndarray) -> dict:
+    """Task: report how the matrix was received."""
+    return {"type": type(matrix).__name__, "writeable": bool(matrix.flags.writeable)}
+
+
+def _fail() -> None:
+    """Task: always raises."""
+    raise ValueError("boom")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestComputeExecutor:
+    """Test ComputeExecutor."""
+
+    async def test_large_arrays_go_through_shared_memory(self) -> None:
+        """Test that a large array reaches the worker as a read-only shared view."""
+        executor = ComputeExecutor(max_workers=1, enabled=True, shared_memory_min_bytes=1024, warmup_modules=())
+        matrix = np.random.default_rng(0).normal(size=(500, 16)).astype(np.float32)
+        try:
+            await executor.start()
+            sums = await executor.run(_column_sums, matrix, scale=2.0)
+            received = await executor.run(_describe, matrix)
+        finally:
+            await executor.shutdown()
+
+        np.testing.assert_allclose(sums, matrix.sum(axis=0) * 2.0, rtol=1e-5)
+        assert received == {"type": "ndarray", "writeable": False}
+        metrics = executor.get_metrics()
+        assert metrics["shared_bytes"] == 2 * matrix.nbytes
+        assert metrics["completed"] == 2 and metrics["in_flight"] == 0
+        assert metrics["tasks"]["_column_sums"]["count"] == 1
+
+    async def test_disabled_executor_runs_in_thread(self) -> None:
+        """Test that tasks run in a thread when the pool is disabled."""
+        executor = ComputeExecutor(enabled=False)
+        matrix = np.ones((4, 3))
+
+        sums = await executor.run(_column_sums, matrix)
+
+        np.testing.assert_array_equal(sums, [4.0, 4.0, 4.0])
+        metrics = executor.get_metrics()
+        assert metrics["running"] is False
+        assert metrics["fallback_runs"] == 1
+
+    async def test_task_errors_are_raised_and_counted(self) -> None:
+        """Test that a failing task propagates its exception."""
+        executor = ComputeExecutor(enabled=False)
+
+        with pytest.raises(ValueError):
+            await executor.run(_fail)
+
+        assert executor.get_metrics()["failed"] == 1
+
+
+@pytest.mark.unit
+class TestSharedArrays:
+    """Test the shared memory transfer of task arguments."""
+
+    def test_small_arrays_are_pickled(self) -> None:
+        """Test that arrays below the threshold are not copied to shared memory."""
+        executor = ComputeExecutor(enabled=False, shared_memory_min_bytes=1024)
+        segments = []
+
+        small = executor._share(np.zeros(8), segments)
+        large = executor._share(np.zeros(1024), segments)
+        try:
+            assert isinstance(small, np.ndarray)
+            assert isinstance(large, SharedArrayRef) and large.shape == (1024,)
+        finally:
+            for segment in segments:
+                segment.close()
+                segment.unlink()
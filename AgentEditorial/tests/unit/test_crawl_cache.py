@@ -0,0 +1,153 @@
+"""Unit tests for the two-tier crawl cache."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from python_scripts.database import crud_crawl_cache
+from python_scripts.ingestion.crawl_cache import CachedPage, CrawlCacheLayer
+from python_scripts.ingestion.crawl_pages import crawl_page_async
+
+URL = "https://example.com/article"
+
+
+def _row(expires_in: timedelta, metadata=None) -> SimpleNamespace:
+    """Database row as returned by get_crawl_cache."""
+    return SimpleNamespace(
+        cached_content="Cached text",
+        cached_metadata=metadata or {"title": "Cached", "status_code": 200},
+        expires_at=datetime.now(timezone.utc) + expires_in,
+    )
+
+
+def _session_factory(session: MagicMock):
+    """Async context manager factory yielding a given session."""
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    return factory
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCrawlCacheLayer:
+    """Test CrawlCacheLayer."""
+
+    async def test_hits_are_served_from_memory_and_flushed_in_batch(self) -> None:
+        """Test that repeated reads hit the database once and write stats once."""
+        stats_session = MagicMock()
+        layer = CrawlCacheLayer(session_factory=_session_factory(stats_session), flush_batch_size=100)
+
+        with patch.object(
+            crud_crawl_cache, "get_crawl_cache", AsyncMock(return_value=_row(timedelta(days=1)))
+        ) as get_row, patch.object(
+            crud_crawl_cache, "record_crawl_cache_hits", AsyncMock(return_value=1)
+        ) as record:
+            pages = [await layer.get(MagicMock(), URL) for _ in range(5)]
+            assert record.await_count == 0
+            await layer.flush()
+
+        assert all(page.content == "Cached text" for page in pages)
+        assert get_row.await_count == 1
+        record.assert_awaited_once()
+        hits = record.await_args.args[1]
+        assert hits[crud_crawl_cache.generate_url_hash(URL)][0] == 5
+        assert layer.get_stats()["memory_hits"] == 4
+
+    async def test_memory_tier_is_bounded_by_size(self) -> None:
+        """Test that least recently used pages are evicted above max_bytes."""
+        layer = CrawlCacheLayer(max_bytes=25)
+        expires_at = datetime.now(timezone.utc) + timedelta(days=1)
+
+        for i in range(3):
+            layer._remember(f"key-{i}", CachedPage(url=f"u{i}", content="x" * 10, metadata={}, expires_at=expires_at))
+
+        assert list(layer._entries) == ["key-1", "key-2"]
+        assert layer.get_stats()["memory_bytes"] == 20
+
+    async def test_shared_session_is_never_used_concurrently(self) -> None:
+        """Test that concurrent misses on one session are serialized."""
+        in_use = 0
+        peak = 0
+
+        async def get_row(*args, **kwargs):
+            nonlocal in_use, peak
+            in_use += 1
+            peak = max(peak, in_use)
+            await asyncio.sleep(0.01)
+            in_use -= 1
+            return None
+
+        layer = CrawlCacheLayer()
+        session = MagicMock()
+        with patch.object(crud_crawl_cache, "get_crawl_cache", side_effect=get_row):
+            await asyncio.gather(*(layer.get(session, f"{URL}/{i}") for i in range(5)))
+
+        assert peak == 1
+
+    async def test_cancelled_caller_does_not_interrupt_the_write(self) -> None:
+        """Test that a crawl cancelled mid-write leaves the session usable."""
+        finished = []
+
+        async def write_row(**kwargs):
+            await asyncio.sleep(0.05)
+            finished.append(kwargs["url"])
+            return SimpleNamespace(expires_at=datetime.now(timezone.utc))
+
+        layer = CrawlCacheLayer()
+        session = MagicMock()
+        with patch.object(crud_crawl_cache, "create_or_update_crawl_cache", side_effect=write_row), patch.object(
+            crud_crawl_cache, "get_crawl_cache", AsyncMock(return_value=None)
+        ):
+            put = asyncio.create_task(layer.put(session, URL, "text", {}))
+            await asyncio.sleep(0.01)
+            put.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await put
+            # The next operation on the session waits for the shielded write
+            await layer.get(session, f"{URL}/other")
+
+        assert finished == [URL]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRevalidation:
+    """Test conditional revalidation in crawl_page_async."""
+
+    async def test_not_modified_refreshes_ttl_without_download(self) -> None:
+        """Test that a 304 returns the cached page and only extends the TTL."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"etag": '"v1"'})
+            return httpx.Response(200, text="<html><title>New</title></html>")
+
+        row = _row(timedelta(days=-1), {"title": "Cached", "status_code": 200, "etag": '"v1"'})
+        new_expiry = datetime.now(timezone.utc) + timedelta(days=30)
+        layer = CrawlCacheLayer()
+
+        with patch("python_scripts.ingestion.crawl_pages.crawl_cache", layer), patch.object(
+            crud_crawl_cache, "get_crawl_cache", AsyncMock(return_value=row)
+        ), patch.object(
+            crud_crawl_cache, "refresh_crawl_cache_expiry", AsyncMock(return_value=new_expiry)
+        ) as refresh, patch.object(
+            crud_crawl_cache, "create_or_update_crawl_cache", AsyncMock()
+        ) as save:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                result = await crawl_page_async(URL, db_session=MagicMock(), client=client)
+                again = await crawl_page_async(URL, db_session=MagicMock(), client=client)
+
+        assert result["revalidated"] is True
+        assert result["text"] == "Cached text" and result["title"] == "Cached"
+        refresh.assert_awaited_once()
+        save.assert_not_awaited()
+        # The refreshed entry is fresh again: no second request
+        assert len(requests) == 1
+        assert again["cached"] is True and "revalidated" not in again
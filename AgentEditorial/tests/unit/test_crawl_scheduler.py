@@ -0,0 +1,118 @@
+"""Unit tests for the multi-domain crawl scheduler."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from python_scripts.agents.scrapping.scheduler import (
+    CrawlBudget,
+    CrawlScheduler,
+    host_key,
+    summarize_domain_results,
+)
+from python_scripts.ingestion.rate_control import HostRateController
+
+
+@pytest.mark.unit
+class TestCrawlBudget:
+    """Test CrawlBudget."""
+
+    def test_reservations_stop_at_the_budget(self) -> None:
+        """Test partial grants once the budget runs low."""
+        budget = CrawlBudget(25)
+
+        assert budget.reserve(20) == 20
+        assert budget.reserve(20) == 5
+        assert budget.reserve(20) == 0
+        assert budget.exhausted
+
+    def test_zero_means_unlimited(self) -> None:
+        """Test that a 0 budget does not limit the run."""
+        budget = CrawlBudget(0)
+
+        assert budget.reserve(1000) == 1000
+        assert budget.remaining is None and not budget.exhausted
+
+    def test_host_key(self) -> None:
+        """Test that URLs and domains of a site share a key."""
+        assert host_key("https://WWW.Example.com/blog/post") == "example.com"
+        assert host_key("example.com") == "example.com"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCrawlScheduler:
+    """Test CrawlScheduler."""
+
+    async def test_domains_run_concurrently_with_bounded_hosts(self) -> None:
+        """Test the per-host and global in-flight limits across domains."""
+        scheduler = CrawlScheduler(
+            max_domains=3,
+            max_in_flight=4,
+            per_host_concurrency=2,
+            politeness_delay=0,
+            respect_crawl_delay=False,
+            rate_controller=HostRateController(initial_limit=2),
+        )
+        in_flight = {"total": 0, "max_total": 0}
+        per_host = {}
+
+        async def fetch(url: str) -> None:
+            host = host_key(url)
+            async with scheduler.slot(url):
+                in_flight["total"] += 1
+                per_host[host] = per_host.get(host, 0) + 1
+                in_flight["max_total"] = max(in_flight["max_total"], in_flight["total"])
+                in_flight[host] = max(in_flight.get(host, 0), per_host[host])
+                await asyncio.sleep(0.01)
+                per_host[host] -= 1
+                in_flight["total"] -= 1
+
+        async def scrape(domain: str):
+            await asyncio.gather(*(fetch(f"https://{domain}/page-{i}") for i in range(5)))
+            return {"statistics": {"discovered": 5, "scraped": 5, "valid": 5}}
+
+        results = await scheduler.run(["a.com", "b.com", "c.com"], scrape)
+
+        assert list(results) == ["a.com", "b.com", "c.com"]
+        assert in_flight["max_total"] == 4
+        assert all(in_flight[host] == 2 for host in ("a.com", "b.com", "c.com"))
+
+    async def test_failed_domain_does_not_stop_the_others(self) -> None:
+        """Test error isolation and serialized per-domain reports."""
+        scheduler = CrawlScheduler(max_domains=2, respect_crawl_delay=False)
+        reported = []
+
+        async def scrape(domain: str):
+            if domain == "broken.com":
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.01)
+            return {"statistics": {"discovered": 3, "scraped": 2, "valid": 1}}
+
+        async def report(domain: str, result):
+            reported.append(domain)
+
+        results = await scheduler.run(["ok.com", "broken.com", "ok.com"], scrape, on_domain_done=report)
+        stats = summarize_domain_results(results)
+
+        assert results["broken.com"]["error"] == "boom"
+        assert sorted(reported) == ["broken.com", "ok.com"]
+        assert stats["total_domains"] == 2
+        assert stats["domains_with_errors"] == 1 and stats["domains_with_articles"] == 1
+        assert stats["total_articles_valid"] == 1
+
+    async def test_robots_crawl_delay_raises_the_host_delay(self) -> None:
+        """Test that a Crawl-delay above the politeness delay is applied, capped."""
+        parser = MagicMock()
+        parser.get_crawl_delay.return_value = 120
+        scheduler = CrawlScheduler(politeness_delay=0.5)
+
+        with patch(
+            "python_scripts.agents.scrapping.scheduler.parse_robots_txt",
+            new=AsyncMock(return_value=parser),
+        ), patch("python_scripts.agents.scrapping.scheduler.settings.scraping_max_crawl_delay", 10.0):
+            policy = await scheduler.prepare_host("slow.com")
+
+        assert policy.delay == 10.0
+        assert scheduler._policy("slow.com").gate.delay == 10.0
@@ -0,0 +1,149 @@
+"""Unit tests for the request-scoped data loader."""
+
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from python_scripts.database.crud_articles import count_competitor_articles_by_domain
+from python_scripts.database.data_loader import RequestDataLoader
+
+MODULE = "python_scripts.database.data_loader"
+
+
+class FakeSession:
+    """Session that fails when used by two tasks at once, like an AsyncSession."""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.busy = False
+
+    async def query(self, value: Any, delay: float = 0.02) -> Any:
+        if self.busy:
+            raise RuntimeError("This session is provisioning a new connection")
+        self.busy = True
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.busy = False
+        return value
+
+
+class FakeSessionFactory:
+    """Hands out a new FakeSession per `async with`."""
+
+    def __init__(self) -> None:
+        self.sessions: List[FakeSession] = []
+
+    def __call__(self) -> "FakeSessionFactory":
+        return self
+
+    async def __aenter__(self) -> FakeSession:
+        session = FakeSession(len(self.sessions))
+        self.sessions.append(session)
+        return session
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRequestDataLoader:
+    """Test RequestDataLoader."""
+
+    async def test_concurrent_lookups_use_their_own_sessions(self) -> None:
+        """Test that gathered lookups never share a session."""
+        factory = FakeSessionFactory()
+        loader = RequestDataLoader(session_factory=factory)
+
+        results = await asyncio.gather(
+            loader.load("competitors", lambda session: session.query("exec")),
+            loader.load("trend", lambda session: session.query("trend")),
+            loader.load("articles", lambda session: session.query((12, True))),
+        )
+
+        assert results == ["exec", "trend", (12, True)]
+        assert len(factory.sessions) == 3
+
+    async def test_identical_lookups_are_memoized(self) -> None:
+        """Test that in-flight and completed lookups are shared by key."""
+        factory = FakeSessionFactory()
+        loader = RequestDataLoader(session_factory=factory)
+        calls: List[str] = []
+
+        async def lookup(session: FakeSession) -> str:
+            calls.append("competitors")
+            return await session.query("exec")
+
+        first, second = await asyncio.gather(
+            loader.load(("competitors", "innosys.fr"), lookup),
+            loader.load(("competitors", "innosys.fr"), lookup),
+        )
+        third = await loader.load(("competitors", "innosys.fr"), lookup)
+
+        assert first == second == third == "exec"
+        assert calls == ["competitors"]
+        assert len(factory.sessions) == 1
+
+    async def test_failed_lookups_are_retried(self) -> None:
+        """Test that an error is not memoized."""
+        loader = RequestDataLoader(session_factory=FakeSessionFactory())
+        lookup = AsyncMock(side_effect=[RuntimeError("connection reset"), "exec"])
+
+        with pytest.raises(RuntimeError):
+            await loader.load("competitors", lookup)
+
+        assert await loader.load("competitors", lookup) == "exec"
+        assert lookup.await_count == 2
+
+    async def test_competitor_article_counts_are_batched(self) -> None:
+        """Test one grouped query per batch of domains not counted yet."""
+        loader = RequestDataLoader(session_factory=FakeSessionFactory())
+        queried: List[List[str]] = []
+
+        async def count_by_domain(session: FakeSession, domains: List[str]) -> Dict[str, int]:
+            queried.append(list(domains))
+            return await session.query({domain: len(domain) for domain in domains})
+
+        with patch(f"{MODULE}.count_competitor_articles_by_domain", side_effect=count_by_domain):
+            first, second = await asyncio.gather(
+                loader.count_competitor_articles(["a.fr", "bb.fr", "a.fr"]),
+                loader.count_competitor_articles(["bb.fr"]),
+            )
+            third = await loader.count_competitor_articles(["bb.fr", "cccc.fr"])
+
+        assert first == {"a.fr": 4, "bb.fr": 5}
+        assert second == {"bb.fr": 5}
+        assert third == {"bb.fr": 5, "cccc.fr": 7}
+        assert queried == [["a.fr", "bb.fr"], ["cccc.fr"]]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCountCompetitorArticlesByDomain:
+    """Test count_competitor_articles_by_domain."""
+
+    async def test_single_grouped_query(self) -> None:
+        """Test the GROUP BY query and the zero counts of domains without articles."""
+        result = MagicMock()
+        result.all.return_value = [("a.fr", 12)]
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+
+        counts = await count_competitor_articles_by_domain(session, ["a.fr", "b.fr"])
+
+        assert counts == {"a.fr": 12, "b.fr": 0}
+        session.execute.assert_awaited_once()
+        sql = str(session.execute.await_args.args[0])
+        assert "GROUP BY competitor_articles.domain" in sql
+        assert "IN" in sql
+
+    async def test_no_domains_no_query(self) -> None:
+        """Test that an empty domain list does not hit the database."""
+        session = MagicMock()
+        session.execute = AsyncMock()
+
+        assert await count_competitor_articles_by_domain(session, []) == {}
+        session.execute.assert_not_awaited()
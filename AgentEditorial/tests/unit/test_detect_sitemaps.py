@@ -1,17 +1,40 @@
 """Unit tests for sitemap detection (T093 - US5)."""
 
+import asyncio
+import gzip
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from python_scripts.ingestion.detect_sitemaps import (
+    SitemapStreamParser,
     detect_sitemap_urls,
     get_sitemap_urls,
+    iter_sitemap_urls,
+    parse_lastmod,
     parse_sitemap,
 )
 from python_scripts.utils.exceptions import CrawlingError
 
 
+def _stream_response(body: str = "", status_code: int = 200) -> MagicMock:
+    """Context manager returned by a mocked client.stream()."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"content-type": "application/xml"}
+
+    async def aiter_bytes():
+        yield body.encode()
+
+    response.aiter_bytes = aiter_bytes
+    stream = MagicMock()
+    stream.__aenter__ = AsyncMock(return_value=response)
+    stream.__aexit__ = AsyncMock(return_value=None)
+    return stream
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 class TestDetectSitemapUrls:
@@ -125,12 +148,8 @@ class TestParseSitemap:
     </url>
 </urlset>"""
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = sitemap_xml
-
         mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
+        mock_client.stream = MagicMock(return_value=_stream_response(sitemap_xml))
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
 
@@ -160,18 +179,15 @@ class TestParseSitemap:
     </url>
 </urlset>"""
 
-        # Mock responses: index first, then nested sitemaps
-        mock_index_response = MagicMock()
-        mock_index_response.status_code = 200
-        mock_index_response.text = index_xml
-
-        mock_nested_response = MagicMock()
-        mock_nested_response.status_code = 200
-        mock_nested_response.text = nested_sitemap_xml
-
         mock_client = AsyncMock()
         # First call returns index, subsequent calls return nested sitemap
-        mock_client.get = AsyncMock(side_effect=[mock_index_response, mock_nested_response, mock_nested_response])
+        mock_client.stream = MagicMock(
+            side_effect=[
+                _stream_response(index_xml),
+                _stream_response(nested_sitemap_xml),
+                _stream_response(nested_sitemap_xml),
+            ]
+        )
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
 
@@ -184,11 +200,8 @@ class TestParseSitemap:
 
     async def test_parse_sitemap_not_found(self, mocker) -> None:
         """Test parsing when sitemap is not found."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-
         mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
+        mock_client.stream = MagicMock(return_value=_stream_response(status_code=404))
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
 
@@ -200,12 +213,8 @@ class TestParseSitemap:
         """Test parsing invalid XML."""
         invalid_xml = "This is not XML"
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = invalid_xml
-
         mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
+        mock_client.stream = MagicMock(return_value=_stream_response(invalid_xml))
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
 
@@ -219,12 +228,8 @@ class TestParseSitemap:
 <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
 </urlset>"""
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = empty_xml
-
         mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
+        mock_client.stream = MagicMock(return_value=_stream_response(empty_xml))
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
 
@@ -257,13 +262,10 @@ class TestGetSitemapUrls:
         mock_robots_response.status_code = 200
         mock_robots_response.text = robots_content
 
-        mock_sitemap_response = MagicMock()
-        mock_sitemap_response.status_code = 200
-        mock_sitemap_response.text = sitemap_xml
-
         mock_client = AsyncMock()
-        # First call for robots.txt, second for sitemap
-        mock_client.get = AsyncMock(side_effect=[mock_robots_response, mock_sitemap_response])
+        # robots.txt is fetched with get(), the sitemap is streamed
+        mock_client.get = AsyncMock(return_value=mock_robots_response)
+        mock_client.stream = MagicMock(return_value=_stream_response(sitemap_xml))
         mock_client.head = AsyncMock(return_value=MagicMock(status_code=404))
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -312,12 +314,9 @@ class TestGetSitemapUrls:
         mock_robots_response.status_code = 200
         mock_robots_response.text = robots_content
 
-        mock_sitemap_response = MagicMock()
-        mock_sitemap_response.status_code = 200
-        mock_sitemap_response.text = sitemap_xml
-
         mock_client = AsyncMock()
-        mock_client.get = AsyncMock(side_effect=[mock_robots_response, mock_sitemap_response])
+        mock_client.get = AsyncMock(return_value=mock_robots_response)
+        mock_client.stream = MagicMock(return_value=_stream_response(sitemap_xml))
         mock_client.head = AsyncMock(return_value=MagicMock(status_code=404))
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
@@ -329,3 +328,148 @@ class TestGetSitemapUrls:
         assert len(urls) == 2
         assert urls.count("https://example.com/page1") == 1
 
+
+
+def _urlset(*entries) -> str:
+    """Build a <urlset> from (loc, lastmod) pairs."""
+    urls = "".join(
+        f"<url><loc>{loc}</loc>" + (f"<lastmod>{lastmod}</lastmod>" if lastmod else "") + "</url>"
+        for loc, lastmod in entries
+    )
+    return f'<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'
+
+
+def _index(*entries) -> str:
+    """Build a <sitemapindex> from (loc, lastmod) pairs."""
+    sitemaps = "".join(
+        f"<sitemap><loc>{loc}</loc><lastmod>{lastmod}</lastmod></sitemap>" for loc, lastmod in entries
+    )
+    return (
+        '<?xml version="1.0"?>'
+        f'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{sitemaps}</sitemapindex>'
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStreamingSitemaps:
+    """Test iter_sitemap_urls against an in-memory HTTP transport."""
+
+    async def _collect(self, handler, *args, **kwargs):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("httpx.AsyncClient", return_value=client):
+            return [entry async for entry in iter_sitemap_urls(*args, **kwargs)]
+
+    async def test_gzip_child_and_lastmod(self) -> None:
+        """Test that gzipped children are read transparently, with their lastmod."""
+        bodies = {
+            "/sitemap_index.xml": _index(("https://example.com/news.xml.gz", "2024-03-01")).encode(),
+            "/news.xml.gz": gzip.compress(
+                _urlset(("https://example.com/a", "2024-03-01T10:00:00Z"), ("https://example.com/b", None)).encode()
+            ),
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=bodies[request.url.path])
+
+        entries = await self._collect(handler, "https://example.com/sitemap_index.xml")
+
+        assert [entry.url for entry in entries] == ["https://example.com/a", "https://example.com/b"]
+        assert entries[0].lastmod == datetime(2024, 3, 1, 10, tzinfo=timezone.utc)
+        assert entries[1].lastmod is None
+
+    async def test_incremental_mode_skips_old_children_and_urls(self) -> None:
+        """Test that entries older than `since` are skipped without fetching old children."""
+        requested = []
+        bodies = {
+            "/index.xml": _index(
+                ("https://example.com/2023.xml", "2023-12-31"),
+                ("https://example.com/2024.xml", "2024-06-01"),
+            ),
+            "/2024.xml": _urlset(
+                ("https://example.com/old", "2024-01-01"),
+                ("https://example.com/new", "2024-06-01"),
+                ("https://example.com/undated", None),
+            ),
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request.url.path)
+            return httpx.Response(200, text=bodies[request.url.path])
+
+        entries = await self._collect(
+            handler, "https://example.com/index.xml", since=datetime(2024, 3, 1, tzinfo=timezone.utc)
+        )
+
+        assert {entry.url for entry in entries} == {"https://example.com/new", "https://example.com/undated"}
+        assert "/2023.xml" not in requested
+
+    async def test_children_are_fetched_concurrently_with_a_bound(self) -> None:
+        """Test that at most max_concurrency sitemaps are downloaded at once."""
+        in_flight = 0
+        peak = 0
+        children = [f"https://example.com/child-{i}.xml" for i in range(6)]
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            if request.url.path == "/index.xml":
+                return httpx.Response(200, text=_index(*((child, "2024-01-01") for child in children)))
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return httpx.Response(200, text=_urlset((f"https://example.com{request.url.path}/page", None)))
+
+        entries = await self._collect(handler, "https://example.com/index.xml", max_concurrency=2)
+
+        assert len(entries) == 6
+        assert peak == 2
+
+    async def test_failed_child_is_skipped(self) -> None:
+        """Test that a broken child sitemap does not fail the whole index."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/index.xml":
+                return httpx.Response(
+                    200,
+                    text=_index(("https://example.com/ok.xml", "2024-01-01"), ("https://example.com/ko.xml", "2024-01-01")),
+                )
+            if request.url.path == "/ko.xml":
+                return httpx.Response(500)
+            return httpx.Response(200, text=_urlset(("https://example.com/page", None)))
+
+        entries = await self._collect(handler, "https://example.com/index.xml")
+
+        assert [entry.url for entry in entries] == ["https://example.com/page"]
+
+
+@pytest.mark.unit
+class TestSitemapStreamParser:
+    """Test SitemapStreamParser and parse_lastmod."""
+
+    def test_records_are_released_while_parsing(self) -> None:
+        """Test byte-by-byte feeding and that parsed <url> elements are dropped."""
+        parser = SitemapStreamParser("https://example.com/sitemap.xml")
+        body = _urlset(*((f"https://example.com/{i}", None) for i in range(50))).encode()
+
+        records = []
+        for i in range(len(body)):
+            records.extend(parser.feed(body[i : i + 1]))
+            assert len(parser._root or []) <= 1
+        records.extend(parser.close())
+
+        assert len(records) == 50
+        assert parser.kind == "urlset"
+
+    def test_non_sitemap_root_is_rejected(self) -> None:
+        """Test that an HTML document is not accepted as a sitemap."""
+        parser = SitemapStreamParser("https://example.com/sitemap.xml")
+
+        with pytest.raises(CrawlingError):
+            parser.feed(b"<html><body>Not found</body></html>")
+
+    def test_parse_lastmod_formats(self) -> None:
+        """Test W3C datetime variants."""
+        assert parse_lastmod("2024-01-02") == datetime(2024, 1, 2, tzinfo=timezone.utc)
+        assert parse_lastmod("2024-01-02T03:04:05+02:00").utcoffset().total_seconds() == 7200
+        assert parse_lastmod("not a date") is None
@@ -0,0 +1,78 @@
+"""Unit tests for the persistent embedding cache."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from python_scripts.vectorstore.embedding_cache import EmbeddingCache, text_hash
+
+
+def _embedding(seed: int, dimension: int = 8) -> list:
+    """Build a deterministic normalized embedding."""
+    vector = np.random.default_rng(seed).normal(size=dimension)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+@pytest.mark.unit
+class TestEmbeddingCache:
+    """Test EmbeddingCache."""
+
+    def test_roundtrip_and_persistence(self, tmp_path) -> None:
+        """Test that embeddings survive a reopen of the store."""
+        cache = EmbeddingCache("test-model", cache_dir=str(tmp_path), dtype="float16")
+        cache.put_many(["first text", "second text"], [_embedding(1), _embedding(2)])
+
+        reopened = EmbeddingCache("test-model", cache_dir=str(tmp_path), dtype="float16")
+        first, missing = reopened.get_many(["first  text ", "unknown"])
+
+        assert missing is None
+        np.testing.assert_allclose(first, _embedding(1), atol=1e-3)
+        stats = reopened.get_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["bytes_saved"] == len("first  text ".encode("utf-8"))
+
+    def test_lru_eviction_respects_cap(self, tmp_path) -> None:
+        """Test that the least recently used entry is evicted at capacity."""
+        cache = EmbeddingCache("test-model", cache_dir=str(tmp_path), dtype="float32", max_entries=2)
+        cache.put("a", _embedding(1))
+        cache.put("b", _embedding(2))
+        cache.get("a")  # "b" becomes the least recently used
+        cache.put("c", _embedding(3))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        np.testing.assert_allclose(cache.get("c"), _embedding(3), atol=1e-6)
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.capacity == 2
+
+    def test_text_hash_normalizes_whitespace_only(self) -> None:
+        """Test that hashing ignores whitespace but not case."""
+        assert text_hash("Hello   world\n") == text_hash("Hello world")
+        assert text_hash("Hello world") != text_hash("hello world")
+
+
+@pytest.mark.unit
+class TestCachedEmbeddingGeneration:
+    """Test the cache in front of generate_embeddings_batch."""
+
+    def test_only_misses_are_encoded(self, tmp_path) -> None:
+        """Test that cached texts are not sent to the model."""
+        from python_scripts.vectorstore import embeddings_utils
+
+        cache = EmbeddingCache("test-model", cache_dir=str(tmp_path), dtype="float32")
+        cache.put("cached", _embedding(1))
+
+        model = MagicMock()
+        model.encode.side_effect = lambda texts, **kwargs: np.array([_embedding(2) for _ in texts])
+
+        with patch.object(embeddings_utils, "get_embedding_cache", return_value=cache), patch.object(
+            embeddings_utils, "get_embedding_model", return_value=model
+        ):
+            embeddings = embeddings_utils.generate_embeddings_batch(["cached", "new"])
+            again = embeddings_utils.generate_embeddings_batch(["new"])
+
+        assert model.encode.call_count == 1
+        assert model.encode.call_args[0][0] == ["new"]
+        np.testing.assert_allclose(embeddings[0], _embedding(1), atol=1e-6)
+        np.testing.assert_allclose(again[0], _embedding(2), atol=1e-6)
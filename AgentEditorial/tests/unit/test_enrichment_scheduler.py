@@ -0,0 +1,111 @@
+"""Unit tests for the concurrent LLM enrichment stage."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from python_scripts.agents.trend_pipeline.llm_enrichment import (
+    EnrichmentJob,
+    EnrichmentScheduler,
+    LLMEnricher,
+    LLMEnrichmentConfig,
+)
+
+
+def _jobs(scores):
+    """Build jobs from potential scores."""
+    return [
+        EnrichmentJob(priority=-score, sequence=i, topic_id=i)
+        for i, score in enumerate(scores)
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestEnrichmentScheduler:
+    """Test EnrichmentScheduler."""
+
+    async def test_jobs_run_by_priority(self) -> None:
+        """Test that the highest potential topics are processed first."""
+        order = []
+
+        async def handler(job: EnrichmentJob) -> int:
+            order.append(job.topic_id)
+            return job.topic_id
+
+        results = await EnrichmentScheduler(max_concurrency=1).run(_jobs([0.2, 0.9, 0.5]), handler)
+
+        assert order == [1, 2, 0]
+        assert [job.topic_id for job, _ in results] == [1, 2, 0]
+
+    async def test_concurrency_is_bounded(self) -> None:
+        """Test that no more than max_concurrency jobs run at once."""
+        running = 0
+        peak = 0
+
+        async def handler(job: EnrichmentJob) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        scheduler = EnrichmentScheduler(max_concurrency=3)
+        await scheduler.run(_jobs([0.1] * 10), handler)
+
+        assert peak == 3
+        assert scheduler.get_stats()["completed"] == 10
+
+    async def test_timed_out_and_failed_jobs_are_skipped(self) -> None:
+        """Test that slow or failing jobs do not stop the others."""
+
+        async def handler(job: EnrichmentJob) -> int:
+            if job.topic_id == 0:
+                await asyncio.sleep(1)
+            if job.topic_id == 1:
+                raise ValueError("boom")
+            return job.topic_id
+
+        scheduler = EnrichmentScheduler(max_concurrency=3, job_timeout=0.05)
+        results = await scheduler.run(_jobs([0.3, 0.2, 0.1]), handler)
+
+        assert [job.topic_id for job, _ in results] == [2]
+        assert scheduler.get_stats() == {"completed": 1, "failed": 1, "timed_out": 1}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestModelConcurrency:
+    """Test the per-model limit of LLMEnricher."""
+
+    async def test_in_flight_calls_are_limited_per_model(self) -> None:
+        """Test that a model never receives more calls than its limit."""
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def invoke(prompt: str) -> str:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return "{}"
+
+        llm = MagicMock()
+        llm.invoke.side_effect = invoke
+        config = LLMEnrichmentConfig(max_concurrent_per_model=2, model_concurrency={"slow:7b": 1})
+        enricher = LLMEnricher(config)
+
+        with patch.object(enricher, "_get_llm", return_value=llm):
+            await asyncio.gather(*(enricher._invoke_llm("p", "mistral:7b", timeout=5) for _ in range(6)))
+            assert peak == 2
+
+            peak = 0
+            await asyncio.gather(*(enricher._invoke_llm("p", "slow:7b", timeout=5) for _ in range(3)))
+            assert peak == 1
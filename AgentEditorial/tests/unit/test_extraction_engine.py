@@ -0,0 +1,115 @@
+"""Unit tests for the concurrent extraction engine (phase 3 of the scraping agent)."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from python_scripts.agents.scrapping.extraction_engine import (
+    ConcurrentExtractionEngine,
+    PolitenessGate,
+)
+
+
+def _make_extractor(word_count: int = 300) -> MagicMock:
+    """Build an extractor mock returning a fixed article."""
+    extractor = MagicMock()
+
+    async def extract(html, url, profile):
+        return {"url": url, "title": "Title", "content": "x " * word_count, "word_count": word_count}
+
+    extractor.extract_article_adaptive = extract
+    extractor.validate_article = MagicMock(return_value=(True, None))
+    return extractor
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestConcurrentExtractionEngine:
+    """Test ConcurrentExtractionEngine."""
+
+    async def test_outcomes_keep_input_order(self) -> None:
+        """Test that outcomes are returned in URL order whatever the completion order."""
+        urls = [{"url": f"https://example.com/article-{i}"} for i in range(6)]
+
+        async def fake_crawl(url, timeout, client, **kwargs):
+            # Later URLs complete first
+            await asyncio.sleep(0.01 * (6 - int(url.rsplit("-", 1)[1])))
+            return {"success": True, "html": "<html></html>"}
+
+        engine = ConcurrentExtractionEngine(
+            _make_extractor(), max_concurrency=6, politeness_delay=0, window_size=6
+        )
+        with patch(
+            "python_scripts.agents.scrapping.extraction_engine.crawl_page_async",
+            side_effect=fake_crawl,
+        ):
+            outcomes = await engine.process_window(urls, {}, 150, client=MagicMock())
+
+        assert [o.url_data["url"] for o in outcomes] == [u["url"] for u in urls]
+        assert all(o.crawled and o.is_valid for o in outcomes)
+
+    async def test_concurrency_is_bounded(self) -> None:
+        """Test that no more than max_concurrency pages are crawled at once."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_crawl(url, timeout, client, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"success": True, "html": ""}
+
+        engine = ConcurrentExtractionEngine(_make_extractor(), max_concurrency=3, politeness_delay=0)
+        urls = [{"url": f"https://example.com/{i}"} for i in range(10)]
+        with patch(
+            "python_scripts.agents.scrapping.extraction_engine.crawl_page_async",
+            side_effect=fake_crawl,
+        ):
+            await engine.process_window(urls, {}, 150, client=MagicMock())
+
+        assert max_in_flight == 3
+
+    async def test_crawl_failure_and_exception_are_reported(self) -> None:
+        """Test that failed crawls and worker exceptions are captured per URL."""
+
+        async def fake_crawl(url, timeout, client, **kwargs):
+            if url.endswith("boom"):
+                raise RuntimeError("boom")
+            return {"success": False, "error": "HTTP 404"}
+
+        engine = ConcurrentExtractionEngine(_make_extractor(), politeness_delay=0)
+        urls = [{"url": "https://example.com/missing"}, {"url": "https://example.com/boom"}]
+        with patch(
+            "python_scripts.agents.scrapping.extraction_engine.crawl_page_async",
+            side_effect=fake_crawl,
+        ):
+            missing, boom = await engine.process_window(urls, {}, 150, client=MagicMock())
+
+        assert not missing.crawled and missing.crawl_error == "HTTP 404"
+        assert missing.error is None
+        assert not boom.crawled and isinstance(boom.error, RuntimeError)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPolitenessGate:
+    """Test PolitenessGate."""
+
+    async def test_requests_are_spaced(self) -> None:
+        """Test that request starts are spaced by at least the delay."""
+        gate = PolitenessGate(0.02)
+        loop = asyncio.get_running_loop()
+        starts = []
+
+        async def request() -> None:
+            await gate.wait()
+            starts.append(loop.time())
+
+        await asyncio.gather(*(request() for _ in range(4)))
+
+        starts.sort()
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert all(gap >= 0.015 for gap in gaps)
@@ -0,0 +1,96 @@
+"""Unit tests for the shared parsed HTML document."""
+
+from unittest.mock import patch
+
+import pytest
+
+from python_scripts.agents.scrapping.extractor import AdaptiveExtractor
+from python_scripts.ingestion.article_detector import ArticleDetector
+from python_scripts.ingestion.html_document import ParsedDocument
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Guide &amp; astuces</title>
+    <meta name="description" content="Un guide complet">
+    <meta name="author" content="Jeanne Martin">
+    <meta property="og:type" content="article">
+    <meta property="og:title" content="Guide OG">
+    <meta property="article:published_time" content="2024-05-02T08:00:00+00:00">
+    <link rel="canonical" href="https://example.com/blog/guide">
+    <script type="application/ld+json">{"@type": "BlogPosting", "headline": "Guide JSON-LD"}</script>
+    <script type="application/ld+json">not json</script>
+    <style>body { color: red; }</style>
+</head>
+<body>
+    <header><nav>Accueil Blog Contact</nav></header>
+    <article class="post">
+        <h1 class="entry-title">Guide complet</h1>
+        <time datetime="2024-05-02">2 mai 2024</time>
+        <div class="entry-content"><p>%s</p><script>var tracking = 1;</script></div>
+    </article>
+    <footer>Mentions légales</footer>
+</body>
+</html>""" % ("Contenu de l'article. " * 60)
+
+
+@pytest.mark.unit
+class TestParsedDocument:
+    """Test ParsedDocument."""
+
+    def test_metadata_is_collected_in_one_pass(self) -> None:
+        """Test title, meta, Open Graph, JSON-LD and canonical extraction."""
+        metadata = ParsedDocument(PAGE, "https://example.com/blog/guide").metadata
+
+        assert metadata["title"] == "Guide & astuces"
+        assert metadata["description"] == "Un guide complet"
+        assert metadata["author"] == "Jeanne Martin"
+        assert metadata["canonical"] == "https://example.com/blog/guide"
+        assert metadata["opengraph"]["og:type"] == "article"
+        assert metadata["opengraph"]["article:published_time"].startswith("2024-05-02")
+        assert metadata["jsonld"] == [{"@type": "BlogPosting", "headline": "Guide JSON-LD"}]
+
+    def test_text_skips_scripts_and_styles(self) -> None:
+        """Test that the visible text excludes script and style content."""
+        text = ParsedDocument(PAGE).text()
+
+        assert "Guide complet" in text
+        assert "tracking" not in text and "color: red" not in text
+
+    def test_unparsable_input_gives_an_empty_document(self) -> None:
+        """Test empty and whitespace-only pages."""
+        for html in ("", "   \n", '<?xml version="1.0" encoding="utf-8"?><html><body>x</body></html>'):
+            document = ParsedDocument(html)
+            assert document.title == ""
+            assert isinstance(document.text(), str)
+
+
+@pytest.mark.unit
+class TestSharedDocumentConsumers:
+    """Test that extractors reuse the parsed document."""
+
+    def test_extractor_reuses_the_parsed_document(self) -> None:
+        """Test that extraction does not parse the page with lxml again."""
+        extractor = AdaptiveExtractor(use_trafilatura=False)
+        document = ParsedDocument(PAGE, "https://example.com/blog/guide")
+
+        with patch("python_scripts.ingestion.html_document.lxml.html.document_fromstring") as parse:
+            article = extractor.extract_article(document, document.url, {})
+
+        parse.assert_not_called()
+        assert article["title"] == "Guide JSON-LD"
+        assert article["published_time"] == "2024-05-02T08:00:00+00:00"
+        assert article["word_count"] > 150
+        assert extractor.validate_article(article) == (True, None)
+
+    def test_detector_does_not_modify_the_shared_tree(self) -> None:
+        """Test detection on a shared document, which stays intact for other consumers."""
+        document = ParsedDocument(PAGE)
+        before = document.text()
+
+        is_article, score, metadata = ArticleDetector().detect(document)
+
+        assert is_article is True
+        assert metadata["has_date"] and metadata["has_author"] and metadata["has_article_tag"]
+        assert score == pytest.approx(1.05)
+        assert document.text() == before
@@ -0,0 +1,82 @@
+"""Unit tests for the compressed HTML store of the crawl cache."""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from python_scripts.database import crud_crawl_cache
+from python_scripts.ingestion.crawl_cache import CrawlCacheLayer, migrate_inline_html
+from python_scripts.ingestion.html_store import HtmlBlobStore, LocalBlobBackend
+
+HTML = "<html><head><title>Page</title></head><body>" + "<p>Contenu répété</p>" * 500 + "</body></html>"
+
+
+@pytest.fixture
+def store(tmp_path) -> HtmlBlobStore:
+    """Store on a temporary directory."""
+    return HtmlBlobStore(backend=LocalBlobBackend(str(tmp_path / "blobs")))
+
+
+@pytest.mark.unit
+class TestHtmlBlobStore:
+    """Test HtmlBlobStore."""
+
+    def test_roundtrip_and_deduplication(self, store: HtmlBlobStore) -> None:
+        """Test that identical pages are stored once, compressed."""
+        ref = store.put(HTML)
+
+        assert store.put(HTML) == ref
+        assert store.get(ref) == HTML
+        stats = store.get_stats()
+        assert stats["writes"] == 1 and stats["deduplicated"] == 1
+        assert stats["stored_bytes"] < stats["raw_bytes"] / 10
+
+    def test_zlib_blobs_stay_readable(self, tmp_path) -> None:
+        """Test that a store reads blobs written with another codec."""
+        backend = LocalBlobBackend(str(tmp_path / "blobs"))
+        ref = HtmlBlobStore(backend=backend, codec="zlib").put(HTML)
+
+        assert ref.startswith("zlib:")
+        assert HtmlBlobStore(backend=backend).get(ref) == HTML
+        assert HtmlBlobStore(backend=backend).get("zlib:" + "0" * 64) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCrawlCacheHtml:
+    """Test the HTML offloading of the crawl cache."""
+
+    async def test_put_keeps_only_the_reference(self, store: HtmlBlobStore) -> None:
+        """Test that rows store the reference and HTML is loaded on demand."""
+        layer = CrawlCacheLayer(html_store=store)
+        row = SimpleNamespace(expires_at=datetime.now(timezone.utc) + timedelta(days=30))
+
+        with patch.object(crud_crawl_cache, "create_or_update_crawl_cache", AsyncMock(return_value=row)) as save:
+            page = await layer.put(MagicMock(), "https://example.com", "Texte", {"title": "Page", "html": HTML})
+
+        saved_metadata = save.await_args.kwargs["cached_metadata"]
+        assert "html" not in saved_metadata
+        assert saved_metadata["html_ref"] == page.metadata["html_ref"]
+        assert page.size < len(HTML)
+        assert store.get_stats()["reads"] == 0
+        assert await layer.get_html(page) == HTML
+
+    async def test_migrate_inline_html(self, store: HtmlBlobStore) -> None:
+        """Test that existing rows are rewritten by batch with a shared blob."""
+        batches = [
+            [(1, {"title": "A", "html": HTML}), (2, {"title": "B", "html": HTML})],
+            [(5, {"title": "C", "html": "<html></html>"})],
+            [],
+        ]
+        with patch.object(
+            crud_crawl_cache, "get_crawl_cache_with_inline_html", AsyncMock(side_effect=batches)
+        ) as fetch, patch.object(crud_crawl_cache, "update_crawl_cache_metadata", AsyncMock()) as update:
+            stats = await migrate_inline_html(MagicMock(), store, batch_size=2)
+
+        assert stats["rows"] == 3 and stats["deduplicated"] == 1
+        assert [call.args[1] for call in fetch.await_args_list] == [0, 2, 5]
+        first_batch = update.await_args_list[0].args[1]
+        assert first_batch[1]["html_ref"] == first_batch[2]["html_ref"]
+        assert all("html" not in metadata for metadata in first_batch.values())
@@ -0,0 +1,116 @@
+"""Unit tests for the shared pooled HTTP clients."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from python_scripts.utils.http_client import (
+    HttpClientRegistry,
+    PooledTransport,
+    http_client_registry,
+    pooled_client,
+)
+
+
+def _make_transport(handler, max_connections_per_host: int = 2) -> PooledTransport:
+    """Build a PooledTransport whose network layer is replaced by a mock."""
+    transport = PooledTransport(
+        max_connections=10,
+        max_connections_per_host=max_connections_per_host,
+        keepalive_expiry=5.0,
+        http2=False,
+    )
+    transport._transport = httpx.MockTransport(handler)
+    return transport
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPooledTransport:
+    """Test PooledTransport."""
+
+    async def test_per_host_limit(self) -> None:
+        """Test that concurrent requests to one host are capped."""
+        in_flight = {"a.com": 0, "b.com": 0}
+        max_in_flight = {"a.com": 0, "b.com": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            in_flight[host] += 1
+            max_in_flight[host] = max(max_in_flight[host], in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return httpx.Response(200, text="ok")
+
+        transport = _make_transport(handler, max_connections_per_host=2)
+        async with httpx.AsyncClient(transport=transport) as client:
+            urls = [f"https://{host}/{i}" for host in ("a.com", "b.com") for i in range(5)]
+            responses = await asyncio.gather(*(client.get(url) for url in urls))
+
+        assert all(r.status_code == 200 for r in responses)
+        assert max_in_flight == {"a.com": 2, "b.com": 2}
+        assert transport.metrics.requests == 10
+        assert transport.metrics.waiting_for_host_slot > 0
+
+    async def test_errors_release_host_slot(self) -> None:
+        """Test that a failed request does not leak its host slot."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection failed", request=request)
+
+        transport = _make_transport(handler, max_connections_per_host=1)
+        async with httpx.AsyncClient(transport=transport) as client:
+            for _ in range(3):
+                with pytest.raises(httpx.ConnectError):
+                    await asyncio.wait_for(client.get("https://a.com/"), timeout=1.0)
+
+        assert transport.metrics.errors == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestHttpClientRegistry:
+    """Test HttpClientRegistry and pooled_client."""
+
+    async def test_shared_client_per_profile(self) -> None:
+        """Test that a started registry returns one client per profile."""
+        registry = HttpClientRegistry()
+        await registry.start()
+        try:
+            crawl = registry.get_client("crawl")
+            assert registry.get_client("crawl") is crawl
+            assert registry.get_client("default") is not crawl
+            assert set(registry.get_metrics()["profiles"]) == {"crawl", "default"}
+        finally:
+            await registry.close()
+
+        assert crawl.is_closed
+        assert not registry.is_started
+
+    async def test_clients_of_a_previous_loop_are_closed(self) -> None:
+        """Test that a loop change closes the old clients instead of dropping them."""
+        registry = HttpClientRegistry()
+        await registry.start()
+        try:
+            # Stopped loop (e.g. a previous asyncio.run): closed from the current loop
+            registry._loop = asyncio.new_event_loop()
+            registry._loop.close()
+            stale = registry._clients["crawl"] = registry.build_client("crawl")
+
+            fresh = registry.get_client("crawl")
+            await asyncio.gather(*registry._closing)
+
+            assert fresh is not stale
+            assert stale.is_closed and not fresh.is_closed
+        finally:
+            await registry.close()
+
+    async def test_pooled_client_without_registry(self) -> None:
+        """Test that pooled_client falls back to a short-lived client."""
+        assert not http_client_registry.is_started
+
+        async with pooled_client("crawl") as client:
+            assert "Mozilla" in client.headers["User-Agent"]
+
+        assert client.is_closed
@@ -0,0 +1,133 @@
+"""Unit tests for incremental trend clustering."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("bertopic")
+
+from python_scripts.agents.trend_pipeline.clustering.bertopic_clusterer import BertopicClusterer
+from python_scripts.agents.trend_pipeline.clustering.config import ClusteringConfig
+
+
+class FakeTopicModel:
+    """Minimal stand-in for a fitted BERTopic model."""
+
+    def __init__(self, centers: np.ndarray):
+        self.centers = centers
+        self.embedding_model = None
+
+    def transform(self, documents, embeddings):
+        distances = np.linalg.norm(embeddings[:, None, :] - self.centers[None, :, :], axis=2)
+        return distances.argmin(axis=1).tolist(), None
+
+    def get_topic_info(self):
+        return pd.DataFrame(
+            {
+                "Topic": [-1, 0, 1],
+                "Count": [0, 10, 10],
+                "Name": ["-1_outliers", "0_cloud", "1_seo"],
+                "Representative_Docs": [[], [], []],
+            }
+        )
+
+    def get_topic(self, topic_id):
+        return [("word", 0.5)]
+
+
+def _corpus(centers: np.ndarray, count: int, prefix: str):
+    """Build embeddings around the centers with document IDs."""
+    rng = np.random.default_rng(len(prefix) + count)
+    embeddings = np.vstack([centers[i % len(centers)] + rng.normal(scale=0.01, size=4) for i in range(count)])
+    ids = [f"{prefix}-{i}" for i in range(count)]
+    return embeddings, ids
+
+
+@pytest.mark.unit
+class TestIncrementalClustering:
+    """Test BertopicClusterer.cluster_incremental."""
+
+    @pytest.fixture
+    def clusterer(self, tmp_path) -> BertopicClusterer:
+        config = ClusteringConfig(client_domain="example.com", min_articles=10, model_store_dir=str(tmp_path))
+        return BertopicClusterer(config)
+
+    def _fit(self, clusterer: BertopicClusterer, embeddings, ids, centers):
+        """Simulate a full fit and persist its state."""
+        topics = [i % 2 for i in range(len(ids))]
+        clusterer._model = FakeTopicModel(centers)
+        result = {
+            "success": True,
+            "topics": topics,
+            "model": clusterer._model,
+            "centroids": clusterer._calculate_centroids(embeddings, topics),
+        }
+        clusterer._save_state(clusterer._state_key(), ids, embeddings, result)
+        return result
+
+    def test_new_documents_are_assigned_without_refit(self, clusterer: BertopicClusterer) -> None:
+        """Test that a few new documents are predicted with the stored model."""
+        centers = np.array([[1.0, 0, 0, 0], [0, 1.0, 0, 0]])
+        embeddings, ids = _corpus(centers, 20, "old")
+        self._fit(clusterer, embeddings, ids, centers)
+
+        new_embeddings, new_ids = _corpus(centers, 3, "new")
+        with patch.object(clusterer, "cluster") as full_fit:
+            result = clusterer.cluster_incremental(
+                ["text"] * 23, np.vstack([embeddings, new_embeddings]), ids + new_ids
+            )
+
+        full_fit.assert_not_called()
+        assert result["clustering_mode"] == "incremental"
+        assert result["topics"][-3:] == [0, 1, 0]
+        assert sorted(c["size"] for c in result["clusters"]) == [11, 12]
+
+    def test_refit_when_new_points_ratio_is_exceeded(self, clusterer: BertopicClusterer) -> None:
+        """Test that many new documents trigger a full refit."""
+        centers = np.array([[1.0, 0, 0, 0], [0, 1.0, 0, 0]])
+        embeddings, ids = _corpus(centers, 20, "old")
+        self._fit(clusterer, embeddings, ids, centers)
+
+        new_embeddings, new_ids = _corpus(centers, 10, "new")
+        with patch.object(clusterer, "cluster", return_value={"success": False}) as full_fit:
+            result = clusterer.cluster_incremental(
+                ["text"] * 30, np.vstack([embeddings, new_embeddings]), ids + new_ids
+            )
+
+        full_fit.assert_called_once()
+        assert result["refit_reason"] == "new_points_ratio"
+
+    def test_refit_when_centroids_drift(self, clusterer: BertopicClusterer) -> None:
+        """Test that a moved topic centroid triggers a full refit."""
+        centers = np.array([[1.0, 0, 0, 0], [0, 1.0, 0, 0]])
+        embeddings, ids = _corpus(centers, 20, "old")
+        self._fit(clusterer, embeddings, ids, centers)
+
+        # Same documents, but topic 0 embeddings have moved
+        moved = embeddings.copy()
+        moved[::2] = np.array([0, 0, 1.0, 0])
+        with patch.object(clusterer, "cluster", return_value={"success": False}) as full_fit:
+            result = clusterer.cluster_incremental(["text"] * 20, moved, ids)
+
+        full_fit.assert_called_once()
+        assert result["refit_reason"] == "drift"
+
+    @pytest.mark.parametrize("with_embeddings, loads_model", [(True, False), (False, True)])
+    def test_worker_fit_does_not_load_the_embedding_model(self, tmp_path, with_embeddings, loads_model) -> None:
+        """Test that load_embedding_model=False only loads the model to embed texts."""
+        config = ClusteringConfig(client_domain="example.com", min_articles=10, model_store_dir=str(tmp_path))
+        clusterer = BertopicClusterer(config, load_embedding_model=False)
+        embeddings, _ = _corpus(np.eye(4)[:2], 20, "doc")
+        topic_model = MagicMock()
+        topic_model.fit_transform.return_value = ([i % 2 for i in range(20)], None)
+
+        module = "python_scripts.agents.trend_pipeline.clustering.bertopic_clusterer"
+        with patch(f"{module}.get_embedding_model") as get_embedding_model, patch(
+            f"{module}.BERTopic", return_value=topic_model
+        ) as bertopic:
+            clusterer.cluster(["text"] * 20, embeddings if with_embeddings else None)
+
+        assert get_embedding_model.called is loads_model
+        assert (bertopic.call_args.kwargs["embedding_model"] is None) is not loads_model
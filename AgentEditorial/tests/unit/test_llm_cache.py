@@ -0,0 +1,105 @@
+"""Unit tests for the persistent LLM response cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from python_scripts.agents.utils.llm_cache import (
+    CachedLLM,
+    LLMResponseCache,
+    invalidate_cached_response,
+    make_cache_key,
+)
+
+
+def _cached_llm(cache: LLMResponseCache, response: str = '{"ok": true}', temperature: float = 0.3, validate=None):
+    """Wrap a mock LLM returning a fixed response."""
+    llm = MagicMock()
+    llm.invoke.return_value = response
+    llm.ainvoke = AsyncMock(return_value=response)
+    return CachedLLM(llm, "phi3:medium", temperature, "competitor_relevance", cache, validate=validate), llm
+
+
+@pytest.mark.unit
+class TestLLMResponseCache:
+    """Test LLMResponseCache and CachedLLM."""
+
+    def test_repeated_prompt_is_served_from_cache(self, tmp_path) -> None:
+        """Test that the second identical prompt does not reach the model."""
+        cache = LLMResponseCache(path=str(tmp_path / "llm.sqlite"))
+        cached_llm, llm = _cached_llm(cache)
+
+        first = cached_llm.invoke("Classify example.com")
+        second = cached_llm.invoke("Classify   example.com ")
+
+        assert first == second == '{"ok": true}'
+        assert llm.invoke.call_count == 1
+        stats = cache.get_stats()["models"]["phi3:medium"]
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["saved_tokens"] > 0
+
+    @pytest.mark.asyncio
+    async def test_ainvoke_uses_the_same_entries(self, tmp_path) -> None:
+        """Test that async and sync calls share the cache and survive a reopen."""
+        path = str(tmp_path / "llm.sqlite")
+        cached_llm, _ = _cached_llm(LLMResponseCache(path=path))
+        cached_llm.invoke("prompt")
+
+        reopened, llm = _cached_llm(LLMResponseCache(path=path))
+        assert await reopened.ainvoke("prompt") == '{"ok": true}'
+        llm.ainvoke.assert_not_called()
+
+    def test_key_depends_on_model_temperature_and_template(self) -> None:
+        """Test that calls differing by model, temperature or template do not collide."""
+        base = make_cache_key("phi3:medium", 0.3, "relevance", "prompt")
+
+        assert base == make_cache_key("phi3:medium", 0.3, "relevance", " prompt ")
+        assert base != make_cache_key("llama3:8b", 0.3, "relevance", "prompt")
+        assert base != make_cache_key("phi3:medium", 0.7, "relevance", "prompt")
+        assert base != make_cache_key("phi3:medium", 0.3, "synthesis", "prompt")
+
+    def test_expired_entries_and_eviction(self, tmp_path) -> None:
+        """Test TTL expiry and the max entries cap."""
+        expired = LLMResponseCache(path=str(tmp_path / "ttl.sqlite"), ttl_seconds=-1)
+        cached_llm, llm = _cached_llm(expired)
+        cached_llm.invoke("prompt")
+        cached_llm.invoke("prompt")
+        assert llm.invoke.call_count == 2
+
+        capped = LLMResponseCache(path=str(tmp_path / "cap.sqlite"), max_entries=2)
+        for i in range(3):
+            capped.put(f"key-{i}", "phi3:medium", "t", "response", 10, 1.0)
+        assert capped.get_stats()["entries"] == 2
+        assert capped.get("key-0", "phi3:medium") is None
+
+    def test_rejected_responses_are_not_cached(self, tmp_path) -> None:
+        """Test the validate callback and invalidate for responses the caller cannot parse."""
+        cache = LLMResponseCache(path=str(tmp_path / "llm.sqlite"))
+        cached_llm, llm = _cached_llm(cache, response="not json", validate=lambda r: r.startswith("{"))
+        cached_llm.invoke("prompt")
+        cached_llm.invoke("prompt")
+        assert llm.invoke.call_count == 2
+        assert cache.get_stats()["entries"] == 0
+
+        cached_llm, llm = _cached_llm(cache)
+        cached_llm.invoke("other prompt")
+        invalidate_cached_response(cached_llm, "other prompt")
+        invalidate_cached_response(llm, "other prompt")  # Not cached: no-op
+        cached_llm.invoke("other prompt")
+        assert llm.invoke.call_count == 2
+
+    def test_create_llm_wraps_only_cached_templates(self, tmp_path) -> None:
+        """Test that create_llm returns a CachedLLM only for low-temperature templates."""
+        from python_scripts.agents.utils import llm_factory
+
+        cache = LLMResponseCache(path=str(tmp_path / "llm.sqlite"))
+        with patch.object(llm_factory, "get_llm_cache", return_value=cache):
+            assert isinstance(
+                llm_factory.create_llm("phi3:medium", temperature=0.3, cache_template="relevance"), CachedLLM
+            )
+            assert not isinstance(llm_factory.create_llm("phi3:medium", temperature=0.3), CachedLLM)
+            # Sampled analysis calls are not cached by default
+            assert not isinstance(
+                llm_factory.create_llm("phi3:medium", temperature=0.7, cache_template="editorial_analysis"),
+                CachedLLM,
+            )
@@ -0,0 +1,207 @@
+"""Unit tests for the VRAM-aware model call scheduler, against a fake Ollama server."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+import pytest
+
+from python_scripts.agents.agent_analyse_client.model_scheduler import (
+    ModelCallScheduler,
+    OllamaResidency,
+    plan_batches,
+)
+from python_scripts.config.settings import settings
+
+GB = 1024**3
+MODELS = ["llama3:8b", "mistral:7b", "phi3:medium"]
+
+
+class FakeOllama:
+    """
+    Minimal Ollama server: /api/ps, /api/tags and /api/generate.
+
+    Each model answers after a configurable latency. At most `capacity`
+    models are resident; generating with another model evicts the least
+    recently loaded one and counts a load.
+    """
+
+    def __init__(
+        self,
+        latencies: Dict[str, float],
+        capacity: int = 3,
+        loaded: Optional[List[str]] = None,
+        response: str = '{"language_level": "advanced", "editorial_tone": "expert"}',
+    ) -> None:
+        self.latencies = latencies
+        self.capacity = capacity
+        self.loaded: List[str] = list(loaded or [])
+        self.response = response
+        self.loads = 0
+        self.calls: List[str] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:
+                pass
+
+            def _send(self, payload: dict) -> None:
+                body = (json.dumps(payload) + "\n").encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                with fake._lock:
+                    if self.path == "/api/ps":
+                        models = [{"name": m, "size_vram": 5 * GB} for m in fake.loaded]
+                    else:
+                        models = [{"name": m, "size": 4 * GB} for m in fake.latencies]
+                self._send({"models": models})
+
+            def do_POST(self) -> None:
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                model = request["model"]
+                with fake._lock:
+                    fake.calls.append(model)
+                    fake.in_flight += 1
+                    fake.peak_in_flight = max(fake.peak_in_flight, fake.in_flight)
+                    if model not in fake.loaded:
+                        fake.loads += 1
+                        fake.loaded.append(model)
+                        if len(fake.loaded) > fake.capacity:
+                            fake.loaded.pop(0)
+                time.sleep(fake.latencies.get(model, 0.0))
+                with fake._lock:
+                    fake.in_flight -= 1
+                self._send({"model": model, "created_at": "2024-01-01T00:00:00Z", "response": fake.response, "done": True})
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch):
+    """Start fake Ollama servers pointed to by settings.ollama_base_url."""
+    servers = []
+
+    def start(**kwargs) -> FakeOllama:
+        server = FakeOllama(**kwargs)
+        servers.append(server)
+        monkeypatch.setattr(settings, "ollama_base_url", server.url)
+        monkeypatch.setattr(settings, "llm_cache_enabled", False)
+        # Known budget: the GPU probe (VRAMResourceManager import) is not timed
+        monkeypatch.setattr(settings, "ollama_vram_budget_gb", 24.0)
+        return server
+
+    yield start
+    for server in servers:
+        server.close()
+
+
+@pytest.mark.unit
+class TestPlanBatches:
+    """Test plan_batches."""
+
+    def test_models_fitting_the_budget_share_a_batch(self) -> None:
+        """Test that a large enough budget gives a single concurrent batch."""
+        residency = OllamaResidency(model_sizes={m: 4 * GB for m in MODELS}, vram_budget_bytes=24 * GB)
+
+        assert plan_batches(MODELS, residency, run_last="llama3:8b") == [
+            ["mistral:7b", "phi3:medium", "llama3:8b"]
+        ]
+
+    def test_small_budget_runs_loaded_models_first(self) -> None:
+        """Test the swap-minimizing order when only one model fits."""
+        residency = OllamaResidency(
+            loaded={"phi3:medium": 5 * GB},
+            model_sizes={m: 4 * GB for m in MODELS},
+            vram_budget_bytes=6 * GB,
+        )
+
+        assert plan_batches(MODELS, residency, run_last="llama3:8b") == [
+            ["phi3:medium"],
+            ["mistral:7b"],
+            ["llama3:8b"],
+        ]
+
+    def test_unknown_budget_only_groups_loaded_models(self) -> None:
+        """Test that without VRAM information only resident models run together."""
+        residency = OllamaResidency(loaded={"mistral:7b": 5 * GB, "llama3:8b": 5 * GB})
+
+        assert plan_batches(MODELS, residency, max_loaded_models=3) == [
+            ["mistral:7b", "llama3:8b"],
+            ["phi3:medium"],
+        ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestModelCallScheduler:
+    """Test ModelCallScheduler and the editorial analysis against a fake Ollama server."""
+
+    async def test_models_run_concurrently_when_resident(self, fake_ollama) -> None:
+        """Test that the analysis costs the slowest model, not the sum of all."""
+        from python_scripts.agents.agent_analyse_client import EditorialAnalysisAgent
+
+        server = fake_ollama(latencies={m: 0.5 for m in MODELS}, loaded=MODELS)
+        agent = EditorialAnalysisAgent()
+
+        started = time.perf_counter()
+        result = await agent.execute("exec-1", {"content": "Contenu du site"})
+        elapsed = time.perf_counter() - started
+
+        assert server.peak_in_flight == 3
+        assert elapsed < 2.0  # 3 concurrent analyses + synthesis, sequential takes at least 2s
+        assert result["analysis_schedule"]["batches"] == [["mistral:7b", "phi3:medium", "llama3:8b"]]
+        assert all(result["llm_models_used"].values())
+        assert server.loads == 0
+
+    async def test_sequential_order_minimizes_swaps(self, fake_ollama) -> None:
+        """Test that a single-model host loads each model once, synthesis included."""
+        server = fake_ollama(latencies={m: 0.01 for m in MODELS}, capacity=1, loaded=["mistral:7b"])
+        scheduler = ModelCallScheduler(mode="auto", vram_budget_bytes=6 * GB)
+        calls = {
+            model: (lambda model=model: _generate(model))
+            for model in MODELS
+        }
+
+        report = await scheduler.run(calls, run_last="llama3:8b")
+        await _generate("llama3:8b")  # synthesis
+
+        assert report.batches == [["mistral:7b"], ["phi3:medium"], ["llama3:8b"]]
+        assert server.calls == ["mistral:7b", "phi3:medium", "llama3:8b", "llama3:8b"]
+        assert server.loads == 2
+
+    async def test_timed_out_model_gives_partial_analysis(self, fake_ollama) -> None:
+        """Test that a model exceeding its timeout is reported and the others are synthesized."""
+        from python_scripts.agents.agent_analyse_client import EditorialAnalysisAgent
+
+        fake_ollama(latencies={"llama3:8b": 0.01, "mistral:7b": 0.01, "phi3:medium": 2.0}, loaded=MODELS)
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(settings, "ollama_model_timeouts", {"phi3:medium": 0.2})
+            result = await EditorialAnalysisAgent().execute("exec-2", {"content": "Contenu"})
+
+        assert result["partial_analysis"] is True
+        assert "timed out" in result["llm_errors"]["phi3:medium"]
+        assert result["llm_models_used"] == {"llama3:8b": True, "mistral:7b": True, "phi3:medium": False}
+
+
+async def _generate(model: str) -> str:
+    """Call the fake server through the LLM factory."""
+    from python_scripts.agents.utils.llm_factory import create_llm
+
+    return await create_llm(model).ainvoke("prompt")
@@ -0,0 +1,95 @@
+"""Unit tests for batched article indexing in Qdrant."""
+
+from typing import List
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+
+from python_scripts.vectorstore.collection_cache import collection_cache
+from python_scripts.vectorstore.qdrant_client import QdrantClientWrapper
+
+DIMENSION = 1024
+
+
+def _vector(axis: int, noise_axis: int = None, noise: float = 0.0) -> List[float]:
+    """Build a normalized vector mostly aligned with one axis."""
+    vector = np.zeros(DIMENSION, dtype=np.float32)
+    vector[axis] = 1.0
+    if noise_axis is not None:
+        vector[noise_axis] = noise
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+def _article(article_id: int, title: str) -> dict:
+    """Build an article dictionary for index_articles_batch."""
+    return {
+        "article_id": article_id,
+        "domain": "example.com",
+        "title": title,
+        "content_text": "content",
+        "url": f"https://example.com/{article_id}",
+        "url_hash": f"hash-{article_id}",
+    }
+
+
+@pytest.fixture
+def wrapper() -> QdrantClientWrapper:
+    """Qdrant wrapper backed by an in-memory Qdrant instance."""
+    instance = QdrantClientWrapper()
+    instance.client = QdrantClient(":memory:")
+    # Collections known from other tests do not exist on this fresh instance
+    collection_cache.invalidate()
+    return instance
+
+
+@pytest.mark.unit
+class TestIndexArticlesBatch:
+    """Test QdrantClientWrapper.index_articles_batch."""
+
+    def test_indexes_and_detects_duplicates(self, wrapper: QdrantClientWrapper) -> None:
+        """Test duplicates against the collection and inside the batch."""
+        vectors = {
+            "first": _vector(0),
+            "second": _vector(1),
+            "first-copy": _vector(0, noise_axis=5, noise=0.05),
+        }
+
+        def fake_embeddings(texts, batch_size=32):
+            return [vectors[text.split("\n")[0]] for text in texts]
+
+        with patch(
+            "python_scripts.vectorstore.qdrant_client.generate_embeddings_batch",
+            side_effect=fake_embeddings,
+        ):
+            first_run = wrapper.index_articles_batch(
+                [_article(1, "first"), _article(2, "first-copy")],
+                collection_name="test_articles",
+            )
+            second_run = wrapper.index_articles_batch(
+                [_article(3, "second"), _article(4, "first-copy")],
+                collection_name="test_articles",
+                upsert_chunk_size=1,
+            )
+
+        assert [o["status"] for o in first_run] == ["indexed", "duplicate"]
+        assert first_run[1]["point_id"] == first_run[0]["point_id"]
+
+        assert [o["status"] for o in second_run] == ["indexed", "duplicate"]
+        assert str(second_run[1]["point_id"]) == str(first_run[0]["point_id"])
+        assert wrapper.client.count("test_articles").count == 2
+
+    def test_embedding_failure_reports_every_article(self, wrapper: QdrantClientWrapper) -> None:
+        """Test that an embedding failure is reported per article without raising."""
+        with patch(
+            "python_scripts.vectorstore.qdrant_client.generate_embeddings_batch",
+            side_effect=RuntimeError("model unavailable"),
+        ):
+            outcomes = wrapper.index_articles_batch(
+                [_article(1, "a"), _article(2, "b")],
+                collection_name="test_articles",
+            )
+
+        assert [o["status"] for o in outcomes] == ["error", "error"]
+        assert all(o["point_id"] is None and "model unavailable" in o["error"] for o in outcomes)
@@ -0,0 +1,88 @@
+"""Unit tests for the adaptive per-host rate controller."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from python_scripts.ingestion.rate_control import HostRateController, parse_retry_after
+
+
+@pytest.mark.unit
+class TestParseRetryAfter:
+    """Test parse_retry_after."""
+
+    def test_seconds_and_http_date(self) -> None:
+        """Test both Retry-After formats."""
+        in_a_minute = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+
+        assert parse_retry_after("120") == 120.0
+        assert 55 <= parse_retry_after(in_a_minute) <= 60
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestHostRateController:
+    """Test HostRateController."""
+
+    @staticmethod
+    async def _crawl(controller: HostRateController, url: str, status_code: int = 200, **kwargs) -> None:
+        async with controller.slot(url) as ticket:
+            await asyncio.sleep(0.01)
+            ticket.observe(status_code=status_code, **kwargs)
+
+    async def test_concurrency_grows_while_latency_is_flat(self) -> None:
+        """Test the additive increase up to the host ceiling."""
+        controller = HostRateController(initial_limit=1, max_limit=4)
+
+        for _ in range(6):
+            await asyncio.gather(*(self._crawl(controller, "https://fast.com/p") for _ in range(8)))
+
+        state = controller.state("fast.com")
+        assert state.capacity == 4
+        assert state.in_flight == 0 and state.error_rate == 0
+
+    async def test_429_backs_off_once_per_burst_and_honors_retry_after(self) -> None:
+        """Test the multiplicative decrease and the Retry-After pause."""
+        controller = HostRateController(initial_limit=4, max_limit=8)
+
+        await asyncio.gather(
+            *(self._crawl(controller, "https://www.busy.com/p", 429, retry_after=0.2) for _ in range(4))
+        )
+        state = controller.state("busy.com")
+        assert state.capacity == 2
+        assert state.backoffs == 1 and state.errors == 4
+        assert controller.get_stats()["hosts"][0]["blocked_for_s"] > 0
+
+        started = time.monotonic()
+        await self._crawl(controller, "https://busy.com/p")
+        assert time.monotonic() - started >= 0.15
+
+    async def test_timeout_inside_the_slot_counts_as_congestion(self) -> None:
+        """Test that a raised timeout reduces the limit."""
+        controller = HostRateController(initial_limit=4)
+
+        with pytest.raises(asyncio.TimeoutError):
+            async with controller.slot("https://slow.com/p"):
+                raise asyncio.TimeoutError()
+
+        assert controller.state("slow.com").capacity == 2
+
+    async def test_learned_rate_round_trip(self) -> None:
+        """Test export, seeding of a new process and adaptive timeouts."""
+        controller = HostRateController(initial_limit=1, max_limit=6)
+        for _ in range(4):
+            await asyncio.gather(*(self._crawl(controller, "https://site.com/p") for _ in range(4)))
+        saved = controller.export("site.com")
+
+        restarted = HostRateController(initial_limit=1, max_limit=6)
+        restarted.seed("site.com", saved)
+
+        assert restarted.state("site.com").limit == saved["concurrency"] > 1
+        assert restarted.export("site.com") is None
+        assert controller.timeout_for("site.com", 30.0) == 5.0
+        assert restarted.timeout_for("site.com", 30.0) == 30.0
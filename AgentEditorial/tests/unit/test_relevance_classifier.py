@@ -0,0 +1,138 @@
+"""Unit tests for concurrent, memoized LLM relevance classification."""
+
+import asyncio
+import json
+import re
+from typing import Any, List
+from unittest.mock import patch
+
+import pytest
+
+from python_scripts.agents.competitor.classifiers import RelevanceClassifier
+from python_scripts.agents.competitor.config import CompetitorSearchConfig
+from python_scripts.agents.utils.llm_cache import LLMResponseCache
+
+MODULE = "python_scripts.agents.competitor.classifiers"
+CANDIDATES_HEADER = "Candidate domains to evaluate:"
+
+
+class FakeLLM:
+    """Answers with the candidates whose domain contains "esn" (others are left out)."""
+
+    def __init__(self, delay: float = 0.02, garbage: bool = False) -> None:
+        self.delay = delay
+        self.garbage = garbage
+        self.prompts: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def ainvoke(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if self.garbage:
+            return "Je ne peux pas répondre en JSON."
+        domains = re.findall(r"^- (\S+)$", prompt.split(CANDIDATES_HEADER)[1], re.MULTILINE)
+        competitors = [
+            {"domain": d, "relevance_score": 0.9, "confidence_score": 0.8, "reason": "ESN"}
+            for d in domains
+            if "esn" in d
+        ]
+        return "Voici le résultat : " + json.dumps({"competitors": competitors})
+
+
+def _candidates(count: int) -> List[dict]:
+    return [{"domain": f"{'esn' if i % 2 else 'shop'}-{i}.fr"} for i in range(count)]
+
+
+def _classifier(**config: Any) -> RelevanceClassifier:
+    values = {"relevance_concurrency": 3, "relevance_batch_size": 4}
+    values.update(config)
+    return RelevanceClassifier(CompetitorSearchConfig(**values))
+
+
+@pytest.fixture
+def memo(tmp_path) -> LLMResponseCache:
+    return LLMResponseCache(path=str(tmp_path / "llm.sqlite"), ttl_seconds=3600, max_entries=1000)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRelevanceClassifier:
+    """Test RelevanceClassifier.classify_batch."""
+
+    async def test_batches_run_concurrently_with_a_shared_prefix(self) -> None:
+        """Test bounded parallel dispatch, shared prompt prefix and the merge."""
+        llm = FakeLLM()
+        classifier = _classifier()
+        context = {"keywords": {"primary": ["cloud", "développement"]}, "editorial_tone": "expert"}
+
+        with patch(f"{MODULE}.get_phi3_llm", return_value=llm), patch(
+            f"{MODULE}.get_llm_cache", return_value=None
+        ):
+            classified = await classifier.classify_batch("cible.fr", _candidates(20), context)
+
+        assert len(llm.prompts) == 5
+        assert llm.max_in_flight == 3
+        prefixes = {prompt.split(CANDIDATES_HEADER)[0] for prompt in llm.prompts}
+        assert len(prefixes) == 1 and "développement" in prefixes.pop()
+        # ESN candidates scored by the LLM, the others left out then dropped by the fallback
+        assert [c["domain"] for c in classified] == [f"esn-{i}.fr" for i in range(1, 20, 2)]
+        assert all(c["relevance_score"] == 0.9 for c in classified)
+
+    async def test_classifications_are_memoized_across_runs(self, memo: LLMResponseCache) -> None:
+        """Test that a second run only sends the new candidates."""
+        context = {"keywords": {"primary": ["cloud"]}}
+        first_llm, second_llm = FakeLLM(), FakeLLM()
+
+        with patch(f"{MODULE}.get_llm_cache", return_value=memo):
+            with patch(f"{MODULE}.get_phi3_llm", return_value=first_llm):
+                first = await _classifier().classify_batch("cible.fr", _candidates(8), context)
+            with patch(f"{MODULE}.get_phi3_llm", return_value=second_llm):
+                second = await _classifier().classify_batch("cible.fr", _candidates(10), context)
+
+        assert len(first_llm.prompts) == 2
+        assert len(second_llm.prompts) == 1
+        assert "- shop-8.fr\n- esn-9.fr" in second_llm.prompts[0]
+        assert "esn-1.fr" not in second_llm.prompts[0]
+        assert [c["domain"] for c in second] == [c["domain"] for c in first] + ["esn-9.fr"]
+
+    async def test_batch_size_adapts_to_parse_failures(self) -> None:
+        """Test that unparsable responses shrink the batches, then successes grow them."""
+        classifier = _classifier(
+            relevance_concurrency=1,
+            relevance_batch_size=16,
+            relevance_min_batch_size=4,
+            relevance_max_batch_size=20,
+        )
+
+        with patch(f"{MODULE}.get_llm_cache", return_value=None):
+            with patch(f"{MODULE}.get_phi3_llm", return_value=FakeLLM(delay=0, garbage=True)):
+                classified = await classifier.classify_batch("cible.fr", _candidates(96), {})
+            assert classifier.batch_size == 4
+            # Failed batches fall back to the signal-based scores
+            assert classified == []
+
+            with patch(f"{MODULE}.get_phi3_llm", return_value=FakeLLM(delay=0)):
+                await classifier.classify_batch("cible.fr", _candidates(64), {})
+            assert classifier.batch_size > 4
+
+    async def test_sync_llm_runs_in_a_thread(self) -> None:
+        """Test the invoke() fallback does not block the event loop."""
+
+        class SyncLLM:
+            def invoke(self, prompt: str) -> str:
+                return json.dumps({"competitors": [{"domain": "esn-1.fr", "relevance_score": 0.8}]})
+
+        classifier = _classifier()
+        with patch(f"{MODULE}.get_phi3_llm", return_value=SyncLLM()), patch(
+            f"{MODULE}.get_llm_cache", return_value=None
+        ), patch(f"{MODULE}.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            classified = await classifier.classify_batch("cible.fr", _candidates(2), {})
+
+        assert to_thread.call_count == 1
+        assert [(c["domain"], c["relevance_score"]) for c in classified] == [("esn-1.fr", 0.8)]
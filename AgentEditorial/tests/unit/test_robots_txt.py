@@ -1,10 +1,23 @@
 """Unit tests for robots.txt parser."""
 
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
+from python_scripts.ingestion import robots_txt
 from python_scripts.ingestion.robots_txt import RobotsTxtParser, fetch_robots_txt, parse_robots_txt
 
 
+@pytest.fixture(autouse=True)
+def clear_robots_cache():
+    """Isolate tests from the process-level robots.txt cache."""
+    robots_txt.robots_cache.clear()
+    yield
+    robots_txt.robots_cache.clear()
+
+
 @pytest.mark.unit
 class TestRobotsTxtParser:
     """Test RobotsTxtParser class."""
@@ -226,3 +239,99 @@ class TestParseRobotsTxt:
         parser = await parse_robots_txt("example.com")
         assert parser is None
 
+
+
+@pytest.mark.unit
+class TestRobotsRuleMatcher:
+    """Test the compiled longest-match rules."""
+
+    def test_longest_match_wins(self) -> None:
+        """Test that the most specific rule wins regardless of order."""
+        content = """
+User-agent: *
+Allow: /shop/public
+Disallow: /shop
+Disallow: /shop/public/drafts
+"""
+        parser = RobotsTxtParser(content, "https://example.com")
+        assert parser.is_allowed("https://example.com/shop/cart") is False
+        assert parser.is_allowed("https://example.com/shop/public/item") is True
+        assert parser.is_allowed("https://example.com/shop/public/drafts/1") is False
+
+    def test_equal_length_prefers_allow(self) -> None:
+        """Test that Allow wins over a Disallow of the same length."""
+        parser = RobotsTxtParser("User-agent: *\nDisallow: /page\nAllow: /page", "https://example.com")
+        assert parser.is_allowed("https://example.com/page") is True
+
+    def test_wildcards_and_end_anchor(self) -> None:
+        """Test "*" inside patterns, "$" anchors and query strings."""
+        content = """
+User-agent: *
+Disallow: /*.pdf$
+Disallow: /search?*q=
+Disallow: /*/private/
+"""
+        parser = RobotsTxtParser(content, "https://example.com")
+        assert parser.is_allowed("https://example.com/docs/file.pdf") is False
+        assert parser.is_allowed("https://example.com/docs/file.pdf?v=2") is True
+        assert parser.is_allowed("https://example.com/search?lang=fr&q=test") is False
+        assert parser.is_allowed("https://example.com/search") is True
+        assert parser.is_allowed("https://example.com/team/private/notes") is False
+        assert parser.is_allowed("https://example.com/private/") is True
+
+    def test_grouped_user_agents_share_rules(self) -> None:
+        """Test that consecutive User-agent lines form one group."""
+        content = """
+User-agent: BotA
+User-agent: BotB
+Disallow: /internal/  # comment
+
+User-agent: *
+Disallow: /tmp/
+"""
+        parser = RobotsTxtParser(content, "https://example.com")
+        assert parser.is_allowed("https://example.com/internal/x", "BotA") is False
+        assert parser.is_allowed("https://example.com/internal/x", "botb") is False
+        assert parser.is_allowed("https://example.com/internal/x") is True
+        assert parser.is_allowed("https://example.com/tmp/x", "OtherBot") is False
+
+    def test_many_urls_are_checked_quickly(self) -> None:
+        """Test that checking 10k URLs against one domain stays cheap."""
+        rules = "\n".join(f"Disallow: /section-{i}/*/draft$" for i in range(200))
+        parser = RobotsTxtParser(f"User-agent: *\n{rules}\nDisallow: /admin/", "https://example.com")
+        urls = [f"https://example.com/section-{i % 300}/article-{i}/draft" for i in range(10000)]
+
+        started = time.perf_counter()
+        blocked = sum(not parser.is_allowed(url) for url in urls)
+        elapsed = time.perf_counter() - started
+
+        assert blocked == sum(1 for i in range(10000) if i % 300 < 200)
+        assert elapsed < 1.0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRobotsCache:
+    """Test the process-level robots.txt cache."""
+
+    async def test_concurrent_lookups_fetch_once(self) -> None:
+        """Test that a domain is fetched once for many concurrent URLs."""
+
+        async def fetch(domain: str) -> str:
+            await asyncio.sleep(0.01)
+            return "User-agent: *\nDisallow: /admin/"
+
+        with patch.object(robots_txt, "fetch_robots_txt", AsyncMock(side_effect=fetch)) as fetch_mock:
+            parsers = await asyncio.gather(*(parse_robots_txt("example.com") for _ in range(20)))
+
+        assert fetch_mock.await_count == 1
+        assert all(parser is parsers[0] for parser in parsers)
+        assert robots_txt.robots_cache.get_stats()["entries"] == 1
+
+    async def test_missing_robots_txt_is_cached(self) -> None:
+        """Test that a domain without robots.txt is not fetched again."""
+        with patch.object(robots_txt, "fetch_robots_txt", AsyncMock(return_value=None)) as fetch_mock:
+            assert await parse_robots_txt("example.com") is None
+            assert await parse_robots_txt("example.com") is None
+
+        assert fetch_mock.await_count == 1
@@ -0,0 +1,232 @@
+"""Unit tests for the enhanced scraping agent workflow."""
+
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from python_scripts.agents.scrapping.agent import EnhancedScrapingAgent
+from python_scripts.agents.scrapping.crud import save_discovery_log, update_site_discovery_profile
+from python_scripts.agents.scrapping.extraction_engine import ExtractionOutcome
+from python_scripts.agents.scrapping.scheduler import CrawlScheduler
+from python_scripts.database.models import DiscoveryLog
+
+AGENT = "python_scripts.agents.scrapping.agent"
+
+
+class FakeSession:
+    """AsyncSession stand-in: flushed work is lost unless committed."""
+
+    def __init__(self) -> None:
+        self.pending: List[Any] = []
+        self.committed: List[Any] = []
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        # Closing a session rolls back what was not committed
+        self.pending.clear()
+
+    def add(self, instance: Any) -> None:
+        self.pending.append(instance)
+
+    async def execute(self, statement: Any) -> MagicMock:
+        self.pending.append(statement)
+        return MagicMock()
+
+    async def flush(self) -> None:
+        pass
+
+    async def commit(self) -> None:
+        self.committed.extend(self.pending)
+        self.pending.clear()
+
+    async def rollback(self) -> None:
+        self.pending.clear()
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        # SAVEPOINT: an error only undoes the work done inside the block
+        savepoint = len(self.pending)
+        try:
+            yield
+        except Exception:
+            del self.pending[savepoint:]
+            raise
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestEnhancedScrapingAgentSessions:
+    """Test the per-domain sessions of concurrent workflows."""
+
+    async def test_domain_writes_are_committed_with_parallel_domains(self) -> None:
+        """Test that the discovery log and profile feedback survive when max_domains > 1."""
+        sessions: List[FakeSession] = []
+
+        def session_factory() -> FakeSession:
+            session = FakeSession()
+            sessions.append(session)
+            return session
+
+        async def fake_discover(db_session, domain, max_articles, **kwargs):
+            await save_discovery_log(db_session, domain, operation="discovery", status="success")
+            await update_site_discovery_profile(db_session, domain, {"total_urls_discovered": 3})
+            return {"articles": [], "statistics": {"valid": 0}}
+
+        agent = EnhancedScrapingAgent()
+        agent.discover_and_scrape_articles = fake_discover
+
+        result = await agent.execute(
+            uuid4(),
+            {"domains": ["a.example", "b.example"], "max_parallel_domains": 2},
+            db_session=MagicMock(),
+            session_factory=session_factory,
+        )
+
+        assert set(result["results_by_domain"]) == {"a.example", "b.example"}
+        assert len(sessions) == 2
+        for session in sessions:
+            assert any(isinstance(item, DiscoveryLog) for item in session.committed)
+            assert len(session.committed) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestIncrementalSitemapWatermark:
+    """Test when last_crawled_at (the incremental sitemap watermark) advances."""
+
+    async def _run(self, sitemap_count: int, max_articles: int, page_budget: int = 0) -> Dict[str, Any]:
+        """Scrape a sitemap-only domain and return the profile feedback update."""
+        profile = MagicMock(
+            last_profiled_at=datetime.now(timezone.utc),
+            last_crawled_at=datetime.now(timezone.utc) - timedelta(days=3),
+            has_rest_api=False,
+            rss_feeds=[],
+            sitemap_urls=["https://a.example/sitemap.xml"],
+            crawl_rate_state=None,
+        )
+        sitemap_urls = [f"https://a.example/blog/2024/01/article-{i}" for i in range(sitemap_count)]
+
+        agent = EnhancedScrapingAgent()
+        agent.discovery.discover_via_sitemap = AsyncMock(return_value=sitemap_urls)
+        agent.discovery.discover_via_heuristics = AsyncMock(return_value=[])
+        agent.extraction_engine.process_window = AsyncMock(return_value=[])
+
+        @asynccontextmanager
+        async def create_client():
+            yield MagicMock()
+
+        async def persist_window(db_session, outcomes, **kwargs):
+            kwargs["extraction_results"].append({"word_count": 300})
+            return kwargs["site_profile_id"]
+
+        agent.extraction_engine.create_client = create_client
+        agent._persist_window = persist_window
+        update_profile = AsyncMock()
+
+        with patch(f"{AGENT}.get_site_discovery_profile", AsyncMock(return_value=profile)), patch(
+            f"{AGENT}.update_site_discovery_profile", update_profile
+        ), patch(f"{AGENT}.save_url_discovery_scores_batch", AsyncMock()), patch(
+            f"{AGENT}.get_existing_competitor_article_hashes", AsyncMock(return_value=set())
+        ), patch(f"{AGENT}.save_discovery_log", AsyncMock()):
+            await agent.discover_and_scrape_articles(
+                MagicMock(),
+                "a.example",
+                max_articles,
+                incremental=True,
+                scheduler=CrawlScheduler(max_domains=1, page_budget=page_budget),
+            )
+
+        assert agent.discovery.discover_via_sitemap.await_args.kwargs["since"] == profile.last_crawled_at
+        return update_profile.await_args.args[2]
+
+    async def test_complete_run_advances_the_watermark(self) -> None:
+        """Test that a run visiting every new sitemap entry moves last_crawled_at."""
+        update_data = await self._run(sitemap_count=3, max_articles=10)
+
+        assert "last_crawled_at" in update_data
+
+    async def test_truncated_discovery_keeps_the_watermark(self) -> None:
+        """Test that entries left out by max_articles are still discovered next time."""
+        update_data = await self._run(sitemap_count=10, max_articles=10)
+
+        assert "last_crawled_at" not in update_data
+        assert update_data["total_urls_discovered"] == 10
+
+    async def test_exhausted_budget_keeps_the_watermark(self) -> None:
+        """Test that URLs skipped by the crawl budget are still discovered next time."""
+        update_data = await self._run(sitemap_count=3, max_articles=10, page_budget=1)
+
+        assert "last_crawled_at" not in update_data
+
+
+@dataclass
+class SavedArticle:
+    """Row returned by the article batch insert."""
+
+    id: int
+    url: str
+    title: str = ""
+    word_count: int = 300
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPersistWindowFallback:
+    """Test the single-insert fallback of _persist_window."""
+
+    async def test_failed_batch_keeps_earlier_flushed_work(self) -> None:
+        """Test that a bad row only loses its own insert, not the window's URL statuses."""
+        session = FakeSession()
+        outcomes = [
+            ExtractionOutcome(
+                url_data={"url": f"https://a.example/{name}", "url_hash": name, "initial_score": 1.0},
+                crawled=True,
+                article={"title": name, "content": "texte", "word_count": 300},
+                is_valid=True,
+            )
+            for name in ["first", "bad", "last"]
+        ]
+
+        async def create_batch(db_session, articles_data):
+            rows = [SavedArticle(id=i, url=data["url"]) for i, data in enumerate(articles_data)]
+            for row in rows:
+                db_session.add(row)
+            if any(data["url_hash"] == "bad" for data in articles_data):
+                raise ValueError("duplicate key")
+            await db_session.commit()
+            return rows
+
+        agent = EnhancedScrapingAgent()
+        agent._index_saved_articles = AsyncMock()
+        scraped_articles: List[Dict[str, Any]] = []
+
+        with patch(f"{AGENT}.create_competitor_articles_batch", create_batch), patch(
+            f"{AGENT}.log_error_from_exception", AsyncMock()
+        ) as log_error:
+            await agent._persist_window(
+                session,
+                outcomes,
+                domain="a.example",
+                stats={"scraped": 0, "valid": 0},
+                scraped_articles=scraped_articles,
+                extraction_results=[],
+                is_client_site=False,
+                site_profile_id=None,
+                execution_id=None,
+                client_domain=None,
+            )
+        await session.commit()
+
+        assert [a["url"] for a in scraped_articles] == ["https://a.example/first", "https://a.example/last"]
+        assert log_error.await_count == 1
+        saved_urls = [item.url for item in session.committed if isinstance(item, SavedArticle)]
+        assert saved_urls == ["https://a.example/first", "https://a.example/last"]
+        # 3 scrape statuses written before the batch, the failed row and 2 validations
+        assert len([item for item in session.committed if not isinstance(item, SavedArticle)]) == 6
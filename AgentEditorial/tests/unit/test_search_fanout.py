@@ -0,0 +1,157 @@
+"""Unit tests for the concurrent, cached competitor search fan-out."""
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from python_scripts.agents.competitor.config import CompetitorSearchConfig
+from python_scripts.agents.competitor.query_generator import QueryGenerator
+from python_scripts.agents.competitor.search_fanout import (
+    SearchFanout,
+    SearchResultCache,
+    make_search_key,
+)
+
+
+class StubProvider:
+    """Local search provider: deterministic results, call and concurrency counters."""
+
+    def __init__(self, name: str, delay: float = 0.02, results_per_query: int = 2) -> None:
+        self.name = name
+        self.delay = delay
+        self.results_per_query = results_per_query
+        self.calls: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, query: str) -> List[Dict[str, Any]]:
+        self.calls.append(query)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if "vide" in query.lower():
+            return []
+        # "geo" queries keep returning the same domains
+        stem = "geo" if query.startswith("geo") else query.replace(" ", "-")
+        return [
+            {"url": f"https://{stem}-{i}.fr/", "domain": f"{stem}-{i}.fr", "source": self.name}
+            for i in range(self.results_per_query)
+        ]
+
+
+def _config(**overrides: Any) -> CompetitorSearchConfig:
+    values: Dict[str, Any] = {
+        "search_batch_size": 4,
+        "search_provider_concurrency": {"stub": 2, "other": 4},
+        "search_provider_interval": {"stub": 0.0, "other": 0.0},
+        "search_min_new_domains": 0.0,
+    }
+    values.update(overrides)
+    return CompetitorSearchConfig(**values)
+
+
+def _queries(strategy: str, count: int) -> List[Dict[str, str]]:
+    return [{"strategy": strategy, "query": f"{strategy} requête {i}"} for i in range(count)]
+
+
+@pytest.fixture
+def cache(tmp_path) -> SearchResultCache:
+    return SearchResultCache(path=str(tmp_path / "search.sqlite"), ttl_seconds=3600)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSearchFanout:
+    """Test SearchFanout.search."""
+
+    async def test_queries_run_concurrently_within_provider_limits(self) -> None:
+        """Test the per-provider concurrency limit and the result order."""
+        stub, other = StubProvider("stub"), StubProvider("other")
+        fanout = SearchFanout({"stub": stub, "other": other}, _config(), QueryGenerator(_config()))
+        queries = _queries("direct", 8)
+
+        started = time.monotonic()
+        outcome = await fanout.search(queries)
+
+        # 8 queries at 2 in flight for "stub": 4 rounds of 20 ms, not 16
+        assert time.monotonic() - started < 0.25
+        assert stub.max_in_flight == 2
+        assert other.max_in_flight == 4
+        assert outcome.queries_executed == 8
+        assert outcome.provider_calls == 16
+        assert [r["source"] for r in outcome.results[:4]] == ["stub", "stub", "other", "other"]
+        assert outcome.results[0]["domain"] == "direct-requête-0-0.fr"
+        assert all(r["strategy"] == "direct" for r in outcome.results)
+        assert outcome.strategy_results["direct"] == {"stub": 16, "other": 16, "total": 32}
+
+    async def test_provider_interval_spaces_out_calls(self) -> None:
+        """Test the minimum delay between two calls to the same provider."""
+        stub = StubProvider("stub", delay=0.0)
+        config = _config(
+            search_provider_concurrency={"stub": 4},
+            search_provider_interval={"stub": 0.05},
+        )
+        fanout = SearchFanout({"stub": stub}, config, QueryGenerator(config))
+
+        started = time.monotonic()
+        await fanout.search(_queries("direct", 4))
+
+        assert time.monotonic() - started >= 0.15
+
+    async def test_second_run_is_served_from_the_cache(self, cache: SearchResultCache) -> None:
+        """Test the query/provider cache, query normalization and empty results."""
+        stub = StubProvider("stub")
+        config = _config()
+        queries = _queries("direct", 3) + [{"strategy": "direct", "query": "vide"}]
+
+        first = await SearchFanout({"stub": stub}, config, QueryGenerator(config), cache=cache).search(queries)
+        renormalized = [{**q, "query": "  " + q["query"].upper() + " "} for q in queries]
+        second = await SearchFanout({"stub": stub}, config, QueryGenerator(config), cache=cache).search(
+            renormalized
+        )
+
+        # The empty result list is not cached (providers also return [] on errors)
+        assert stub.calls.count("vide") == 1 and len(stub.calls) == 5
+        assert second.cache_hits == 3 and second.provider_calls == 1
+        assert second.results == first.results
+        assert cache.get_stats()["providers"]["stub"]["hits"] == 3
+
+    async def test_cache_key_includes_provider_and_max_results(self, cache: SearchResultCache) -> None:
+        """Test that different providers or result counts do not share entries."""
+        cache.put(make_search_key("stub", "ESN Paris", 20), "stub", "ESN Paris", [{"domain": "a.fr"}])
+
+        assert cache.get(make_search_key("stub", "esn  paris", 20), "stub") == [{"domain": "a.fr"}]
+        assert cache.get(make_search_key("stub", "ESN Paris", 10), "stub") is None
+        assert cache.get(make_search_key("other", "ESN Paris", 20), "other") is None
+
+    async def test_expired_entries_are_ignored(self, tmp_path) -> None:
+        """Test the TTL."""
+        cache = SearchResultCache(path=str(tmp_path / "search.sqlite"), ttl_seconds=-1)
+        key = make_search_key("stub", "ESN Paris")
+        cache.put(key, "stub", "ESN Paris", [{"domain": "a.fr"}])
+
+        assert cache.get(key, "stub") is None
+
+    async def test_unproductive_strategy_stops_early(self) -> None:
+        """Test the early stop on marginal new domains per query."""
+        stub = StubProvider("stub")
+        config = _config(search_min_new_domains=0.5, search_efficiency_window=4)
+        generator = QueryGenerator(config)
+        fanout = SearchFanout({"stub": stub}, config, generator)
+        # Interleaved: "geo" returns the same domains, "direct" new ones
+        queries = [q for pair in zip(_queries("geo", 12), _queries("direct", 12)) for q in pair]
+
+        outcome = await fanout.search(queries, exclude_domain="geo-0.fr")
+
+        assert outcome.stopped_strategies == ["geo"]
+        assert outcome.queries_skipped == 12 - 4
+        assert sum(1 for call in stub.calls if call.startswith("geo")) == 4
+        assert sum(1 for call in stub.calls if call.startswith("direct")) == 12
+        # First geo query: one new domain (geo-0.fr is the target), then none
+        assert generator.get_strategy_efficiency("geo", window=4) == 0.25
+        assert generator.get_strategy_efficiency("direct") == 2.0
@@ -0,0 +1,94 @@
+"""Unit tests for the vectorized trend pipeline kernels."""
+
+import numpy as np
+import pytest
+
+from python_scripts.agents.trend_pipeline.kernels import (
+    cosine_matrix,
+    group_indices,
+    mean_pairwise_cosine,
+    nearest_centroids,
+    reassign_by_similarity,
+    segment_mean_pairwise_cosine,
+    topic_centroids,
+)
+
+
+@pytest.fixture
+def corpus():
+    """Random embeddings with topic assignments (including noise)."""
+    rng = np.random.default_rng(42)
+    embeddings = rng.normal(size=(200, 16)).astype(np.float32)
+    topics = rng.integers(-1, 6, size=200).tolist()
+    return embeddings, topics
+
+
+def _naive_coherence(embeddings: np.ndarray) -> float:
+    """Reference: mean of the off-diagonal cosine similarity matrix."""
+    normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    similarities = normalized @ normalized.T
+    n = len(similarities)
+    return float((similarities.sum() - n) / (n * (n - 1)))
+
+
+@pytest.mark.unit
+class TestTrendKernels:
+    """Test the kernels against naive per-topic implementations."""
+
+    def test_group_indices(self) -> None:
+        """Test that indices are grouped per label in document order."""
+        groups = group_indices([2, -1, 2, 0, -1])
+
+        assert {k: v.tolist() for k, v in groups.items()} == {-1: [1, 4], 0: [3], 2: [0, 2]}
+
+    def test_topic_centroids_skip_noise(self, corpus) -> None:
+        """Test that centroids match per-topic means and exclude noise."""
+        embeddings, topics = corpus
+
+        centroids = topic_centroids(embeddings, topics)
+
+        assert -1 not in centroids
+        for topic_id, centroid in centroids.items():
+            expected = embeddings[[i for i, t in enumerate(topics) if t == topic_id]].mean(axis=0)
+            np.testing.assert_allclose(centroid, expected, rtol=1e-5, atol=1e-6)
+
+    def test_coherence_matches_pairwise_matrix(self, corpus) -> None:
+        """Test that coherence equals the mean off-diagonal cosine similarity."""
+        embeddings, topics = corpus
+
+        coherence = segment_mean_pairwise_cosine(embeddings, topics)
+
+        for topic_id, score in coherence.items():
+            topic_embeddings = embeddings[[i for i, t in enumerate(topics) if t == topic_id]]
+            assert score == pytest.approx(_naive_coherence(topic_embeddings), abs=1e-6)
+            assert mean_pairwise_cosine(topic_embeddings) == pytest.approx(score, abs=1e-6)
+        assert mean_pairwise_cosine(embeddings[:1]) == 1.0
+
+    def test_nearest_centroids(self, corpus) -> None:
+        """Test that the matmul nearest centroid matches a brute-force search."""
+        embeddings, topics = corpus
+        centroids = np.vstack(list(topic_centroids(embeddings, topics).values()))
+
+        nearest, distances = nearest_centroids(embeddings, centroids)
+
+        brute = np.linalg.norm(embeddings[:, None, :] - centroids[None, :, :], axis=2)
+        np.testing.assert_array_equal(nearest, brute.argmin(axis=1))
+        np.testing.assert_allclose(distances, brute.min(axis=1), rtol=1e-5)
+
+    def test_cosine_matrix_handles_zero_rows(self) -> None:
+        """Test that zero vectors get a similarity of 0 instead of NaN."""
+        similarities = cosine_matrix(np.array([[1.0, 0.0], [0.0, 0.0]]), np.array([[2.0, 0.0]]))
+
+        np.testing.assert_allclose(similarities, [[1.0], [0.0]])
+
+    def test_reassign_by_similarity(self) -> None:
+        """Test that only documents closer to another centroid above the threshold move."""
+        embeddings = np.array(
+            [[1.0, 0.0], [1.0, 0.1], [0.0, 1.0], [0.1, 1.0], [0.95, 0.05], [0.5, 0.5]]
+        )
+        topics = [0, 0, 1, 1, 1, -1]
+
+        refined, reassigned = reassign_by_similarity(embeddings, topics, similarity_threshold=0.7)
+
+        assert refined.tolist() == [0, 0, 1, 1, 0, -1]
+        assert reassigned == 1
@@ -0,0 +1,84 @@
+"""Unit tests for the discovery URL frontier."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from python_scripts.agents.scrapping.frontier import UrlFrontier, canonicalize_url
+from python_scripts.database.crud_articles import get_existing_competitor_article_hashes
+from python_scripts.ingestion.crawl_pages import generate_url_hash
+
+
+@pytest.mark.unit
+class TestCanonicalizeUrl:
+    """Test canonicalize_url."""
+
+    def test_tracking_parameters_are_removed(self) -> None:
+        """Test that campaign parameters are dropped and the others sorted."""
+        url = "https://example.com/blog/post?utm_source=x&b=2&fbclid=abc&a=1#comments"
+
+        assert canonicalize_url(url) == "https://example.com/blog/post?a=1&b=2"
+
+    def test_scheme_host_and_port_are_normalized(self) -> None:
+        """Test scheme/host case, default port and empty path."""
+        assert canonicalize_url("HTTPS://Example.COM:443") == "https://example.com/"
+        assert canonicalize_url("http://example.com:8080/Path/") == "http://example.com:8080/Path/"
+
+    def test_clean_urls_keep_their_hash(self) -> None:
+        """Test that already clean URLs hash as before (stored url_hash values stay valid)."""
+        url = "https://example.com/2024/01/article/"
+
+        assert generate_url_hash(canonicalize_url(url)) == generate_url_hash(url)
+
+
+@pytest.mark.unit
+class TestUrlFrontier:
+    """Test UrlFrontier."""
+
+    def test_variants_of_a_url_are_deduplicated(self) -> None:
+        """Test that the first source keeps a URL found several times."""
+        frontier = UrlFrontier()
+
+        assert frontier.add("https://example.com/blog/post", "rss") is True
+        assert frontier.add("https://EXAMPLE.com/blog/post/?utm_medium=feed", "sitemap") is False
+        assert frontier.add_many(["https://example.com/blog/post#top", "https://example.com/blog/other"], "heuristic") == 1
+
+        assert len(frontier) == 2
+        assert frontier.duplicates == 2
+        assert [entry.source for entry in frontier] == ["rss", "heuristic"]
+        assert "https://example.com/blog/post/" in frontier
+
+    def test_selection_is_ordered_by_score(self) -> None:
+        """Test that selection keeps the best non-negative scores, best first."""
+        frontier = UrlFrontier()
+        frontier.add("https://example.com/tag/python", "sitemap")
+        frontier.add("https://example.com/page-a", "sitemap")
+        frontier.add("https://example.com/blog/2024/01/article", "rss")
+        frontier.add("https://example.com/page-b", "sitemap")
+
+        selected = frontier.select(2)
+
+        assert [entry.url for entry in selected] == [
+            "https://example.com/blog/2024/01/article",
+            "https://example.com/page-a",
+        ]
+        assert all(entry.initial_score >= 0 for entry in frontier.select(10))
+        assert len(frontier.select(10)) == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestKnownArticleLookup:
+    """Test the bulk already-known lookup."""
+
+    async def test_hashes_are_checked_in_chunks(self) -> None:
+        """Test one query per chunk instead of one per URL."""
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = ["h1"]
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+
+        known = await get_existing_competitor_article_hashes(session, [f"h{i}" for i in range(5)], chunk_size=2)
+
+        assert known == {"h1"}
+        assert session.execute.await_count == 3